@@ -110,6 +110,8 @@ e.g. textual, rich, :abbr:`mp (multiprocessing)` or :abbr:`mq (rabbitmq)`
 
 """
 
+from typing import TYPE_CHECKING
+
 from .constants import LoggingConfigCategory
 from .exceptions import (
     LoggingStrictError,
@@ -118,17 +120,19 @@ from .exceptions import (
     LoggingStrictPackageStartFolderNameRequired,
     LoggingStrictProcessCategoryRequired,
 )
-from .logging_api import (
-    LoggingState,
-    setup_ui_other,
-    setup_worker_other,
-    ui_yaml_curated,
-    worker_yaml_curated,
-)
-from .logging_yaml_abc import (
-    LoggingYamlType,
-    setup_logging_yaml,
-)
+
+if TYPE_CHECKING:
+    from .logging_api import (
+        setup_ui_other,
+        setup_worker_other,
+        ui_yaml_curated,
+        worker_yaml_curated,
+    )
+    from .logging_state import LoggingState
+    from .logging_yaml_abc import (
+        LoggingYamlType,
+        setup_logging_yaml,
+    )
 
 __all__ = (
     "LoggingConfigCategory",
@@ -145,3 +149,50 @@ __all__ = (
     "LoggingStrictProcessCategoryRequired",
     "LoggingStrictGenreRequired",
 )
+
+# Imported on first access (PEP 562). name --> submodule
+_LAZY = {
+    "LoggingState": "logging_state",
+    "setup_ui_other": "logging_api",
+    "setup_worker_other": "logging_api",
+    "ui_yaml_curated": "logging_api",
+    "worker_yaml_curated": "logging_api",
+    "LoggingYamlType": "logging_yaml_abc",
+    "setup_logging_yaml": "logging_yaml_abc",
+}
+
+
+def __getattr__(name):
+    """Import the submodule providing name on first access
+
+    :param name: package attribute name
+    :type name: str
+    :returns: package attribute
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`AttributeError` -- Not a package attribute
+
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:  # pragma: no cover
+        pass
+
+    import importlib
+
+    mod = importlib.import_module(f".{_LAZY[name]}", __name__)
+    ret = getattr(mod, name)
+    # Subsequent access skips __getattr__
+    globals()[name] = ret
+
+    return ret
+
+
+def __dir__():
+    """Include lazy attributes
+
+    :returns: package attribute names
+    :rtype: list[str]
+    """
+    return sorted(set(globals().keys()) | set(__all__))
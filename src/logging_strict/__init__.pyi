@@ -7,12 +7,12 @@ from .exceptions import (
     LoggingStrictProcessCategoryRequired,
 )
 from .logging_api import (
-    LoggingState,
     setup_ui_other,
     setup_worker_other,
     ui_yaml_curated,
     worker_yaml_curated,
 )
+from .logging_state import LoggingState
 from .logging_yaml_abc import (
     LoggingYamlType,
     setup_logging_yaml,
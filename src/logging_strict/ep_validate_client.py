@@ -0,0 +1,273 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+..
+
+Thin client entrypoint. Validate :py:mod:`logging.config` yaml file(s)
+using the warm validation daemon,
+:py:mod:`logging_strict.ep_validate_daemon`.
+
+Most of the cost of validating a few files is interpreter startup plus
+importing strictyaml and building the schema. The daemon pays that
+once. The client only imports the standard library. If the daemon is
+not running, or is another logging_strict version, the client falls
+back to validating within this process.
+
+Protocol. Over a Unix socket, one JSON object per line. Client sends
+one request
+
+.. code-block:: text
+
+   {"version": "1.4.0", "paths": ["/abs/a.worker.logging.config.yaml"],
+    "contents": [{"path": "<stdin>", "yaml": "version: 1\\n"}],
+    "fail_fast": false}
+
+Daemon replies with one ``file`` record per file, as each finishes,
+then one ``done`` record, containing the ``summary`` record and human
+readable ``report``. Or one ``error`` record.
+
+Client holds the replies until the ``done`` record. If the daemon fails
+midway, nothing was output, so falling back can't duplicate records.
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str, str]
+   :value: ("get_socket_path", "request_daemon")
+
+   Module exports
+
+**Module objects**
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import socket
+import sys
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from ._version import __version__
+from .constants import g_app_name
+
+__all__ = (
+    "get_socket_path",
+    "request_daemon",
+)
+
+#: str: Socket file name
+SOCKET_NAME = "validate.sock"
+
+#: float: Seconds to wait for the daemon to accept. Then fall back
+CONNECT_TIMEOUT = 0.5
+
+#: float: Seconds to wait for each daemon reply line
+READ_TIMEOUT = 60.0
+
+
+def get_socket_path(path_socket=None):
+    """Per user socket path. Within XDG runtime folder, if there is
+    one, otherwise within XDG user cache folder
+
+    :param path_socket: Default None. Overrides socket path
+    :type path_socket: typing.Any | None
+    :returns: socket absolute path
+    :rtype: pathlib.Path
+    """
+    if path_socket is not None:
+        ret = Path(path_socket)
+    else:
+        str_runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "")
+        if bool(str_runtime_dir) and Path(str_runtime_dir).is_dir():
+            path_dir = Path(str_runtime_dir).joinpath(g_app_name)
+        else:
+            # Not free. Lazy import
+            from .util.xdg_folder import DestFolderUser
+
+            path_dir = Path(DestFolderUser(g_app_name).cache_dir)
+        ret = path_dir.joinpath(SOCKET_NAME)
+
+    return ret
+
+
+def request_daemon(d_request, emit, path_socket=None):
+    """Send request to the daemon. Once the daemon completes the
+    request, pass each reply record to emit. Until then, emit is not
+    called
+
+    :param d_request: request. Keys: paths, contents, and fail_fast
+    :type d_request: dict[str, typing.Any]
+    :param emit: called with each reply record
+    :type emit: collections.abc.Callable[[dict[str, typing.Any]], None]
+    :param path_socket: Default None. Overrides socket path
+    :type path_socket: typing.Any | None
+    :returns:
+
+       True if daemon completed the request. False if daemon is not
+       running, is another version, or went away. Fall back to
+       validating within this process
+
+    :rtype: bool
+    """
+    str_socket = str(get_socket_path(path_socket))
+    d_request = {**d_request, "version": __version__}
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str_socket)
+        sock.settimeout(READ_TIMEOUT)
+        sock.sendall(json.dumps(d_request).encode("utf-8") + b"\n")
+        # Nothing more to send
+        sock.shutdown(socket.SHUT_WR)
+        replies = []
+        with sock.makefile(mode="r", encoding="utf-8") as f:
+            for line in f:
+                d_reply = json.loads(line)
+                reply_type = d_reply.get("type", None)
+                if reply_type == "error":
+                    return False
+                replies.append(d_reply)
+                if reply_type == "done":
+                    for d_reply in replies:
+                        emit(d_reply)
+                    return True
+                else:  # pragma: no cover continue
+                    pass
+    except (OSError, ValueError):
+        # Not running, stale socket, timeout, or garbled reply
+        pass
+    finally:
+        sock.close()
+
+    return False
+
+
+def _process_args():
+    """parse args
+
+    :returns: request and other options. Keys: socket and format
+    :rtype: tuple[dict[str, typing.Any], dict[str, typing.Any]]
+    """
+    desc = "Validate .[worker|app].logging.config.yaml files using the daemon"
+    prog = f"{g_app_name}_validate_client"
+    epilog = f"""Send files to the warm validation daemon, {g_app_name}_validate_daemon.
+If the daemon is not running, validates within this process.
+
+Report is the same as {g_app_name}_validate_yaml. Including fail fast
+by default. --no-fail-fast validates every file
+
+EXIT CODES
+
+- 2 -- Unwisely used as a catchall by cli parser, argparse
+
+- 3 -- An argument has wrong type or missing entirely
+
+- 10 -- No files. Neither files nor --stdin
+
+"""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=desc,
+        epilog=epilog,
+        formatter_class=argparse.RawTextHelpFormatter,
+        exit_on_error=False,
+    )
+    parser.add_argument(
+        "paths",
+        type=Path,
+        help="logging.config yaml files",
+        nargs="*",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Also validate logging.config yaml read from stdin",
+        default=False,
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Socket path. Default within XDG runtime or user cache folder",
+        default=None,
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["text", "jsonl"],
+        help="Report format. Same as validate entrypoint",
+        default="text",
+    )
+    # Same default as validate entrypoint
+    parser.add_argument(
+        "-f",
+        "--fail-fast",
+        action=argparse.BooleanOptionalAction,
+        help="Stop on first fail or error. Default True",
+        default=True,
+    )
+
+    try:
+        f = io.StringIO()
+        with redirect_stderr(f):
+            args = parser.parse_args()
+    except argparse.ArgumentError:
+        sys.exit(3)
+
+    # Relative to client current working directory, not the daemon's
+    paths = [str(path_f.resolve()) for path_f in args.paths if path_f.is_file()]
+    contents = []
+    if args.stdin:
+        contents.append({"path": "<stdin>", "yaml": sys.stdin.read()})
+    else:  # pragma: no cover
+        pass
+
+    if not bool(paths) and not bool(contents):
+        sys.exit(10)
+    else:  # pragma: no cover
+        pass
+
+    d_request = {
+        "paths": paths,
+        "contents": contents,
+        "fail_fast": args.fail_fast,
+    }
+    d_options = {"socket": args.socket, "format": args.format}
+
+    return d_request, d_options
+
+
+def main() -> None:
+    """Validate yaml files, using the daemon if running"""
+    d_request, d_options = _process_args()
+    is_jsonl = d_options.get("format", "text") == "jsonl"
+
+    def emit(d_reply):
+        """Write reply records. Same output as validate entrypoint"""
+        reply_type = d_reply.get("type", None)
+        if reply_type == "file" and is_jsonl:
+            print(json.dumps(d_reply), flush=True)
+        elif reply_type == "done" and is_jsonl:
+            print(json.dumps(d_reply["summary"]), flush=True)
+        elif reply_type == "done":
+            print(d_reply["report"], file=sys.stderr)
+        else:  # pragma: no cover
+            pass
+
+    is_done = request_daemon(d_request, emit, path_socket=d_options.get("socket"))
+    if not is_done:
+        # Fall back. Validate within this process
+        from .ep_validate_daemon import handle_request
+
+        handle_request(d_request, emit)
+    else:  # pragma: no cover
+        pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
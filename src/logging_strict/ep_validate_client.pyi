@@ -0,0 +1,24 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import (
+    Any,
+    Final,
+)
+
+__all__ = (
+    "get_socket_path",
+    "request_daemon",
+)
+
+SOCKET_NAME: Final[str]
+CONNECT_TIMEOUT: Final[float]
+READ_TIMEOUT: Final[float]
+
+def get_socket_path(path_socket: Any | None = None) -> Path: ...
+def request_daemon(
+    d_request: dict[str, Any],
+    emit: Callable[[dict[str, Any]], None],
+    path_socket: Any | None = None,
+) -> bool: ...
+def _process_args() -> tuple[dict[str, Any], dict[str, Any]]: ...
+def main() -> None: ...
@@ -0,0 +1,284 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+..
+
+Warm validation daemon entrypoint. Keeps strictyaml imported and the
+:py:mod:`logging.config` schema built. Listens on a per user Unix
+socket. Clients, :py:mod:`logging_strict.ep_validate_client`, send
+file paths or contents and get result records back.
+
+Runs in the foreground. Background it with the shell, or a user
+service manager. Stop with ``--stop`` or a signal.
+
+The socket folder and socket are only accessible by the user.
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str, str]
+   :value: ("ValidateDaemon", "handle_request")
+
+   Module exports
+
+**Module objects**
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from ._version import __version__
+from .constants import g_app_name
+from .ep_validate_client import (
+    CONNECT_TIMEOUT,
+    get_socket_path,
+    request_daemon,
+)
+from .ep_validate_yaml import (
+    _build_report,
+    _is_fail,
+    _validate_file,
+    _validate_str,
+)
+from .logging_yaml_validate import validate_yaml_data
+
+__all__ = (
+    "ValidateDaemon",
+    "handle_request",
+)
+
+
+def handle_request(d_request, emit):
+    """Validate the files and contents of one request. Used by the
+    daemon and by the client fallback
+
+    :param d_request: request. Keys: paths, contents, and fail_fast
+    :type d_request: dict[str, typing.Any]
+    :param emit: called with each ``file`` record, then the ``done`` record
+    :type emit: collections.abc.Callable[[dict[str, typing.Any]], None]
+    """
+    is_fail_fast = bool(d_request.get("fail_fast", False))
+    # (name, None) is a file. (name, yaml str) is contents
+    items = [(str(str_path), None) for str_path in d_request.get("paths", None) or ()]
+    for d_content in d_request.get("contents", None) or ():
+        str_yaml = str(d_content.get("yaml", ""))
+        items.append((str(d_content.get("path", "<stdin>")), str_yaml))
+
+    names = []
+    d_results = {}
+    start = time.perf_counter()
+    for pos, (str_name, str_yaml) in enumerate(items):
+        if str_yaml is None:
+            try:
+                d_result = _validate_file(Path(str_name))
+            except OSError:
+                # File moved or unreadable. Not a logging.config failure
+                continue
+        else:
+            d_result = _validate_str(str_yaml, str_name)
+        idx = len(names)
+        names.append(str_name)
+        d_results[idx] = d_result
+        emit({"type": "file", "index": idx, **d_result})
+        if is_fail_fast and _is_fail(d_result):
+            # Not validated, yet part of the total. Same as validate entrypoint
+            names.extend(str_name for str_name, _ in items[pos + 1 :])
+            break
+        else:  # pragma: no cover continue
+            pass
+    seconds = time.perf_counter() - start
+
+    d_summary, report = _build_report(tuple(names), d_results, is_fail_fast, seconds)
+    emit({"type": "done", "summary": d_summary, "report": report})
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One client connection. One request"""
+
+    def handle(self):
+        """Read request line, write reply lines"""
+
+        def emit(d_reply):
+            """Write one reply line"""
+            str_line = json.dumps(d_reply) + "\n"
+            self.wfile.write(str_line.encode("utf-8"))
+            self.wfile.flush()
+
+        line = self.rfile.readline()
+        if not bool(line.strip()):
+            # Connected only to check daemon is running
+            return
+        else:  # pragma: no cover
+            pass
+
+        try:
+            d_request = json.loads(line)
+            if not isinstance(d_request, dict):
+                raise ValueError("Request is not a JSON object")
+            else:  # pragma: no cover
+                pass
+        except ValueError:
+            d_request = None
+
+        try:
+            if d_request is None:
+                emit({"type": "error", "reason": "bad request"})
+            elif d_request.get("stop", False):
+                emit({"type": "done", "summary": {}, "report": "stopping"})
+                # Not from this thread. shutdown waits for serve_forever
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            elif d_request.get("version", None) != __version__:
+                # Client falls back to validating within its process
+                emit({"type": "error", "reason": "version"})
+            else:
+                handle_request(d_request, emit)
+        except OSError:
+            # Client went away
+            pass
+
+
+class ValidateDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server. One thread per client connection
+
+    :ivar path_socket: socket path
+    :vartype path_socket: pathlib.Path
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path_socket):
+        """Class constructor. Binds the socket, accessible only by the user"""
+        path_socket = Path(path_socket)
+        path_socket.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Stale socket from a daemon which did not exit cleanly
+        path_socket.unlink(missing_ok=True)
+        self.path_socket = path_socket
+        umask_old = os.umask(0o177)
+        try:
+            super().__init__(str(path_socket), _RequestHandler)
+        finally:
+            os.umask(umask_old)
+
+    def server_close(self):
+        """Close and remove the socket"""
+        super().server_close()
+        self.path_socket.unlink(missing_ok=True)
+
+
+def _is_running(path_socket):
+    """Check a daemon is accepting connections
+
+    :param path_socket: socket path
+    :type path_socket: pathlib.Path
+    :returns: True if a daemon is listening
+    :rtype: bool
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path_socket))
+    except OSError:
+        ret = False
+    else:
+        ret = True
+    finally:
+        sock.close()
+
+    return ret
+
+
+def _process_args():
+    """parse args
+
+    :returns: socket path and True to stop a running daemon
+    :rtype: tuple[pathlib.Path, bool]
+    """
+    desc = "Warm validation daemon for .[worker|app].logging.config.yaml files"
+    prog = f"{g_app_name}_validate_daemon"
+    epilog = f"""Keeps validators warm. Clients, {g_app_name}_validate_client,
+get results without paying interpreter startup and imports
+
+EXIT CODES
+
+- 2 -- Unwisely used as a catchall by cli parser, argparse
+
+- 3 -- An argument has wrong type or missing entirely
+
+- 11 -- A daemon is already listening on the socket
+
+- 12 -- --stop, but no daemon is listening on the socket
+
+"""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=desc,
+        epilog=epilog,
+        formatter_class=argparse.RawTextHelpFormatter,
+        exit_on_error=False,
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Socket path. Default within XDG runtime or user cache folder",
+        default=None,
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the running daemon",
+        default=False,
+    )
+
+    try:
+        f = io.StringIO()
+        with redirect_stderr(f):
+            args = parser.parse_args()
+    except argparse.ArgumentError:
+        sys.exit(3)
+
+    path_socket = get_socket_path(args.socket)
+
+    return path_socket, args.stop
+
+
+def main() -> None:
+    """Serve until stopped"""
+    path_socket, is_stop = _process_args()
+
+    if is_stop:
+        is_stopped = request_daemon({"stop": True}, lambda d: None, path_socket)
+        if not is_stopped:
+            sys.exit(12)
+        else:  # pragma: no cover
+            pass
+        return
+
+    if _is_running(path_socket):
+        sys.exit(11)
+    else:  # pragma: no cover
+        pass
+
+    # Warm up. Import and build everything validation needs
+    validate_yaml_data("version: 1\n")
+
+    with ValidateDaemon(path_socket) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:  # pragma: no cover
+            pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,31 @@
+import socketserver
+from collections.abc import Callable
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+)
+
+__all__ = (
+    "ValidateDaemon",
+    "handle_request",
+)
+
+def handle_request(
+    d_request: dict[str, Any],
+    emit: Callable[[dict[str, Any]], None],
+) -> None: ...
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None: ...
+
+class ValidateDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads: ClassVar[bool]
+    path_socket: Path
+
+    def __init__(self, path_socket: Any) -> None: ...
+    def server_close(self) -> None: ...
+
+def _is_running(path_socket: Path) -> bool: ...
+def _process_args() -> tuple[Path, bool]: ...
+def main() -> None: ...
@@ -12,12 +12,25 @@ Entrypoint to validate :py:mod:`logging.config` yaml file(s)
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib.util
 import io
+import json
+import os
 import sys
 import textwrap
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
 from contextlib import redirect_stderr
-from pathlib import Path
+from pathlib import (
+    Path,
+    PurePath,
+)
 
+import importlib_metadata as metadata
 from strictyaml import YAMLValidationError
 
 from .constants import (
@@ -29,15 +42,49 @@ from .exceptions import (
     LoggingStrictPackageStartFolderNameRequired,
 )
 from .logging_api import LoggingConfigYaml
-from .logging_yaml_validate import validate_yaml_dirty
+from .logging_yaml_validate import (
+    ENGINE_DISK,
+    ENGINE_MEMORY,
+    ENGINE_STRICTYAML,
+    _validate_yaml_engine,
+)
 from .util.check_type import is_not_ok
+from .util.file_walk import (
+    ExcludeRules,
+    iter_files,
+)
+from .util.validation_cache import ValidationManifest
+
+#: str: Result record status. File is valid
+STATUS_OK = "ok"
+
+#: str: Result record status. File is not valid
+STATUS_FAIL = "fail"
+
+#: str: Report format. Human readable, to stderr, once finished
+FORMAT_TEXT = "text"
+
+#: str: Report format. JSON Lines, to stdout, one record per file as it finishes
+FORMAT_JSONL = "jsonl"
+
+#: float: Watch mode. Default seconds between polls
+WATCH_INTERVAL = 1.0
+
+#: str: Result record engine. Result from the incremental manifest
+ENGINE_MANIFEST = "manifest"
+
+#: tuple[str, ...]: Source of these modules identifies the schema
+SCHEMA_MODULES = (
+    f"{g_app_name}.logging_yaml_validate",
+    f"{g_app_name}.logging_yaml_prevalidate",
+)
 
 
 def _process_args():
     """parse args
 
-    :returns: cli arguments
-    :rtype: tuple[tuple[pathlib.Path, ...], bool]
+    :returns: cli arguments. Files, fail fast, and dict of other options
+    :rtype: tuple[tuple[pathlib.Path, ...], bool, dict[str, typing.Any]]
     """
     desc = "Validate .[worker|app].logging.config.yaml files"
     prog = f"{g_app_name}_validate_yaml"
@@ -56,7 +103,8 @@ this on other yaml files
 EXIT CODES
 
 There is no error messages, only exit codes. `echo $?` command to check
-which error occurred.
+which error occurred. Except missing positional paths, which are listed
+on stderr.
 
 - 1 -- Purposefully avoided. Folder permissions will trigger
 
@@ -78,7 +126,62 @@ which error occurred.
 - 9 -- Genre is required. For app, UI framework e.g. 'textual' or 'pyside'.
     For worker, 'mp' or 'rabbitmq'
 
-- 10 -- Not an absolute folder or folder does not containing files matching pattern
+- 10 -- Not an absolute folder or folder does not containing files matching pattern.
+    Or a positional path does not exist. Only existing files given, none
+    matching the pattern, is not an error. Nothing to validate, so exit 0
+
+FILES
+
+Positional paths may be folders or files. Folders are searched
+recursively. Files are validated as is; no folder is searched. So
+pre-commit can pass the staged file names. --files-from reads file
+paths from a file, or from stdin if '-'. One path per line or null
+delimited, e.g. `git diff --name-only -z`. Files not matching the
+pattern, e.g. category genre or flavor, are skipped. A missing
+positional path, e.g. a mistyped folder, is an error. Missing files
+within --files-from are skipped, e.g. deleted files
+
+EXCLUDES
+
+Folder search skips version control, tool cache, and virtual
+environment folders, e.g. .git .tox .venv __pycache__.
+--no-default-excludes searches those too. Symlinked folders are not
+followed. --exclude takes a .gitignore style pattern, relative to the
+searched folder. Repeatable. --exclude-from reads patterns from a
+.gitignore style file
+
+PARALLEL
+
+Files are validated in parallel, by --jobs worker processes. Report
+order is file order, regardless of which file finishes first. With
+fail fast, the report is as if files were validated one by one
+
+REPORT FORMAT
+
+--format jsonl writes JSON Lines to stdout. One record per file, as
+soon as it finishes, so in completion order. Keys: type ('file'),
+index, path, status ('ok' or 'fail'), context, problem, mark, bytes,
+ms (validation time in milliseconds), engine, and cached. engine is
+what answered: 'strictyaml', 'prevalidate' (fast engine), 'memory' or
+'disk' (validation cache), or 'manifest' (--incremental). Only a
+strictyaml ms is the cost of a full validation. cached is true if
+engine is a cache or the manifest. Then a final summary
+record. Keys: type ('summary'), processed, total, succeed, fail,
+last_index, last, and ms
+
+WATCH
+
+--watch DIR keeps validating. Polls DIR, every --interval seconds, for
+files matching the pattern. Only new or changed files are validated.
+Results are written as each file finishes. Stop with Ctrl+C
+
+INCREMENTAL
+
+With --incremental, per file content hash and result are recorded in a
+manifest. Default within XDG user cache folder, or --cache-file. Later
+runs only validate files whose content changed. A logging_strict,
+strictyaml, or schema change invalidates the whole manifest. Concurrent
+runs may share a manifest; entries are merged, not overwritten
 
 """
     parser = argparse.ArgumentParser(
@@ -90,14 +193,28 @@ which error occurred.
     )
 
     help_text = (
-        "Folder (absolute path) containing " "*.[app|worker].logging.config.yaml files"
+        "Folder(s) containing *.[app|worker].logging.config.yaml files "
+        "or the files themselves. Default current working directory"
     )
     parser.add_argument(
         "dir",
         type=Path,
         help=help_text,
-        default=Path.cwd(),
-        nargs="?",
+        default=None,
+        nargs="*",
+        metavar="PATH",
+    )
+
+    help_text = (
+        "Read file paths from this file. '-' for stdin. Newline or "
+        "null delimited. Skips searching folders"
+    )
+    parser.add_argument(
+        "--files-from",
+        type=str,
+        help=help_text,
+        default=None,
+        required=False,
     )
 
     help_text = (
@@ -185,6 +302,115 @@ which error occurred.
         required=False,
     )
 
+    help_text = (
+        "Validate files in parallel, using this many worker processes. "
+        "Default CPU count. 1 validates within this process"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help=help_text,
+        default=None,  # cpu count
+        required=False,
+    )
+
+    help_text = (
+        "Only validate files which changed since the last run. Results "
+        "of unchanged files are taken from the manifest"
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help=help_text,
+        default=False,
+        required=False,
+    )
+
+    help_text = (
+        "Manifest file path. Implies --incremental. Default within "
+        "XDG user cache folder"
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help=help_text,
+        default=None,
+        required=False,
+    )
+
+    help_text = (
+        "Report format. text, human readable to stderr. jsonl, one "
+        "JSON record per file as it finishes then a summary record, to stdout"
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=[FORMAT_TEXT, FORMAT_JSONL],
+        help=help_text,
+        default=FORMAT_TEXT,
+        required=False,
+    )
+
+    help_text = (
+        "Keep watching this folder. Validate new or changed files, as "
+        "they change. Positional paths are ignored"
+    )
+    parser.add_argument(
+        "--watch",
+        type=Path,
+        help=help_text,
+        default=None,
+        required=False,
+        metavar="DIR",
+    )
+
+    help_text = "With --watch, seconds between polls. Default 1.0"
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help=help_text,
+        default=WATCH_INTERVAL,
+        required=False,
+    )
+
+    help_text = (
+        "Folder search skips files and folders matching this .gitignore "
+        "style pattern. Repeatable"
+    )
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        action="append",
+        help=help_text,
+        default=None,
+        required=False,
+        metavar="PATTERN",
+    )
+
+    help_text = "Read --exclude patterns from a .gitignore style file"
+    parser.add_argument(
+        "--exclude-from",
+        type=Path,
+        help=help_text,
+        default=None,
+        required=False,
+        metavar="FILE",
+    )
+
+    help_text = (
+        "Folder search also descends into version control, tool cache, "
+        "and virtual environment folders"
+    )
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help=help_text,
+        default=False,
+        required=False,
+    )
+
     # sys.exit(2) happens automagically if missing required args or unknown kwargs
     try:
         f = io.StringIO()
@@ -205,17 +431,66 @@ which error occurred.
         "flavor",
         "version",
         "fail_fast",
+        "jobs",
+        "incremental",
+        "cache_file",
+        "files_from",
+        "format",
+        "watch",
+        "interval",
+        "exclude",
+        "exclude_from",
+        "no_default_excludes",
     )
 
-    # Extra args. There is one optional
-    if len(keys) > len(t_required) + len(t_optional):
+    # Extra args. Any key which is neither required nor optional
+    if not set(keys).issubset(t_required + t_optional):
         sys.exit(5)
     else:  # pragma: no cover
         pass
 
-    # files_ = d_args["file_"]
-    # file_count = len(files_)
-    path_dir = d_args["dir"]  # start path
+    # Folder(s) and/or file(s). One Path, if called with older kwargs
+    mixed_paths = d_args["dir"]
+    if mixed_paths is None:
+        paths_arg = []
+    elif issubclass(type(mixed_paths), PurePath):
+        paths_arg = [mixed_paths]
+    else:
+        paths_arg = list(mixed_paths)
+
+    is_files_from = "files_from" in keys and not is_not_ok(d_args["files_from"])
+    if not is_files_from:
+        paths_from = []
+    else:
+        paths_from = _read_files_from(d_args["files_from"])
+        if paths_from is None:
+            sys.exit(3)
+        else:  # pragma: no cover
+            pass
+
+    paths_dir = []
+    paths_explicit = []
+    paths_missing = []
+    for path_arg in paths_arg:
+        if path_arg.is_dir():
+            paths_dir.append(path_arg)
+        elif path_arg.exists():
+            paths_explicit.append(path_arg)
+        else:
+            paths_missing.append(path_arg)
+    # e.g. a mistyped folder. Must not pass silently
+    if bool(paths_missing):
+        for path_arg in paths_missing:
+            print(f"not found: {path_arg!s}", file=sys.stderr)
+        sys.exit(10)
+    else:  # pragma: no cover
+        pass
+    paths_explicit.extend(paths_from)
+    # Neither folders nor files --> current working directory
+    if not bool(paths_arg) and not is_files_from:
+        paths_dir.append(Path.cwd())
+    else:  # pragma: no cover
+        pass
 
     if "package" not in keys:
         str_package = None
@@ -261,6 +536,82 @@ which error occurred.
     else:
         is_fail_fast = d_args["fail_fast"]
 
+    # None or less than 1 --> cpu count
+    if "jobs" not in keys:
+        jobs = None
+    else:
+        jobs = d_args["jobs"]
+    if jobs is None or not isinstance(jobs, int) or jobs < 1:
+        jobs = os.cpu_count() or 1
+    else:  # pragma: no cover
+        pass
+
+    if "cache_file" not in keys:
+        path_cache_file = None
+    else:
+        path_cache_file = d_args["cache_file"]
+
+    # A manifest file implies incremental
+    if "incremental" not in keys:
+        is_incremental = path_cache_file is not None
+    else:
+        is_incremental = bool(d_args["incremental"]) or path_cache_file is not None
+
+    if "format" not in keys or d_args["format"] not in (FORMAT_TEXT, FORMAT_JSONL):
+        str_format = FORMAT_TEXT
+    else:
+        str_format = d_args["format"]
+
+    if "watch" not in keys or d_args["watch"] is None:
+        path_watch = None
+    else:
+        path_watch = Path(d_args["watch"]).resolve()
+        if not path_watch.is_dir():
+            sys.exit(10)
+        else:  # pragma: no cover
+            pass
+
+    if "interval" not in keys:
+        interval = WATCH_INTERVAL
+    else:
+        interval = d_args["interval"]
+    if not isinstance(interval, (int, float)) or interval <= 0:
+        interval = WATCH_INTERVAL
+    else:  # pragma: no cover
+        pass
+
+    # .gitignore style. Compiled once
+    patterns_exclude = []
+    if "exclude_from" in keys and d_args["exclude_from"] is not None:
+        try:
+            str_excludes = Path(d_args["exclude_from"]).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            sys.exit(3)
+        patterns_exclude.extend(str_excludes.splitlines())
+    else:  # pragma: no cover
+        pass
+    if "exclude" in keys and d_args["exclude"] is not None:
+        patterns_exclude.extend(d_args["exclude"])
+    else:  # pragma: no cover
+        pass
+    excludes = ExcludeRules(patterns_exclude)
+    # None --> IGNORE_DIRS. Empty --> no folder is skipped by name
+    if "no_default_excludes" in keys and bool(d_args["no_default_excludes"]):
+        ignore_dirs = ()
+    else:
+        ignore_dirs = None
+
+    d_options = {
+        "format": str_format,
+        "jobs": jobs,
+        "incremental": is_incremental,
+        "cache_file": path_cache_file,
+        "watch": path_watch,
+        "interval": interval,
+        "excludes": excludes,
+        "ignore_dirs": ignore_dirs,
+    }
+
     abspath_files = []
     file_count = 0
     try:
@@ -277,67 +628,599 @@ which error occurred.
     except LoggingStrictPackageStartFolderNameRequired:
         sys.exit(7)
 
-    for path_yaml in api.iter_yamls(path_dir):
+    pattern = type(api).pattern(
+        category=api.category,
+        genre=api.genre,
+        flavor=api.flavor,
+        version=api.version,
+    )
+    d_options["pattern"] = pattern
+
+    # Watch folder is searched on each poll. No files yet is ok
+    if path_watch is not None:
+        return (), is_fail_fast, d_options
+    else:  # pragma: no cover
+        pass
+
+    # Explicit files. No folder search
+    for path_yaml in _iter_explicit(paths_explicit, pattern):
         abspath_files.append(path_yaml)
         file_count = file_count + 1
-    if file_count == 0:
+
+    for path_dir in paths_dir:
+        for path_yaml in api.iter_yamls(
+            path_dir,
+            ignore_dirs=ignore_dirs,
+            excludes=excludes,
+        ):
+            abspath_files.append(path_yaml)
+            file_count = file_count + 1
+    is_files_only = not bool(paths_dir) and all(
+        path_f.is_file() for path_f in paths_explicit
+    )
+    if file_count == 0 and is_files_only:
+        # Only existing files given, e.g. by pre-commit. None are
+        # logging.config yaml files matching category, genre, or flavor.
+        # Nothing to validate
+        sys.exit(0)
+    elif file_count == 0:
         sys.exit(10)
     else:  # pragma: no cover
         pass
 
-    return tuple(abspath_files), is_fail_fast
+    # Same file given more than once. Validate once, keep first position
+    t_files = tuple(dict.fromkeys(abspath_files))
 
+    return t_files, is_fail_fast, d_options
 
-def main() -> None:
-    """Validate yaml files, provide useful readable feedback"""
-    paths_file, is_fail_fast = _process_args()
-    count_total = len(paths_file)
-    count_succeed = 0
-    count_fail = 0
-    current_idx = 0
-    file_last = None
-    errors = []
-    for idx, path_file in enumerate(paths_file):
-        current_idx = idx
-        file_last = str(path_file)
-
-        # Check file is simple ``ASCII text``
-        # file --brief str(path_file)
-        pass
 
-        yaml_snippet = path_file.read_text()
+def _read_files_from(str_files_from):
+    """Read file paths. One per line or null delimited
 
-        try:
-            validate_yaml_dirty(yaml_snippet)
-        except YAMLValidationError as exc:
-            count_fail = count_fail + 1
-            exc_text = exc.context
-            problem = exc.problem
-            string_mark_problem_mark = exc.problem_mark
-            str_problem_mark = str(string_mark_problem_mark)
-            t_err = (
-                f"file: {file_last}",
-                exc_text,
-                problem,
-                str_problem_mark,
-            )
-            errors.append("\n".join(list(t_err)))
+    :param str_files_from: file path. ``-`` for stdin
+    :type str_files_from: str
+    :returns: file paths. None if unreadable
+    :rtype: list[pathlib.Path] | None
+    """
+    try:
+        if str_files_from == "-":
+            str_contents = sys.stdin.read()
         else:
-            count_succeed = count_succeed + 1
-        if is_fail_fast and bool(errors):
-            break
+            str_contents = Path(str_files_from).read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if "\0" in str_contents:
+        lines = str_contents.split("\0")
+    else:
+        lines = str_contents.splitlines()
+
+    ret = [Path(line) for line in lines if bool(line.strip())]
+
+    return ret
+
+
+def _iter_explicit(paths, pattern):
+    """Filter explicit file paths. Files matching pattern, that exist
+
+    :param paths: file paths. Relative to current working directory or absolute
+    :type paths: collections.abc.Iterable[pathlib.Path]
+    :param pattern: file name glob pattern
+    :type pattern: str
+    :returns: file absolute paths
+    :rtype: collections.abc.Iterator[pathlib.Path]
+    """
+    for path_f in paths:
+        if path_f.match(pattern) and path_f.is_file():
+            yield path_f.resolve()
         else:  # pragma: no cover continue
             pass
 
-    # Write the report
+
+def _validate_file(path_file):
+    """Validate one file. Within a worker process, so must be picklable
+
+    :param path_file: logging.config yaml file absolute path
+    :type path_file: pathlib.Path
+    :returns:
+
+       Result record. Keys: path, status (``ok`` or ``fail``), context,
+       problem, mark, bytes, ms (validation time in milliseconds),
+       engine (what answered), and cached (engine is a cache)
+
+    :rtype: dict[str, typing.Any]
+    """
+    # Check file is simple ``ASCII text``
+    # file --brief str(path_file)
+    pass
+
+    yaml_snippet = path_file.read_text()
+    ret = _validate_str(yaml_snippet, str(path_file), size=path_file.stat().st_size)
+
+    return ret
+
+
+def _validate_str(yaml_snippet, str_path, size=None):
+    """Validate logging.config yaml str, e.g. an unsaved editor buffer
+
+    :param yaml_snippet: logging.config yaml str
+    :type yaml_snippet: str
+    :param str_path: file path or name. Only for the report
+    :type str_path: str
+    :param size: Default None. Byte count. None, byte count of utf-8 encoded str
+    :type size: int | None
+    :returns: Result record. Same as :py:func:`_validate_file`
+    :rtype: dict[str, typing.Any]
+    """
+    if size is None:
+        size = len(yaml_snippet.encode("utf-8"))
+    else:  # pragma: no cover
+        pass
+
+    d_result = {
+        "path": str_path,
+        "status": STATUS_OK,
+        "context": None,
+        "problem": None,
+        "mark": None,
+        "bytes": size,
+        "ms": 0.0,
+        "engine": ENGINE_STRICTYAML,
+        "cached": False,
+    }
+    start = time.perf_counter()
+    try:
+        _, engine = _validate_yaml_engine(yaml_snippet)
+    except YAMLValidationError as exc:
+        d_result["status"] = STATUS_FAIL
+        d_result["context"] = exc.context
+        d_result["problem"] = exc.problem
+        d_result["mark"] = str(exc.problem_mark)
+    else:
+        # A cache hit ms is not the cost of validating
+        d_result["engine"] = engine
+        d_result["cached"] = engine in (ENGINE_MEMORY, ENGINE_DISK)
+    seconds = time.perf_counter() - start
+    d_result["ms"] = round(seconds * 1_000, 3)
+
+    return d_result
+
+
+def _is_fail(d_result):
+    """Check result record is a failure
+
+    :param d_result: result record
+    :type d_result: dict[str, typing.Any]
+    :returns: True if file is not valid
+    :rtype: bool
+    """
+    ret = d_result.get("status", None) != STATUS_OK
+
+    return ret
+
+
+def _format_error(d_result):
+    """Human readable error message
+
+    :param d_result: result record
+    :type d_result: dict[str, typing.Any]
+    :returns: None if valid otherwise error message
+    :rtype: str | None
+    """
+    if _is_fail(d_result):
+        t_err = (
+            f"file: {d_result['path']!s}",
+            d_result["context"],
+            d_result["problem"],
+            d_result["mark"],
+        )
+        ret = "\n".join(list(t_err))
+    else:
+        ret = None
+
+    return ret
+
+
+def _iter_results(paths_file, is_fail_fast, jobs):
+    """Validate files. Yield each result as soon as it finishes. So
+    order is completion order, not file order
+
+    With fail fast, once a file fails, cancel files after it. Files
+    before it still complete, so the first failure, in file order, is
+    known
+
+    :param paths_file: logging.config yaml files absolute paths
+    :type paths_file: tuple[pathlib.Path, ...]
+    :param is_fail_fast: True stop on first failure
+    :type is_fail_fast: bool
+    :param jobs: worker process count. 1 validates within this process
+    :type jobs: int
+    :returns: file index and result record
+    :rtype: collections.abc.Iterator[tuple[int, dict[str, typing.Any]]]
+    """
+    file_count = len(paths_file)
+    if jobs <= 1 or file_count <= 1:
+        for idx, path_file in enumerate(paths_file):
+            d_result = _validate_file(path_file)
+            yield idx, d_result
+            if is_fail_fast and _is_fail(d_result):
+                break
+            else:  # pragma: no cover continue
+                pass
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, file_count)) as executor:
+            d_futures = {
+                executor.submit(_validate_file, path_file): idx
+                for idx, path_file in enumerate(paths_file)
+            }
+            idx_fail = None
+            for future in as_completed(d_futures):
+                if future.cancelled():
+                    continue
+                idx = d_futures[future]
+                d_result = future.result()
+                yield idx, d_result
+                is_earliest = idx_fail is None or idx < idx_fail
+                if is_fail_fast and _is_fail(d_result) and is_earliest:
+                    idx_fail = idx
+                    for future_other, idx_other in d_futures.items():
+                        if idx_other > idx_fail:
+                            future_other.cancel()
+                        else:  # pragma: no cover continue
+                            pass
+                else:  # pragma: no cover continue
+                    pass
+
+
+def _get_schema_version():
+    """Identifies the logging.config schema, and the engines validating
+    against it. For the incremental manifest.
+
+    A schema repr omits defaults and value validators. Instead hash
+    the source of the modules defining the schema and the fast engine,
+    and the strictyaml version. Modules are found, not imported
+
+    :returns: sha256 hex digest
+    :rtype: str
+    """
+    sha256 = hashlib.sha256()
+    for mod_name in SCHEMA_MODULES:
+        spec = importlib.util.find_spec(mod_name)
+        try:
+            sha256.update(Path(spec.origin).read_bytes())
+        except (AttributeError, OSError, TypeError):
+            # e.g. frozen. Package version, in manifest versions, must do
+            sha256.update(mod_name.encode("utf-8"))
+        sha256.update(b"\0")
+    try:
+        strictyaml_version = metadata.version("strictyaml")
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        strictyaml_version = ""
+    sha256.update(strictyaml_version.encode("utf-8"))
+    ret = sha256.hexdigest()
+
+    return ret
+
+
+def _collect_results(paths_file, is_fail_fast, d_options, on_result=None):
+    """Validate files. With incremental, unchanged files results come
+    from the manifest and only changed files are validated
+
+    :param paths_file: logging.config yaml files absolute paths
+    :type paths_file: tuple[pathlib.Path, ...]
+    :param is_fail_fast: True stop on first failure
+    :type is_fail_fast: bool
+    :param d_options: other options. jobs, incremental, and cache_file
+    :type d_options: dict[str, typing.Any]
+    :param on_result:
+
+       Default None. Called with file index and result record, as soon
+       as each file finishes
+
+    :type on_result: collections.abc.Callable[[int, dict[str, typing.Any]], None] | None
+    :returns: result record by file index, of completed files
+    :rtype: dict[int, dict[str, typing.Any]]
+    """
+    jobs = d_options.get("jobs", 1)
+    is_incremental = d_options.get("incremental", False)
+
+    d_results = {}
+
+    def add_result(idx, d_result):
+        """Store result and notify"""
+        d_results[idx] = d_result
+        if on_result is not None:
+            on_result(idx, d_result)
+        else:  # pragma: no cover
+            pass
+
+    d_digests = {}
+    idxs_todo = []
+    if is_incremental:
+        manifest = ValidationManifest(
+            d_options.get("cache_file", None),
+            schema_version=_get_schema_version(),
+        )
+        manifest.load()
+        for idx, path_file in enumerate(paths_file):
+            digest = manifest.get_digest(path_file)
+            d_digests[idx] = digest
+            is_hit, d_result = manifest.lookup(path_file, digest)
+            if is_hit and isinstance(d_result, dict):
+                d_result = {
+                    **d_result,
+                    "path": str(path_file),
+                    "engine": ENGINE_MANIFEST,
+                    "cached": True,
+                }
+                add_result(idx, d_result)
+            else:
+                idxs_todo.append(idx)
+
+        # fail fast. Files after a known failure need not be validated
+        idxs_fail = [idx for idx, d_result in d_results.items() if _is_fail(d_result)]
+        if is_fail_fast and bool(idxs_fail):
+            idx_stop = min(idxs_fail)
+            idxs_todo = [idx for idx in idxs_todo if idx < idx_stop]
+        else:  # pragma: no cover
+            pass
+    else:
+        manifest = None
+        idxs_todo = list(range(len(paths_file)))
+
+    paths_todo = tuple(paths_file[idx] for idx in idxs_todo)
+    for idx_todo, d_result in _iter_results(paths_todo, is_fail_fast, jobs):
+        idx = idxs_todo[idx_todo]
+        if manifest is not None:
+            manifest.record(paths_file[idx], d_digests[idx], d_result)
+        else:  # pragma: no cover
+            pass
+        add_result(idx, d_result)
+
+    if manifest is not None:
+        manifest.save()
+    else:  # pragma: no cover
+        pass
+
+    return d_results
+
+
+def _print_jsonl(d_record):
+    """Write one JSON Lines record to stdout. Flushed, so a reader
+    sees each record as soon as it is written
+
+    :param d_record: record
+    :type d_record: dict[str, typing.Any]
+    """
+    print(json.dumps(d_record), flush=True)
+
+
+def _build_report(paths_file, d_results, is_fail_fast, seconds):
+    """Deterministic report. Regardless of completion order
+
+    :param paths_file: logging.config yaml files absolute paths
+    :type paths_file: tuple[pathlib.Path | str, ...]
+    :param d_results: result record by file index, of completed files
+    :type d_results: dict[int, dict[str, typing.Any]]
+    :param is_fail_fast: True stop on first failure
+    :type is_fail_fast: bool
+    :param seconds: elapsed time
+    :type seconds: float
+    :returns: summary record and human readable report
+    :rtype: tuple[dict[str, typing.Any], str]
+    """
+    count_total = len(paths_file)
+    idxs_fail = [idx for idx, d_result in d_results.items() if _is_fail(d_result)]
+    if is_fail_fast and bool(idxs_fail):
+        # As if validated one by one. Stop at first failure
+        idxs_report = list(range(min(idxs_fail) + 1))
+    else:
+        idxs_report = sorted(d_results.keys())
+    errors = [
+        _format_error(d_results[idx]) for idx in idxs_report if _is_fail(d_results[idx])
+    ]
+    count_fail = len(errors)
+    count_succeed = len(idxs_report) - count_fail
+    if bool(idxs_report):
+        current_idx = idxs_report[-1]
+        file_last = str(paths_file[current_idx])
+    else:  # pragma: no cover
+        current_idx = 0
+        file_last = None
+
     count_processed = count_succeed + count_fail
+    d_summary = {
+        "type": "summary",
+        "processed": count_processed,
+        "total": count_total,
+        "succeed": count_succeed,
+        "fail": count_fail,
+        "last_index": current_idx,
+        "last": file_last,
+        "ms": round(seconds * 1_000, 3),
+    }
     report = (
         f"Processed: {count_processed} / {count_total}\n"
         f"Success / fail: {count_succeed} / {count_fail}\n"
         f"last ({current_idx!s}): {file_last}"
     )
     str_err = "\n".join(errors)
-    print(f"{report}\n{str_err}", file=sys.stderr)
+    ret = (d_summary, f"{report}\n{str_err}")
+
+    return ret
+
+
+def _scan(path_dir, pattern, excludes=None, ignore_dirs=None):
+    """Files matching pattern, with what identifies a change
+
+    :param path_dir: folder. Searched recursively
+    :type path_dir: pathlib.Path
+    :param pattern: file name glob pattern
+    :type pattern: str
+    :param excludes: Default None. ``.gitignore`` style rules
+    :type excludes: logging_strict.util.file_walk.ExcludeRules | None
+    :param ignore_dirs:
+
+       Default None. Folder names never descended into. None for
+       :py:data:`logging_strict.util.file_walk.IGNORE_DIRS`
+
+    :type ignore_dirs: collections.abc.Container[str] | None
+    :returns: modification time (ns) and size by file absolute path
+    :rtype: dict[pathlib.Path, tuple[int, int]]
+    """
+    d_stamps = {}
+    for path_f in iter_files(
+        path_dir,
+        pattern,
+        ignore_dirs=ignore_dirs,
+        excludes=excludes,
+    ):
+        try:
+            stat_result = path_f.stat()
+        except OSError:
+            # Removed since listed
+            continue
+        d_stamps[path_f] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+    return d_stamps
+
+
+def _watch(path_dir, d_options, max_polls=None):
+    """Validate new or changed files, until interrupted. The process
+    stays up, so strictyaml, schema, and validation caches stay warm
+
+    :param path_dir: folder to watch. Searched recursively
+    :type path_dir: pathlib.Path
+    :param d_options: other options. pattern, excludes, ignore_dirs, interval, jobs, and format
+    :type d_options: dict[str, typing.Any]
+    :param max_polls: Default None. Stop after this many polls. None forever
+    :type max_polls: int | None
+    """
+    pattern = d_options.get("pattern", "*")
+    excludes = d_options.get("excludes", None)
+    ignore_dirs = d_options.get("ignore_dirs", None)
+    interval = d_options.get("interval", WATCH_INTERVAL)
+    jobs = d_options.get("jobs", 1)
+    is_jsonl = d_options.get("format", FORMAT_TEXT) == FORMAT_JSONL
+
+    d_stamps = {}
+    d_fails = {}
+    count_polls = 0
+    while max_polls is None or count_polls < max_polls:
+        if count_polls != 0:
+            time.sleep(interval)
+        else:  # pragma: no cover
+            pass
+        count_polls += 1
+
+        d_stamps_new = _scan(
+            path_dir,
+            pattern,
+            excludes=excludes,
+            ignore_dirs=ignore_dirs,
+        )
+        paths_changed = tuple(
+            path_f
+            for path_f, stamp in sorted(d_stamps_new.items())
+            if d_stamps.get(path_f, None) != stamp
+        )
+        paths_removed = [path_f for path_f in d_stamps if path_f not in d_stamps_new]
+        d_stamps = d_stamps_new
+        if not bool(paths_changed) and not bool(paths_removed):
+            continue
+        else:  # pragma: no cover
+            pass
+
+        for path_f in paths_removed:
+            d_fails.pop(path_f, None)
+            if is_jsonl:
+                _print_jsonl({"type": "removed", "path": str(path_f)})
+            else:
+                print(f"removed: {path_f!s}", file=sys.stderr)
+
+        paths_done = set()
+        try:
+            for idx, d_result in _iter_results(paths_changed, False, jobs):
+                path_f = paths_changed[idx]
+                paths_done.add(path_f)
+                if _is_fail(d_result):
+                    d_fails[path_f] = d_result
+                else:
+                    d_fails.pop(path_f, None)
+                if is_jsonl:
+                    _print_jsonl({"type": "file", **d_result})
+                elif _is_fail(d_result):
+                    print(_format_error(d_result), file=sys.stderr)
+                else:
+                    print(f"ok: {path_f!s}", file=sys.stderr)
+        except OSError:
+            # Removed or unreadable mid-edit. Retry those not done next poll
+            for path_f in paths_changed:
+                if path_f not in paths_done:
+                    d_stamps.pop(path_f, None)
+                else:  # pragma: no cover continue
+                    pass
+
+        # State of all watched files
+        count_total = len(d_stamps_new)
+        count_fail = len(d_fails)
+        if is_jsonl:
+            d_summary = {
+                "type": "summary",
+                "total": count_total,
+                "succeed": count_total - count_fail,
+                "fail": count_fail,
+            }
+            _print_jsonl(d_summary)
+        else:
+            print(
+                f"Watching: {count_total}\n"
+                f"Success / fail: {count_total - count_fail} / {count_fail}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+
+def main() -> None:
+    """Validate yaml files, provide useful readable feedback"""
+    paths_file, is_fail_fast, d_options = _process_args()
+    path_watch = d_options.get("watch", None)
+    if path_watch is not None:
+        try:
+            _watch(path_watch, d_options)
+        except KeyboardInterrupt:  # pragma: no cover
+            pass
+        return
+    else:  # pragma: no cover
+        pass
+
+    is_jsonl = d_options.get("format", FORMAT_TEXT) == FORMAT_JSONL
+
+    if is_jsonl:
+
+        def on_result(idx, d_result):
+            """Stream each file record. Completion order"""
+            _print_jsonl({"type": "file", "index": idx, **d_result})
+
+    else:
+        on_result = None
+
+    start = time.perf_counter()
+    d_results = _collect_results(
+        paths_file,
+        is_fail_fast,
+        d_options,
+        on_result=on_result,
+    )
+    seconds = time.perf_counter() - start
+
+    d_summary, report = _build_report(paths_file, d_results, is_fail_fast, seconds)
+
+    # Write the report
+    if is_jsonl:
+        _print_jsonl(d_summary)
+    else:
+        print(report, file=sys.stderr)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,4 +1,64 @@
+from collections.abc import (
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+)
 from pathlib import Path
+from typing import (
+    Any,
+    Final,
+)
 
-def _process_args() -> tuple[tuple[Path, ...], bool]: ...
+from .util.file_walk import ExcludeRules
+
+STATUS_OK: Final[str]
+STATUS_FAIL: Final[str]
+FORMAT_TEXT: Final[str]
+FORMAT_JSONL: Final[str]
+WATCH_INTERVAL: Final[float]
+ENGINE_MANIFEST: Final[str]
+SCHEMA_MODULES: Final[tuple[str, ...]]
+
+def _process_args() -> tuple[tuple[Path, ...], bool, dict[str, Any]]: ...
+def _read_files_from(str_files_from: str) -> list[Path] | None: ...
+def _iter_explicit(paths: Iterable[Path], pattern: str) -> Iterator[Path]: ...
+def _validate_file(path_file: Path) -> dict[str, Any]: ...
+def _validate_str(
+    yaml_snippet: str,
+    str_path: str,
+    size: int | None = None,
+) -> dict[str, Any]: ...
+def _is_fail(d_result: dict[str, Any]) -> bool: ...
+def _format_error(d_result: dict[str, Any]) -> str | None: ...
+def _iter_results(
+    paths_file: tuple[Path, ...],
+    is_fail_fast: bool,
+    jobs: int,
+) -> Iterator[tuple[int, dict[str, Any]]]: ...
+def _get_schema_version() -> str: ...
+def _collect_results(
+    paths_file: tuple[Path, ...],
+    is_fail_fast: bool,
+    d_options: dict[str, Any],
+    on_result: Callable[[int, dict[str, Any]], None] | None = None,
+) -> dict[int, dict[str, Any]]: ...
+def _print_jsonl(d_record: dict[str, Any]) -> None: ...
+def _build_report(
+    paths_file: tuple[Path | str, ...],
+    d_results: dict[int, dict[str, Any]],
+    is_fail_fast: bool,
+    seconds: float,
+) -> tuple[dict[str, Any], str]: ...
+def _scan(
+    path_dir: Path,
+    pattern: str,
+    excludes: ExcludeRules | None = None,
+    ignore_dirs: Container[str] | None = None,
+) -> dict[Path, tuple[int, int]]: ...
+def _watch(
+    path_dir: Path,
+    d_options: dict[str, Any],
+    max_polls: int | None = None,
+) -> None: ...
 def main() -> None: ...
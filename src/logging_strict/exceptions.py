@@ -29,13 +29,7 @@ Usage
 
 """
 
-try:
-    from importlib_metadata import PackageNotFoundError
-except ImportError:  # pragma: no cover
-    # What CPython provides likely very dated
-    from importlib.metadata import PackageNotFoundError
-
-__all__ = (
+__all__ = (  # noqa: F822 PackageNotFoundError is lazy
     "LoggingStrictError",
     "LoggingStrictPackageNameRequired",
     "LoggingStrictPackageStartFolderNameRequired",
@@ -45,6 +39,44 @@ __all__ = (
 )
 
 
+def __getattr__(name):
+    """PEP 562. Imports importlib_metadata only once
+    :py:exc:`PackageNotFoundError` is needed, not on package import
+
+    :param name: module attribute name
+    :type name: str
+    :returns: exception class
+    :rtype: type[ModuleNotFoundError]
+    :raises:
+
+       - :py:exc:`AttributeError` -- Not a module attribute
+
+    """
+    if name != "PackageNotFoundError":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:  # pragma: no cover
+        pass
+
+    try:
+        from importlib_metadata import PackageNotFoundError
+    except ImportError:  # pragma: no cover
+        # What CPython provides likely very dated
+        from importlib.metadata import PackageNotFoundError
+
+    globals()[name] = PackageNotFoundError
+
+    return PackageNotFoundError
+
+
+def __dir__():
+    """PEP 562. Include PackageNotFoundError not yet imported
+
+    :returns: module attribute names
+    :rtype: list[str]
+    """
+    return sorted(set(globals().keys()) | {"PackageNotFoundError"})
+
+
 class LoggingStrictError(ValueError):
     """Catchall back exception
 
@@ -26,12 +26,9 @@ logging output, including it along with the worker output.
 
 """
 
-import threading
 from functools import partial
 from typing import TYPE_CHECKING
 
-import strictyaml as s
-
 from .constants import (
     LoggingConfigCategory,
     g_app_name,
@@ -43,11 +40,13 @@ from .exceptions import (
     LoggingStrictProcessCategoryRequired,
     PackageNotFoundError,
 )
+from .logging_state import LoggingState
 from .logging_yaml_abc import (
     VERSION_FALLBACK,
     YAML_LOGGING_CONFIG_SUFFIX,
     LoggingYamlType,
-    after_as_str_update_package_name,
+    ValidatedLoggingConfig,
+    as_validated,
 )
 from .util.check_type import (
     is_not_ok,
@@ -74,6 +73,8 @@ except ImportError:  # pragma: no cover
 __all__ = (
     "LoggingConfigYaml",
     "LoggingState",
+    "get_in_memory",
+    "set_in_memory",
     "setup_ui_other",
     "setup_worker_other",
     "ui_yaml_curated",
@@ -81,6 +82,50 @@ __all__ = (
 )
 
 
+#: bool: Default False. Process wide default of ``is_in_memory``
+_is_in_memory = False
+
+
+def set_in_memory(is_in_memory):
+    """Process wide, choose whether :py:mod:`logging.config` yaml files
+    are read directly from package data, rather than extracted. For
+    read-only or ephemeral home folders
+
+    Per call, pass ``is_in_memory`` to override
+
+    :param is_in_memory: True read from package data. False extract
+    :type is_in_memory: bool
+    """
+    global _is_in_memory
+
+    _is_in_memory = is_in_memory is True
+
+
+def get_in_memory():
+    """Process wide default of ``is_in_memory``
+
+    :returns: True if yaml files are read from package data, not extracted
+    :rtype: bool
+    """
+    return _is_in_memory
+
+
+def _resolve_in_memory(is_in_memory):
+    """Per call choice, else the process wide default
+
+    :param is_in_memory: None uses :py:func:`get_in_memory`
+    :type is_in_memory: bool | None
+    :returns: True read from package data. False extract
+    :rtype: bool
+    """
+    if is_in_memory is None:
+        ret = _is_in_memory
+    else:
+        ret = is_in_memory is True
+
+    return ret
+
+
 def cb_true(x):
     """A Callback which always returns ``True``
 
@@ -183,6 +228,11 @@ class LoggingConfigYaml(LoggingYamlType):
           **Not** the version of the yaml spec. Don't confuse the two.
 
     :vartype version_no: typing.Any | None
+    :ivar path_dest_folder:
+
+       Default None. Extraction folder. None uses the XDG user data folder
+
+    :vartype path_dest_folder: pathlib.Path | None
     :raises:
 
        - :py:exc:`logging_strict.exceptions.LoggingStrictPackageNameRequired`
@@ -203,6 +253,7 @@ class LoggingConfigYaml(LoggingYamlType):
         genre=None,
         flavor=None,
         version_no=VERSION_FALLBACK,
+        path_dest_folder=None,
     ):
         """Class constructor"""
         super().__init__()
@@ -250,6 +301,8 @@ class LoggingConfigYaml(LoggingYamlType):
 
         self.version = version_no
 
+        self._path_dest_folder = path_dest_folder
+
     @property
     def file_stem(self):
         """file stem consists of slugs seperated by underscore
@@ -456,28 +509,33 @@ class LoggingConfigYaml(LoggingYamlType):
 
     @property
     def dest_folder(self):
-        """Normally xdg user data dir. During testing, temp folder used instead
+        """Normally xdg user data dir. Unless an extraction folder was provided
 
         :returns: Destination folder
         :rtype: pathlib.Path
         """
-        return _get_path_config(self.package)
+        if self._path_dest_folder is None:
+            ret = _get_path_config(self.package)
+        else:
+            ret = self._path_dest_folder
 
-    def extract(self, path_relative_package_dir=""):
-        """folder of yaml file is unknown, find the file
+        return ret
+
+    def _find(self, path_relative_package_dir):
+        """Find the one package data folder containing the
+        :py:mod:`logging.config` yaml file
 
         :param path_relative_package_dir:
 
-           Default empty string which means search the entire package.
-           Specifying a start folder narrows the search
+           Empty string means search the entire package. Specifying a
+           start folder narrows the search
 
         :type path_relative_package_dir: pathlib.Path | str | None
-        :returns: Relative path, within package, to ``*.*.logging.config.yaml``
-        :rtype: str
-
+        :returns: package resource, folders found, suffix and stem filters
+        :rtype: tuple[logging_strict.util.package_resource.PackageResource, list[importlib.resources.abc.Traversable], logging_strict.util.package_resource.PartSuffix, logging_strict.util.package_resource.PartStem]
         :raises:
 
-           - :py:exc:`ImportError` -- Cannot extract files. Install package then try again
+           - :py:exc:`ImportError` -- Package not installed
            - :py:exc:`AssertionError` -- Expecting one yaml file, many found
            - :py:exc:`FileNotFoundError` -- No yaml files found
 
@@ -552,14 +610,34 @@ class LoggingConfigYaml(LoggingYamlType):
             raise FileNotFoundError(msg_err)
         else:  # pragma: no cover
             pass
-        gen = pr.package_data_folders(
-            cb_suffix=cb_suffix,
-            cb_file_stem=cb_file_stem,
-            path_relative_package_dir=path_relative_package_dir,
-        )
+
+        t_ret = (pr, folders, cb_suffix, cb_file_stem)
+
+        return t_ret
+
+    def extract(self, path_relative_package_dir=""):
+        """folder of yaml file is unknown, find the file
+
+        :param path_relative_package_dir:
+
+           Default empty string which means search the entire package.
+           Specifying a start folder narrows the search
+
+        :type path_relative_package_dir: pathlib.Path | str | None
+        :returns: Relative path, within package, to ``*.*.logging.config.yaml``
+        :rtype: str
+
+        :raises:
+
+           - :py:exc:`ImportError` -- Cannot extract files. Install package then try again
+           - :py:exc:`AssertionError` -- Expecting one yaml file, many found
+           - :py:exc:`FileNotFoundError` -- No yaml files found
+
+        """
+        pr, folders, cb_suffix, cb_file_stem = self._find(path_relative_package_dir)
         path_ret = next(
             pr.resource_extract(
-                gen,
+                iter(folders),
                 self.dest_folder,
                 cb_suffix=cb_suffix,
                 cb_file_stem=cb_file_stem,
@@ -571,6 +649,79 @@ class LoggingConfigYaml(LoggingYamlType):
 
         return str_ret
 
+    def read_text(self, path_relative_package_dir=""):
+        """Zero extraction. Read the yaml file from within the package.
+        Nothing is written to, nor read from, the destination folder
+
+        Same search as
+        :py:meth:`LoggingConfigYaml.extract <logging_strict.logging_api.LoggingConfigYaml.extract>`
+
+        :param path_relative_package_dir:
+
+           Default empty string which means search the entire package.
+           Specifying a start folder narrows the search
+
+        :type path_relative_package_dir: pathlib.Path | str | None
+        :returns:
+
+           Relative path, within package data folder, to
+           ``*.*.logging.config.yaml`` and the yaml str. Not validated
+
+        :rtype: tuple[str, str]
+        :raises:
+
+           - :py:exc:`ImportError` -- Package not installed
+           - :py:exc:`AssertionError` -- Expecting one yaml file, many found
+           - :py:exc:`FileNotFoundError` -- No yaml files found
+
+        """
+        pr, _, cb_suffix, cb_file_stem = self._find(path_relative_package_dir)
+        f_relpath, traversable_f = next(
+            pr.iter_data_files(
+                cb_suffix=cb_suffix,
+                cb_file_stem=cb_file_stem,
+                path_relative_package_dir=path_relative_package_dir,
+            )
+        )
+        str_yaml = traversable_f.read_text(encoding="utf-8")
+        t_ret = (f_relpath, str_yaml)
+
+        return t_ret
+
+    def as_validated(self):
+        """Read the YAML config file, from the extraction folder, and
+        validate it
+
+        :returns: validated logging config. Pass ``.text`` to each worker
+        :rtype: logging_strict.logging_yaml_abc.ValidatedLoggingConfig
+        :raises:
+
+           - :py:exc:`strictyaml.exceptions.YAMLValidationError` -- Invalid.
+             Validation against logging.config schema failed
+
+           - :py:exc:`FileNotFoundError` -- Could not find logging config YAML file
+
+           - :py:exc:`~logging_strict.exceptions.LoggingStrictGenreRequired` --
+             Genre required to get file name
+
+        """
+        if self._path_dest_folder is None:
+            ret = super().as_validated()
+        else:
+            try:
+                self.file_stem
+            except LoggingStrictGenreRequired as e:
+                msg_exc = "Without genre, cannot retrieve logging.config yaml file"
+                raise LoggingStrictGenreRequired(msg_exc) from e
+
+            ret = as_validated(
+                self.package,
+                self.file_name,
+                path_dest_folder=self._path_dest_folder,
+            )
+
+        return ret
+
 
 def setup_ui_other(
     package_name,
@@ -580,6 +731,9 @@ def setup_ui_other(
     version_no=VERSION_FALLBACK,
     package_start_relative_folder="",
     logger_package_name=None,
+    path_dest_folder=None,
+    is_skip_setup=False,
+    is_in_memory=None,
 ):
     """Before creating an App instance, seemlessly extracts
     :py:mod:`logging.config` yaml file for app, but not worker(s)
@@ -627,6 +781,24 @@ def setup_ui_other(
        Will always want to do this
 
     :type logger_package_name: str | None
+    :param path_dest_folder:
+
+       Default None. Extraction folder. None uses the XDG user data folder
+
+    :type path_dest_folder: pathlib.Path | None
+    :param is_skip_setup:
+
+       Default False. True extracts and validates, but does not apply
+       the :py:mod:`logging.config`. Logging setup can raise errors,
+       such as ModuleNotFoundError
+
+    :type is_skip_setup: bool
+    :param is_in_memory:
+
+       Default None. True reads the yaml file from package data. Nothing
+       is extracted. None uses :py:func:`get_in_memory`
+
+    :type is_in_memory: bool | None
     :returns: relative path to validated logging config YAML file and the yaml str
     :rtype: tuple[str, str]
 
@@ -656,6 +828,7 @@ def setup_ui_other(
             genre=genre,
             flavor=flavor,
             version_no=version_no,
+            path_dest_folder=path_dest_folder,
         )
     except (
         LoggingStrictPackageNameRequired,
@@ -663,32 +836,50 @@ def setup_ui_other(
     ):
         raise
 
-    # extract package resource
-    try:
-        f_relpath = ui_yaml.extract(
-            path_relative_package_dir=package_start_relative_folder
-        )
-    except ImportError:
-        raise
-    except (FileNotFoundError, AssertionError):
-        raise
+    # runtime validate. Only time the yaml is parsed and validated
+    import strictyaml as s
 
-    # runtime validate
-    try:
-        str_yaml_raw = ui_yaml.as_str()
-    except (FileNotFoundError, s.YAMLValidationError):
-        raise
+    if _resolve_in_memory(is_in_memory):
+        # read package resource. Zero extraction
+        try:
+            f_relpath, str_yaml = ui_yaml.read_text(
+                path_relative_package_dir=package_start_relative_folder
+            )
+        except ImportError:
+            raise
+        except (FileNotFoundError, AssertionError):
+            raise
 
-    str_yaml = after_as_str_update_package_name(
-        str_yaml_raw,
-        logger_package_name=logger_package_name,
-    )
+        try:
+            config_raw = ValidatedLoggingConfig.from_str(str_yaml)
+        except s.YAMLValidationError:
+            raise
+    else:
+        # extract package resource
+        try:
+            f_relpath = ui_yaml.extract(
+                path_relative_package_dir=package_start_relative_folder
+            )
+        except ImportError:
+            raise
+        except (FileNotFoundError, AssertionError):
+            raise
 
-    # LoggingConfigYaml.setup is a wrapper of setup_logging_yaml
-    # Checks: is_ok
-    ui_yaml.setup(str_yaml_raw, package_name=logger_package_name)
+        try:
+            config_raw = ui_yaml.as_validated()
+        except (FileNotFoundError, s.YAMLValidationError):
+            raise
 
-    t_ret = (f_relpath, str_yaml)
+    # validation already occurred. Replace logger package name w/o reparsing
+    config = config_raw.with_logger_package_name(logger_package_name)
+
+    if not is_skip_setup:
+        # LoggingConfigYaml.setup is a wrapper of setup_logging_yaml
+        ui_yaml.setup(config)
+    else:  # pragma: no cover
+        pass
+
+    t_ret = (f_relpath, config.text)
 
     return t_ret
 
@@ -699,6 +890,7 @@ def ui_yaml_curated(
     version_no=VERSION_FALLBACK,
     package_start_relative_folder="",
     logger_package_name=None,
+    is_in_memory=None,
 ):
     """Curated within |project_name| So do not have to provide package
     and package base data folder name
@@ -732,6 +924,12 @@ def ui_yaml_curated(
        Always desirable.
 
     :type logger_package_name: str | None
+    :param is_in_memory:
+
+       Default None. True reads the yaml file from package data. Nothing
+       is extracted. None uses :py:func:`get_in_memory`
+
+    :type is_in_memory: bool | None
     :returns:
 
         relative destination path to validated logging config YAML file and the yaml str
@@ -748,6 +946,7 @@ def ui_yaml_curated(
         version_no=version_no,
         package_start_relative_folder=package_start_relative_folder,
         logger_package_name=logger_package_name,
+        is_in_memory=is_in_memory,
     )
 
     return t_ret
@@ -759,6 +958,7 @@ def worker_yaml_curated(
     version_no=VERSION_FALLBACK,
     package_start_relative_folder="",
     logger_package_name=None,
+    is_in_memory=None,
 ):
     """For multiprocessing workers, retrieve the yaml in this order:
 
@@ -809,6 +1009,12 @@ def worker_yaml_curated(
        Set logger to the intended package name. Default None which leaves as-is
 
     :type logger_package_name: str | None
+    :param is_in_memory:
+
+       Default None. True reads the yaml file from package data. Nothing
+       is extracted. None uses :py:func:`get_in_memory`
+
+    :type is_in_memory: bool | None
     :returns:
 
        relative destination path to validated logging config YAML file and the yaml str
@@ -837,6 +1043,7 @@ def worker_yaml_curated(
         version_no=version_no,
         package_start_relative_folder=package_start_relative_folder,
         logger_package_name=logger_package_name,
+        is_in_memory=is_in_memory,
     )
 
     return t_ret
@@ -850,6 +1057,8 @@ def setup_worker_other(
     version_no=VERSION_FALLBACK,
     package_start_relative_folder="",
     logger_package_name=None,
+    path_dest_folder=None,
+    is_in_memory=None,
 ):
     """worker_yaml_curated grabs the logging.config yaml from logging-strict.
     Use this if located in another package
@@ -908,6 +1117,17 @@ def setup_worker_other(
        Set logger to the intended package name. Default None which leaves as-is
 
     :type logger_package_name: str | None
+    :param path_dest_folder:
+
+       Default None. Extraction folder. None uses the XDG user data folder
+
+    :type path_dest_folder: pathlib.Path | None
+    :param is_in_memory:
+
+       Default None. True reads the yaml file from package data. Nothing
+       is extracted. None uses :py:func:`get_in_memory`
+
+    :type is_in_memory: bool | None
     :returns:
 
        relative destination path to validated logging config YAML file and the yaml str
@@ -939,6 +1159,7 @@ def setup_worker_other(
             genre=genre,
             flavor=flavor,
             version_no=version_no,
+            path_dest_folder=path_dest_folder,
         )
     except (
         LoggingStrictPackageNameRequired,
@@ -946,114 +1167,43 @@ def setup_worker_other(
     ):
         raise
 
-    # extract package resource
-    try:
-        f_relpath = ui_yaml.extract(
-            path_relative_package_dir=package_start_relative_folder
-        )
-    except ImportError:
-        raise
-    except (FileNotFoundError, AssertionError):
-        raise
+    # runtime validate. Only time the yaml is parsed and validated
+    import strictyaml as s
 
-    # runtime validate
-    try:
-        str_yaml_raw = ui_yaml.as_str()
-    except (FileNotFoundError, s.YAMLValidationError):
-        raise
-
-    # validation already occurred. In yaml, replace logger package name
-    str_yaml = after_as_str_update_package_name(
-        str_yaml_raw,
-        logger_package_name=logger_package_name,
-    )
-
-    t_ret = (f_relpath, str_yaml)
-
-    return t_ret
-
-
-class LoggingState:
-    """Singleton to hold the current logging state. To know whether or
-    not, run by app or from cli.
-
-    logging is redirected to:
-
-    - If run from app --> :py:exc:`textual.logging.TextualHandler`
-
-    - If run from cli --> :py:class:`logging.StreamHandler`
-
-    Knowing the logging mode (or state), first step towards restoring logging mode.
-
-    Class variables
-
-    :cvar _instance: Default None. Holds Singleton instance
-    :type _instance: logging_strict.logging_api.LoggingState | None
-    :cvar _lock: Thread lock for Singleton
-    :type _lock: threading.RLock
-
-    .. seealso::
-
-       See :py:mod:`textual.logging`
-
-       Thread safe Singleton
-       `[blog post] <https://medium.com/analytics-vidhya/how-to-create-a-thread-safe-singleton-class-in-python-822e1170a7f6>`_
-
-    """
-
-    _instance = None
-    _lock = threading.RLock()
-
-    def __new__(cls):
-        """
-        :returns: Singleton instance
-        :rtype: ``"LoggingState"``
-        """
-        if cls._instance is None:  # pragma: no branch
-            with cls._lock:
-                if not cls._instance:  # pragma: no branch
-                    cls._instance = super().__new__(cls)
-
-        return cls._instance
-
-    @classmethod
-    def reset(cls):
-        """A cheat to reset the Singleton state. Use only during testing"""
-        if cls._instance is not None:  # pragma: no branch
-            with cls._lock:
-                if cls._instance:  # pragma: no branch
-                    cls._instance = None
-
-    @property
-    def is_state_app(self):
-        """Get logging state
-
-        :returns: ``True`` if app logging state otherwise ``False``
-        :rtype: bool | None
-        """
-        cls = type(self)
-        with cls._lock:
-            if hasattr(self, "_state"):
-                ret = self._state
-            else:
-                ret = None
-
-        return ret
+    if _resolve_in_memory(is_in_memory):
+        # read package resource. Zero extraction
+        try:
+            f_relpath, str_yaml = ui_yaml.read_text(
+                path_relative_package_dir=package_start_relative_folder
+            )
+        except ImportError:
+            raise
+        except (FileNotFoundError, AssertionError):
+            raise
 
-    @is_state_app.setter
-    def is_state_app(self, val):
-        """Would only ever be changed within a unittest or module dealing with logging
+        try:
+            config_raw = ValidatedLoggingConfig.from_str(str_yaml)
+        except s.YAMLValidationError:
+            raise
+    else:
+        # extract package resource
+        try:
+            f_relpath = ui_yaml.extract(
+                path_relative_package_dir=package_start_relative_folder
+            )
+        except ImportError:
+            raise
+        except (FileNotFoundError, AssertionError):
+            raise
 
-        - ``True`` app logging state
+        try:
+            config_raw = ui_yaml.as_validated()
+        except (FileNotFoundError, s.YAMLValidationError):
+            raise
 
-        - ``False`` cli_logging state
+    # validation already occurred. Replace logger package name w/o reparsing
+    config = config_raw.with_logger_package_name(logger_package_name)
 
-        If not a bool, logging state is not changed
+    t_ret = (f_relpath, config.text)
 
-        :param val: New logging state. ``True`` if app otherwise ``False``
-        :type val: typing.Any
-        """
-        cls = type(self)
-        with cls._lock:
-            if val is not None and isinstance(val, bool):  # pragma: no branch
-                self._state = val
+    return t_ret
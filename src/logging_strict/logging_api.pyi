@@ -1,5 +1,5 @@
-import sys
-import threading
+from collections.abc import Callable
+from importlib.abc import Traversable
 from pathlib import Path
 from typing import (
     Any,
@@ -7,22 +7,29 @@ from typing import (
 )
 
 from .constants import LoggingConfigCategory
-from .logging_yaml_abc import LoggingYamlType
-
-if sys.version_info >= (3, 11):
-    from typing import Self
-else:
-    from typing_extensions import Self
+from .logging_state import LoggingState as LoggingState
+from .logging_yaml_abc import (
+    LoggingYamlType,
+    ValidatedLoggingConfig,
+)
+from .util.package_resource import PackageResource
 
 __all__ = (
     "LoggingConfigYaml",
     "LoggingState",
+    "get_in_memory",
+    "set_in_memory",
     "setup_ui_other",
     "setup_worker_other",
     "ui_yaml_curated",
     "worker_yaml_curated",
 )
 
+_is_in_memory: bool
+
+def set_in_memory(is_in_memory: bool) -> None: ...
+def get_in_memory() -> bool: ...
+def _resolve_in_memory(is_in_memory: bool | None) -> bool: ...
 def cb_true(x: Any) -> bool: ...
 
 class LoggingConfigYaml(LoggingYamlType):
@@ -32,6 +39,7 @@ class LoggingConfigYaml(LoggingYamlType):
     _genre: str | None
     _flavor: str | None
     _version: str
+    _path_dest_folder: Path | None
 
     def __init__(
         self,
@@ -41,6 +49,7 @@ class LoggingConfigYaml(LoggingYamlType):
         genre: str | None = None,
         flavor: str | None = None,
         version_no: Any | None = ...,
+        path_dest_folder: Path | None = None,
     ) -> None: ...
     @property
     def file_stem(self) -> str: ...
@@ -64,10 +73,24 @@ class LoggingConfigYaml(LoggingYamlType):
     def package(self, val: Any) -> None: ...
     @property
     def dest_folder(self) -> Path: ...
+    def _find(
+        self,
+        path_relative_package_dir: Path | str | None,
+    ) -> tuple[
+        PackageResource,
+        list[Traversable],
+        Callable[[str], bool],
+        Callable[[str], bool],
+    ]: ...
     def extract(
         self,
         path_relative_package_dir: Path | str | None = "",
     ) -> str: ...
+    def read_text(
+        self,
+        path_relative_package_dir: Path | str | None = "",
+    ) -> tuple[str, str]: ...
+    def as_validated(self) -> ValidatedLoggingConfig: ...
 
 def setup_ui_other(
     package_name: str,
@@ -77,6 +100,9 @@ def setup_ui_other(
     version_no: Any | None = ...,
     package_start_relative_folder: Path | str | None = "",
     logger_package_name: str | None = None,
+    path_dest_folder: Path | None = None,
+    is_skip_setup: bool = False,
+    is_in_memory: bool | None = None,
 ) -> tuple[str, str]: ...
 def ui_yaml_curated(
     genre: str,
@@ -84,6 +110,7 @@ def ui_yaml_curated(
     version_no: Any | None = ...,
     package_start_relative_folder: Path | str | None = "",
     logger_package_name: str | None = None,
+    is_in_memory: bool | None = None,
 ) -> tuple[str, str]: ...
 def worker_yaml_curated(
     genre: Any | None = "mp",
@@ -91,6 +118,7 @@ def worker_yaml_curated(
     version_no: Any | None = ...,
     package_start_relative_folder: Path | str | None = "",
     logger_package_name: str | None = None,
+    is_in_memory: bool | None = None,
 ) -> tuple[str, str]: ...
 def setup_worker_other(
     package_name: str,
@@ -100,16 +128,6 @@ def setup_worker_other(
     version_no: Any | None = ...,
     package_start_relative_folder: Path | str | None = "",
     logger_package_name: str | None = None,
+    path_dest_folder: Path | None = None,
+    is_in_memory: bool | None = None,
 ) -> tuple[str, str]: ...
-
-class LoggingState:
-    _instance: ClassVar[Self | None] = None
-    _lock: ClassVar[threading.RLock] = ...
-
-    def __new__(cls) -> Self: ...
-    @classmethod
-    def reset(cls) -> None: ...
-    @property
-    def is_state_app(self) -> bool: ...
-    @is_state_app.setter
-    def is_state_app(self, val: Any) -> None: ...
@@ -0,0 +1,109 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Logging state Singleton. Whether logging is set up for the app or the
+cli. Apart from :py:mod:`logging_strict.logging_api`, so
+``from logging_strict import LoggingState`` imports neither strictyaml,
+:py:mod:`logging.config`, nor the package data machinery.
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str]
+   :value: ("LoggingState",)
+
+   Module exports
+
+**Module objects**
+
+"""
+
+import threading
+
+__all__ = ("LoggingState",)
+
+
+class LoggingState:
+    """Singleton to hold the current logging state. To know whether or
+    not, run by app or from cli.
+
+    logging is redirected to:
+
+    - If run from app --> :py:exc:`textual.logging.TextualHandler`
+
+    - If run from cli --> :py:class:`logging.StreamHandler`
+
+    Knowing the logging mode (or state), first step towards restoring logging mode.
+
+    Class variables
+
+    :cvar _instance: Default None. Holds Singleton instance
+    :type _instance: logging_strict.logging_state.LoggingState | None
+    :cvar _lock: Thread lock for Singleton
+    :type _lock: threading.RLock
+
+    .. seealso::
+
+       See :py:mod:`textual.logging`
+
+       Thread safe Singleton
+       `[blog post] <https://medium.com/analytics-vidhya/how-to-create-a-thread-safe-singleton-class-in-python-822e1170a7f6>`_
+
+    """
+
+    _instance = None
+    _lock = threading.RLock()
+
+    def __new__(cls):
+        """
+        :returns: Singleton instance
+        :rtype: ``"LoggingState"``
+        """
+        if cls._instance is None:  # pragma: no branch
+            with cls._lock:
+                if not cls._instance:  # pragma: no branch
+                    cls._instance = super().__new__(cls)
+
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """A cheat to reset the Singleton state. Use only during testing"""
+        if cls._instance is not None:  # pragma: no branch
+            with cls._lock:
+                if cls._instance:  # pragma: no branch
+                    cls._instance = None
+
+    @property
+    def is_state_app(self):
+        """Get logging state
+
+        :returns: ``True`` if app logging state otherwise ``False``
+        :rtype: bool | None
+        """
+        cls = type(self)
+        with cls._lock:
+            if hasattr(self, "_state"):
+                ret = self._state
+            else:
+                ret = None
+
+        return ret
+
+    @is_state_app.setter
+    def is_state_app(self, val):
+        """Would only ever be changed within a unittest or module dealing with logging
+
+        - ``True`` app logging state
+
+        - ``False`` cli_logging state
+
+        If not a bool, logging state is not changed
+
+        :param val: New logging state. ``True`` if app otherwise ``False``
+        :type val: typing.Any
+        """
+        cls = type(self)
+        with cls._lock:
+            if val is not None and isinstance(val, bool):  # pragma: no branch
+                self._state = val
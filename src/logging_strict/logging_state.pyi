@@ -0,0 +1,25 @@
+import sys
+import threading
+from typing import (
+    Any,
+    ClassVar,
+)
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+__all__ = ("LoggingState",)
+
+class LoggingState:
+    _instance: ClassVar[Self | None] = None
+    _lock: ClassVar[threading.RLock] = ...
+
+    def __new__(cls) -> Self: ...
+    @classmethod
+    def reset(cls) -> None: ...
+    @property
+    def is_state_app(self) -> bool: ...
+    @is_state_app.setter
+    def is_state_app(self, val: Any) -> None: ...
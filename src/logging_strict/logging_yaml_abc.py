@@ -14,18 +14,18 @@ ensure validation passes!
 """
 
 import abc
+import copy
 import logging.config
 from pathlib import PurePath
 from typing import TYPE_CHECKING
 
-import strictyaml as s
-
 from .exceptions import LoggingStrictGenreRequired
-from .logging_yaml_validate import validate_yaml_dirty
+from .logging_yaml_validate import validate_yaml_data
 from .util.check_type import (
     is_not_ok,
     is_ok,
 )
+from .util.file_walk import iter_files
 from .util.package_resource import _to_package_case
 from .util.xdg_folder import _get_path_config
 
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     "LoggingYamlType",
+    "ValidatedLoggingConfig",
     "YAML_LOGGING_CONFIG_SUFFIX",
     "after_as_str_update_package_name",
     "setup_logging_yaml",
@@ -85,10 +86,134 @@ def _update_logger_package_name(
             d_config["loggers"][valid_package_name] = d_logger_package_src
 
 
+class ValidatedLoggingConfig:
+    """A :py:mod:`logging.config` YAML str which has already passed
+    validation, along with the validated dict.
+
+    strictyaml validation is the expensive step. Validate once, then
+    pass this object thru logger rename and
+    :py:func:`logging.config.dictConfig` without reparsing.
+
+    :ivar text:
+
+       :py:mod:`logging.config` YAML str. None means generate from the
+       validated dict, on first access
+
+    :vartype text: str | None
+    :ivar data: validated :py:mod:`logging.config` dict
+    :vartype data: dict[str, typing.Any]
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str]
+       :value: ("_data", "_text")
+
+       Fixed class private attributes
+
+    """
+
+    __slots__ = ("_data", "_text")
+
+    def __init__(self, text, data):
+        """Class constructor"""
+        self._text = text
+        self._data = data
+
+    def __repr__(self):
+        """Instance str representation
+
+        :returns: str representation. Omits the YAML str
+        :rtype: str
+        """
+        str_class_name = self.__class__.__name__
+        loggers = tuple(self._data.get("loggers", {}).keys())
+        ret = f"<{str_class_name}(loggers={loggers!r})>"
+
+        return ret
+
+    @classmethod
+    def from_str(cls, str_yaml):
+        """Validate a :py:mod:`logging.config` YAML str. The only place
+        within the setup pipeline where validation occurs
+
+        :param str_yaml: :py:mod:`logging.config` YAML str
+        :type str_yaml: str
+        :returns: validated logging config
+        :rtype: logging_strict.logging_yaml_abc.ValidatedLoggingConfig
+        :raises:
+
+           - :py:exc:`strictyaml.YAMLValidationError` -- Invalid.
+             Validation against logging.config schema failed
+
+        """
+        # Cached. Already seen str_yaml is not validated again
+        d_config = validate_yaml_data(str_yaml)
+        ret = cls(str_yaml, d_config)
+
+        return ret
+
+    @property
+    def text(self):
+        """Get :py:mod:`logging.config` YAML str. After a logger rename,
+        generated from the validated dict
+
+        :returns: logging config YAML str
+        :rtype: str
+        """
+        if self._text is None:
+            import strictyaml as s
+
+            # convert dict --> yaml str
+            self._text = str(s.YAML(self._data).text)
+
+        return self._text
+
+    @property
+    def data(self):
+        """Get validated :py:mod:`logging.config` dict. Do not modify
+        in-place, :py:func:`logging.config.dictConfig` included
+
+        :returns: validated logging config dict
+        :rtype: dict[str, typing.Any]
+        """
+        return self._data
+
+    def with_logger_package_name(
+        self,
+        logger_package_name=None,
+        target_logger_name=PACKAGE_NAME_SRC,
+    ):
+        """Without reparsing, replace the logger package name
+
+        :param logger_package_name:
+
+           Set logger to the intended package name. Default None which leaves as-is
+
+        :type logger_package_name: str | None
+        :param target_logger_name: in logger config dict, logger name to replace
+        :type target_logger_name: str | None
+        :returns: self if nothing to rename otherwise a new instance
+        :rtype: logging_strict.logging_yaml_abc.ValidatedLoggingConfig
+        """
+        cls = type(self)
+        if is_ok(logger_package_name):
+            d_config = copy.deepcopy(self._data)
+            _update_logger_package_name(
+                d_config,
+                package_name=_to_package_case(logger_package_name),
+                target_logger_name=target_logger_name,
+            )
+            # YAML str is stale. Generated on demand
+            ret = cls(None, d_config)
+        else:
+            ret = self
+
+        return ret
+
+
 def setup_logging_yaml(path_yaml, package_name=None):
     """Loads :py:mod:`logging.config` configuration.
 
-    Can pass in a path or a the YAML str
+    Can pass in a path, the YAML str, or an already validated config
 
     :param path_yaml: :py:mod:`logging.config` YAML file path
     :type path_yaml: typing.Any
@@ -104,41 +229,47 @@ def setup_logging_yaml(path_yaml, package_name=None):
 
     """
     if TYPE_CHECKING:
-        yaml_config: s.YAML
+        config: ValidatedLoggingConfig | None
         d_config: dict[str, Any]
 
+    str_yaml = None
+    config = None
     if path_yaml is None:
-        str_yaml = None
+        pass
+    elif isinstance(path_yaml, ValidatedLoggingConfig):
+        # Validation already occurred
+        config = path_yaml
+    elif (
+        issubclass(type(path_yaml), PurePath)
+        and path_yaml.exists()
+        and path_yaml.is_file()
+    ):
+        str_yaml = path_yaml.read_text()
+    elif isinstance(path_yaml, str):
+        # Provide the text rather than a file
+        str_yaml = path_yaml
     else:
-        if (
-            issubclass(type(path_yaml), PurePath)
-            and path_yaml.exists()
-            and path_yaml.is_file()
-        ):
-            str_yaml = path_yaml.read_text()
-        elif isinstance(path_yaml, str):
-            # Provide the text rather than a file
-            str_yaml = path_yaml
-        else:
-            # unsupported type
-            str_yaml = None
+        # unsupported type
+        pass
 
     if is_ok(str_yaml):  # pragma: no branch
-        yaml_config = validate_yaml_dirty(str_yaml)
         # QA Tester is responsible to test the logging.config yaml file
         # A broken yaml config file will crash the app here
-        d_config = yaml_config.data
+        config = ValidatedLoggingConfig.from_str(str_yaml)
 
+    if config is not None:
         # Rename logger from PACKAGE_NAME_SRC --> package_name
-        _update_logger_package_name(d_config, package_name=package_name)
+        config = config.with_logger_package_name(package_name)
 
+        # dictConfig modifies the dict in-place. Keep validated dict pristine
+        d_config = copy.deepcopy(config.data)
         logging.config.dictConfig(d_config)  # test: defang
 
     # During testing, return needed to get locals
     return None
 
 
-def as_str(package_name, file_name):
+def as_validated(package_name, file_name, path_dest_folder=None):
     """Assumes package data file already extracted to expected folder
 
     :param package_name:
@@ -149,8 +280,14 @@ def as_str(package_name, file_name):
     :type package_name: str
     :param file_name: File name of :py:mod:`logging.config` yaml file
     :type file_name: str
+    :param path_dest_folder:
+
+       Default None. Folder the yaml file was extracted to. None uses
+       the XDG user data folder
+
+    :type path_dest_folder: pathlib.Path | None
     :returns: Reads and validates yaml against the :py:mod:`logging.config` schema.
-    :rtype: str
+    :rtype: logging_strict.logging_yaml_abc.ValidatedLoggingConfig
 
     :raises:
 
@@ -160,8 +297,11 @@ def as_str(package_name, file_name):
        - :py:exc:`FileNotFoundError` -- Could not find logging config YAML file
 
     """
-    path_xdg_user_data_dir = _get_path_config(package_name)
-    path_yaml = path_xdg_user_data_dir.joinpath(file_name)
+    if path_dest_folder is None:
+        path_dest_folder = _get_path_config(package_name)
+    else:  # pragma: no cover
+        pass
+    path_yaml = path_dest_folder.joinpath(file_name)
 
     msg_err = (
         "Did not find a logging config YAML file. It's extracted "
@@ -178,10 +318,36 @@ def as_str(package_name, file_name):
     If another yaml implementation, the exception raised will
     be that implementation specific
     """
-    yaml_config = validate_yaml_dirty(str_yaml)
-    assert isinstance(yaml_config, s.YAML)
+    ret = ValidatedLoggingConfig.from_str(str_yaml)
 
-    return str_yaml
+    return ret
+
+
+def as_str(package_name, file_name):
+    """Assumes package data file already extracted to expected folder
+
+    :param package_name:
+
+       Package that contained the :py:mod:`logging.config` yaml file.
+       For determining folder path
+
+    :type package_name: str
+    :param file_name: File name of :py:mod:`logging.config` yaml file
+    :type file_name: str
+    :returns: Reads and validates yaml against the :py:mod:`logging.config` schema.
+    :rtype: str
+
+    :raises:
+
+       - :py:exc:`strictyaml.YAMLValidationError` -- Invalid.
+         Validation against logging.config schema failed
+
+       - :py:exc:`FileNotFoundError` -- Could not find logging config YAML file
+
+    """
+    config = as_validated(package_name, file_name)
+
+    return config.text
 
 
 def after_as_str_update_package_name(
@@ -191,6 +357,10 @@ def after_as_str_update_package_name(
 ):
     """Validation already occurred. In yaml, replace logger package name
 
+    Have a :py:class:`~logging_strict.logging_yaml_abc.ValidatedLoggingConfig`?
+    Use :py:meth:`ValidatedLoggingConfig.with_logger_package_name <logging_strict.logging_yaml_abc.ValidatedLoggingConfig.with_logger_package_name>`
+    instead, which avoids reparsing
+
     :param str_yaml: validated yaml that needs some adjustments
     :type str_yaml: str
     :param logger_package_name:
@@ -204,16 +374,12 @@ def after_as_str_update_package_name(
     :rtype: str
     """
     if is_ok(logger_package_name):
-        yaml_config = validate_yaml_dirty(str_yaml)
-        d_config = yaml_config.data
-        _update_logger_package_name(
-            d_config,
-            package_name=_to_package_case(logger_package_name),
+        config = ValidatedLoggingConfig.from_str(str_yaml)
+        config_renamed = config.with_logger_package_name(
+            logger_package_name,
             target_logger_name=target_logger_name,
         )
-        # convert dict --> yaml str
-        text_yaml = s.YAML(d_config).text
-        ret = str(text_yaml)
+        ret = config_renamed.text
     else:
         ret = str_yaml
 
@@ -329,7 +495,7 @@ class LoggingYamlType(abc.ABC):
 
         return ret
 
-    def iter_yamls(self, path_dir):
+    def iter_yamls(self, path_dir, *, ignore_dirs=None, excludes=None):
         """Conducts a recursive search thru the folder tree starting from
         package base data folder, further narrow search by relative
         (to package base data folder) path,
@@ -337,11 +503,23 @@ class LoggingYamlType(abc.ABC):
 
         Iterator of absolute path of search results
 
+        Folders such as ``.git``, ``.tox``, and ``.venv`` are not
+        searched. Nor are symlinked folders followed. See
+        :py:func:`logging_strict.util.file_walk.iter_files`
+
         :param path_dir:
 
            Absolute path to a folder
 
         :type path_dir: pathlib.Path | None
+        :param ignore_dirs:
+
+           Default None. Folder names never descended into. None for
+           :py:data:`logging_strict.util.file_walk.IGNORE_DIRS`
+
+        :type ignore_dirs: collections.abc.Container[str] | None
+        :param excludes: Default None. ``.gitignore`` style patterns or rules
+        :type excludes: logging_strict.util.file_walk.ExcludeRules | collections.abc.Iterable[str] | None
         :returns: Within folder tree, iterator of yaml
 
            ``True`` if at least one yaml file exists in folder
@@ -361,18 +539,12 @@ class LoggingYamlType(abc.ABC):
             type(path_dir), PurePath
         ):  # pragma: no branch
             if path_dir.exists() and path_dir.is_dir():  # pragma: no branch
-                """
-                search_query = f"{path_dir}/**/{pattern}"
-                # print(f"search_query: {search_query}", file=sys.stderr)
-                # py310+ --> kw param root_dir
-                for path_yaml in glob.glob(
-                    search_query,
-                    # root_dir=path_dir, py310
-                    recursive=True,
-                ):
-                    yield Path(path_yaml)
-                """
-                yield from path_dir.rglob(pattern)
+                yield from iter_files(
+                    path_dir,
+                    pattern,
+                    ignore_dirs=ignore_dirs,
+                    excludes=excludes,
+                )
 
     @classmethod
     def __subclasshook__(cls, C):
@@ -499,13 +671,14 @@ class LoggingYamlType(abc.ABC):
         """
         ...
 
-    def as_str(self):
-        """Read the YAML config file, raise an error if not there or invalid
+    def as_validated(self):
+        """Read the YAML config file and validate it, raise an error if
+        not there or invalid
 
         The yaml files must have already been extracted from a package
 
-        :returns: YAML str. Pass this to each worker
-        :rtype: str
+        :returns: validated logging config. Pass ``.text`` to each worker
+        :rtype: logging_strict.logging_yaml_abc.ValidatedLoggingConfig
         :raises:
 
            - :py:exc:`strictyaml.exceptions.YAMLValidationError` -- Invalid.
@@ -523,10 +696,32 @@ class LoggingYamlType(abc.ABC):
             msg_exc = "Without genre, cannot retrieve logging.config yaml file"
             raise LoggingStrictGenreRequired(msg_exc) from e
 
-        ret = as_str(self.package, self.file_name)
+        ret = as_validated(self.package, self.file_name)
 
         return ret
 
+    def as_str(self):
+        """Read the YAML config file, raise an error if not there or invalid
+
+        The yaml files must have already been extracted from a package
+
+        :returns: YAML str. Pass this to each worker
+        :rtype: str
+        :raises:
+
+           - :py:exc:`strictyaml.exceptions.YAMLValidationError` -- Invalid.
+             Validation against logging.config schema failed
+
+           - :py:exc:`FileNotFoundError` -- Could not find logging config YAML file
+
+           - :py:exc:`~logging_strict.exceptions.LoggingStrictGenreRequired` --
+             Genre required to get file name
+
+        """
+        config = self.as_validated()
+
+        return config.text
+
     def setup(self, str_yaml, package_name=None):  # pragma: no cover
         """Only called by app, not worker. For worker, is a 2 step
         process, not 1.
@@ -537,8 +732,11 @@ class LoggingYamlType(abc.ABC):
 
         xdg user data folder: :code:`$HOME/.local/share/[app name]`
 
-        :param str_yaml: :py:mod:`logging.config` yaml str
-        :type str_yaml: str
+        :param str_yaml:
+
+           :py:mod:`logging.config` yaml str or an already validated config
+
+        :type str_yaml: str | logging_strict.logging_yaml_abc.ValidatedLoggingConfig
         :param package_name:
 
            In logger dict, instead of the default package name, set a package name.
@@ -546,5 +744,7 @@ class LoggingYamlType(abc.ABC):
 
         :type: str | None
         """
-        if is_ok(str_yaml):  # pragma: no branch
+        if is_ok(str_yaml) or isinstance(
+            str_yaml, ValidatedLoggingConfig
+        ):  # pragma: no branch
             setup_logging_yaml(str_yaml, package_name=package_name)
@@ -1,13 +1,26 @@
 import abc
-from collections.abc import Iterator
+import sys
+from collections.abc import (
+    Container,
+    Iterable,
+    Iterator,
+)
 from pathlib import Path
 from typing import (
     Any,
     Final,
 )
 
+from .util.file_walk import ExcludeRules
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 __all__ = (
     "LoggingYamlType",
+    "ValidatedLoggingConfig",
     "YAML_LOGGING_CONFIG_SUFFIX",
     "after_as_str_update_package_name",
     "setup_logging_yaml",
@@ -22,10 +35,36 @@ def _update_logger_package_name(
     package_name: str | None = None,
     target_logger_name: str | None = ...,
 ) -> None: ...
+
+class ValidatedLoggingConfig:
+    __slots__ = ("_data", "_text")
+
+    _text: str | None
+    _data: dict[str, Any]
+
+    def __init__(self, text: str | None, data: dict[str, Any]) -> None: ...
+    def __repr__(self) -> str: ...
+    @classmethod
+    def from_str(cls, str_yaml: str) -> Self: ...
+    @property
+    def text(self) -> str: ...
+    @property
+    def data(self) -> dict[str, Any]: ...
+    def with_logger_package_name(
+        self,
+        logger_package_name: str | None = None,
+        target_logger_name: str | None = ...,
+    ) -> Self: ...
+
 def setup_logging_yaml(
     path_yaml: Any,
     package_name: str | None = None,
 ) -> None: ...
+def as_validated(
+    package_name: str,
+    file_name: str,
+    path_dest_folder: Path | None = None,
+) -> ValidatedLoggingConfig: ...
 def as_str(package_name: str, file_name: str) -> str: ...
 def after_as_str_update_package_name(
     str_yaml: str,
@@ -47,6 +86,9 @@ class LoggingYamlType(abc.ABC):
     def iter_yamls(
         self,
         path_dir: Path | None,
+        *,
+        ignore_dirs: Container[str] | None = None,
+        excludes: ExcludeRules | Iterable[str] | None = None,
     ) -> Iterator[Path]: ...
     @classmethod
     def __subclasshook__(cls, C: Any) -> bool: ...
@@ -67,9 +109,10 @@ class LoggingYamlType(abc.ABC):
         self,
         path_relative_package_dir: Path | str | None = "",
     ) -> str: ...
+    def as_validated(self) -> ValidatedLoggingConfig: ...
     def as_str(self) -> str: ...
     def setup(
         self,
-        str_yaml: str,
+        str_yaml: str | ValidatedLoggingConfig,
         package_name: str | None = None,
     ) -> None: ...
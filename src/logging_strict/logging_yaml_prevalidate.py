@@ -0,0 +1,500 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Fast pre-validation of :py:mod:`logging.config` YAML.
+
+strictyaml builds a full round trip tree plus a validator object per
+node. Heavy for configs already known to be valid. This second engine
+mirrors the rules of
+:py:data:`~logging_strict.logging_yaml_validate.schema_logging_config`,
+but on plain dict, list, and str data:
+
+- Parse with the YAML parser vendored by strictyaml. No round trip, no
+  constructor. Like strictyaml, every scalar stays a str
+
+- Walk the plain data applying the same rules and coercions. Level
+  enums, int, bool, float, empty None, and defaults
+
+Disallowed by strictyaml? e.g. tags, anchors, aliases, duplicate keys.
+Reject. Any doubt? Reject.
+
+A rejected config is not necessarily invalid. Rejected means fall back to
+:py:func:`~logging_strict.logging_yaml_validate.validate_yaml_dirty`.
+Which is authoritative and gives the precise error mark. So a false
+reject only costs time. Whereas accepted data must always equal the
+strictyaml data.
+
+.. code-block:: text
+
+   from logging_strict.logging_yaml_prevalidate import prevalidate_yaml
+   from logging_strict.logging_yaml_validate import validate_yaml_dirty
+
+   d_config = prevalidate_yaml(str_yaml)
+   if d_config is None:
+       # Invalid? strictyaml says where
+       d_config = validate_yaml_dirty(str_yaml).data
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str]
+   :value: ("PREVALIDATORS", "load_plain", "prevalidate_data", \
+   "prevalidate_yaml")
+
+   Module exports
+
+**Module objects**
+
+"""
+
+import re
+import sys
+
+from strictyaml.constants import (
+    BOOL_VALUES,
+    TRUE_VALUES,
+)
+from strictyaml.ruamel.composer import Composer
+from strictyaml.ruamel.error import YAMLError
+from strictyaml.ruamel.events import AliasEvent
+from strictyaml.ruamel.nodes import (
+    MappingNode,
+    ScalarNode,
+    SequenceNode,
+)
+from strictyaml.ruamel.parser import Parser
+from strictyaml.ruamel.reader import Reader
+from strictyaml.ruamel.resolver import BaseResolver
+from strictyaml.ruamel.scanner import Scanner
+
+__all__ = (
+    "PREVALIDATORS",
+    "load_plain",
+    "prevalidate_data",
+    "prevalidate_yaml",
+)
+
+# Same as strictyaml.utils. Compiled once rather than per scalar
+_RE_INT = re.compile(r"^[-+]?[0-9_]+$")
+_RE_DECIMAL = re.compile(r"^[-+]?[0-9_]*(\.[0-9_]*)?([eE][-+]?[0-9_]+)?$")
+_RE_INFINITY = re.compile(r"^[-+]?\.?(?:inf|Inf|INF)$")
+_RE_NAN = re.compile(r"^\.?(?:nan|NaN|NAN)$")
+
+_LEVELS = (
+    "UNSET",
+    "DEBUG",
+    "INFO",
+    "WARN",
+    "WARNING",
+    "ERROR",
+    "CRITICAL",
+    "FATAL",
+)
+_FORMAT_STYLES = ("%", "{", "$")
+
+
+class _Rejected(Exception):
+    """Not provably valid. Fall back to strictyaml"""
+
+
+class _PlainLoader(Reader, Scanner, Parser, Composer, BaseResolver):
+    """Compose only. Skip implicit type resolution and construction.
+    Reject the tokens strictyaml disallows"""
+
+    # BaseResolver lacks. VersionedResolver default YAML version
+    processing_version = (1, 2)
+
+    def __init__(self, stream):
+        """Class constructor"""
+        Reader.__init__(self, stream, loader=self)
+        Scanner.__init__(self, loader=self)
+        Parser.__init__(self, loader=self)
+        Composer.__init__(self, loader=self)
+        BaseResolver.__init__(self, loadumper=self)
+
+    def compose_node(self, parent, index):
+        """strictyaml disallows tags, anchors, and so aliases"""
+        event = self.parser.peek_event()
+        is_disallowed = (
+            isinstance(event, AliasEvent)
+            or event.anchor is not None
+            or getattr(event, "tag", None) is not None
+        )
+        if is_disallowed:
+            raise _Rejected
+
+        return super().compose_node(parent, index)
+
+
+def _to_plain(node):
+    """Node tree --> dict, list, and str
+
+    :param node: composed YAML node
+    :type node: strictyaml.ruamel.nodes.Node
+    :returns: plain data. Every scalar is a str
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`_Rejected` -- non-scalar or duplicate or merge key
+
+    """
+    if isinstance(node, ScalarNode):
+        ret = node.value
+    elif isinstance(node, SequenceNode):
+        ret = [_to_plain(node_item) for node_item in node.value]
+    elif isinstance(node, MappingNode):
+        ret = {}
+        for node_key, node_value in node.value:
+            if not isinstance(node_key, ScalarNode):
+                raise _Rejected
+            key = node_key.value
+            if key in ret or key == "<<":
+                raise _Rejected
+            ret[key] = _to_plain(node_value)
+    else:  # pragma: no cover
+        raise _Rejected
+
+    return ret
+
+
+def load_plain(yaml_snippet):
+    """Parse YAML into plain data. Every scalar is a str
+
+    :param yaml_snippet: YAML str
+    :type yaml_snippet: str
+    :returns: plain data. None if unparsable or uses disallowed syntax
+    :rtype: typing.Any | None
+    """
+    if not isinstance(yaml_snippet, str):
+        return None
+
+    loader = _PlainLoader(yaml_snippet)
+    try:
+        node = loader.get_single_node()
+        ret = None if node is None else _to_plain(node)
+    except (_Rejected, YAMLError):
+        ret = None
+    finally:
+        loader.dispose()
+
+    return ret
+
+
+# Scalar rules. Mirror strictyaml.scalar validators
+def _str(val):
+    if not isinstance(val, str):
+        raise _Rejected
+    return val
+
+
+def _int(val):
+    if not isinstance(val, str) or _RE_INT.match(val) is None:
+        raise _Rejected
+    try:
+        ret = int(val.replace("_", ""))
+    except ValueError:
+        raise _Rejected from None
+    return ret
+
+
+def _float(val):
+    if not isinstance(val, str):
+        raise _Rejected
+    if _RE_INFINITY.match(val) is not None or _RE_NAN.match(val) is not None:
+        val = val.replace(".", "")
+    elif _RE_DECIMAL.match(val) is None:
+        raise _Rejected
+    try:
+        ret = float(val.replace("_", ""))
+    except ValueError:
+        raise _Rejected from None
+    return ret
+
+
+def _bool(val):
+    if not isinstance(val, str) or val.lower() not in BOOL_VALUES:
+        raise _Rejected
+    return val.lower() in TRUE_VALUES
+
+
+def _empty_none(val):
+    if val != "":
+        raise _Rejected
+    return None
+
+
+def _empty_list(val):
+    if val != "":
+        raise _Rejected
+    return []
+
+
+def _any(val):
+    """strictyaml.Any. Nested dict and list of str"""
+    if isinstance(val, dict):
+        ret = {key: _any(val_item) for key, val_item in val.items()}
+    elif isinstance(val, list):
+        ret = [_any(val_item) for val_item in val]
+    else:
+        ret = _str(val)
+    return ret
+
+
+# Rule factories. Mirror strictyaml.compound validators
+def _enum(choices, item_rule=_str):
+    def rule(val):
+        ret = item_rule(val)
+        if ret not in choices:
+            raise _Rejected
+        return ret
+
+    return rule
+
+
+def _or(*rules):
+    """First rule which accepts. Same order as strictyaml ``|``"""
+
+    def rule(val):
+        for rule_item in rules:
+            try:
+                ret = rule_item(val)
+            except _Rejected:
+                continue
+            return ret
+        raise _Rejected
+
+    return rule
+
+
+def _seq(item_rule):
+    def rule(val):
+        if not isinstance(val, list):
+            raise _Rejected
+        return [item_rule(val_item) for val_item in val]
+
+    return rule
+
+
+def _fixed_seq(*item_rules):
+    def rule(val):
+        if not isinstance(val, list) or len(val) != len(item_rules):
+            raise _Rejected
+        return [item_rule(val_item) for item_rule, val_item in zip(item_rules, val)]
+
+    return rule
+
+
+def _map_pattern(value_rule):
+    def rule(val):
+        if not isinstance(val, dict):
+            raise _Rejected
+        return {key: value_rule(val_item) for key, val_item in val.items()}
+
+    return rule
+
+
+def _map(key_rules, required=(), defaults=None, extra_rule=None):
+    """strictyaml.Map or, with extra_rule, strictyaml.MapCombined.
+    defaults are the already validated default values"""
+
+    def rule(val):
+        if not isinstance(val, dict):
+            raise _Rejected
+        ret = {}
+        for key, val_item in val.items():
+            key_rule = key_rules.get(key, extra_rule)
+            if key_rule is None:
+                # Map. unexpected key
+                raise _Rejected
+            ret[key] = key_rule(val_item)
+        for key in required:
+            if key not in val:
+                raise _Rejected
+        if defaults is not None:
+            for key, default in defaults.items():
+                if key not in val:
+                    ret[key] = default
+        return ret
+
+    return rule
+
+
+_levels = _enum(_LEVELS)
+_format_style = _enum(_FORMAT_STYLES)
+_seq_str = _seq(_str)
+_str_or_none = _or(_empty_none, _str)
+
+if sys.version_info >= (3, 12):  # pragma: no cover
+    _formatter_rules = {
+        "format": _or(_str, _empty_none),
+        "datefmt": _or(_str, _empty_none),
+        "style": _format_style,
+        "validate": _bool,
+        "defaults": _map_pattern(_any),
+        "class": _str,
+    }
+    _formatter_extra = _or(_bool, _str, _format_style, _map_pattern(_any))
+else:  # pragma: no cover
+    _formatter_rules = {
+        "format": _or(_str, _empty_none),
+        "datefmt": _or(_str, _empty_none),
+        "style": _format_style,
+        "validate": _bool,
+        "class": _str,
+    }
+    _formatter_extra = _or(_bool, _str, _format_style)
+
+#: Mirrors formatter_map. Optional defaults, after validation
+_formatter = _map(
+    _formatter_rules,
+    defaults={"format": "", "datefmt": "", "style": "%", "validate": True},
+    extra_rule=_formatter_extra,
+)
+
+#: Mirrors filters_map
+_filter = _map({"level": _str, "()": _str}, extra_rule=_str)
+
+#: Mirrors handlers_map
+_handler = _map(
+    {
+        "class": _str,
+        "()": _str,
+        "level": _levels,
+        "formatter": _str,
+        "filters": _seq_str,
+        "filename": _str,
+        "host": _str,
+        "port": _int,
+        "appname": _str,
+        "mailhost": _str,
+        "fromaddr": _str,
+        "toaddrs": _or(_empty_list, _seq_str),
+        "subject": _str,
+        "capacity": _int,
+        "queue": _str,
+        "listener": _str,
+        "handlers": _seq_str,
+        "stream": _str_or_none,
+        "mode": _str,
+        "encoding": _str_or_none,
+        "delay": _bool,
+        "errors": _str_or_none,
+        "maxBytes": _int,
+        "backupCount": _int,
+        "when": _str,
+        "interval": _int,
+        "utc": _bool,
+        "address": _fixed_seq(_str, _int),
+        "facility": _str,
+        "socktype": _int,
+        "dllname": _str_or_none,
+        "logtype": _str,
+        "credentials": _or(_empty_none, _fixed_seq(_str, _str)),
+        "secure": _or(_empty_none, _empty_list, _seq_str),
+        "timeout": _float,
+        "flushlevel": _str,
+        "target": _str_or_none,
+        "flushOnClose": _bool,
+        "respect_handler_level": _bool,
+    },
+    extra_rule=_any,
+)
+
+#: Mirrors loggers_map
+_logger = _map(
+    {
+        "level": _levels,
+        "propagate": _bool,
+        "filters": _seq_str,
+        "handlers": _seq_str,
+        "qualname": _str,
+    },
+)
+
+#: Mirrors root_map
+_root = _map(
+    {
+        "level": _levels,
+        "filters": _seq_str,
+        "handlers": _seq_str,
+    },
+)
+
+#: Mirrors schema_logging_config
+_logging_config = _map(
+    {
+        "version": _enum((1,), item_rule=_int),
+        "formatters": _map_pattern(_formatter),
+        "filters": _map_pattern(_filter),
+        "handlers": _map_pattern(_handler),
+        "loggers": _map_pattern(_logger),
+        "root": _root,
+        "incremental": _or(_empty_none, _bool),
+        "disable_existing_loggers": _or(_empty_none, _bool),
+    },
+    required=("version",),
+    defaults={"incremental": False, "disable_existing_loggers": True},
+    extra_rule=_any,
+)
+
+#: dict[str, collections.abc.Callable[[typing.Any], typing.Any]]: Fast
+#: rules keyed by the :py:mod:`logging_strict.logging_yaml_validate`
+#: schema they mirror
+PREVALIDATORS = {
+    "schema_logging_config": _logging_config,
+    "formatter_map": _formatter,
+    "filters_map": _filter,
+    "handlers_map": _handler,
+    "loggers_map": _logger,
+    "root_map": _root,
+}
+
+
+def prevalidate_data(data, schema_name="schema_logging_config"):
+    """Apply the fast rules to plain data, e.g. from :py:func:`load_plain`
+
+    :param data: plain data. Every scalar a str
+    :type data: typing.Any
+    :param schema_name:
+
+       Default ``schema_logging_config``. A :py:data:`PREVALIDATORS` key
+
+    :type schema_name: str
+    :returns:
+
+       New validated and coerced data. None if rejected or unknown schema
+
+    :rtype: typing.Any | None
+    """
+    rule = PREVALIDATORS.get(schema_name, None)
+    if rule is None or data is None:
+        ret = None
+    else:
+        try:
+            ret = rule(data)
+        except _Rejected:
+            ret = None
+
+    return ret
+
+
+def prevalidate_yaml(yaml_snippet, schema_name="schema_logging_config"):
+    """Parse then apply the fast rules. None means ask strictyaml
+
+    :param yaml_snippet: :py:mod:`logging.config` YAML str
+    :type yaml_snippet: str
+    :param schema_name:
+
+       Default ``schema_logging_config``. A :py:data:`PREVALIDATORS` key
+
+    :type schema_name: str
+    :returns:
+
+       Validated data. Equals what strictyaml would produce. None if rejected
+
+    :rtype: typing.Any | None
+    """
+    data = load_plain(yaml_snippet)
+    ret = prevalidate_data(data, schema_name=schema_name)
+
+    return ret
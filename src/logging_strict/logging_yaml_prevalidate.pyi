@@ -0,0 +1,83 @@
+import re
+from collections.abc import Callable
+from typing import (
+    Any,
+    Final,
+)
+
+from strictyaml.ruamel.composer import Composer
+from strictyaml.ruamel.nodes import Node
+from strictyaml.ruamel.parser import Parser
+from strictyaml.ruamel.reader import Reader
+from strictyaml.ruamel.resolver import BaseResolver
+from strictyaml.ruamel.scanner import Scanner
+
+__all__ = (
+    "PREVALIDATORS",
+    "load_plain",
+    "prevalidate_data",
+    "prevalidate_yaml",
+)
+
+_RE_INT: Final[re.Pattern[str]]
+_RE_DECIMAL: Final[re.Pattern[str]]
+_RE_INFINITY: Final[re.Pattern[str]]
+_RE_NAN: Final[re.Pattern[str]]
+_LEVELS: Final[tuple[str, ...]]
+_FORMAT_STYLES: Final[tuple[str, ...]]
+
+class _Rejected(Exception): ...
+
+class _PlainLoader(Reader, Scanner, Parser, Composer, BaseResolver):
+    processing_version: tuple[int, int]
+
+    def __init__(self, stream: str) -> None: ...
+    def compose_node(self, parent: Any, index: Any) -> Any: ...
+
+def _to_plain(node: Node) -> Any: ...
+def load_plain(yaml_snippet: str) -> Any | None: ...
+
+_Rule = Callable[[Any], Any]
+
+def _str(val: Any) -> str: ...
+def _int(val: Any) -> int: ...
+def _float(val: Any) -> float: ...
+def _bool(val: Any) -> bool: ...
+def _empty_none(val: Any) -> None: ...
+def _empty_list(val: Any) -> list[Any]: ...
+def _any(val: Any) -> Any: ...
+def _enum(choices: tuple[Any, ...], item_rule: _Rule = ...) -> _Rule: ...
+def _or(*rules: _Rule) -> _Rule: ...
+def _seq(item_rule: _Rule) -> _Rule: ...
+def _fixed_seq(*item_rules: _Rule) -> _Rule: ...
+def _map_pattern(value_rule: _Rule) -> _Rule: ...
+def _map(
+    key_rules: dict[str, _Rule],
+    required: tuple[str, ...] = (),
+    defaults: dict[str, Any] | None = None,
+    extra_rule: _Rule | None = None,
+) -> _Rule: ...
+
+_levels: _Rule
+_format_style: _Rule
+_seq_str: _Rule
+_str_or_none: _Rule
+_formatter_rules: dict[str, _Rule]
+_formatter_extra: _Rule
+_formatter: _Rule
+_filter: _Rule
+_handler: _Rule
+_logger: _Rule
+_root: _Rule
+_logging_config: _Rule
+
+PREVALIDATORS: dict[str, _Rule]
+
+def prevalidate_data(
+    data: Any,
+    schema_name: str = "schema_logging_config",
+) -> Any | None: ...
+def prevalidate_yaml(
+    yaml_snippet: str,
+    schema_name: str = "schema_logging_config",
+) -> Any | None: ...
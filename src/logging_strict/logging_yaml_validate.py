@@ -2,8 +2,9 @@
 .. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
 
 .. py:data:: __all__
-   :type: tuple[str, str]
-   :value: ("schema_logging_config", "validate_yaml_dirty")
+   :type: tuple[str, str, str, str, str]
+   :value: ("schema_logging_config", "validate_yaml_dirty", \
+   "validate_yaml_data", "validation_cache_clear", "validation_cache_info")
 
    Module exports
 
@@ -11,230 +12,342 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import sys
+import threading
+from collections import (
+    OrderedDict,
+    namedtuple,
+)
 from functools import partial
 
-import strictyaml as s
+from .util.validation_cache import ValidationDiskCache
 
-__all__ = (
+__all__ = (  # noqa: F822 schema_logging_config is lazy
     "schema_logging_config",
     "validate_yaml_dirty",
+    "validate_yaml_data",
+    "validation_cache_clear",
+    "validation_cache_info",
 )
 
-format_style = s.Enum(["%", "{", "$"])
-format_style_default = "%"
-# https://github.com/python/cpython/blob/ae7fa9fa60c7dc446c0681122037ab27adf35b51/Lib/logging/__init__.py#L98
-levels = s.Enum(
-    [
-        "UNSET",
-        "DEBUG",
-        "INFO",
-        "WARN",
-        "WARNING",
-        "ERROR",
-        "CRITICAL",
-        "FATAL",
-    ],
-)
-logger_keys = s.Enum(
-    ["level", "filters", "handlers", "propagate"],
+#: int: Max validated configs kept in-process. Least recently used is dropped
+VALIDATION_CACHE_MAXSIZE = 64
+
+#: str: Answered by the in-process cache
+ENGINE_MEMORY = "memory"
+#: str: Answered by the XDG user cache folder
+ENGINE_DISK = "disk"
+#: str: Answered by the fast engine, ``logging_yaml_prevalidate``
+ENGINE_PREVALIDATE = "prevalidate"
+#: str: Answered by strictyaml
+ENGINE_STRICTYAML = "strictyaml"
+
+#: Validation cache statistics. Same fields as :py:func:`functools.lru_cache` cache_info
+ValidationCacheInfo = namedtuple(
+    "ValidationCacheInfo",
+    ["hits", "misses", "maxsize", "currsize"],
 )
-logging_config_keys = s.Enum(
-    [
-        "version",
-        "formatters",
-        "filters",
-        "handlers",
-        "loggers",
-        "root",
-        "incremental",
-        "disable_existing_loggers",
-    ]
+
+format_style_default = "%"
+
+_lock_schemas = threading.Lock()
+
+#: tuple[str, ...]: Built on first access. See :py:func:`_build_schemas`
+_SCHEMA_NAMES = (
+    "format_style",
+    "levels",
+    "logger_keys",
+    "logging_config_keys",
+    "formatter_map",
+    "filters_map",
+    "handlers_map",
+    "loggers_map",
+    "root_map",
+    "schema_logging_config",
 )
 
-if sys.version_info >= (3, 12):  # pragma: no cover
-    # logging.Formatter <https://docs.python.org/3/library/logging.html#logging.Formatter>`_
-    # `format <https://docs.python.org/3/library/logging.html#logrecord-attributes>`_
-    formatter_map = s.MapCombined(  # map validator
-        {
-            s.Optional("format", default=None, drop_if_none=False): s.Str()
-            | s.EmptyNone(),
-            s.Optional("datefmt", default=None, drop_if_none=False): s.Str()
-            | s.EmptyNone(),
-            s.Optional("style", default=format_style_default): format_style,
-            s.Optional("validate", default=True): s.Bool(),  # py38
-            s.Optional("defaults"): s.MapPattern(s.Str(), s.Any()),  # py312
-            s.Optional("class"): s.Str(),
-        },
-        s.Str(),  # key validator
-        # value validator
-        s.OrValidator(
+
+def _build_schemas():
+    """Build the strictyaml schemas. Importing strictyaml and building
+    every ``s.MapCombined`` is not free. So postponed until a schema is
+    first used
+
+    :returns: schema by name. Keys same as :py:data:`_SCHEMA_NAMES`
+    :rtype: dict[str, strictyaml.Validator]
+    """
+    import strictyaml as s
+
+    format_style = s.Enum(["%", "{", "$"])
+    # https://github.com/python/cpython/blob/ae7fa9fa60c7dc446c0681122037ab27adf35b51/Lib/logging/__init__.py#L98
+    levels = s.Enum(
+        [
+            "UNSET",
+            "DEBUG",
+            "INFO",
+            "WARN",
+            "WARNING",
+            "ERROR",
+            "CRITICAL",
+            "FATAL",
+        ],
+    )
+    logger_keys = s.Enum(
+        ["level", "filters", "handlers", "propagate"],
+    )
+    logging_config_keys = s.Enum(
+        [
+            "version",
+            "formatters",
+            "filters",
+            "handlers",
+            "loggers",
+            "root",
+            "incremental",
+            "disable_existing_loggers",
+        ]
+    )
+
+    if sys.version_info >= (3, 12):  # pragma: no cover
+        # logging.Formatter <https://docs.python.org/3/library/logging.html#logging.Formatter>`_
+        # `format <https://docs.python.org/3/library/logging.html#logrecord-attributes>`_
+        formatter_map = s.MapCombined(  # map validator
+            {
+                s.Optional("format", default=None, drop_if_none=False): s.Str()
+                | s.EmptyNone(),
+                s.Optional("datefmt", default=None, drop_if_none=False): s.Str()
+                | s.EmptyNone(),
+                s.Optional("style", default=format_style_default): format_style,
+                s.Optional("validate", default=True): s.Bool(),  # py38
+                s.Optional("defaults"): s.MapPattern(s.Str(), s.Any()),  # py312
+                s.Optional("class"): s.Str(),
+            },
+            s.Str(),  # key validator
+            # value validator
+            s.OrValidator(
+                s.OrValidator(
+                    s.OrValidator(s.Bool(), s.Str()),
+                    format_style,
+                ),
+                s.MapPattern(s.Str(), s.Any()),  # defaults
+            ),
+        )
+    else:  # pragma: no cover
+        formatter_map = s.MapCombined(  # map validator
+            {
+                s.Optional("format", default=None, drop_if_none=False): s.Str()
+                | s.EmptyNone(),
+                s.Optional("datefmt", default=None, drop_if_none=False): s.Str()
+                | s.EmptyNone(),
+                s.Optional("style", default=format_style_default): format_style,
+                s.Optional("validate", default=True): s.Bool(),  # py38
+                s.Optional("class"): s.Str(),
+            },
+            s.Str(),  # key validator
             s.OrValidator(
                 s.OrValidator(s.Bool(), s.Str()),
                 format_style,
             ),
-            s.MapPattern(s.Str(), s.Any()),  # defaults
-        ),
+        )
+
+    # filters
+    filters_map = s.MapCombined(
+        {
+            s.Optional("level"): s.Str(),
+            s.Optional("()"): s.Str(),  # followed by random params
+        },
+        s.Str(),  # all keys are str.
+        s.Str(),  # all values are str e.g. dotted path to a function
     )
-else:  # pragma: no cover
-    formatter_map = s.MapCombined(  # map validator
+
+    # handlers
+    #    ``All other keys are passed through as keyword arguments to the handler’s constructor``
+    #    Downside: unknown keys' value passthrough as str, not int
+    #
+    #    args and kwargs
+    #    https://docs.python.org/3/library/logging.config.html#configuration-file-format
+    #
+    #    QueueHandler and QueueListener
+    #    https://docs.python.org/3/library/logging.config.html#configuring-queuehandler-and-queuelistener
+    #
+    # For setting default types for these handler args/kwargs
+    #
+    # https://peps.python.org/pep-0020/ -- `explicit is better than implicit`
+    handlers_map = s.MapCombined(
         {
-            s.Optional("format", default=None, drop_if_none=False): s.Str()
-            | s.EmptyNone(),
-            s.Optional("datefmt", default=None, drop_if_none=False): s.Str()
-            | s.EmptyNone(),
-            s.Optional("style", default=format_style_default): format_style,
-            s.Optional("validate", default=True): s.Bool(),  # py38
             s.Optional("class"): s.Str(),
+            s.Optional("()"): s.Str(),  # '()': ext://textual.logging.TextualHandler
+            s.Optional("level"): levels,
+            s.Optional("formatter"): s.Str(),
+            s.Optional("filters"): s.Seq(s.Str()),  # also filter instances py311 ??
+            # Think this is fileConfig, not dictConfig
+            # default=[] removed
+            # s.Optional("args"): s.Seq(s.Any()) | s.EmptyList(),
+            # default={} removed
+            # s.Optional("kwargs"): s.MapPattern(s.Str(), s.Any()) | s.EmptyDict(),
+            # args
+            # #######
+            s.Optional("filename"): s.Str(),  # FileHandler, WatchedFileHandler, ...
+            s.Optional("host"): s.Str(),  # SocketHandler, DatagramHandler
+            s.Optional("port"): s.Int(),  # SocketHandler, DatagramHandler
+            s.Optional("appname"): s.Str(),  # NTEventLogHandler
+            s.Optional("mailhost"): s.Str(),  # SMTPHandler
+            s.Optional("fromaddr"): s.Str(),  # SMTPHandler
+            s.Optional("toaddrs"): s.EmptyList() | s.Seq(s.Str()),  # SMTPHandler
+            s.Optional("subject"): s.Str(),  # SMTPHandler
+            s.Optional("capacity"): s.Int(),  # SMTPHandler
+            s.Optional("queue"): s.Str(),  # QueueHandler and QueueListener
+            s.Optional("listener"): s.Str(),  # QueueHandler and QueueListener
+            s.Optional("handlers"): s.Seq(s.Str()),  # QueueHandler and QueueListener
+            # kwargs ... due to side effect, can't set default
+            # #######
+            s.Optional("stream"): s.EmptyNone()
+            | s.Str(),  # logging.StreamHandler. Default None
+            s.Optional("mode"): s.Str(),  # logging.FileHandler. Default 'a'
+            s.Optional("encoding"): s.EmptyNone()
+            | s.Str(),  # logging.FileHandler. Default None
+            s.Optional("delay"): s.Bool(),  # logging.FileHandler. Default False
+            s.Optional("errors"): s.EmptyNone()
+            | s.Str(),  # logging.FileHandler. Default None
+            s.Optional("maxBytes"): s.Int(),  # RotatingFileHandler. Default 0
+            s.Optional("backupCount"): s.Int(),  # RotatingFileHandler. Default 0
+            s.Optional("when"): s.Str(),  # TimedRotatingFileHandler. Default 'h'
+            s.Optional("interval"): s.Int(),  # TimedRotatingFileHandler. Default 1
+            s.Optional("utc"): s.Bool(),  # TimedRotatingFileHandler. Default False
+            # s.Optional("atTime"): s.EmptyNone() | "datetime.time"), TimedRotatingFileHandler. Default None
+            s.Optional("address"): s.FixedSeq([s.Str(), s.Int()]),  # SysLogHandler
+            s.Optional("facility"): s.Str(),  # SysLogHandler
+            # socket.SOCK_STREAM or socket.SOCK_DGRAM
+            s.Optional("socktype"): s.Int(),  # SysLogHandler
+            s.Optional("dllname"): s.EmptyNone() | s.Str(),  # NTEventLogHandler
+            s.Optional("logtype"): s.Str(),  # NTEventLogHandler
+            s.Optional("credentials"): s.EmptyNone()
+            | s.FixedSeq([s.Str(), s.Str()]),  # SMTPHandler
+            # SMTPHandler. Default None. Or'ing together two FixedSeq is not allowed
+            s.Optional("secure"): s.EmptyNone() | s.EmptyList() | s.Seq(s.Str()),
+            s.Optional("timeout"): s.Float(),  # SMTPHandler. Default 1.0
+            s.Optional("flushlevel"): s.Str(),  # MemoryHandler. Default "ERROR"
+            s.Optional("target"): s.EmptyNone()
+            | s.Str(),  # MemoryHandler. Default None
+            s.Optional("flushOnClose"): s.Bool(),  # MemoryHandler. Default True
+            # QueueHandler and QueueListener. Default False
+            s.Optional("respect_handler_level"): s.Bool(),
         },
-        s.Str(),  # key validator
-        s.OrValidator(
-            s.OrValidator(s.Bool(), s.Str()),
-            format_style,
-        ),
+        s.Str(),
+        s.Any(),  # s.OrValidator(s.OrValidator(s.Str(), levels), s.Seq(s.Str())),
     )
 
-# filters
-filters_map = s.MapCombined(
-    {
-        s.Optional("level"): s.Str(),
-        s.Optional("()"): s.Str(),  # followed by random params
-    },
-    s.Str(),  # all keys are str.
-    s.Str(),  # all values are str e.g. dotted path to a function
-)
+    # filters can be dotted path
+    #
+    #    qualname
+    #
+    #    https://docs.python.org/3/library/logging.config.html#configuration-file-format
+    #    hierarchical channel name used by an app to get the logger
+    loggers_map = s.Map(
+        {
+            s.Optional("level"): levels,
+            s.Optional("propagate"): s.Bool(),
+            s.Optional("filters"): s.Seq(
+                s.Str()
+            ),  # dotted path. filters instances py311
+            s.Optional("handlers"): s.Seq(s.Str()),
+            s.Optional("qualname"): s.Str(),
+        },
+    )
 
-# handlers
-#    ``All other keys are passed through as keyword arguments to the handler’s constructor``
-#    Downside: unknown keys' value passthrough as str, not int
-#
-#    args and kwargs
-#    https://docs.python.org/3/library/logging.config.html#configuration-file-format
-#
-#    QueueHandler and QueueListener
-#    https://docs.python.org/3/library/logging.config.html#configuring-queuehandler-and-queuelistener
-#
-# For setting default types for these handler args/kwargs
-#
-# https://peps.python.org/pep-0020/ -- `explicit is better than implicit`
-handlers_map = s.MapCombined(
-    {
-        s.Optional("class"): s.Str(),
-        s.Optional("()"): s.Str(),  # '()': ext://textual.logging.TextualHandler
-        s.Optional("level"): levels,
-        s.Optional("formatter"): s.Str(),
-        s.Optional("filters"): s.Seq(s.Str()),  # also filter instances py311 ??
-        # Think this is fileConfig, not dictConfig
-        # default=[] removed
-        # s.Optional("args"): s.Seq(s.Any()) | s.EmptyList(),
-        # default={} removed
-        # s.Optional("kwargs"): s.MapPattern(s.Str(), s.Any()) | s.EmptyDict(),
-        # args
-        # #######
-        s.Optional("filename"): s.Str(),  # FileHandler, WatchedFileHandler, ...
-        s.Optional("host"): s.Str(),  # SocketHandler, DatagramHandler
-        s.Optional("port"): s.Int(),  # SocketHandler, DatagramHandler
-        s.Optional("appname"): s.Str(),  # NTEventLogHandler
-        s.Optional("mailhost"): s.Str(),  # SMTPHandler
-        s.Optional("fromaddr"): s.Str(),  # SMTPHandler
-        s.Optional("toaddrs"): s.EmptyList() | s.Seq(s.Str()),  # SMTPHandler
-        s.Optional("subject"): s.Str(),  # SMTPHandler
-        s.Optional("capacity"): s.Int(),  # SMTPHandler
-        s.Optional("queue"): s.Str(),  # QueueHandler and QueueListener
-        s.Optional("listener"): s.Str(),  # QueueHandler and QueueListener
-        s.Optional("handlers"): s.Seq(s.Str()),  # QueueHandler and QueueListener
-        # kwargs ... due to side effect, can't set default
-        # #######
-        s.Optional("stream"): s.EmptyNone()
-        | s.Str(),  # logging.StreamHandler. Default None
-        s.Optional("mode"): s.Str(),  # logging.FileHandler. Default 'a'
-        s.Optional("encoding"): s.EmptyNone()
-        | s.Str(),  # logging.FileHandler. Default None
-        s.Optional("delay"): s.Bool(),  # logging.FileHandler. Default False
-        s.Optional("errors"): s.EmptyNone()
-        | s.Str(),  # logging.FileHandler. Default None
-        s.Optional("maxBytes"): s.Int(),  # RotatingFileHandler. Default 0
-        s.Optional("backupCount"): s.Int(),  # RotatingFileHandler. Default 0
-        s.Optional("when"): s.Str(),  # TimedRotatingFileHandler. Default 'h'
-        s.Optional("interval"): s.Int(),  # TimedRotatingFileHandler. Default 1
-        s.Optional("utc"): s.Bool(),  # TimedRotatingFileHandler. Default False
-        # s.Optional("atTime"): s.EmptyNone() | "datetime.time"), TimedRotatingFileHandler. Default None
-        s.Optional("address"): s.FixedSeq([s.Str(), s.Int()]),  # SysLogHandler
-        s.Optional("facility"): s.Str(),  # SysLogHandler
-        # socket.SOCK_STREAM or socket.SOCK_DGRAM
-        s.Optional("socktype"): s.Int(),  # SysLogHandler
-        s.Optional("dllname"): s.EmptyNone() | s.Str(),  # NTEventLogHandler
-        s.Optional("logtype"): s.Str(),  # NTEventLogHandler
-        s.Optional("credentials"): s.EmptyNone()
-        | s.FixedSeq([s.Str(), s.Str()]),  # SMTPHandler
-        # SMTPHandler. Default None. Or'ing together two FixedSeq is not allowed
-        s.Optional("secure"): s.EmptyNone() | s.EmptyList() | s.Seq(s.Str()),
-        s.Optional("timeout"): s.Float(),  # SMTPHandler. Default 1.0
-        s.Optional("flushlevel"): s.Str(),  # MemoryHandler. Default "ERROR"
-        s.Optional("target"): s.EmptyNone() | s.Str(),  # MemoryHandler. Default None
-        s.Optional("flushOnClose"): s.Bool(),  # MemoryHandler. Default True
-        # QueueHandler and QueueListener. Default False
-        s.Optional("respect_handler_level"): s.Bool(),
-    },
-    s.Str(),
-    s.Any(),  # s.OrValidator(s.OrValidator(s.Str(), levels), s.Seq(s.Str())),
-)
+    root_map = s.Map(
+        {
+            s.Optional("level"): levels,
+            s.Optional("filters"): s.Seq(
+                s.Str()
+            ),  # dotted path. filters instances py311 ??
+            s.Optional("handlers"): s.Seq(s.Str()),
+        }
+    )
 
-# filters can be dotted path
-#
-#    qualname
-#
-#    https://docs.python.org/3/library/logging.config.html#configuration-file-format
-#    hierarchical channel name used by an app to get the logger
-loggers_map = s.Map(
-    {
-        s.Optional("level"): levels,
-        s.Optional("propagate"): s.Bool(),
-        s.Optional("filters"): s.Seq(s.Str()),  # dotted path. filters instances py311
-        s.Optional("handlers"): s.Seq(s.Str()),
-        s.Optional("qualname"): s.Str(),
-    },
-)
+    schema_logging_config = s.MapCombined(
+        {
+            "version": s.Enum([1], item_validator=s.Int()),  # must have 1 s.Optional
+            s.Optional("formatters"): s.MapPattern(s.Str(), formatter_map),
+            s.Optional("filters"): s.MapPattern(s.Str(), filters_map),
+            s.Optional("handlers"): s.MapPattern(s.Str(), handlers_map),
+            s.Optional("loggers"): s.MapPattern(s.Str(), loggers_map),
+            s.Optional("root"): root_map,
+            s.Optional(
+                "incremental",
+                default=False,
+                drop_if_none=True,
+            ): s.EmptyNone()
+            | s.Bool(),
+            s.Optional(
+                "disable_existing_loggers",
+                default=True,
+                drop_if_none=True,
+            ): s.EmptyNone()
+            | s.Bool(),
+        },
+        s.Str(),
+        s.Any(),
+    )
 
-root_map = s.Map(
-    {
-        s.Optional("level"): levels,
-        s.Optional("filters"): s.Seq(
-            s.Str()
-        ),  # dotted path. filters instances py311 ??
-        s.Optional("handlers"): s.Seq(s.Str()),
+    d_schemas = {
+        "format_style": format_style,
+        "levels": levels,
+        "logger_keys": logger_keys,
+        "logging_config_keys": logging_config_keys,
+        "formatter_map": formatter_map,
+        "filters_map": filters_map,
+        "handlers_map": handlers_map,
+        "loggers_map": loggers_map,
+        "root_map": root_map,
+        "schema_logging_config": schema_logging_config,
     }
-)
 
-schema_logging_config = s.MapCombined(
-    {
-        "version": s.Enum([1], item_validator=s.Int()),  # must have 1 s.Optional
-        s.Optional("formatters"): s.MapPattern(s.Str(), formatter_map),
-        s.Optional("filters"): s.MapPattern(s.Str(), filters_map),
-        s.Optional("handlers"): s.MapPattern(s.Str(), handlers_map),
-        s.Optional("loggers"): s.MapPattern(s.Str(), loggers_map),
-        s.Optional("root"): root_map,
-        s.Optional(
-            "incremental",
-            default=False,
-            drop_if_none=True,
-        ): s.EmptyNone()
-        | s.Bool(),
-        s.Optional(
-            "disable_existing_loggers",
-            default=True,
-            drop_if_none=True,
-        ): s.EmptyNone()
-        | s.Bool(),
-    },
-    s.Str(),
-    s.Any(),
-)
+    return d_schemas
+
+
+def __getattr__(name):
+    """PEP 562. Schemas are built on first access, then become plain
+    module attributes
+
+    :param name: module attribute name
+    :type name: str
+    :returns: schema
+    :rtype: strictyaml.Validator
+    :raises:
+
+       - :py:exc:`AttributeError` -- Not a module attribute
+
+    """
+    if name not in _SCHEMA_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:  # pragma: no cover
+        pass
+
+    with _lock_schemas:
+        d_globals = globals()
+        if name not in d_globals:
+            d_globals.update(_build_schemas())
+        else:  # pragma: no cover
+            pass
+
+    return d_globals[name]
+
+
+def __dir__():
+    """PEP 562. Include schemas not yet built
+
+    :returns: module attribute names
+    :rtype: list[str]
+    """
+    return sorted(set(globals().keys()) | set(_SCHEMA_NAMES))
 
 
 def validate_yaml_dirty(
     yaml_snippet,
-    schema=schema_logging_config,
+    schema=None,
+    allow_flow_style=True,
 ):
     """This designed with the intent to verify :py:mod:`logging.config` yaml
 
@@ -271,8 +384,14 @@ def validate_yaml_dirty(
 
     :param yaml_snippet: :py:mod:`logging.config` YAML str
     :type yaml_snippet: str
-    :param schema: :py:mod:`strictyaml` strict typing schema
-    :type schema: strictyaml.Validator | :py:data:`.schema_logging_config`
+    :param schema:
+
+       :py:mod:`strictyaml` strict typing schema. Default None,
+       :py:data:`.schema_logging_config`
+
+    :type schema: strictyaml.Validator | None
+    :param allow_flow_style: Default True. False to reject YAML flow style
+    :type allow_flow_style: bool
     :returns: YAML object. Pass this to each worker
     :rtype: strictyaml.YAML | None
     :single-line-parameter-list:
@@ -284,8 +403,20 @@ def validate_yaml_dirty(
        of dealing with Traceback
 
     """
+    import strictyaml as s
+
+    if schema is None:
+        schema = __getattr__("schema_logging_config")
+    else:  # pragma: no cover
+        pass
+
     # Allow flow style uz used often in logging.config cookbook
-    func = partial(s.dirty_load, yaml_snippet, schema=schema, allow_flow_style=True)
+    func = partial(
+        s.dirty_load,
+        yaml_snippet,
+        schema=schema,
+        allow_flow_style=allow_flow_style,
+    )
 
     try:
         actual = func()
@@ -293,3 +424,245 @@ def validate_yaml_dirty(
         raise
 
     return actual
+
+
+class _ValidationCache:
+    """Thread-safe bounded LRU of validated data. Keyed by sha256 of
+    the YAML str, schema identity, and allow_flow_style.
+
+    Each entry keeps a reference to its schema. So while the entry
+    exists, the schema :py:func:`id` cannot be reused by another object
+
+    Failed validation is not cached
+
+    :ivar maxsize: Max entry count
+    :vartype maxsize: int
+    """
+
+    __slots__ = ("_d_cache", "_hits", "_lock", "_misses", "maxsize")
+
+    def __init__(self, maxsize=VALIDATION_CACHE_MAXSIZE):
+        """Class constructor"""
+        self._d_cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self.maxsize = maxsize
+
+    @staticmethod
+    def get_key(yaml_snippet, schema, allow_flow_style):
+        """Cache key
+
+        :param yaml_snippet: :py:mod:`logging.config` YAML str
+        :type yaml_snippet: str
+        :param schema: :py:mod:`strictyaml` strict typing schema. None is default
+        :type schema: strictyaml.Validator | None
+        :param allow_flow_style: Whether YAML flow style is allowed
+        :type allow_flow_style: bool
+        :returns: sha256 hex digest, schema id, and allow_flow_style
+        :rtype: tuple[str, int, bool]
+        """
+        digest = hashlib.sha256(yaml_snippet.encode("utf-8")).hexdigest()
+        ret = (digest, id(schema), bool(allow_flow_style))
+
+        return ret
+
+    def get(self, key):
+        """On hit, move entry to most recently used
+
+        :param key: From :py:meth:`_ValidationCache.get_key`
+        :type key: tuple[str, int, bool]
+        :returns: validated data or None on miss. Not a copy!
+        :rtype: typing.Any | None
+        """
+        with self._lock:
+            t_entry = self._d_cache.get(key, None)
+            if t_entry is None:
+                self._misses += 1
+                ret = None
+            else:
+                self._hits += 1
+                self._d_cache.move_to_end(key)
+                _, ret = t_entry
+
+        return ret
+
+    def put(self, key, schema, data):
+        """Store validated data. Drop least recently used beyond maxsize
+
+        :param key: From :py:meth:`_ValidationCache.get_key`
+        :type key: tuple[str, int, bool]
+        :param schema: Kept alive so it's id stays unique
+        :type schema: strictyaml.Validator | None
+        :param data: validated data. Caller must not keep a reference
+        :type data: typing.Any
+        """
+        with self._lock:
+            self._d_cache[key] = (schema, data)
+            self._d_cache.move_to_end(key)
+            while len(self._d_cache) > self.maxsize:
+                self._d_cache.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._d_cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Cache statistics
+
+        :returns: hits, misses, maxsize, and currsize
+        :rtype: logging_strict.logging_yaml_validate.ValidationCacheInfo
+        """
+        with self._lock:
+            ret = ValidationCacheInfo(
+                self._hits,
+                self._misses,
+                self.maxsize,
+                len(self._d_cache),
+            )
+
+        return ret
+
+
+_validation_cache = _ValidationCache()
+_disk_cache = ValidationDiskCache()
+
+
+def validate_yaml_data(
+    yaml_snippet,
+    schema=None,
+    allow_flow_style=True,
+):
+    """Cached :py:func:`~logging_strict.logging_yaml_validate.validate_yaml_dirty`.
+    Get only the validated data, not the YAML object
+
+    Seen this YAML str before, with the same schema? Skip the strictyaml
+    schema walk. Re-applying a config becomes a copy, not a validation
+
+    With the default schema, validated data also persists in the XDG user
+    cache folder. So another process, validating the same YAML str,
+    loads JSON rather than validating. See
+    :py:class:`logging_strict.util.validation_cache.ValidationDiskCache`
+
+    With the default schema, first try the fast engine,
+    :py:func:`logging_strict.logging_yaml_prevalidate.prevalidate_yaml`.
+    Only if it rejects, is strictyaml run. A cache hit imports neither
+    engine
+
+    :param yaml_snippet: :py:mod:`logging.config` YAML str
+    :type yaml_snippet: str
+    :param schema:
+
+       :py:mod:`strictyaml` strict typing schema. Default None,
+       :py:data:`.schema_logging_config`
+
+    :type schema: strictyaml.Validator | None
+    :param allow_flow_style: Default True. False to reject YAML flow style
+    :type allow_flow_style: bool
+    :returns:
+
+       Validated data. An independent deep copy, safe to modify in-place
+
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`strictyaml.YAMLValidationError` -- Invalid.
+         Validation against schema failed
+
+       - :py:exc:`strictyaml.exceptions.DisallowedToken` -- flow style
+         encountered, but allow_flow_style False
+
+    """
+    data, _ = _validate_yaml_engine(
+        yaml_snippet,
+        schema=schema,
+        allow_flow_style=allow_flow_style,
+    )
+    ret = copy.deepcopy(data)
+
+    return ret
+
+
+def _validate_yaml_engine(
+    yaml_snippet,
+    schema=None,
+    allow_flow_style=True,
+):
+    """Validate thru the cache layers. Also which layer answered, so
+    a validation time can be attributed
+
+    :param yaml_snippet: :py:mod:`logging.config` YAML str
+    :type yaml_snippet: str
+    :param schema: Default None, :py:data:`.schema_logging_config`
+    :type schema: strictyaml.Validator | None
+    :param allow_flow_style: Default True. False to reject YAML flow style
+    :type allow_flow_style: bool
+    :returns:
+
+       Validated data, shared with the cache so do not modify. And
+       engine, :py:data:`ENGINE_MEMORY`, :py:data:`ENGINE_DISK`,
+       :py:data:`ENGINE_PREVALIDATE`, or :py:data:`ENGINE_STRICTYAML`
+
+    :rtype: tuple[typing.Any, str]
+    :raises:
+
+       - :py:exc:`strictyaml.YAMLValidationError` -- Invalid.
+         Validation against schema failed
+
+    """
+    # Default schema is keyed as None. So need not be built to check cache
+    if schema is not None and schema is globals().get("schema_logging_config", None):
+        schema = None
+    else:  # pragma: no cover
+        pass
+
+    key = _ValidationCache.get_key(yaml_snippet, schema, allow_flow_style)
+    data = _validation_cache.get(key)
+    engine = ENGINE_MEMORY
+    if data is None:
+        # Schema identity is per process. Only persist the default schema
+        is_default = schema is None and allow_flow_style
+        if is_default:
+            data = _disk_cache.get(yaml_snippet)
+            engine = ENGINE_DISK
+            if data is None:
+                from .logging_yaml_prevalidate import prevalidate_yaml
+
+                # Fast engine. Rejects --> strictyaml, for the precise error
+                data = prevalidate_yaml(yaml_snippet)
+                engine = ENGINE_PREVALIDATE
+                if data is not None:
+                    _disk_cache.put(yaml_snippet, data)
+        if data is None:
+            yaml_config = validate_yaml_dirty(
+                yaml_snippet,
+                schema=schema,
+                allow_flow_style=allow_flow_style,
+            )
+            engine = ENGINE_STRICTYAML
+            # Each access of ``YAML.data`` builds a new object. Cache keeps this one
+            data = yaml_config.data
+            if is_default:
+                _disk_cache.put(yaml_snippet, data)
+        _validation_cache.put(key, schema, data)
+
+    return data, engine
+
+
+def validation_cache_clear():
+    """Empty the in-process validation cache and reset statistics"""
+    _validation_cache.clear()
+
+
+def validation_cache_info():
+    """In-process validation cache statistics
+
+    :returns: hits, misses, maxsize, and currsize
+    :rtype: logging_strict.logging_yaml_validate.ValidationCacheInfo
+    """
+    ret = _validation_cache.info()
+
+    return ret
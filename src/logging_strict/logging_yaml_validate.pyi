@@ -1,15 +1,41 @@
 # once strictyaml implements type hints #90, this stub breaks
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    NamedTuple,
+)
+
 from strictyaml import (
     YAML,
     Enum,
     Validator,
 )
 
+from .util.validation_cache import ValidationDiskCache
+
 __all__ = (
     "schema_logging_config",
     "validate_yaml_dirty",
+    "validate_yaml_data",
+    "validation_cache_clear",
+    "validation_cache_info",
 )
 
+VALIDATION_CACHE_MAXSIZE: int
+ENGINE_MEMORY: str
+ENGINE_DISK: str
+ENGINE_PREVALIDATE: str
+ENGINE_STRICTYAML: str
+_SCHEMA_NAMES: tuple[str, ...]
+_lock_schemas: threading.Lock
+
+class ValidationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 format_style: Enum
 format_style_default: str
 levels: Enum
@@ -24,7 +50,53 @@ root_map: Validator
 
 schema_logging_config: Validator
 
+def _build_schemas() -> dict[str, Validator]: ...
+def __getattr__(name: str) -> Validator: ...
+def __dir__() -> list[str]: ...
 def validate_yaml_dirty(
     yaml_snippet: str,
-    schema: Validator | None = ...,
+    schema: Validator | None = None,
+    allow_flow_style: bool = True,
 ) -> YAML | None: ...
+
+class _ValidationCache:
+    __slots__ = ("_d_cache", "_hits", "_lock", "_misses", "maxsize")
+
+    _d_cache: OrderedDict[tuple[str, int, bool], tuple[Validator | None, Any]]
+    _lock: threading.Lock
+    _hits: int
+    _misses: int
+    maxsize: int
+
+    def __init__(self, maxsize: int = ...) -> None: ...
+    @staticmethod
+    def get_key(
+        yaml_snippet: str,
+        schema: Validator | None,
+        allow_flow_style: bool,
+    ) -> tuple[str, int, bool]: ...
+    def get(self, key: tuple[str, int, bool]) -> Any | None: ...
+    def put(
+        self,
+        key: tuple[str, int, bool],
+        schema: Validator | None,
+        data: Any,
+    ) -> None: ...
+    def clear(self) -> None: ...
+    def info(self) -> ValidationCacheInfo: ...
+
+_validation_cache: _ValidationCache
+_disk_cache: ValidationDiskCache
+
+def validate_yaml_data(
+    yaml_snippet: str,
+    schema: Validator | None = None,
+    allow_flow_style: bool = True,
+) -> Any: ...
+def _validate_yaml_engine(
+    yaml_snippet: str,
+    schema: Validator | None = None,
+    allow_flow_style: bool = True,
+) -> tuple[Any, str]: ...
+def validation_cache_clear() -> None: ...
+def validation_cache_info() -> ValidationCacheInfo: ...
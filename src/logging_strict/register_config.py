@@ -74,30 +74,25 @@ Between ``- file:\\n`` and ``a: b\\n`` there are four spaces, not two.
 Very helpful to understand difference between expected dict and needed yaml str
 """
 
-from collections.abc import (
-    Generator,
-    Iterator,
-    Mapping,
-    MutableSet,
-    Sequence,
-)
-from contextlib import nullcontext as does_not_raise
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import (
     Path,
     PurePath,
 )
 from typing import TYPE_CHECKING
-from unittest.mock import patch
 
+import importlib_metadata as metadata
 import strictyaml as s
 
-from .constants import (
-    LoggingConfigCategory,
-    g_app_name,
-)
+from .constants import LoggingConfigCategory
 from .exceptions import PackageNotFoundError
 from .logging_api import (
+    _resolve_in_memory,
     setup_ui_other,
     setup_worker_other,
 )
@@ -110,12 +105,15 @@ from .util.package_resource import (
     filter_by_file_stem,
     filter_by_suffix,
 )
+from .util.validation_cache import RegistrySnapshot
 from .util.xdg_folder import DestFolderUser
 
 # _logger = logging.getLogger(f"{g_app_name}.register_config")
 
 CONFIG_STEM = "logging_strict"
 CONFIG_SUFFIX = ".yml"
+ENTRY_POINT_GROUP = "logging_strict.registry"
+QUERY_CACHE_MAXSIZE = 128
 # REGEX_REL_PATH = "^(?!-)[_a-zA-Z0-9-]+(?<!-)(/(?!-)[_a-zA-Z0-9-]+(?<!-))*(/(?!-\.)[_a-zA-Z0-9-\.]+(?<![_\.-]))?$"
 REGEX_REL_PATH = r"^(?!-)[_a-zA-Z0-9-]+(?<!-)(\/(?!-)[_a-zA-Z0-9-]+(?<!-))*(\/(?!-\.)[_a-zA-Z0-9-\.]+(?<![_\.-]))?$"
 
@@ -152,6 +150,72 @@ test_yaml = """\
     flavor: asz
     version_no: 1"""
 
+#: Validated registries. Per package, keyed by installed distribution
+_registry_snapshot = RegistrySnapshot()
+
+#: tuple[str, str, str, str]: With is_test_file, fields making up the index key
+INDEX_FIELDS = ("category", "genre", "flavor", "version_no")
+
+
+def _category_value(category):
+    """Category enum to its value. Other values as-is
+
+    :param category: worker or app
+    :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+    :returns: category value
+    :rtype: typing.Any
+    """
+    if isinstance(category, LoggingConfigCategory):
+        ret = category.value
+    else:
+        ret = category
+
+    return ret
+
+
+def _index_key(values, is_test_file):
+    """Index key. Field values which are not a non-empty str match any value
+
+    :param values: category, genre, flavor, and version_no
+    :type values: collections.abc.Sequence[typing.Any]
+    :param is_test_file: True test file otherwise normal file
+    :type is_test_file: bool
+    :returns: index key
+    :rtype: tuple[str | None | bool, ...]
+    """
+    ret = tuple(val if is_ok(val) else None for val in values) + (is_test_file,)
+
+    return ret
+
+
+def _build_index(registry):
+    """Index registry records by every combination of
+    :py:data:`INDEX_FIELDS`, so each query is one dict lookup
+
+    :param registry: validated registry records
+    :type registry: collections.abc.Sequence[dict[str, dict[str, typing.Any]]]
+    :returns: index key --> registry positions, in registry order
+    :rtype: dict[tuple[str | None | bool, ...], list[int]]
+    """
+    masks = tuple(itertools.product((True, False), repeat=len(INDEX_FIELDS)))
+    d_index = {}
+    for idx, d_record in enumerate(registry):
+        d_item = d_record["file"]
+        values = tuple(d_item[field] for field in INDEX_FIELDS)
+        is_test_file = d_item["is_test_file"]
+        # Empty str field is keyed as None. Masks then collide. Once per key
+        keys = {
+            _index_key(
+                tuple(val if is_used else None for val, is_used in zip(values, mask)),
+                is_test_file,
+            )
+            for mask in masks
+        }
+        for key in keys:
+            d_index.setdefault(key, []).append(idx)
+
+    return d_index
+
 
 class ExtractorLoggingConfig:
     """Extract both registry (YAML) db and a logging config YAML file
@@ -166,18 +230,27 @@ class ExtractorLoggingConfig:
        The extraction folder, by default, is XDG User config folder.
        Support specifying an alternative folder.
 
-       Having this feature baked in, would eleviate the need to use
-       unittest.mock.patch and know what to patch
+       Passed explicitly to the extraction and validation functions.
+       No module globals are patched, so queries may run concurrently
 
     :vartype path_alternative_dest_folder: pathlib.Path | None
     :ivar is_test_file: Default False. True if want to search for test files
     :vartype is_test_file: bool | None
+    :ivar is_in_memory:
+
+       Default None. True reads the registry db and logging config YAML
+       files from package data. Nothing is extracted. None uses
+       :py:func:`logging_strict.logging_api.get_in_memory`
+
+    :vartype is_in_memory: bool | None
 
     .. py:attribute:: __slots__
-       :type: tuple[str, str, str, str, str, str, str]
+       :type: tuple[str, str, str, str, str, str, str, str, str, str, str, str, str]
        :value: ("_package_name", "_patch_extract_folder", "_path_extraction_dir", \
         "_is_test_file", "_path_extracted_db", "_logging_config_yaml_str", \
-        "_registry", "_logging_config_yaml_relpath")
+        "_registry", "_logging_config_yaml_relpath", "_index", \
+        "_is_extract_pending", "_query_cache", "_query_cache_lock", \
+        "_is_in_memory")
 
        Fixed class private attributes
 
@@ -192,6 +265,11 @@ class ExtractorLoggingConfig:
         "_logging_config_yaml_str",
         "_registry",
         "_logging_config_yaml_relpath",
+        "_index",
+        "_is_extract_pending",
+        "_query_cache",
+        "_query_cache_lock",
+        "_is_in_memory",
     )
 
     def __init__(
@@ -199,8 +277,13 @@ class ExtractorLoggingConfig:
         package_name,
         path_alternative_dest_folder=None,
         is_test_file=False,
+        is_in_memory=None,
     ):
         """class constructor"""
+        # query_db results. Least recently used first
+        self._query_cache = OrderedDict()
+        # Concurrent queries share the cache
+        self._query_cache_lock = threading.Lock()
         self.package_name = package_name
 
         # Specify alternative extraction folder
@@ -242,11 +325,15 @@ class ExtractorLoggingConfig:
         else:  # pragma: no cover
             self._is_test_file = is_test_file
 
+        self._is_in_memory = is_in_memory
+
         # Yet to be set
         self._path_extracted_db = None
         self._logging_config_yaml_str = None
         self._logging_config_yaml_relpath = None
         self._registry = None
+        self._index = None
+        self._is_extract_pending = False
 
     def __repr__(self):
         """Instance str representation
@@ -299,6 +386,7 @@ class ExtractorLoggingConfig:
         package_name_clean = cls.clean_package_name(val)
         if package_name_clean is not None:  # pragma: no branch
             self._package_name = package_name_clean
+            self.query_cache_clear()
 
     @property
     def path_extracted_db(self):
@@ -306,9 +394,17 @@ class ExtractorLoggingConfig:
         :py:meth:`logging_strict.register_config.ExtractorLoggingConfig.extract_db`
         will hold the path to the registry db YAML file
 
+        Registry loaded from the snapshot? Extracts on first access
+
         :returns: logging config YAML registry db path. registry db is also a YAML file
         :rtype: pathlib.Path | None
         """
+        if self._is_extract_pending:
+            self._is_extract_pending = False
+            self.extract_db()
+        else:  # pragma: no cover
+            pass
+
         return self._path_extracted_db
 
     @property
@@ -324,6 +420,16 @@ class ExtractorLoggingConfig:
         """
         return self._is_test_file
 
+    @property
+    def is_in_memory(self):
+        """True if the registry db and logging config YAML files are read
+        from package data, rather than extracted
+
+        :returns: True zero extraction. False extract
+        :rtype: bool
+        """
+        return _resolve_in_memory(self._is_in_memory)
+
     @property
     def logging_config_yaml_str(self):
         """Get query_db result
@@ -397,12 +503,60 @@ class ExtractorLoggingConfig:
                 # Failed query. In package, no such data file
                 self._path_extracted_db = None
 
+    def read_db(self):
+        """Zero extraction. Read logging config YAML file registry db
+        from package data
+
+        :returns: registry db YAML str. None if no such package or file
+        :rtype: str | None
+        """
+        if TYPE_CHECKING:
+            from .util.package_resource import (
+                PartStem,
+                PartSuffix,
+            )
+
+            cb_stem: PartStem
+            cb_suffix: PartSuffix
+
+        start_folder_relpath = ""
+        cb_stem = partial(filter_by_file_stem, CONFIG_STEM)
+        cb_suffix = partial(filter_by_suffix, CONFIG_SUFFIX)
+
+        try:
+            pr = PackageResource(self._package_name, start_folder_relpath)
+        except PackageNotFoundError:
+            ret = None
+        else:
+            gen_files = pr.iter_data_files(
+                cb_suffix=cb_suffix,
+                cb_file_stem=cb_stem,
+            )
+            t_found = next(gen_files, None)
+            if t_found is not None:
+                # Take the 1st result although there should only be one file
+                _, traversable_f = t_found
+                ret = traversable_f.read_text(encoding="utf-8")
+            else:  # pragma: no cover
+                # In package, no such data file
+                ret = None
+
+        return ret
+
     def get_db(self, path_extracted_db=None):
         """Get YAML registry of logging config YAML file records. Which happens
         also to be a YAML file.
 
         If package not installed, will emit INFO and WARNING log messages
 
+        Without path_extracted_db, a validated snapshot, from a prior
+        run, is loaded instead. Requires the same installed distribution.
+        The registry db file is then extracted only if
+        :py:attr:`ExtractorLoggingConfig.path_extracted_db` is accessed
+
+        If :py:attr:`ExtractorLoggingConfig.is_in_memory`, the registry
+        db is read from package data. Never extracted
+
         :param path_extracted_db:
 
            Default None. None extract registry otherwise restore previously
@@ -416,6 +570,29 @@ class ExtractorLoggingConfig:
            - :py:exc:`strictyaml.YAMLValidationError` -- validation failed
 
         """
+        self._is_extract_pending = False
+        # Registry reloaded. Prior query results may be stale
+        self.query_cache_clear()
+        snapshot_key = None
+        if path_extracted_db is None:
+            # Warm start. No package walk, no file copy, no strictyaml
+            snapshot_key = _registry_snapshot.get_key(self._package_name)
+            if snapshot_key is not None:
+                registry = _registry_snapshot.get(self._package_name, snapshot_key)
+            else:
+                registry = None
+
+            if registry is not None:
+                self._registry = registry
+                self._index = _build_index(registry)
+                self._path_extracted_db = None
+                self._is_extract_pending = not self.is_in_memory
+                return
+            else:  # pragma: no cover
+                pass
+        else:  # pragma: no cover
+            pass
+
         # On failure, :code:`self._path_extracted_db is None` and a warning is logged
         if path_extracted_db is not None:
             if (
@@ -431,15 +608,22 @@ class ExtractorLoggingConfig:
         else:
             is_extract = True
 
-        if is_extract:  # pragma: no branch
-            self.extract_db()
+        if is_extract and self.is_in_memory:
+            # Zero extraction
+            self._path_extracted_db = None
+            str_yaml_raw = self.read_db()
+        else:
+            if is_extract:  # pragma: no branch
+                self.extract_db()
+
+            path_f = self.path_extracted_db
+            str_yaml_raw = None if path_f is None else path_f.read_text()
 
-        path_f = self.path_extracted_db
-        if path_f is None:
+        if str_yaml_raw is None:
             # Failed query. In package, no such data file
             self._registry = None
+            self._index = None
         else:
-            str_yaml_raw = path_f.read_text()
             # validate database against schema
             try:
                 yaml_config = validate_yaml_dirty(
@@ -451,6 +635,15 @@ class ExtractorLoggingConfig:
             else:
                 # when patched, this method didn't end at the :code:`raise`
                 self._registry = yaml_config.data
+                self._index = _build_index(self._registry)
+                if snapshot_key is not None:
+                    _registry_snapshot.put(
+                        self._package_name,
+                        snapshot_key,
+                        self._registry,
+                    )
+                else:  # pragma: no cover
+                    pass
 
     def query_db(
         self,
@@ -467,6 +660,12 @@ class ExtractorLoggingConfig:
 
         Does not emit log messages
 
+        Results are remembered, up to :py:data:`QUERY_CACHE_MAXSIZE`. A
+        repeated query neither extracts nor validates. Except UI queries
+        which do not skip setup. Cleared by
+        :py:meth:`ExtractorLoggingConfig.get_db` and
+        :py:meth:`ExtractorLoggingConfig.query_cache_clear`
+
         :param category: worker or app. Unfortunitely the default is app.
         :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
         :param genre:
@@ -496,149 +695,529 @@ class ExtractorLoggingConfig:
 
         :type is_skip_setup: bool | None
         """
+        # Setup is a side effect. Must occur on every query
+        is_cacheable = bool(is_skip_setup) or (
+            _category_value(category) != LoggingConfigCategory.UI.value
+        )
+        key = _index_key(
+            (_category_value(category), genre, flavor, version_no),
+            self.is_test_file,
+        ) + (logger_package_name if is_ok(logger_package_name) else None,)
+        if is_cacheable:
+            with self._query_cache_lock:
+                t_ret = self._query_cache.get(key, None)
+                if t_ret is not None:
+                    self._query_cache.move_to_end(key)
+                else:  # pragma: no cover
+                    pass
+        else:
+            t_ret = None
+
+        if t_ret is None:
+            t_ret = next(
+                self.query_all(
+                    category,
+                    genre=genre,
+                    flavor=flavor,
+                    version_no=version_no,
+                    logger_package_name=logger_package_name,
+                    is_skip_setup=is_skip_setup,
+                ),
+                None,
+            )
+            if t_ret is not None and is_cacheable:
+                with self._query_cache_lock:
+                    self._query_cache[key] = t_ret
+                    self._query_cache.move_to_end(key)
+                    while len(self._query_cache) > QUERY_CACHE_MAXSIZE:
+                        self._query_cache.popitem(last=False)
+            else:  # pragma: no cover
+                pass
+
+        if t_ret is None:
+            # No registry or no record matches
+            self._logging_config_yaml_relpath = None
+            self._logging_config_yaml_str = None
+        else:
+            f_relpath, str_yaml = t_ret
+            self._logging_config_yaml_relpath = f_relpath
+            self._logging_config_yaml_str = str_yaml
+
+    def query_cache_clear(self):
+        """Forget remembered query results. e.g. after a QA tester
+        edits an extracted logging config YAML file"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def iter_records(
+        self,
+        category=None,
+        genre=None,
+        flavor=None,
+        version_no=None,
+    ):
+        """Matching registry records, in registry order. Uses the index,
+        so does not scan the registry. Nothing is extracted
+
+        Omitted, None or empty str, fields match any value. Only test
+        files or only normal files, depending on
+        :py:attr:`ExtractorLoggingConfig.is_test_file`
+
+        :param category: Default None. worker or app
+        :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+        :param genre: Default None. e.g. "textual" or "mp"
+        :type genre: str | None
+        :param flavor: Default None. e.g. "asz"
+        :type flavor: str | None
+        :param version_no: Default None. e.g. "1"
+        :type version_no: str | None
+        :returns: registry record ``file`` items
+        :rtype: collections.abc.Iterator[dict[str, typing.Any]]
+        """
+        if self._index is None:
+            # No registry
+            return
+        else:  # pragma: no cover
+            pass
+
+        key = _index_key(
+            (_category_value(category), genre, flavor, version_no),
+            self.is_test_file,
+        )
+        for idx in self._index.get(key, ()):
+            yield self._registry[idx]["file"]
+
+    def query_all(
+        self,
+        category,
+        genre=None,
+        flavor=None,
+        version_no=VERSION_FALLBACK,
+        logger_package_name=None,
+        is_skip_setup=True,
+    ):
+        """Lazily extract and validate each matching logging config YAML
+        file. Nothing is extracted until the next result is requested
+
+        Records whose logging config YAML file is missing, ambiguous, or
+        invalid are skipped. Params are the same as
+        :py:meth:`ExtractorLoggingConfig.query_db`
+
+        :param category: worker or app
+        :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+        :param genre: Default None. e.g. "textual" or "mp"
+        :type genre: str | None
+        :param flavor: Default None. e.g. "asz"
+        :type flavor: str | None
+        :param version_no: Default "1"
+        :type version_no: str | None
+        :param logger_package_name:
+
+           Default None. In the logging config YAML file, replaces default
+           logger token with package name that will be logged
+
+        :type logger_package_name: str | None
+        :param is_skip_setup: Default True. During querying, avoid (UI only) setup
+        :type is_skip_setup: bool | None
+        :returns: relative path to extracted logging config YAML file and the yaml str
+        :rtype: collections.abc.Iterator[tuple[str, str]]
+        """
+        gen_records = self.iter_records(
+            category=category,
+            genre=genre,
+            flavor=flavor,
+            version_no=version_no,
+        )
+        for d_item in gen_records:
+            t_ret = self._extract_item(
+                d_item,
+                logger_package_name=logger_package_name,
+                is_skip_setup=is_skip_setup,
+            )
+            if t_ret is not None:
+                yield t_ret
+            else:  # pragma: no cover continue
+                pass
+
+    def _extract_item(self, d_item, logger_package_name=None, is_skip_setup=True):
+        """Extract and validate the logging config YAML file of one
+        registry record
+
+        :param d_item: registry record ``file`` item
+        :type d_item: dict[str, typing.Any]
+        :param logger_package_name:
+
+           Default None. In the logging config YAML file, replaces default
+           logger token with package name that will be logged
+
+        :type logger_package_name: str | None
+        :param is_skip_setup: Default True. During querying, avoid (UI only) setup
+        :type is_skip_setup: bool | None
+        :returns:
+
+           relative path to extracted logging config YAML file and the
+           yaml str. None if missing, ambiguous, or invalid
+
+        :rtype: tuple[str, str] | None
+        """
         if is_ok(logger_package_name):
             str_logger_package_name = logger_package_name
         else:
             str_logger_package_name = None
 
-        is_set_blank = True
-        if self._registry is None or not isinstance(
-            self._registry,
-            (Generator, Sequence, Iterator, set, MutableSet),
-        ):
-            # No Registry. Cannot extract and validate
-            is_set_blank = True
+        """Choose which extraction function to use based only on category
+
+        Do not call worker_yaml_curated or ui_yaml_curated.
+        ``package_data_folder_start`` is hardcoded.
+        """
+        if d_item["category"] == LoggingConfigCategory.UI.value:
+            # During querying, setup can raise. Caller chooses
+            fcn = partial(setup_ui_other, is_skip_setup=is_skip_setup)
         else:
-            for d_record in self._registry:
-                assert isinstance(d_record, Mapping)
-                d_item = d_record["file"]
-                # should be a posix path to a logging config YAML file
-                item_f_relpath = d_item["relative_path"]
-                item_category = d_item["category"]
-                item_genre = d_item["genre"]
-                item_flavor = d_item["flavor"]
-                item_version_no = d_item["version_no"]
-                # Optional field. If not provided, schema automagically sets default
-                item_is_test_file = d_item["is_test_file"]
-
-                # Either both test file or both normal file
-                # not a test file and want a test file
-                is_mismatch_not_a_test = (
-                    self.is_test_file is False and item_is_test_file is True
-                )
-                # is a test file, but don't want a test file
-                is_mismatch_not_a_normal = (
-                    self.is_test_file is True and item_is_test_file is False
-                )
-                is_mismatch = is_mismatch_not_a_test or is_mismatch_not_a_normal
-                is_category_mismatch = is_ok(category) and category != item_category
-                is_genre_mismatch = is_ok(genre) and genre != item_genre
-                is_flavor_mismatch = is_ok(flavor) and flavor != item_flavor
-                is_version_no_mismatch = (
-                    is_ok(version_no) and version_no != item_version_no
-                )
+            # LoggingConfigCategory.WORKER.value. No setup
+            fcn = setup_worker_other
 
-                t_skip = (
-                    is_mismatch,
-                    is_category_mismatch,
-                    is_genre_mismatch,
-                    is_flavor_mismatch,
-                    is_version_no_mismatch,
-                )
-                is_skip = any(t_skip)
+        # Extraction folder. None is the XDG user data folder
+        if self._patch_extract_folder:
+            path_dest_folder = self._path_extraction_dir
+        else:
+            path_dest_folder = None
+
+        # Is package data so will need to extract package data file
+        # Separate relpath into components. Get relative path without file name
+        relpath_f = Path(d_item["relative_path"])
+        package_start_relative_folder = ""
+        if str(relpath_f.parent) != ".":  # pragma: no branch
+            package_start_relative_folder = str(relpath_f.parent)
+
+        try:
+            ret = fcn(
+                self.package_name,
+                package_start_relative_folder,
+                d_item["genre"],
+                d_item["flavor"],
+                version_no=d_item["version_no"],
+                package_start_relative_folder=package_start_relative_folder,
+                logger_package_name=str_logger_package_name,
+                path_dest_folder=path_dest_folder,
+                is_in_memory=self.is_in_memory,
+            )
+        except (FileNotFoundError, AssertionError):
+            """Inappropriate location to validate ``logging_strict.yml``
 
-                if is_skip:  # pragma: no branch
-                    continue
+            FileNotFoundError -- register db contains entry but
+            the package data file is missing.
 
-                """Choose which extraction function to use based only on category
+            AssertionError -- More than one logging config YAML file found.
+            """
+            ret = None
+        except s.YAMLValidationError:
+            """Inappropriate location to validate ``logging_strict.yml``
 
-                Do not call worker_yaml_curated or ui_yaml_curated.
-                ``package_data_folder_start`` is hardcoded.
-                """
-                if category == LoggingConfigCategory.UI.value:
-                    fcn = setup_ui_other
-                else:
-                    # Default to LoggingConfigCategory.WORKER.value
-                    fcn = setup_worker_other
-
-                # Is package data so will need to extract package data file
-                # Separate relpath into components. Get relative path without file name
-                relpath_f = Path(item_f_relpath)
-                package_start_relative_folder = ""
-                if str(relpath_f.parent) != ".":  # pragma: no branch
-                    package_start_relative_folder = str(relpath_f.parent)
-
-                # Extract the logging config YAML file
-                fcn_wo_params = partial(
-                    fcn,
-                    self.package_name,
-                    package_start_relative_folder,
-                    item_genre,
-                    item_flavor,
-                    version_no=item_version_no,
-                    package_start_relative_folder=package_start_relative_folder,
-                    logger_package_name=str_logger_package_name,
-                )
-                if is_skip_setup:
-                    # logging config defang. Skip setup to avoid possible exceptions
-                    cm_skip = patch(
-                        "logging.config.dictConfig",
-                        return_value=True,
-                    )
-                else:
-                    # Do not skip setup
-                    cm_skip = does_not_raise()
-
-                try:
-                    is_xdg_folder = not self._patch_extract_folder
-                    if is_xdg_folder:
-                        with cm_skip:
-                            t_ret = fcn_wo_params()
-                    else:
-                        # alternative extraction folder
-                        with (
-                            cm_skip,
-                            patch(
-                                f"{g_app_name}.util.xdg_folder._get_path_config",
-                                return_value=self._path_extraction_dir,
-                            ),
-                            patch(
-                                f"{g_app_name}.logging_yaml_abc._get_path_config",
-                                return_value=self._path_extraction_dir,
-                            ),
-                            patch(
-                                f"{g_app_name}.logging_api._get_path_config",
-                                return_value=self._path_extraction_dir,
-                            ),
-                        ):
-                            t_ret = fcn_wo_params()
-                except (FileNotFoundError, AssertionError):
-                    """Inappropriate location to validate ``logging_strict.yml``
-
-                    FileNotFoundError -- register db contains entry but
-                    the package data file is missing.
-
-                    AssertionError -- More than one logging config YAML file found.
-                    """
-                    continue
-                except s.YAMLValidationError:
-                    """Inappropriate location to validate ``logging_strict.yml``
-
-                    strictyaml.YAMLValidationError -- logging config
-                    YAML file validation failed.
-                    """
-                    continue
-                else:
-                    is_set_blank = False
-                    f_relpath, str_yaml = t_ret
-                    self._logging_config_yaml_relpath = f_relpath
-                    self._logging_config_yaml_str = str_yaml
-                    # match was found. Stop the for loop
-                    break
-            else:
-                # config file has no records
-                is_set_blank = True
+            strictyaml.YAMLValidationError -- logging config
+            YAML file validation failed.
+            """
+            ret = None
 
-        if is_set_blank:  # pragma: no branch
-            self._logging_config_yaml_relpath = None
-            self._logging_config_yaml_str = None
+        return ret
+
+
+def iter_registry_packages():
+    """Installed distributions advertising a ``logging_strict.yml``
+    registry. In the distribution's ``pyproject.toml``
+
+    .. code-block:: text
+
+       [project.entry-points."logging_strict.registry"]
+       my_package = "my_package"
+
+    Entry point value is the package, containing the registry
+
+    :returns: package names, without duplicates, in discovery order
+    :rtype: list[str]
+    """
+    package_names = []
+    for ep in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        package_name = _to_package_case(ep.module)
+        if package_name not in package_names:
+            package_names.append(package_name)
+        else:  # pragma: no cover
+            pass
+
+    return package_names
+
+
+class RegistryCatalog:
+    """One catalog, merged from the registries of many packages. Query
+    any (category, genre, flavor) without knowing which package has it
+
+    Query results are returned, not stored, so one catalog may be
+    shared between threads. See :py:func:`get_registry_catalog`
+
+    :ivar path_alternative_dest_folder:
+
+       Default None. Extraction folder. None uses XDG user data folder
+
+    :vartype path_alternative_dest_folder: pathlib.Path | None
+    :ivar is_test_file: Default False. True if want to search for test files
+    :vartype is_test_file: bool | None
+    :ivar package_names:
+
+       Default None. None discovers packages by entry point, group
+       :py:data:`ENTRY_POINT_GROUP`
+
+    :vartype package_names: collections.abc.Sequence[str] | None
+    :ivar max_workers: Default None. Max threads which load registries
+    :vartype max_workers: int | None
+    :ivar is_in_memory:
+
+       Default None. True reads from package data. Nothing is extracted.
+       None uses :py:func:`logging_strict.logging_api.get_in_memory`
+
+    :vartype is_in_memory: bool | None
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str, str, str, str, str, str]
+       :value: ("_index", "_is_in_memory", "_is_test_file", "_items", \
+        "_max_workers", "_package_names", "_path_alternative_dest_folder")
+
+       Fixed class private attributes
+
+    """
+
+    __slots__ = (
+        "_index",
+        "_is_in_memory",
+        "_is_test_file",
+        "_items",
+        "_max_workers",
+        "_package_names",
+        "_path_alternative_dest_folder",
+    )
+
+    def __init__(
+        self,
+        path_alternative_dest_folder=None,
+        is_test_file=False,
+        package_names=None,
+        max_workers=None,
+        is_in_memory=None,
+    ):
+        """Class constructor"""
+        self._path_alternative_dest_folder = path_alternative_dest_folder
+        self._is_test_file = is_test_file is True
+        if package_names is None:
+            self._package_names = None
+        else:
+            self._package_names = tuple(package_names)
+        self._max_workers = max_workers
+        self._is_in_memory = is_in_memory
+
+        # Yet to be loaded
+        self._items = []
+        self._index = {}
+
+    @property
+    def package_names(self):
+        """Packages, with a registry, within the catalog
+
+        :returns: package names
+        :rtype: list[str]
+        """
+        ret = list(dict.fromkeys(reg.package_name for reg, _ in self._items))
+
+        return ret
+
+    def _load_one(self, package_name):
+        """Load one package's registry. From the snapshot if possible
+
+        :param package_name: package containing a ``logging_strict.yml``
+        :type package_name: str
+        :returns: extractor. None if no or invalid registry
+        :rtype: logging_strict.register_config.ExtractorLoggingConfig | None
+        """
+        reg = ExtractorLoggingConfig(
+            package_name,
+            path_alternative_dest_folder=self._path_alternative_dest_folder,
+            is_test_file=self._is_test_file,
+            is_in_memory=self._is_in_memory,
+        )
+        try:
+            reg.get_db()
+        except s.YAMLValidationError:
+            # One bad registry does not spoil the catalog
+            ret = None
+        else:
+            ret = reg if reg._registry is not None else None
+
+        return ret
+
+    def load(self):
+        """Load every package's registry, in parallel threads. Then
+        merge and index, in a single pass
+
+        :returns: count of packages with a registry
+        :rtype: int
+        """
+        if self._package_names is None:
+            package_names = iter_registry_packages()
+        else:
+            package_names = self._package_names
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            extractors = [
+                reg for reg in executor.map(self._load_one, package_names) if reg
+            ]
+
+        # Package discovery order, then registry order
+        self._items = [
+            (reg, d_record) for reg in extractors for d_record in reg._registry
+        ]
+        self._index = _build_index([d_record for _, d_record in self._items])
+
+        return len(extractors)
+
+    def iter_records(
+        self,
+        category=None,
+        genre=None,
+        flavor=None,
+        version_no=None,
+    ):
+        """Matching registry records, across packages. Nothing is extracted
+
+        :param category: Default None. worker or app
+        :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+        :param genre: Default None. e.g. "textual" or "mp"
+        :type genre: str | None
+        :param flavor: Default None. e.g. "asz"
+        :type flavor: str | None
+        :param version_no: Default None. e.g. "1"
+        :type version_no: str | None
+        :returns: package name and registry record ``file`` item
+        :rtype: collections.abc.Iterator[tuple[str, dict[str, typing.Any]]]
+        """
+        key = _index_key(
+            (_category_value(category), genre, flavor, version_no),
+            self._is_test_file,
+        )
+        for idx in self._index.get(key, ()):
+            reg, d_record = self._items[idx]
+            yield reg.package_name, d_record["file"]
+
+    def query_all(
+        self,
+        category,
+        genre=None,
+        flavor=None,
+        version_no=VERSION_FALLBACK,
+        logger_package_name=None,
+        is_skip_setup=True,
+    ):
+        """Lazily extract and validate each matching logging config YAML
+        file, across packages. Params are the same as
+        :py:meth:`ExtractorLoggingConfig.query_all`
+
+        :param category: worker or app
+        :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+        :param genre: Default None. e.g. "textual" or "mp"
+        :type genre: str | None
+        :param flavor: Default None. e.g. "asz"
+        :type flavor: str | None
+        :param version_no: Default "1"
+        :type version_no: str | None
+        :param logger_package_name:
+
+           Default None. In the logging config YAML file, replaces default
+           logger token with package name that will be logged
+
+        :type logger_package_name: str | None
+        :param is_skip_setup: Default True. During querying, avoid (UI only) setup
+        :type is_skip_setup: bool | None
+        :returns:
+
+           package name, relative path to extracted logging config YAML
+           file, and the yaml str
+
+        :rtype: collections.abc.Iterator[tuple[str, str, str]]
+        """
+        key = _index_key(
+            (_category_value(category), genre, flavor, version_no),
+            self._is_test_file,
+        )
+        for idx in self._index.get(key, ()):
+            reg, d_record = self._items[idx]
+            t_ret = reg._extract_item(
+                d_record["file"],
+                logger_package_name=logger_package_name,
+                is_skip_setup=is_skip_setup,
+            )
+            if t_ret is not None:
+                f_relpath, str_yaml = t_ret
+                yield reg.package_name, f_relpath, str_yaml
+            else:  # pragma: no cover continue
+                pass
+
+    def query_db(
+        self,
+        category,
+        genre=None,
+        flavor=None,
+        version_no=VERSION_FALLBACK,
+        logger_package_name=None,
+        is_skip_setup=True,
+    ):
+        """First result of :py:meth:`RegistryCatalog.query_all`
+
+        :param category: worker or app
+        :type category: logging_strict.constants.LoggingConfigCategory | str | typing.Any | None
+        :param genre: Default None. e.g. "textual" or "mp"
+        :type genre: str | None
+        :param flavor: Default None. e.g. "asz"
+        :type flavor: str | None
+        :param version_no: Default "1"
+        :type version_no: str | None
+        :param logger_package_name: Default None. Logger package name
+        :type logger_package_name: str | None
+        :param is_skip_setup: Default True. During querying, avoid (UI only) setup
+        :type is_skip_setup: bool | None
+        :returns:
+
+           package name, relative path to extracted logging config YAML
+           file, and the yaml str. None if no match
+
+        :rtype: tuple[str, str, str] | None
+        """
+        gen = self.query_all(
+            category,
+            genre=genre,
+            flavor=flavor,
+            version_no=version_no,
+            logger_package_name=logger_package_name,
+            is_skip_setup=is_skip_setup,
+        )
+        ret = next(gen, None)
+        gen.close()
+
+        return ret
+
+
+@functools.lru_cache(maxsize=None)
+def get_registry_catalog(is_test_file=False):
+    """Loaded once per process. Registries of all packages discovered
+    by entry point. Each registry loads from its snapshot, if warm
+
+    :param is_test_file: Default False. True if want to search for test files
+    :type is_test_file: bool
+    :returns: loaded catalog. Extracts to XDG user data folder
+    :rtype: logging_strict.register_config.RegistryCatalog
+    """
+    catalog = RegistryCatalog(is_test_file=is_test_file)
+    catalog.load()
+
+    return catalog
+
+
+def registry_catalog_clear():
+    """Forget the loaded catalog. e.g. after installing a package"""
+    get_registry_catalog.cache_clear()
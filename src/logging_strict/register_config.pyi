@@ -1,4 +1,9 @@
-from collections.abc import Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import (
+    Iterator,
+    Sequence,
+)
 from pathlib import Path
 from typing import (
     Any,
@@ -8,9 +13,12 @@ from typing import (
 import strictyaml as s
 
 from .constants import LoggingConfigCategory
+from .util.validation_cache import RegistrySnapshot
 
 CONFIG_STEM: Final[str]
 CONFIG_SUFFIX: Final[str]
+ENTRY_POINT_GROUP: Final[str]
+QUERY_CACHE_MAXSIZE: Final[int]
 REGEX_REL_PATH: Final[str]
 test_yaml: Final[str]
 
@@ -19,6 +27,18 @@ _item_map: s.compound.MapCombined
 _file_map: s.compound.Map
 _schema: s.compound.Seq
 
+_registry_snapshot: RegistrySnapshot
+INDEX_FIELDS: Final[tuple[str, str, str, str]]
+
+def _category_value(category: LoggingConfigCategory | str | Any | None) -> Any: ...
+def _index_key(
+    values: Sequence[Any],
+    is_test_file: bool,
+) -> tuple[str | None | bool, ...]: ...
+def _build_index(
+    registry: Sequence[dict[str, dict[str, Any]]],
+) -> dict[tuple[str | None | bool, ...], list[int]]: ...
+
 class ExtractorLoggingConfig:
     __slots__ = (
         "_package_name",
@@ -29,6 +49,11 @@ class ExtractorLoggingConfig:
         "_logging_config_yaml_str",
         "_registry",
         "_logging_config_yaml_relpath",
+        "_index",
+        "_is_extract_pending",
+        "_query_cache",
+        "_query_cache_lock",
+        "_is_in_memory",
     )
 
     _patch_extract_folder: bool
@@ -36,12 +61,18 @@ class ExtractorLoggingConfig:
     _path_extracted_db: Path | None
     _registry: dict[Any, Any] | None
     _logging_config_yaml_str: str | None
+    _index: dict[tuple[str | None | bool, ...], list[int]] | None
+    _is_extract_pending: bool
+    _query_cache: OrderedDict[tuple[Any, ...], tuple[str, str]]
+    _query_cache_lock: threading.Lock
+    _is_in_memory: bool | None
 
     def __init__(
         self,
         package_name: str,
         path_alternative_dest_folder: Path | None = None,
         is_test_file: bool | None = False,
+        is_in_memory: bool | None = None,
     ) -> None: ...
     def __repr__(self) -> str: ...
     @staticmethod
@@ -55,10 +86,13 @@ class ExtractorLoggingConfig:
     @property
     def is_test_file(self) -> bool: ...
     @property
+    def is_in_memory(self) -> bool: ...
+    @property
     def logging_config_yaml_str(self) -> str | dict[str, Any] | None: ...
     @property
     def logging_config_yaml_relpath(self) -> Path | None: ...
     def extract_db(self) -> None: ...
+    def read_db(self) -> str | None: ...
     def get_db(self, path_extracted_db: Path | None = None) -> None: ...
     def query_db(
         self,
@@ -69,3 +103,88 @@ class ExtractorLoggingConfig:
         logger_package_name: str | None = None,
         is_skip_setup: bool | None = True,
     ) -> str | None: ...
+    def query_cache_clear(self) -> None: ...
+    def iter_records(
+        self,
+        category: LoggingConfigCategory | str | Any | None = None,
+        genre: str | None = None,
+        flavor: str | None = None,
+        version_no: str | None = None,
+    ) -> Iterator[dict[str, Any]]: ...
+    def query_all(
+        self,
+        category: LoggingConfigCategory | str | Any | None,
+        genre: str | None = None,
+        flavor: str | None = None,
+        version_no: str | None = ...,
+        logger_package_name: str | None = None,
+        is_skip_setup: bool | None = True,
+    ) -> Iterator[tuple[str, str]]: ...
+    def _extract_item(
+        self,
+        d_item: dict[str, Any],
+        logger_package_name: str | None = None,
+        is_skip_setup: bool | None = True,
+    ) -> tuple[str, str] | None: ...
+
+def iter_registry_packages() -> list[str]: ...
+
+class RegistryCatalog:
+    __slots__ = (
+        "_index",
+        "_is_in_memory",
+        "_is_test_file",
+        "_items",
+        "_max_workers",
+        "_package_names",
+        "_path_alternative_dest_folder",
+    )
+
+    _index: dict[tuple[str | None | bool, ...], list[int]]
+    _is_in_memory: bool | None
+    _is_test_file: bool
+    _items: list[tuple[ExtractorLoggingConfig, dict[str, dict[str, Any]]]]
+    _max_workers: int | None
+    _package_names: tuple[str, ...] | None
+    _path_alternative_dest_folder: Path | None
+
+    def __init__(
+        self,
+        path_alternative_dest_folder: Path | None = None,
+        is_test_file: bool | None = False,
+        package_names: Sequence[str] | None = None,
+        max_workers: int | None = None,
+        is_in_memory: bool | None = None,
+    ) -> None: ...
+    @property
+    def package_names(self) -> list[str]: ...
+    def _load_one(self, package_name: str) -> ExtractorLoggingConfig | None: ...
+    def load(self) -> int: ...
+    def iter_records(
+        self,
+        category: LoggingConfigCategory | str | Any | None = None,
+        genre: str | None = None,
+        flavor: str | None = None,
+        version_no: str | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]: ...
+    def query_all(
+        self,
+        category: LoggingConfigCategory | str | Any | None,
+        genre: str | None = None,
+        flavor: str | None = None,
+        version_no: str | None = ...,
+        logger_package_name: str | None = None,
+        is_skip_setup: bool | None = True,
+    ) -> Iterator[tuple[str, str, str]]: ...
+    def query_db(
+        self,
+        category: LoggingConfigCategory | str | Any | None,
+        genre: str | None = None,
+        flavor: str | None = None,
+        version_no: str | None = ...,
+        logger_package_name: str | None = None,
+        is_skip_setup: bool | None = True,
+    ) -> tuple[str, str, str] | None: ...
+
+def get_registry_catalog(is_test_file: bool = False) -> RegistryCatalog: ...
+def registry_catalog_clear() -> None: ...
@@ -0,0 +1,349 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Recursive file search, for when the folder tree is large and mostly
+irrelevant. e.g. a monorepo.
+
+:py:meth:`pathlib.Path.rglob` descends into every folder, including
+``.git``, ``.tox``, and ``.venv``, and matches each
+file name with per path component glob machinery.
+
+:py:func:`iter_files` walks with :py:func:`os.scandir`. Ignored folders
+are never descended into. ``.gitignore`` style excludes prune both
+folders and files. File names are matched by a regex, compiled once
+from the glob pattern.
+
+.. code-block:: python
+
+    from pathlib import Path
+    from logging_strict.util.file_walk import ExcludeRules, iter_files
+
+    excludes = ExcludeRules(("/docs/", "*.draft.logging.config.yaml"))
+    for path_f in iter_files(Path.cwd(), "*.logging.config.yaml", excludes=excludes):
+        pass
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str]
+   :value: ("IGNORE_DIRS", "ExcludeRules", "compile_name_pattern", "iter_files")
+
+   Module exports
+
+**Module objects**
+
+"""
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+
+__all__ = (
+    "IGNORE_DIRS",
+    "ExcludeRules",
+    "compile_name_pattern",
+    "iter_files",
+)
+
+#: frozenset[str]: Folder names never descended into. Version control,
+#: tool caches, and ``.venv``. Not ``build`` nor ``dist``, which may
+#: contain files intended to be searched
+IGNORE_DIRS = frozenset(
+    (
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".nox",
+        ".venv",
+        ".eggs",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    )
+)
+
+#: bool: File names are case insensitive, e.g. Windows
+_is_case_insensitive = os.path.normcase("A") == "a"
+
+
+@lru_cache(maxsize=None)
+def compile_name_pattern(pattern):
+    """Compile a file name glob pattern, once
+
+    Same as :py:meth:`pathlib.Path.match`, case insensitive only where
+    the platform is
+
+    :param pattern: file name glob pattern. No folder separators
+    :type pattern: str
+    :returns: regex matching a whole file name
+    :rtype: re.Pattern[str]
+    """
+    flags = re.IGNORECASE if _is_case_insensitive else 0
+    ret = re.compile(fnmatch.translate(pattern), flags)
+
+    return ret
+
+
+def _glob_to_regex(pattern):
+    """Translate one ``.gitignore`` glob. ``*`` and ``?`` don't match
+    ``/``. ``**`` matches across folders
+
+    :param pattern: glob. No leading or trailing ``/``
+    :type pattern: str
+    :returns: regex, without anchors
+    :rtype: str
+    """
+    lst_out = []
+    idx = 0
+    count = len(pattern)
+    while idx < count:
+        char = pattern[idx]
+        if pattern.startswith("**/", idx):
+            # Zero or more folders
+            lst_out.append("(?:.*/)?")
+            idx += 3
+        elif pattern.startswith("**", idx):
+            lst_out.append(".*")
+            idx += 2
+        elif char == "*":
+            lst_out.append("[^/]*")
+            idx += 1
+        elif char == "?":
+            lst_out.append("[^/]")
+            idx += 1
+        elif char == "[":
+            idx_end = pattern.find("]", idx + 2)
+            if idx_end == -1:
+                lst_out.append(re.escape(char))
+                idx += 1
+            else:
+                str_class = pattern[idx + 1 : idx_end].replace("\\", "\\\\")
+                if str_class[0] in ("!", "^"):
+                    str_class = f"^{str_class[1:]}"
+                else:  # pragma: no cover
+                    pass
+                lst_out.append(f"[{str_class}]")
+                idx = idx_end + 1
+        elif char == "\\" and idx + 1 < count:
+            # Escaped. Literal next char
+            lst_out.append(re.escape(pattern[idx + 1]))
+            idx += 2
+        else:
+            lst_out.append(re.escape(char))
+            idx += 1
+
+    return "".join(lst_out)
+
+
+class ExcludeRules:
+    """``.gitignore`` style exclude rules, compiled once
+
+    Supported:
+
+    - blank lines and ``#`` comments are skipped
+
+    - ``!`` re-includes. Last matching rule wins
+
+    - trailing ``/`` matches only folders
+
+    - containing a ``/``, relative to the search folder. Otherwise
+      matches a name at any depth
+
+    - ``*``, ``?``, ``[...]``, and ``**``
+
+    Like git, an excluded folder is not searched, so a file within it
+    can't be re-included
+
+    :ivar patterns: ``.gitignore`` style patterns
+    :vartype patterns: collections.abc.Iterable[str]
+
+    .. py:attribute:: __slots__
+       :type: tuple[str]
+       :value: ("_rules",)
+
+       Compiled rules. Regex, is negated, and folders only
+
+    """
+
+    __slots__ = ("_rules",)
+
+    def __init__(self, patterns=()):
+        """Class constructor"""
+        super().__init__()
+        flags = re.IGNORECASE if _is_case_insensitive else 0
+        rules = []
+        for str_line in patterns:
+            str_pattern = str_line.rstrip("\n").rstrip(" ")
+            if not bool(str_pattern) or str_pattern.startswith("#"):
+                continue
+            else:  # pragma: no cover
+                pass
+
+            is_negate = str_pattern.startswith("!")
+            if is_negate:
+                str_pattern = str_pattern[1:]
+            elif str_pattern.startswith(("\\!", "\\#")):
+                str_pattern = str_pattern[1:]
+            else:  # pragma: no cover
+                pass
+
+            is_dir_only = str_pattern.endswith("/")
+            str_pattern = str_pattern.rstrip("/")
+            is_anchored = "/" in str_pattern
+            str_pattern = str_pattern.lstrip("/")
+            if not bool(str_pattern):
+                continue
+            else:  # pragma: no cover
+                pass
+
+            str_regex = _glob_to_regex(str_pattern)
+            if is_anchored:
+                str_regex = f"^{str_regex}$"
+            else:
+                str_regex = f"^(?:.*/)?{str_regex}$"
+            rules.append((re.compile(str_regex, flags), is_negate, is_dir_only))
+        self._rules = tuple(rules)
+
+    @classmethod
+    def from_file(cls, path_file):
+        """Read rules from a ``.gitignore`` style file
+
+        :param path_file: file path
+        :type path_file: pathlib.Path | str
+        :returns: compiled rules
+        :rtype: logging_strict.util.file_walk.ExcludeRules
+        :raises:
+
+           - :py:exc:`OSError` -- Could not read file
+
+        """
+        str_contents = Path(path_file).read_text(encoding="utf-8")
+
+        return cls(str_contents.splitlines())
+
+    def __bool__(self):
+        """Any rules
+
+        :returns: True if at least one rule
+        :rtype: bool
+        """
+        return bool(self._rules)
+
+    def __len__(self):
+        """Rule count
+
+        :returns: count of compiled rules
+        :rtype: int
+        """
+        return len(self._rules)
+
+    def is_excluded(self, relpath, is_dir=False):
+        """Check a file or folder
+
+        :param relpath: path relative to the search folder. ``/`` separated
+        :type relpath: str
+        :param is_dir: Default False. True if relpath is a folder
+        :type is_dir: bool
+        :returns: True if excluded
+        :rtype: bool
+        """
+        ret = False
+        for regex, is_negate, is_dir_only in self._rules:
+            if is_dir_only and not is_dir:
+                continue
+            elif regex.match(relpath) is not None:
+                ret = not is_negate
+            else:  # pragma: no cover
+                pass
+
+        return ret
+
+
+def iter_files(path_dir, pattern, ignore_dirs=None, excludes=None):
+    """Recursive search for files, by file name glob pattern. Sorted
+    by name, within each folder. Files before sub-folders
+
+    Symlinked folders are not followed
+
+    :param path_dir: search folder
+    :type path_dir: pathlib.Path
+    :param pattern: file name glob pattern, e.g. ``*.logging.config.yaml``
+    :type pattern: str
+    :param ignore_dirs:
+
+       Default None. Folder names never descended into. None for
+       :py:data:`~logging_strict.util.file_walk.IGNORE_DIRS`
+
+    :type ignore_dirs: collections.abc.Container[str] | None
+    :param excludes: Default None. ``.gitignore`` style patterns or rules
+    :type excludes: logging_strict.util.file_walk.ExcludeRules | collections.abc.Iterable[str] | None
+    :returns: absolute paths of matching files
+    :rtype: collections.abc.Iterator[pathlib.Path]
+    """
+    if ignore_dirs is None:
+        ignore_dirs = IGNORE_DIRS
+    else:  # pragma: no cover
+        pass
+
+    if excludes is None:
+        excludes = ExcludeRules()
+    elif not isinstance(excludes, ExcludeRules):
+        excludes = ExcludeRules(excludes)
+    else:  # pragma: no cover
+        pass
+    is_excludes = bool(excludes)
+
+    match_name = compile_name_pattern(pattern).match
+
+    # Folder path and path relative to path_dir
+    stack = [(os.fspath(path_dir), "")]
+    while bool(stack):
+        str_dir, str_reldir = stack.pop()
+        try:
+            with os.scandir(str_dir) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            # Removed since listed, not a folder, or not permitted
+            continue
+
+        dirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:  # pragma: no cover
+                continue
+
+            if is_dir:
+                if name in ignore_dirs:
+                    continue
+                else:  # pragma: no cover
+                    pass
+                str_relpath = f"{str_reldir}{name}"
+                if is_excludes and excludes.is_excluded(str_relpath, is_dir=True):
+                    continue
+                else:  # pragma: no cover
+                    pass
+                dirs.append((entry.path, f"{str_relpath}/"))
+            elif match_name(name) is not None:
+                if is_excludes and excludes.is_excluded(f"{str_reldir}{name}"):
+                    continue
+                else:  # pragma: no cover
+                    pass
+                try:
+                    is_file = entry.is_file()
+                except OSError:  # pragma: no cover
+                    is_file = False
+                if is_file:
+                    yield Path(entry.path)
+                else:  # pragma: no cover
+                    pass
+            else:  # pragma: no cover
+                pass
+
+        # Popped in name order
+        stack.extend(reversed(dirs))
@@ -0,0 +1,42 @@
+import re
+from collections.abc import (
+    Container,
+    Iterable,
+    Iterator,
+)
+from functools import lru_cache
+from pathlib import Path
+from typing import Final
+
+__all__ = (
+    "IGNORE_DIRS",
+    "ExcludeRules",
+    "compile_name_pattern",
+    "iter_files",
+)
+
+IGNORE_DIRS: Final[frozenset[str]]
+_is_case_insensitive: Final[bool]
+
+@lru_cache
+def compile_name_pattern(pattern: str) -> re.Pattern[str]: ...
+def _glob_to_regex(pattern: str) -> str: ...
+
+class ExcludeRules:
+    __slots__ = ("_rules",)
+
+    _rules: tuple[tuple[re.Pattern[str], bool, bool], ...]
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None: ...
+    @classmethod
+    def from_file(cls, path_file: Path | str) -> ExcludeRules: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def is_excluded(self, relpath: str, is_dir: bool = False) -> bool: ...
+
+def iter_files(
+    path_dir: Path,
+    pattern: str,
+    ignore_dirs: Container[str] | None = None,
+    excludes: ExcludeRules | Iterable[str] | None = None,
+) -> Iterator[Path]: ...
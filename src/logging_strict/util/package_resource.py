@@ -124,6 +124,11 @@ For more fine control, options are:
    as well, these are for the simplest scenerio. They are both just a
    normal function. If/when necessary, roll your own
 
+   Callbacks made by :py:func:`functools.partial` from these two are
+   compiled once into a
+   :py:class:`~logging_strict.util.package_resource.FileMatcher`. A
+   roll your own callback is called once per file
+
 .. note:: package_data_folders param :py:obj:`package_data_folders.package_name <logging_strict.util.package_resource.PackageResource.package_data_folders.params.package_name>`
 
    Change to whichever package contains the data files you are interested
@@ -131,36 +136,45 @@ For more fine control, options are:
 
 """
 
+import hashlib
 import importlib.util
+import json
 import logging
 import os
 import platform
 import re
-import shutil
+import stat
 import sys
 import tempfile
+import threading
+import time
 from collections.abc import Sequence
 from contextlib import suppress  # py39+
-from functools import partial
+from functools import (
+    lru_cache,
+    partial,
+)
 from pathlib import (
     Path,
     PurePath,
 )
 from typing import (
     TYPE_CHECKING,
-    Any,
     Protocol,
     cast,
     runtime_checkable,
 )
 
+import importlib_metadata as metadata
+
 from ..constants import g_app_name
 from ..exceptions import PackageNotFoundError
 from .check_type import (
     is_not_ok,
     is_ok,
 )
-from .util_root import IsRoot
+from .util_root import OwnerFixups
+from .validation_cache import RegistrySnapshot
 from .xdg_folder import DestFolderUser
 
 try:
@@ -174,6 +188,12 @@ except ImportError:  # pragma: no cover
 
     is_got_traversable = False
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows. No cross process lock
+    fcntl = None
+
 if not is_got_traversable:  # pragma: no branch # pragma: no cover
     try:
         # py312+
@@ -188,7 +208,14 @@ __all__ = (
     "PartStem",
     "filter_by_suffix",
     "filter_by_file_stem",
+    "FileMatcher",
     "get_package_data",
+    "PackageFileIndex",
+    "get_file_index",
+    "file_index_clear",
+    "ExtractManifest",
+    "ExtractLock",
+    "lookup_cache_clear",
 )
 
 #: bool: on/off switch for module level logging
@@ -200,8 +227,40 @@ g_module = f"{g_app_name}.util.package_resource"
 #: logging.Logger: module level logger
 _LOGGER = logging.getLogger(g_module)
 
+#: dict[tuple[str, str | None], PackageFileIndex]: shared file indexes.
+#: Key is data folder dotted path and distribution version
+_file_indexes = {}
+
+#: threading.Lock: one thread builds each file index
+_file_indexes_lock = threading.Lock()
+
+#: dict[str, bool]: Package name and whether installed. Includes not installed
+_package_exists = {}
+
+#: dict[str, importlib.resources.abc.Traversable | None]: Sanitized
+#: dotted path and its Traversable. None if no such package or data folder
+_package_data_folders = {}
+
+#: str: Extraction manifest file name suffix. Prefixed by package name
+EXTRACT_MANIFEST_SUFFIX = ".extract.json"
+
+#: str: Extraction lock file name suffix. Prefixed by package name
+EXTRACT_LOCK_SUFFIX = ".extract.lock"
+
+#: float: Seconds to wait for another process to finish extracting
+EXTRACT_LOCK_TIMEOUT = 30.0
+
+#: float: Seconds. A lock file older than this is from a hung process
+EXTRACT_LOCK_STALE = 300.0
+
+#: float: Seconds between attempts to acquire the lock
+_EXTRACT_LOCK_POLL = 0.02
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import (
+        Callable,
+        Iterator,
+    )
 
 
 def msg_stem(file_name):
@@ -366,7 +425,241 @@ class PartStem(Protocol):
         pass
 
 
-def match_file(y, /, *, cb_suffix=None, cb_file_stem=None):
+def _split_name(file_name):
+    """Split a file name into stem and all suffixes, without creating
+    a :py:class:`~pathlib.Path`. Same as :py:func:`msg_stem` and
+    :py:attr:`pathlib.PurePath.suffixes` concatenated
+
+    :param file_name: file name. Not a path
+    :type file_name: str
+    :returns: stem and suffixes concatenated. Suffixes empty str if none
+    :rtype: tuple[str, str]
+    """
+    if TYPE_CHECKING:
+        str_stripped: str
+        idx: int
+
+    if file_name.endswith("."):
+        return file_name, ""
+    else:  # pragma: no cover
+        pass
+
+    # Leading periods, e.g. ``.bashrc``, are part of the stem
+    str_stripped = file_name.lstrip(".")
+    idx = str_stripped.find(".")
+    if idx == -1:
+        ret = (file_name, "")
+    else:
+        idx += len(file_name) - len(str_stripped)
+        ret = (file_name[:idx], file_name[idx:])
+
+    return ret
+
+
+class FileMatcher:
+    """Package data file filter, compiled once. Then tests raw file
+    name strings. No :py:class:`~pathlib.Path` per file
+
+    Suffix spec, same as
+    :py:func:`~logging_strict.util.package_resource.filter_by_suffix`,
+    except ``None``:
+
+    - ``None`` -- no suffix filter. Unlike ``filter_by_suffix``, where
+      ``None`` means only files without a suffix
+
+    - ``""`` -- only files without a suffix
+
+    - str or tuple[str, ...] -- suffixes concatenated ends with any one
+      of these. Empty str within a tuple never matches
+
+    File stem spec, same as
+    :py:func:`~logging_strict.util.package_resource.filter_by_file_stem`:
+
+    - ``None`` -- no file stem filter
+
+    - str -- file stem or file name. Compared by stem
+
+    .. testcode::
+
+        from logging_strict.util.package_resource import FileMatcher
+
+        matcher = FileMatcher(suffix=(".yml", ".yaml"), file_stem="mp_1_asz")
+        assert matcher.is_match("mp_1_asz.worker.logging.config.yaml")
+        assert not matcher.is_match("mp_1_asz.worker.logging.config.toml")
+
+        # File stem only. Any suffix
+        matcher = FileMatcher(file_stem="mp_1_asz")
+        assert matcher.is_match("mp_1_asz.worker.logging.config.yaml")
+
+    :ivar suffix: Default None. Suffix or suffixes to search for
+    :vartype suffix: str | tuple[str, ...] | None
+    :ivar file_stem: Default None. File stem to search for
+    :vartype file_stem: str | None
+    :raises:
+
+       - :py:exc:`ValueError` -- file stem empty str
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str, str, str]
+       :value: ("_suffixes", "_stem", "_cb_suffix", "_cb_file_stem")
+
+       Compiled suffixes and stem. Callbacks, only if not compilable
+
+    """
+
+    __slots__ = ("_suffixes", "_stem", "_cb_suffix", "_cb_file_stem")
+
+    def __init__(self, suffix=None, file_stem=None):
+        """Class constructor"""
+        super().__init__()
+        self._suffixes = self._compile_suffix(suffix)
+        self._stem = None if file_stem is None else msg_stem(file_stem)
+        self._cb_suffix = None
+        self._cb_file_stem = None
+
+    @staticmethod
+    def _compile_suffix(suffix):
+        """Normalize a suffix spec
+
+        :param suffix: Suffix or suffixes to search for
+        :type suffix: typing.Any
+        :returns:
+
+           None no filter. Empty str only files without a suffix.
+           Otherwise the non-empty suffixes, possibly none
+
+        :rtype: str | tuple[str, ...] | None
+        """
+        if suffix is None:
+            ret = None
+        elif suffix == "":
+            ret = ""
+        elif isinstance(suffix, str):
+            ret = (suffix,)
+        elif isinstance(suffix, tuple):
+            ret = tuple(
+                str_suffix
+                for str_suffix in suffix
+                if isinstance(str_suffix, str) and bool(str_suffix)
+            )
+        else:
+            # Unsupported type. Nothing matches
+            ret = ()
+
+        return ret
+
+    @classmethod
+    def from_callbacks(cls, cb_suffix=None, cb_file_stem=None):
+        """From suffix and file stem callbacks. Callbacks created by
+        :py:func:`functools.partial` with
+        :py:func:`~logging_strict.util.package_resource.filter_by_suffix`
+        or :py:func:`~logging_strict.util.package_resource.filter_by_file_stem`
+        are compiled. Any other callable is kept and called per file
+
+        :param cb_suffix: Default None. Filters by suffix
+        :type cb_suffix: collections.abc.Callable[[str],bool] | None
+        :param cb_file_stem: Default None. Filters by file name stem
+        :type cb_file_stem: collections.abc.Callable[[str],bool] | None
+        :returns: compiled filter
+        :rtype: logging_strict.util.package_resource.FileMatcher
+        """
+        ret = cls()
+        if cb_suffix is None:
+            ret._suffixes = None
+        elif (
+            isinstance(cb_suffix, partial)
+            and cb_suffix.func is filter_by_suffix
+            and len(cb_suffix.args) == 1
+            and not bool(cb_suffix.keywords)
+        ):
+            # :py:func:`filter_by_suffix`. None and "" both mean no suffix
+            expected_suffix = cb_suffix.args[0]
+            ret._suffixes = cls._compile_suffix(
+                "" if expected_suffix is None else expected_suffix
+            )
+        else:
+            ret._suffixes = None
+            ret._cb_suffix = cb_suffix
+
+        if (
+            isinstance(cb_file_stem, partial)
+            and cb_file_stem.func is filter_by_file_stem
+            and len(cb_file_stem.args) == 1
+            and not bool(cb_file_stem.keywords)
+        ):
+            expected_file_name = cb_file_stem.args[0]
+            ret._stem = (
+                None if expected_file_name is None else msg_stem(expected_file_name)
+            )
+        elif cb_file_stem is not None:
+            ret._cb_file_stem = cb_file_stem
+        else:  # pragma: no cover
+            pass
+
+        return ret
+
+    def is_suffix(self, test_suffix):
+        """Check suffixes concatenated
+
+        :param test_suffix: file name suffixes concatenated
+        :type test_suffix: str | None
+        :returns: True if a match otherwise False
+        :rtype: bool
+        """
+        suffixes = self._suffixes
+        if self._cb_suffix is not None:
+            ret = self._cb_suffix(test_suffix)
+        elif suffixes is None:
+            ret = True
+        elif suffixes == "":
+            ret = test_suffix is None or test_suffix == ""
+        else:
+            # Empty test_suffix never ends with a non-empty suffix
+            ret = isinstance(test_suffix, str) and test_suffix.endswith(suffixes)
+
+        return ret
+
+    def is_stem(self, stem):
+        """Check file stem
+
+        :param stem: file name stem. No suffixes
+        :type stem: str
+        :returns: True if a match otherwise False
+        :rtype: bool
+        """
+        if self._cb_file_stem is not None:
+            ret = self._cb_file_stem(stem)
+        else:
+            ret = self._stem is None or self._stem == stem
+
+        return ret
+
+    def is_match_split(self, stem, suffix):
+        """Check an already split file name
+
+        :param stem: file name stem
+        :type stem: str
+        :param suffix: file name suffixes concatenated
+        :type suffix: str
+        :returns: True if a match otherwise False
+        :rtype: bool
+        """
+        return self.is_suffix(suffix) and self.is_stem(stem)
+
+    def is_match(self, file_name):
+        """Check a file name
+
+        :param file_name: file name. Not a path
+        :type file_name: str
+        :returns: True if a match otherwise False
+        :rtype: bool
+        """
+        stem, suffix = _split_name(file_name)
+
+        return self.is_suffix(suffix) and self.is_stem(stem)
+
+
+def match_file(y, /, *, cb_suffix=None, cb_file_stem=None, matcher=None):
     """The callbacks act as filters to check whether this file is
     a match according to our requirements
 
@@ -386,32 +679,25 @@ def match_file(y, /, *, cb_suffix=None, cb_file_stem=None):
        filters by file name stem
 
     :type cb_file_stem: collections.abc.Callable[[str],bool] | None
+    :param matcher:
+
+       Default None. Compiled filter. Takes precedence over the callbacks
+
+    :type matcher: logging_strict.util.package_resource.FileMatcher | None
     :returns: True if a match otherwise False
     :rtype: bool
     """
     if TYPE_CHECKING:
         ret: bool
-        suffixes: list[str]
-        suffix: str
-        is_filter_suffix: bool
-        str_name: str
-        stem: str
-        is_filter_file_stem: bool
+
+    if matcher is None:
+        matcher = FileMatcher.from_callbacks(cb_suffix, cb_file_stem)
+    else:  # pragma: no cover
+        pass
 
     ret = False
     if isinstance(y, Traversable) and y.is_file():  # pragma: no branch
-        # file_name_pkg = traversable_file.name
-        # Check suffix
-        suffixes = Path(y.name).suffixes
-        suffix = "".join(suffixes)
-        is_filter_suffix = cb_suffix is None or cb_suffix(suffix)
-
-        # Check file name stem
-        str_name = y.name
-        stem = msg_stem(str_name)
-        is_filter_file_stem = cb_file_stem is None or cb_file_stem(stem)
-
-        ret = is_filter_suffix and is_filter_file_stem
+        ret = matcher.is_match(y.name)
 
     return ret
 
@@ -443,17 +729,15 @@ def check_folder(x, cb_suffix=None, cb_file_stem=None):
     if TYPE_CHECKING:
         is_found_target_file: bool
         is_match: bool
+        matcher: FileMatcher
         y: Traversable
 
     if isinstance(x, Traversable):  # pragma: no branch
         is_found_target_file = False
+        matcher = FileMatcher.from_callbacks(cb_suffix, cb_file_stem)
 
         for y in x.iterdir():
-            is_match = match_file(
-                y,
-                cb_suffix=cb_suffix,
-                cb_file_stem=cb_file_stem,
-            )
+            is_match = match_file(y, matcher=matcher)
             if is_match:  # pragma: no branch
                 is_found_target_file = True
 
@@ -495,51 +779,10 @@ def filter_by_suffix(expected_suffix, test_suffix):
     """
     if TYPE_CHECKING:
         ret: bool
-        is_found: bool
-        suffix: str
-
-    def is_empty(val: Any) -> bool:
-        """None or empty str
-
-        :param val: Value to check
-        :type val: typing.Any
-        :returns: True if passes check
-        :rtype: bool
-        """
-        return val is None or (isinstance(val, str) and not bool(val))
-
-    def is_not_empty(val: Any) -> bool:
-        """Not None and non-empty str
 
-        :param val: Value to check
-        :type val: typing.Any
-        :returns: True if passes check
-        :rtype: bool
-        """
-        return val is not None and isinstance(val, str) and bool(val)
-
-    if is_empty(expected_suffix) and is_empty(test_suffix):
-        # Both None or empty string
-        ret = True
-    elif (
-        is_not_empty(expected_suffix)
-        and is_not_empty(test_suffix)
-        and test_suffix.endswith(expected_suffix)
-    ):
-        ret = True
-    elif isinstance(expected_suffix, tuple):
-        is_found = False
-        for suffix in expected_suffix:
-            if (
-                is_not_empty(suffix)
-                and is_not_empty(test_suffix)
-                and test_suffix.endswith(suffix)
-            ):  # pragma: no branch
-                is_found = True
-                break
-        ret = is_found
-    else:
-        ret = False
+    # None and "" both mean no suffix. FileMatcher None means no filter
+    suffix = "" if expected_suffix is None else expected_suffix
+    ret = FileMatcher(suffix=suffix).is_suffix(test_suffix)
 
     return ret
 
@@ -584,9 +827,9 @@ def filter_by_file_stem(expected_file_name, test_file_name):
     if TYPE_CHECKING:
         ret: bool
 
-    ret = expected_file_name is None or msg_stem(expected_file_name) == msg_stem(
-        test_file_name
-    )
+    ret = expected_file_name is None or FileMatcher(
+        file_stem=expected_file_name
+    ).is_stem(msg_stem(test_file_name))
 
     return ret
 
@@ -619,105 +862,826 @@ def walk_tree_folders(traversable_root):
     :returns: The entire sub-tree. Includes self
     :rtype:
 
-       collections.abc.Iterator[importlib.resources.abc.Traversable]
+       collections.abc.Iterator[importlib.resources.abc.Traversable]
+
+    """
+    if TYPE_CHECKING:
+        traversable_x: Traversable
+
+    ignores = ("__pycache__",)
+
+    for traversable_x in traversable_root.iterdir():
+        if traversable_x.is_dir():  # pragma: no branch
+            if traversable_x.name not in ignores:  # pragma: no branch
+                yield traversable_x
+                yield from walk_tree_folders(traversable_x)
+
+
+def is_package_exists(package_name):
+    """Discover whether a python package is installed within
+    virtual environment
+
+    ``importlib.util.find_spec`` implementation.
+
+    - Extremely fast (~0.1ms)
+
+    - locates importable namespaces, which includes:
+      standard packages, namespace packages (PEP 420), and modules inside zip files
+
+    - import name ok
+      distribution name (e.g., Pillow) often differs from the import name (e.g., PIL)
+
+    Results, including not found, are cached. Clear with
+    :py:func:`lookup_cache_clear` or :py:func:`importlib.invalidate_caches`
+
+    :param package_name: python package name
+    :type package_name: str
+    :returns: Whether or not python package found
+    :rtype: bool
+    """
+    ret = _package_exists.get(package_name, None)
+    if ret is None:
+        ret = importlib.util.find_spec(package_name) is not None
+        _package_exists[package_name] = ret
+    else:  # pragma: no cover
+        pass
+
+    return ret
+
+
+def _to_package_case(val):
+    """Sanitize package name to a valid dotted path
+
+    The ultimate test is
+    :py:func:`logging_strict.util.package_resource._get_package_data_folder`.
+    Which wraps :py:func:`importlib_resources.files`. Expects a dotted path.
+
+    If :py:func:`importlib_resources.files` doesn't get a valid dotted path,
+    returns None. Which can be unexpected.
+
+    Acts as a mitigation fix to allow for understandable simple human
+    errors.
+
+    :param val:
+
+       An arbitrary str. Unallowed chars will be converted into hyphens
+
+    :type val: str
+    :returns:
+
+       Valid package name can contain: alphanumeric, underscore, or period chars.
+       A period denotes a namespace package
+
+    :rtype: str
+    """
+    ret = re.sub("[^a-z0-9.]+", "_", val.lower())
+
+    return ret
+
+
+def _get_package_data_folder(dotted_path):
+    """Helper that retrieves the package resource
+
+    If :py:func:`importlib_resources.files` doesn't get a valid dotted path,
+    returns None. Which can be unexpected.
+
+    Better UX would allow for understandable simple human errors.
+
+    Mitigate by fixing weird characters --> underscore. While allowing
+    namespace packages (e.g. ``zope.interface``).
+
+    With the mitigation fix, None means the package is not installed
+    rather than a hard to track down typo.
+
+    Results, including None, are cached. So fallback probes, for data
+    folders a package doesn't have, don't retry the import system.
+    Clear with :py:func:`lookup_cache_clear` or
+    :py:func:`importlib.invalidate_caches`
+
+    :param dotted_path: package_name and optionally dotted path to a subfolder
+    :type dotted_path: str
+    :returns:
+
+       The traversable path. Either a package root or a subfolder
+
+    :rtype: importlib.resources.abc.Traversable | None
+    """
+    dotted_path_valid = _to_package_case(dotted_path)
+    if dotted_path_valid in _package_data_folders.keys():
+        return _package_data_folders[dotted_path_valid]
+    else:  # pragma: no cover
+        pass
+
+    try:
+        trav_ret = importlib_resources.files(anchor=dotted_path_valid)
+    except ModuleNotFoundError:
+        # There is no such package or data folder
+        trav_ret = None
+    _package_data_folders[dotted_path_valid] = trav_ret
+
+    return trav_ret
+
+
+def lookup_cache_clear():
+    """Forget which packages and data folders exist. e.g. after
+    installing a package. Also occurs on
+    :py:func:`importlib.invalidate_caches`"""
+    _package_exists.clear()
+    _package_data_folders.clear()
+
+
+class _LookupCacheInvalidator:
+    """Last on :py:data:`sys.meta_path`. Finds nothing. Exists so
+    :py:func:`importlib.invalidate_caches` also clears package lookups"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def find_spec(fullname, path=None, target=None):
+        """Never finds a module
+
+        :param fullname: dotted module name
+        :type fullname: str
+        :param path: parent package search locations
+        :type path: collections.abc.Sequence[str] | None
+        :param target: module being reloaded
+        :type target: types.ModuleType | None
+        :returns: None
+        :rtype: None
+        """
+        return None
+
+    @staticmethod
+    def invalidate_caches():
+        """Called by :py:func:`importlib.invalidate_caches`"""
+        lookup_cache_clear()
+
+
+# Once. Not again on module reload
+if not any(
+    type(finder).__name__ == _LookupCacheInvalidator.__name__
+    for finder in sys.meta_path
+):  # pragma: no branch
+    sys.meta_path.append(_LookupCacheInvalidator())
+
+
+@lru_cache(maxsize=None)
+def _get_distribution_version(package_name):
+    """Version of the distribution providing a package. Reads only
+    distribution metadata
+
+    :param package_name: package name or dotted path
+    :type package_name: str
+    :returns: distribution version. None if no distribution found
+    :rtype: str | None
+    """
+    top_level = _to_package_case(package_name).split(".")[0]
+    try:
+        ret = metadata.version(top_level)
+    except (metadata.PackageNotFoundError, ValueError):
+        # Distribution name differs from import name. Scans all distributions
+        dist_names = metadata.packages_distributions().get(top_level, [])
+        try:
+            ret = metadata.version(dist_names[0])
+        except (IndexError, metadata.PackageNotFoundError, ValueError):
+            ret = None
+
+    return ret
+
+
+class PackageFileIndex:
+    """Every file within a package data folder tree. Built by one walk
+    of the tree. Queries do not touch the package tree again
+
+    Folders ``__pycache__`` are ignored, same as
+    :py:func:`~logging_strict.util.package_resource.walk_tree_folders`
+
+    :ivar traversable_root: package data folder
+    :vartype traversable_root: importlib.resources.abc.Traversable
+    """
+
+    __slots__ = ("_entries", "_folders")
+
+    def __init__(self, traversable_root):
+        """Class constructor. Walks the tree"""
+        super().__init__()
+        self._entries = []
+        self._folders = {}
+        self._walk(traversable_root, ())
+        self._entries = tuple(self._entries)
+
+    def _walk(self, traversable_dir, reldir):
+        """Index a folder's files, then its sub-folders. Folder order
+        is that of :py:func:`~logging_strict.util.package_resource.check_folder`
+        then :py:func:`~logging_strict.util.package_resource.walk_tree_folders`
+
+        :param traversable_dir: folder to index
+        :type traversable_dir: importlib.resources.abc.Traversable
+        :param reldir: folder path relative to the root folder
+        :type reldir: tuple[str, ...]
+        """
+        ignores = ("__pycache__",)
+        self._folders[reldir] = traversable_dir
+        subfolders = []
+        for traversable_x in traversable_dir.iterdir():
+            name = traversable_x.name
+            if traversable_x.is_file():
+                stem, suffix = _split_name(name)
+                self._entries.append((reldir, name, stem, suffix))
+            elif traversable_x.is_dir() and name not in ignores:
+                subfolders.append(traversable_x)
+            else:  # pragma: no cover
+                pass
+
+        for traversable_x in subfolders:
+            self._walk(traversable_x, reldir + (traversable_x.name,))
+
+    @property
+    def entries(self):
+        """Indexed files
+
+        :returns: relative folder, file name, stem, and suffixes concatenated
+        :rtype: tuple[tuple[tuple[str, ...], str, str, str], ...]
+        """
+        return self._entries
+
+    def folder(self, reldir):
+        """Get an indexed folder
+
+        :param reldir: folder path relative to the root folder
+        :type reldir: tuple[str, ...]
+        :returns: folder
+        :rtype: importlib.resources.abc.Traversable
+        :raises:
+
+           - :py:exc:`KeyError` -- Not an indexed folder
+
+        """
+        return self._folders[reldir]
+
+    def iter_folders(self, cb_suffix=None, cb_file_stem=None):
+        """Folders containing at least one matching file. Same results
+        as :py:func:`~logging_strict.util.package_resource.check_folder`
+        on the root folder and each sub-folder
+
+        :param cb_suffix:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by suffix
+
+        :type cb_suffix: collections.abc.Callable[[str],bool] | None
+        :param cb_file_stem:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by file name stem
+
+        :type cb_file_stem: collections.abc.Callable[[str],bool] | None
+        :returns: matching folders. Each folder once
+        :rtype: collections.abc.Iterator[importlib.resources.abc.Traversable]
+        """
+        is_match_split = FileMatcher.from_callbacks(
+            cb_suffix, cb_file_stem
+        ).is_match_split
+        reldirs = set()
+        for reldir, _, stem, suffix in self._entries:
+            if reldir in reldirs:
+                continue
+            else:  # pragma: no cover
+                pass
+            if is_match_split(stem, suffix):
+                reldirs.add(reldir)
+                yield self._folders[reldir]
+            else:  # pragma: no cover
+                pass
+
+    def iter_files(self, cb_suffix=None, cb_file_stem=None):
+        """Matching files. Root folder files first
+
+        :param cb_suffix:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by suffix
+
+        :type cb_suffix: collections.abc.Callable[[str],bool] | None
+        :param cb_file_stem:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by file name stem
+
+        :type cb_file_stem: collections.abc.Callable[[str],bool] | None
+        :returns: relative folder and file name
+        :rtype: collections.abc.Iterator[tuple[tuple[str, ...], str]]
+        """
+        is_match_split = FileMatcher.from_callbacks(
+            cb_suffix, cb_file_stem
+        ).is_match_split
+        for reldir, name, stem, suffix in self._entries:
+            if is_match_split(stem, suffix):
+                yield reldir, name
+            else:  # pragma: no cover
+                pass
+
+
+def get_file_index(dotted_path, traversable_root):
+    """File index shared by all
+    :py:class:`~logging_strict.util.package_resource.PackageResource`
+    instances. Built on first use, once per package data folder and
+    distribution version
+
+    :param dotted_path: package name and optionally data folder
+    :type dotted_path: str
+    :param traversable_root: package data folder
+    :type traversable_root: importlib.resources.abc.Traversable
+    :returns: file index
+    :rtype: logging_strict.util.package_resource.PackageFileIndex
+    """
+    key = (
+        _to_package_case(dotted_path),
+        _get_distribution_version(dotted_path),
+    )
+    ret = _file_indexes.get(key, None)
+    if ret is None:
+        with _file_indexes_lock:
+            ret = _file_indexes.get(key, None)
+            if ret is None:
+                ret = PackageFileIndex(traversable_root)
+                _file_indexes[key] = ret
+            else:  # pragma: no cover Another thread built it
+                pass
+    else:  # pragma: no cover
+        pass
+
+    return ret
+
+
+def file_index_clear():
+    """Forget the file indexes. e.g. after installing a package or,
+    in an editable install, adding package data files. Also forgets
+    package lookups, :py:func:`lookup_cache_clear`"""
+    with _file_indexes_lock:
+        _file_indexes.clear()
+    lookup_cache_clear()
+    _get_distribution_version.cache_clear()
+    _get_package_key.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _get_package_key(package_name):
+    """Identifies the installed distribution providing a package. An
+    editable install has no reliable key
+
+    :param package_name: package name
+    :type package_name: str
+    :returns: key. None if not installed, editable install, or no ``RECORD``
+    :rtype: str | None
+    """
+    ret = RegistrySnapshot.get_key(package_name)
+
+    return ret
+
+
+def _write_bytes_atomic(path_file, data):
+    """Write to a temporary file in the same folder, then rename. A
+    concurrent reader sees either the old or the new file, never a
+    partial one
+
+    :param path_file: destination file absolute path
+    :type path_file: pathlib.Path
+    :param data: file contents
+    :type data: bytes
+    :raises:
+
+       - :py:exc:`OSError` -- Could not write or rename
+
+    """
+    path_tmp = None
+    try:
+        # Same folder as destination, so os.replace is atomic
+        fd, str_tmp = tempfile.mkstemp(
+            dir=path_file.parent,
+            prefix=f".{path_file.name}.",
+            suffix=".tmp",
+        )
+        path_tmp = Path(str_tmp)
+        with os.fdopen(fd, mode="wb") as f:
+            f.write(data)
+        path_tmp.chmod(0o644)
+        os.replace(path_tmp, path_file)
+    except OSError:
+        if path_tmp is not None:
+            path_tmp.unlink(missing_ok=True)
+        else:  # pragma: no cover
+            pass
+        raise
+
+
+class ExtractManifest:
+    """Per destination folder and package. Content hash, size, and
+    modification time of each extracted file. Plus the installed
+    distribution it was extracted from.
+
+    An extracted file which is untouched, from an unchanged
+    distribution, is skipped. Neither it, nor the package data file,
+    is read.
+
+    :ivar path_dest_dir: destination folder
+    :vartype path_dest_dir: pathlib.Path
+    :ivar package: package name
+    :vartype package: str
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str, str, str]
+       :value: ("_d_files", "_is_dirty", "_key", "_path_file")
+
+       File entries, unsaved changes flag, distribution key, and
+       manifest file path
+
+    """
+
+    __slots__ = ("_d_files", "_is_dirty", "_key", "_path_file")
+
+    def __init__(self, path_dest_dir, package):
+        """Class constructor"""
+        super().__init__()
+        file_name = f".{package}{EXTRACT_MANIFEST_SUFFIX}"
+        self._path_file = Path(path_dest_dir).joinpath(file_name)
+        self._key = _get_package_key(package)
+        self._d_files = {}
+        self._is_dirty = False
+
+    @property
+    def path_file(self):
+        """Get manifest file path. Not created until an extraction
+
+        :returns: manifest file absolute path
+        :rtype: pathlib.Path
+        """
+        return self._path_file
+
+    def load(self):
+        """Load manifest file. Missing or invalid manifest results in
+        no entries
+
+        :returns: entry count
+        :rtype: int
+        """
+        try:
+            str_json = self._path_file.read_text(encoding="utf-8")
+            d_manifest = json.loads(str_json)
+        except (OSError, ValueError):
+            d_manifest = None
+
+        is_valid = isinstance(d_manifest, dict) and isinstance(
+            d_manifest.get("files", None), dict
+        )
+        self._d_files = d_manifest["files"] if is_valid else {}
+        self._is_dirty = False
+
+        return len(self._d_files)
+
+    @staticmethod
+    def _is_untouched(d_entry, st_dest):
+        """Extracted file not modified since extraction
+
+        :param d_entry: manifest entry
+        :type d_entry: typing.Any
+        :param st_dest: extracted file stat. None if no file
+        :type st_dest: os.stat_result | None
+        :returns: True if size and modification time are as recorded
+        :rtype: bool
+        """
+        ret = (
+            st_dest is not None
+            and isinstance(d_entry, dict)
+            and d_entry.get("size", None) == st_dest.st_size
+            and d_entry.get("mtime_ns", None) == st_dest.st_mtime_ns
+        )
+
+        return ret
+
+    def is_current(self, relpath, st_dest):
+        """Check extracted file is up to date, without reading either file
+
+        :param relpath: path relative to the destination folder
+        :type relpath: str
+        :param st_dest: extracted file stat. None if no file
+        :type st_dest: os.stat_result | None
+        :returns: True if untouched and extracted from this distribution
+        :rtype: bool
+        """
+        d_entry = self._d_files.get(relpath, None)
+        ret = (
+            self._key is not None
+            and self._is_untouched(d_entry, st_dest)
+            and d_entry.get("key", None) == self._key
+        )
+
+        return ret
+
+    def is_stale(self, relpath, path_dest_file, st_dest, digest, is_overwrite=False):
+        """Decide whether to write the extracted file
+
+        An untouched extracted file, with other content, is replaced.
+        Otherwise an existing file is only replaced if is_overwrite and
+        its content differs.
+
+        :param relpath: path relative to the destination folder
+        :type relpath: str
+        :param path_dest_file: extracted file absolute path
+        :type path_dest_file: pathlib.Path
+        :param st_dest: extracted file stat. None if no file
+        :type st_dest: os.stat_result | None
+        :param digest: package data file content sha256 hex digest
+        :type digest: str
+        :param is_overwrite:
+
+           Default False. True replace an existing file, if content differs
+
+        :type is_overwrite: bool
+        :returns: True if should write the extracted file
+        :rtype: bool
+        """
+        d_entry = self._d_files.get(relpath, None)
+        if st_dest is None:
+            ret = True
+        elif self._is_untouched(d_entry, st_dest):
+            # Extracted previously. Not edited since
+            ret = d_entry.get("sha256", None) != digest
+            is_same = not ret
+        elif is_overwrite:
+            try:
+                digest_dest = hashlib.sha256(path_dest_file.read_bytes()).hexdigest()
+            except OSError:  # pragma: no cover
+                digest_dest = None
+            ret = digest_dest != digest
+            is_same = not ret
+        else:
+            # Edited or unknown origin. Keep it
+            ret = False
+            is_same = False
+
+        if not ret and is_same:
+            # Identical content. Skip next time
+            self.record(relpath, st_dest, digest)
+        else:  # pragma: no cover
+            pass
+
+        return ret
+
+    def record(self, relpath, st_dest, digest):
+        """Record an extracted file
 
-    """
-    if TYPE_CHECKING:
-        traversable_x: Traversable
+        :param relpath: path relative to the destination folder
+        :type relpath: str
+        :param st_dest: extracted file stat
+        :type st_dest: os.stat_result
+        :param digest: content sha256 hex digest
+        :type digest: str
+        """
+        d_entry = {
+            "sha256": digest,
+            "size": st_dest.st_size,
+            "mtime_ns": st_dest.st_mtime_ns,
+            "key": self._key,
+        }
+        if self._d_files.get(relpath, None) != d_entry:
+            self._d_files[relpath] = d_entry
+            self._is_dirty = True
+        else:  # pragma: no cover
+            pass
 
-    ignores = ("__pycache__",)
+    def save(self):
+        """If changed, atomic write. Failure is silent. Costs a
+        re-check on the next extraction
 
-    for traversable_x in traversable_root.iterdir():
-        if traversable_x.is_dir():  # pragma: no branch
-            if traversable_x.name not in ignores:  # pragma: no branch
-                yield traversable_x
-                yield from walk_tree_folders(traversable_x)
+        :returns: True if written otherwise False
+        :rtype: bool
+        """
+        if self._is_dirty:
+            d_manifest = {"files": self._d_files}
+            try:
+                data = json.dumps(d_manifest).encode("utf-8")
+                _write_bytes_atomic(self._path_file, data)
+            except OSError:
+                ret = False
+            else:
+                self._is_dirty = False
+                ret = True
+        else:
+            ret = False
 
+        return ret
 
-def is_package_exists(package_name):
-    """Discover whether a python package is installed within
-    virtual environment
 
-    ``importlib.util.find_spec`` implementation.
+class ExtractLock:
+    """Per destination folder and package. Cross process lock, so one
+    process extracts. The others wait, then find the extracted files up
+    to date, :py:class:`ExtractManifest`. e.g. workers of a
+    :py:mod:`multiprocessing` pool all starting at once. Also serializes
+    :py:meth:`ValidationManifest.save <logging_strict.util.validation_cache.ValidationManifest.save>`.
 
-    - Extremely fast (~0.1ms)
+    Advisory, :py:func:`fcntl.flock`. Where there is no :py:mod:`fcntl`,
+    e.g. Windows, never acquired. Not acquired is not an error. Writes
+    are atomic, so extracting unlocked is safe, just wasteful.
 
-    - locates importable namespaces, which includes:
-      standard packages, namespace packages (PEP 420), and modules inside zip files
+    A lock file older than
+    :py:data:`~logging_strict.util.package_resource.EXTRACT_LOCK_STALE`,
+    or left by a process which no longer exists, is stale. Once timeout
+    expires, a stale lock file is removed and acquiring retried.
 
-    - import name ok
-      distribution name (e.g., Pillow) often differs from the import name (e.g., PIL)
+    :ivar path_dest_dir: destination folder. Must exist
+    :vartype path_dest_dir: pathlib.Path
+    :ivar package: package name
+    :vartype package: str
+    :ivar timeout: Default 30.0. Seconds to wait for another process
+    :vartype timeout: float
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str, str]
+       :value: ("_fd", "_path_file", "_timeout")
+
+       Lock file descriptor, lock file path, and seconds to wait
 
-    :param package_name: python package name
-    :type package_name: str
-    :returns: Whether or not python package found
-    :rtype: bool
     """
-    ret = importlib.util.find_spec(package_name) is not None
 
-    return ret
+    __slots__ = ("_fd", "_path_file", "_timeout")
 
+    def __init__(self, path_dest_dir, package, timeout=EXTRACT_LOCK_TIMEOUT):
+        """Class constructor"""
+        super().__init__()
+        file_name = f".{package}{EXTRACT_LOCK_SUFFIX}"
+        self._path_file = Path(path_dest_dir).joinpath(file_name)
+        self._timeout = timeout
+        self._fd = None
 
-def _to_package_case(val):
-    """Sanitize package name to a valid dotted path
+    @property
+    def path_file(self):
+        """Get lock file path. Exists only while locked
 
-    The ultimate test is
-    :py:func:`logging_strict.util.package_resource._get_package_data_folder`.
-    Which wraps :py:func:`importlib_resources.files`. Expects a dotted path.
+        :returns: lock file absolute path
+        :rtype: pathlib.Path
+        """
+        return self._path_file
 
-    If :py:func:`importlib_resources.files` doesn't get a valid dotted path,
-    returns None. Which can be unexpected.
+    @property
+    def is_locked(self):
+        """Check this instance holds the lock
 
-    Acts as a mitigation fix to allow for understandable simple human
-    errors.
+        :returns: True if lock acquired and not yet released
+        :rtype: bool
+        """
+        return self._fd is not None
 
-    :param val:
+    def _try_lock(self):
+        """One non-blocking attempt
 
-       An arbitrary str. Unallowed chars will be converted into hyphens
+        Lock file is removed on release. Another process may have
+        opened the removed file, then lock it. So after locking, check
+        the lock file is still the one locked.
 
-    :type val: str
-    :returns:
+        :returns: True if acquired otherwise False
+        :rtype: bool
+        :raises:
 
-       Valid package name can contain: alphanumeric, underscore, or period chars.
-       A period denotes a namespace package
+           - :py:exc:`OSError` -- Cannot create lock file or locking unsupported
 
-    :rtype: str
-    """
-    ret = re.sub("[^a-z0-9.]+", "_", val.lower())
+        """
+        str_path = str(self._path_file)
+        fd = os.open(str_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        except OSError:
+            os.close(fd)
+            raise
 
-    return ret
+        try:
+            is_same = os.stat(str_path).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            is_same = False
+        if not is_same:
+            # Released and removed, in between open and lock. Try again
+            os.close(fd)
+            return False
+        else:  # pragma: no cover
+            pass
 
+        # Lock holder. For stale lock detection
+        d_holder = {"pid": os.getpid(), "host": platform.node()}
+        with suppress(OSError):
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps(d_holder).encode("utf-8"))
+        self._fd = fd
 
-def _get_package_data_folder(dotted_path):
-    """Helper that retrieves the package resource
+        return True
 
-    If :py:func:`importlib_resources.files` doesn't get a valid dotted path,
-    returns None. Which can be unexpected.
+    def _is_stale(self):
+        """Lock holder hung or gone
 
-    Better UX would allow for understandable simple human errors.
+        :returns: True if lock file should be removed
+        :rtype: bool
+        """
+        try:
+            st_lock = self._path_file.stat()
+            d_holder = json.loads(self._path_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Released meanwhile, or holder not yet written
+            return False
+
+        if time.time() - st_lock.st_mtime > EXTRACT_LOCK_STALE:
+            ret = True
+        elif (
+            isinstance(d_holder, dict)
+            and d_holder.get("host", None) == platform.node()
+            and isinstance(d_holder.get("pid", None), int)
+        ):
+            try:
+                os.kill(d_holder["pid"], 0)
+            except ProcessLookupError:
+                ret = True
+            except OSError:
+                # Exists, but owned by another user
+                ret = False
+            else:
+                ret = False
+        else:
+            # Another host. Can't tell
+            ret = False
 
-    Mitigate by fixing weird characters --> underscore. While allowing
-    namespace packages (e.g. ``zope.interface``).
+        return ret
 
-    With the mitigation fix, None means the package is not installed
-    rather than a hard to track down typo.
+    def acquire(self):
+        """Wait for the lock, up to timeout. Then if stale, remove the
+        lock file and wait again
 
-    :param dotted_path: package_name and optionally dotted path to a subfolder
-    :type dotted_path: str
-    :returns:
+        :returns: True if acquired. False if not possible or timed out
+        :rtype: bool
+        """
+        if fcntl is None or self._fd is not None:  # pragma: no cover
+            return self._fd is not None
+        else:  # pragma: no cover
+            pass
 
-       The traversable path. Either a package root or a subfolder
+        is_stale_removed = False
+        deadline = time.monotonic() + self._timeout
+        while True:
+            try:
+                if self._try_lock():
+                    return True
+                else:  # pragma: no cover
+                    pass
+            except OSError:
+                # e.g. read only folder or network fs without locking
+                msg_warn = f"Cannot lock {self._path_file}. Continuing unlocked"
+                _LOGGER.warning(msg_warn)
+                return False
+
+            if time.monotonic() < deadline:
+                time.sleep(_EXTRACT_LOCK_POLL)
+            elif not is_stale_removed and self._is_stale():
+                msg_warn = f"Removing stale lock {self._path_file}"
+                _LOGGER.warning(msg_warn)
+                with suppress(OSError):
+                    self._path_file.unlink()
+                is_stale_removed = True
+                deadline = time.monotonic() + self._timeout
+            else:
+                msg_warn = (
+                    f"Timeout waiting for lock {self._path_file}. Continuing unlocked"
+                )
+                _LOGGER.warning(msg_warn)
+                return False
+
+    def release(self):
+        """Remove lock file, then unlock. No-op if not locked"""
+        fd = self._fd
+        if fd is not None:
+            self._fd = None
+            # While still locked. Waiting processes then try again
+            with suppress(OSError):
+                self._path_file.unlink()
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+        else:  # pragma: no cover
+            pass
 
-    :rtype: importlib.resources.abc.Traversable | None
-    """
-    dotted_path_valid = _to_package_case(dotted_path)
-    try:
-        trav_ret = importlib_resources.files(anchor=dotted_path_valid)
-    except ModuleNotFoundError:
-        # There is no such package or data folder
-        trav_ret = None
+    def __enter__(self):
+        """Acquire the lock. Not acquired is not an error
 
-    return trav_ret
+        :returns: this instance. Check :py:attr:`is_locked`
+        :rtype: logging_strict.util.package_resource.ExtractLock
+        """
+        self.acquire()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the lock"""
+        self.release()
 
 
 class PackageResource:
@@ -1059,12 +2023,7 @@ class PackageResource:
             d_files: dict[str, tuple[str, ...]]
             base_folder_generator: Iterator[Traversable]
             parents: list[str]
-            file_name_pkg: str
-            stem: str
-            suffixes: Sequence[str]
-            suffix: str
-            is_filter_suffix: bool
-            is_filter_file_stem: bool
+            is_match: Callable[[str], bool]
             path_out: Path
 
         d_files = {}
@@ -1104,12 +2063,8 @@ class PackageResource:
             # Query for package data files produced no results
             return d_files
 
-        # generator previously exhausted, refresh generator
-        base_folder_generator = self.package_data_folders(
-            cb_suffix=cb_suffix,
-            cb_file_stem=cb_file_stem,
-            path_relative_package_dir=path_relative_to,
-        )
+        # generator previously exhausted
+        base_folder_generator = iter(lst_base_folders)
 
         # parent count is positive int
         if (
@@ -1120,6 +2075,7 @@ class PackageResource:
             d_files = {}
             return d_files
 
+        is_match = FileMatcher.from_callbacks(cb_suffix, cb_file_stem).is_match
         parents = []
         for traversable_dir in base_folder_generator:
             for traversable_x in traversable_dir.iterdir():
@@ -1127,14 +2083,8 @@ class PackageResource:
                     continue
                 else:
                     # Filter out files not interested in
-                    file_name_pkg = traversable_x.name
-                    stem = msg_stem(file_name_pkg)
-                    suffixes = Path(file_name_pkg).suffixes
-                    suffix = "".join(suffixes)
-                    is_filter_suffix = cb_suffix is None or cb_suffix(suffix)
-                    is_filter_file_stem = cb_file_stem is None or cb_file_stem(stem)
-                    if (
-                        not is_filter_suffix or not is_filter_file_stem
+                    if not is_match(
+                        traversable_x.name
                     ):  # pragma: no cover Filtered these
                         continue
                     else:
@@ -1221,12 +2171,36 @@ class PackageResource:
 
         :rtype: collections.abc.Iterator[importlib.resources.abc.Traversable]
         """
+        if TYPE_CHECKING:
+            file_index: PackageFileIndex
+
+        # Root folder, then all other folders. Walks the tree only once
+        #    root is ``data``. root relative to ``data`` is ````
+        file_index = self._get_file_index(path_relative_package_dir)
+        yield from file_index.iter_folders(
+            cb_suffix=cb_suffix,
+            cb_file_stem=cb_file_stem,
+        )
+
+    def _get_file_index(self, path_relative_package_dir):
+        """Find the package data folder. Get its file index, shared
+        across instances
+
+        :param path_relative_package_dir:
+
+           package base folder to start the search. None uses
+           :py:attr:`PackageResource.package_data_folder_start`
+
+        :type path_relative_package_dir: pathlib.Path | str | None
+        :returns: file index of the package data folder
+        :rtype: logging_strict.util.package_resource.PackageFileIndex
+        """
         if TYPE_CHECKING:
             base_token: str
             path_adjusted: Path
             parts: Sequence[str]
             traversable_data_dir: "Traversable | None"
-            traversable_x: Traversable
+            dotted_path: str
 
         # package installed check occurs in PackageResource.package setter
         """
@@ -1273,16 +2247,16 @@ class PackageResource:
         Start folder, either exists or it doesn't. Adjust if it exists"""
         if base_token is not None:
             # Data folder *might* exist in package
-            traversable_data_dir = _get_package_data_folder(
-                f"{self.package}.{base_token}",
-            )
+            dotted_path = f"{self.package}.{base_token}"
+            traversable_data_dir = _get_package_data_folder(dotted_path)
             is_use_fallback = traversable_data_dir is None
         else:  # pragma: no cover
             # Module definity exists in virtual environment
             is_use_fallback = True
 
         if is_use_fallback:  # pragma: no branch
-            traversable_data_dir = _get_package_data_folder(self.package)
+            dotted_path = self.package
+            traversable_data_dir = _get_package_data_folder(dotted_path)
 
         # Impossible --> traversable_data_dir is None
         if path_adjusted is None:  # pragma: no cover Is package base folder
@@ -1292,30 +2266,56 @@ class PackageResource:
             if bool(parts):  # pragma: no branch
                 traversable_data_dir.joinpath(*parts)
 
-        # Check the root folder
-        #    root is ``data``. root relative to ``data`` is ````
-        if bool(
-            list(
-                check_folder(
-                    traversable_data_dir,
-                    cb_suffix=cb_suffix,
-                    cb_file_stem=cb_file_stem,
-                )
-            )
-        ):  # pragma: no branch
-            yield from check_folder(
-                traversable_data_dir,
-                cb_suffix=cb_suffix,
-                cb_file_stem=cb_file_stem,
-            )
+        ret = get_file_index(dotted_path, traversable_data_dir)
 
-        # Within traversable_root_dir, yield all other folders
-        for traversable_x in walk_tree_folders(traversable_data_dir):
-            yield from check_folder(
-                traversable_x,
-                cb_suffix=cb_suffix,
-                cb_file_stem=cb_file_stem,
-            )
+        return ret
+
+    def iter_data_files(
+        self,
+        *,
+        cb_suffix=None,
+        cb_file_stem=None,
+        path_relative_package_dir=None,
+    ):
+        """Matching package data files, without extracting them. Read
+        each with :py:meth:`importlib.resources.abc.Traversable.read_text`
+
+        Same search as
+        :py:meth:`PackageResource.package_data_folders <logging_strict.util.package_resource.PackageResource.package_data_folders>`
+
+        :param cb_suffix:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by suffix
+
+        :type cb_suffix: collections.abc.Callable[[str],bool] | None
+        :param cb_file_stem:
+
+           Function creating using :py:func:`functools.partial` which
+           filters by file name stem
+
+        :type cb_file_stem: collections.abc.Callable[[str],bool] | None
+        :param path_relative_package_dir:
+
+           package base folder to start the search
+
+        :type path_relative_package_dir: pathlib.Path | str | None
+        :returns:
+
+           path relative to the package data folder, same as an
+           extracted file's path relative to the destination folder,
+           and the package data file
+
+        :rtype: collections.abc.Iterator[tuple[str, importlib.resources.abc.Traversable]]
+        """
+        file_index = self._get_file_index(path_relative_package_dir)
+        gen_files = file_index.iter_files(
+            cb_suffix=cb_suffix,
+            cb_file_stem=cb_file_stem,
+        )
+        for reldir, name in gen_files:
+            relpath = "/".join(reldir + (name,))
+            yield relpath, file_index.folder(reldir).joinpath(name)
 
     def resource_extract(
         self,
@@ -1383,6 +2383,12 @@ class PackageResource:
            Resources will not be extracted if the generator is
            exhausted. If running in a loop, reinitialize generator
 
+        .. note:: Concurrent extraction
+
+           Extraction occurs, under :py:class:`ExtractLock`, on the first
+           ``next``. Processes extracting into the same folder take
+           turns. Files are yielded once unlocked
+
         .. todo:: acl permissions of dest folder
 
            Check acl writable permissions
@@ -1393,11 +2399,16 @@ class PackageResource:
         if TYPE_CHECKING:
             traversable_dir: Traversable
             traversable_x: Traversable
-            file_name_pkg: str
-            suffix: str
-            is_filter_suffix: bool
+            is_match: Callable[[str], bool]
             path_dest_file: Path
-            is_ok_inner: bool
+            manifest: ExtractManifest
+            relpath: str
+            st_dest: "os.stat_result | None"
+            bytes_src: bytes
+            digest: str
+            is_write: bool
+            owner_fixups: OwnerFixups
+            dirs_made: set[tuple[str, ...]]
 
         operation = "resource_extract"
 
@@ -1420,6 +2431,9 @@ class PackageResource:
             msg_info = f"path_dest: {path_dest_dir}"
             print(msg_info, file=sys.stderr)
 
+        # Run as root. Owner changed once, after extracting
+        owner_fixups = OwnerFixups(is_as_user=as_user)
+
         # dest (base) folder
         # On Windows, prevent FileNotFound for Cache folder. Windows needs parents=True?
         if not path_dest_dir.exists():  # pragma: no branch
@@ -1428,223 +2442,212 @@ class PackageResource:
                 parents=True,
                 exist_ok=True,
             )
-            IsRoot.set_owner_as_user(
-                path_dest_dir,
-                is_as_user=as_user,
-            )
+            owner_fixups.add(path_dest_dir)
 
         # Check acl writable permissions. Is dest folder tree writable?
         pass
 
-        for traversable_dir in base_folder_generator:
-            if traversable_dir.is_dir():  # pragma: no cover  # pragma: no branch
-                dir_current_name = traversable_dir.name
-
-            for traversable_x in traversable_dir.iterdir():
-                if traversable_x.is_file():  # pragma: no branch
-                    if is_module_debug:  # pragma: no cover  # pragma: no branch
-                        print(
-                            f"dir {dir_current_name} file {traversable_x.name}",
-                            file=sys.stderr,
-                        )
-                    file_name_pkg = traversable_x.name
-                    stem = msg_stem(file_name_pkg)
-                    suffixes = Path(file_name_pkg).suffixes
-                    suffix = "".join(suffixes)
-                    is_filter_suffix = cb_suffix is None or cb_suffix(suffix)
-                    is_filter_file_stem = cb_file_stem is None or cb_file_stem(stem)
-                    if is_filter_suffix and is_filter_file_stem:  # pragma: no branch
-                        # extract
-                        with importlib_resources.as_file(traversable_x) as path_entry:
-                            """Get relative (to start dir) parent
-                            folders (of package data file), so can extract, preserving
-                            folder tree
-                            """
-                            pass
-
-                            """
-                            package start folder. Not:
-
-                            - current folder
-
-                            - relative folder
-                            """
-                            pkg_start_dir = self.package_data_folder_start
-                            path_relative_to_base = self.path_relative(
-                                path_entry,
-                                parent_count=None,  # means get all
-                                path_relative_package_dir=pkg_start_dir,
+        # One process extracts. Others wait, then find the files up to date
+        paths_extracted = []
+        # Sub-folders created or known to exist, during this extraction
+        dirs_made = set()
+        is_match = FileMatcher.from_callbacks(cb_suffix, cb_file_stem).is_match
+        with ExtractLock(path_dest_dir, self.package):
+            # Files extracted previously. Load once locked, so includes files
+            # just extracted by another process
+            manifest = ExtractManifest(path_dest_dir, self.package)
+            manifest.load()
+
+            for traversable_dir in base_folder_generator:
+                if traversable_dir.is_dir():  # pragma: no cover  # pragma: no branch
+                    dir_current_name = traversable_dir.name
+
+                for traversable_x in traversable_dir.iterdir():
+                    if traversable_x.is_file():  # pragma: no branch
+                        if is_module_debug:  # pragma: no cover  # pragma: no branch
+                            print(
+                                f"dir {dir_current_name} file {traversable_x.name}",
+                                file=sys.stderr,
                             )
+                        if is_match(traversable_x.name):  # pragma: no branch
+                            # extract
+                            with importlib_resources.as_file(
+                                traversable_x
+                            ) as path_entry:
+                                """Get relative (to start dir) parent
+                                folders (of package data file), so can extract, preserving
+                                folder tree
+                                """
+                                pass
+
+                                """
+                                package start folder. Not:
 
-                            # Strip the file name
-                            tuple_relative_folders = path_relative_to_base.parts[:-1]
+                                - current folder
 
-                            if is_module_debug:  # pragma: no cover  # pragma: no branch
-                                print(
-                                    f"path_relative_to_base {path_relative_to_base}",
-                                    file=sys.stderr,
+                                - relative folder
+                                """
+                                pkg_start_dir = self.package_data_folder_start
+                                path_relative_to_base = self.path_relative(
+                                    path_entry,
+                                    parent_count=None,  # means get all
+                                    path_relative_package_dir=pkg_start_dir,
                                 )
-                                print(
-                                    f"tuple_relative_folders {tuple_relative_folders}",
-                                    file=sys.stderr,
+
+                                # Strip the file name
+                                tuple_relative_folders = (
+                                    path_relative_to_base.parent.parts
                                 )
-                            # Gracefully :py:meth:`Path.mkdir` dest folders
-                            if bool(tuple_relative_folders):
-                                """In dest folder, gracefully create all
-                                needed sub-folders. Setting correct owner
-                                along the way.
-                                So this script can be run as root,
-                                but the folders would be owned by
-                                normal session user
-                                """
-                                for num in range(0, len(tuple_relative_folders)):
-                                    lst_folder = tuple_relative_folders[: num + 1]
-                                    path_parent_tmp = path_dest_dir.joinpath(
-                                        *lst_folder
+
+                                if is_module_debug:  # pragma: no cover  # pragma: no branch  # fmt: skip
+                                    print(
+                                        f"path_relative_to_base {path_relative_to_base}",
+                                        file=sys.stderr,
                                     )
-                                    path_parent_tmp.mkdir(
-                                        mode=0o755,
-                                        parents=False,
-                                        exist_ok=True,
+                                    print(
+                                        f"tuple_relative_folders {tuple_relative_folders}",
+                                        file=sys.stderr,
                                     )
-                                    IsRoot.set_owner_as_user(
-                                        path_parent_tmp,
-                                        is_as_user=as_user,
+                                # Gracefully :py:meth:`Path.mkdir` dest folders
+                                if bool(tuple_relative_folders):
+                                    """In dest folder, gracefully create all
+                                    needed sub-folders. Setting correct owner
+                                    along the way.
+                                    So this script can be run as root,
+                                    but the folders would be owned by
+                                    normal session user
+                                    """
+                                    for num in range(0, len(tuple_relative_folders)):
+                                        lst_folder = tuple_relative_folders[: num + 1]
+                                        if lst_folder in dirs_made:
+                                            continue
+                                        else:  # pragma: no cover
+                                            pass
+                                        path_parent_tmp = path_dest_dir.joinpath(
+                                            *lst_folder
+                                        )
+                                        path_parent_tmp.mkdir(
+                                            mode=0o755,
+                                            parents=False,
+                                            exist_ok=True,
+                                        )
+                                        dirs_made.add(lst_folder)
+                                        owner_fixups.add(path_parent_tmp)
+                                    path_dest_parent = path_dest_dir.joinpath(
+                                        *tuple_relative_folders,
                                     )
-                                path_dest_parent = path_dest_dir.joinpath(
-                                    *tuple_relative_folders,
+                                else:
+                                    path_dest_parent = path_dest_dir
+                                path_dest_file = path_dest_parent.joinpath(
+                                    path_entry.name,
                                 )
-                            else:
-                                path_dest_parent = path_dest_dir
-                            path_dest_file = path_dest_parent.joinpath(
-                                path_entry.name,
-                            )
 
-                            if not path_dest_file.exists():
-                                is_ok_inner = True
-                            else:
-                                if (
-                                    not path_dest_file.is_file()
-                                ):  # pragma: no cover logs warning
-                                    # Won't be able to overwrite existing fs object
-                                    msg_warn = (
-                                        f"In {operation}, destination "
-                                        "exists, but is not a file. "
-                                        "Can't overwrite. "
-                                        f"{path_dest_file}"
-                                    )
-                                    _LOGGER.warning(msg_warn)
-                                    is_ok_inner = False
-                                else:
-                                    if (
-                                        isinstance(is_overwrite, bool)
-                                        and is_overwrite is True
-                                    ):
-                                        # overwrite existing file
-                                        is_ok_inner = True
-                                    else:
-                                        # Not a file or don't overwrite
-                                        is_ok_inner = False
-                            """ The docs of shutil, pathlib, and os doesn't
-                                cover which Exceptions are raised. Even the
-                                source code isn't perfect. So best effort
-                            """
-                            try:
-                                if not is_ok_inner:  # pragma: no cover
-                                    # Don't overwrite
-                                    pass
-                                else:
-                                    """Compare sizes. timestamps
-                                    better. Like GNU Makefile
-                                    """
-                                    if (
-                                        path_dest_file.exists()
-                                        and path_dest_file.is_file()
-                                    ):
-                                        dest_size = path_dest_file.stat().st_size
-                                        src_size = path_entry.stat().st_size
-                                        is_size_differs = dest_size != src_size
-                                        if is_size_differs:  # pragma: no branch
-                                            # chown?!
-                                            if is_module_debug:  # pragma: no cover  # pragma: no branch  # fmt: skip
-                                                print(
-                                                    f"copy (overwrites) {path_entry} --> {path_dest_file}",
-                                                    file=sys.stderr,
-                                                )
-                                            shutil.copy2(path_entry, path_dest_file)
-                                            path_dest_file.chmod(0o644)
-                                            IsRoot.set_owner_as_user(
-                                                path_dest_file,
-                                                is_as_user=as_user,
-                                            )
+                                relpath = path_dest_file.relative_to(
+                                    path_dest_dir
+                                ).as_posix()
+                                try:
+                                    st_dest = path_dest_file.stat()
+                                except FileNotFoundError:
+                                    st_dest = None
+
+                                """ The docs of pathlib and os doesn't
+                                    cover which Exceptions are raised. Even the
+                                    source code isn't perfect. So best effort
+                                """
+                                try:
+                                    if st_dest is not None and not stat.S_ISREG(
+                                        st_dest.st_mode
+                                    ):  # pragma: no cover logs warning
+                                        # Won't be able to overwrite existing fs object
+                                        msg_warn = (
+                                            f"In {operation}, destination "
+                                            "exists, but is not a file. "
+                                            "Can't overwrite. "
+                                            f"{path_dest_file}"
+                                        )
+                                        _LOGGER.warning(msg_warn)
+                                        is_write = False
+                                    elif manifest.is_current(relpath, st_dest):
+                                        # Unchanged package. Untouched copy
+                                        is_write = False
                                     else:
-                                        # chown?!
+                                        bytes_src = traversable_x.read_bytes()
+                                        digest = hashlib.sha256(bytes_src).hexdigest()
+                                        is_write = manifest.is_stale(
+                                            relpath,
+                                            path_dest_file,
+                                            st_dest,
+                                            digest,
+                                            is_overwrite=is_overwrite is True,
+                                        )
+
+                                    if is_write:
                                         if is_module_debug:  # pragma: no cover  # pragma: no branch  # fmt: skip
                                             print(
-                                                f"copy (new) {path_entry} --> {path_dest_file}",
+                                                f"copy {path_entry} --> {path_dest_file}",
                                                 file=sys.stderr,
                                             )
-                                        shutil.copy2(
-                                            path_entry,
-                                            path_dest_file,
+                                        # A concurrent reader sees old or new file
+                                        _write_bytes_atomic(path_dest_file, bytes_src)
+                                        owner_fixups.add(path_dest_file)
+                                        manifest.record(
+                                            relpath,
+                                            path_dest_file.stat(),
+                                            digest,
                                         )
-                                        path_dest_file.chmod(0o644)
-                                        IsRoot.set_owner_as_user(
-                                            path_dest_file,
-                                            is_as_user=as_user,
-                                        )
-                            except (
-                                shutil.SameFileError
-                            ):  # pragma: no cover logs warning
-                                # Attempted to copy file onto itself
-                                msg_warn = (
-                                    "During resource extract, attempted "
-                                    "to copy file onto itself. "
-                                    f"{path_dest_file}"
-                                )
-                                _LOGGER.warning(msg_warn)
-                            except FileNotFoundError:  # pragma: no cover logs warning
-                                # Dest folder does not exist
-                                msg_warn = (
-                                    "During resource extract, destination "
-                                    "folder does not exist "
-                                    f"{path_dest_file}"
-                                )
-                                _LOGGER.warning(msg_warn)
-                            except IsADirectoryError:  # pragma: no cover logs warning
-                                # Folder exists but not a folder!
-                                msg_warn = (
-                                    "During resource extract, folder "
-                                    "exists but not a folder! "
-                                    f"{path_dest_file}"
-                                )
-                                _LOGGER.warning(msg_warn)
-                            except OSError:  # pragma: no cover logs warning
-                                # Problem copying file stats
-                                msg_warn = (
-                                    "During resource extract, "
-                                    "problem copying file stats "
-                                    f"{path_dest_file}"
-                                )
-                                _LOGGER.warning(msg_warn)
-                            except PermissionError:  # pragma: no cover logs warning
-                                """Insufficient permissions. Cannot copy
-                                file or chmod
-                                """
-                                msg_warn = (
-                                    "During resource extract, "
-                                    "Insufficient permissions. Cannot "
-                                    "copy file or chmod "
-                                    f"{path_dest_file}"
-                                )
-                                _LOGGER.warning(msg_warn)
-                            else:
-                                if is_module_debug:  # pragma: no cover  # pragma: no branch  # fmt: skip
-                                    print(
-                                        f"yielding {path_dest_file}",
-                                        file=sys.stderr,
+                                    else:  # pragma: no cover
+                                        pass
+                                except IsADirectoryError:  # pragma: no cover logs warning  # fmt: skip
+                                    # Folder exists but not a folder!
+                                    msg_warn = (
+                                        "During resource extract, folder "
+                                        "exists but not a folder! "
+                                        f"{path_dest_file}"
+                                    )
+                                    _LOGGER.warning(msg_warn)
+                                except FileNotFoundError:  # pragma: no cover logs warning  # fmt: skip
+                                    # Dest folder does not exist
+                                    msg_warn = (
+                                        "During resource extract, destination "
+                                        "folder does not exist "
+                                        f"{path_dest_file}"
+                                    )
+                                    _LOGGER.warning(msg_warn)
+                                except PermissionError:  # pragma: no cover logs warning
+                                    """Insufficient permissions. Cannot write
+                                    file or chmod
+                                    """
+                                    msg_warn = (
+                                        "During resource extract, "
+                                        "Insufficient permissions. Cannot "
+                                        "copy file or chmod "
+                                        f"{path_dest_file}"
+                                    )
+                                    _LOGGER.warning(msg_warn)
+                                except OSError:  # pragma: no cover logs warning
+                                    # Problem reading or writing file
+                                    msg_warn = (
+                                        "During resource extract, "
+                                        "problem copying file "
+                                        f"{path_dest_file}"
                                     )
-                                yield path_dest_file
+                                    _LOGGER.warning(msg_warn)
+                                else:
+                                    if is_module_debug:  # pragma: no cover  # pragma: no branch  # fmt: skip
+                                        print(
+                                            f"yielding {path_dest_file}",
+                                            file=sys.stderr,
+                                        )
+                                    paths_extracted.append(path_dest_file)
+            if manifest.save():
+                owner_fixups.add(manifest.path_file)
+            else:  # pragma: no cover
+                pass
+            # One pass. Session user uid and gid resolved once per process
+            owner_fixups.apply()
+
+        # Unlocked before yielding. Caller may abandon this generator
+        yield from paths_extracted
 
     def cache_extract(
         self,
@@ -1,4 +1,7 @@
 import logging
+import os
+import sys
+import threading
 from collections.abc import (
     Callable,
     Iterator,
@@ -6,27 +9,66 @@ from collections.abc import (
 )
 from importlib.abc import Traversable
 from pathlib import Path
+from types import (
+    ModuleType,
+    TracebackType,
+)
 from typing import (
     Any,
     Protocol,
     runtime_checkable,
 )
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 __all__ = (
     "PackageResource",
     "PartSuffix",
     "PartStem",
     "filter_by_suffix",
     "filter_by_file_stem",
+    "FileMatcher",
     "get_package_data",
+    "PackageFileIndex",
+    "get_file_index",
+    "file_index_clear",
+    "ExtractManifest",
+    "ExtractLock",
+    "lookup_cache_clear",
 )
 
 is_module_debug: bool
 g_module: str
 _LOGGER: logging.Logger
+_file_indexes: dict[tuple[str, str | None], PackageFileIndex]
+_file_indexes_lock: threading.Lock
+_package_exists: dict[str, bool]
+_package_data_folders: dict[str, Traversable | None]
+EXTRACT_MANIFEST_SUFFIX: str
+EXTRACT_LOCK_SUFFIX: str
+EXTRACT_LOCK_TIMEOUT: float
+EXTRACT_LOCK_STALE: float
+_EXTRACT_LOCK_POLL: float
 
 def _extract_folder(package: str) -> str: ...
 def _get_package_data_folder(dotted_path: str) -> Traversable | None: ...
+def lookup_cache_clear() -> None: ...
+
+class _LookupCacheInvalidator:
+    __slots__ = ()
+
+    @staticmethod
+    def find_spec(
+        fullname: str,
+        path: Sequence[str] | None = None,
+        target: ModuleType | None = None,
+    ) -> None: ...
+    @staticmethod
+    def invalidate_caches() -> None: ...
+
 def _to_package_case(val: str) -> str: ...
 def check_folder(
     x: Traversable,
@@ -48,8 +90,37 @@ def match_file(
     *,
     cb_suffix: Callable[[str], bool] | None = None,
     cb_file_stem: Callable[[str], bool] | None = None,
+    matcher: FileMatcher | None = None,
 ) -> bool: ...
 def msg_stem(file_name: str) -> str: ...
+def _split_name(file_name: str) -> tuple[str, str]: ...
+
+class FileMatcher:
+    __slots__ = ("_suffixes", "_stem", "_cb_suffix", "_cb_file_stem")
+
+    _suffixes: str | tuple[str, ...] | None
+    _stem: str | None
+    _cb_suffix: Callable[[str], bool] | None
+    _cb_file_stem: Callable[[str], bool] | None
+
+    def __init__(
+        self,
+        suffix: str | tuple[str, ...] | None = None,
+        file_stem: str | None = None,
+    ) -> None: ...
+    @staticmethod
+    def _compile_suffix(suffix: Any) -> str | tuple[str, ...] | None: ...
+    @classmethod
+    def from_callbacks(
+        cls,
+        cb_suffix: Callable[[str], bool] | None = None,
+        cb_file_stem: Callable[[str], bool] | None = None,
+    ) -> Self: ...
+    def is_suffix(self, test_suffix: str | None) -> bool: ...
+    def is_stem(self, stem: str) -> bool: ...
+    def is_match_split(self, stem: str, suffix: str) -> bool: ...
+    def is_match(self, file_name: str) -> bool: ...
+
 def walk_tree_folders(
     traversable_root: Traversable,
 ) -> Iterator[Traversable]: ...
@@ -69,6 +140,90 @@ class PartStem(Protocol):
         test_file_stem: str,
     ) -> bool: ...
 
+def _get_distribution_version(package_name: str) -> str | None: ...
+
+class PackageFileIndex:
+    __slots__ = ("_entries", "_folders")
+
+    def __init__(self, traversable_root: Traversable) -> None: ...
+    def _walk(self, traversable_dir: Traversable, reldir: tuple[str, ...]) -> None: ...
+    @property
+    def entries(self) -> tuple[tuple[tuple[str, ...], str, str, str], ...]: ...
+    def folder(self, reldir: tuple[str, ...]) -> Traversable: ...
+    def iter_folders(
+        self,
+        cb_suffix: Callable[[str], bool] | None = None,
+        cb_file_stem: Callable[[str], bool] | None = None,
+    ) -> Iterator[Traversable]: ...
+    def iter_files(
+        self,
+        cb_suffix: Callable[[str], bool] | None = None,
+        cb_file_stem: Callable[[str], bool] | None = None,
+    ) -> Iterator[tuple[tuple[str, ...], str]]: ...
+
+def get_file_index(
+    dotted_path: str,
+    traversable_root: Traversable,
+) -> PackageFileIndex: ...
+def file_index_clear() -> None: ...
+def _get_package_key(package_name: str) -> str | None: ...
+def _write_bytes_atomic(path_file: Path, data: bytes) -> None: ...
+
+class ExtractManifest:
+    __slots__ = ("_d_files", "_is_dirty", "_key", "_path_file")
+
+    _d_files: dict[str, dict[str, Any]]
+    _is_dirty: bool
+    _key: str | None
+    _path_file: Path
+
+    def __init__(self, path_dest_dir: Path | str, package: str) -> None: ...
+    @property
+    def path_file(self) -> Path: ...
+    def load(self) -> int: ...
+    @staticmethod
+    def _is_untouched(d_entry: Any, st_dest: os.stat_result | None) -> bool: ...
+    def is_current(self, relpath: str, st_dest: os.stat_result | None) -> bool: ...
+    def is_stale(
+        self,
+        relpath: str,
+        path_dest_file: Path,
+        st_dest: os.stat_result | None,
+        digest: str,
+        is_overwrite: bool = False,
+    ) -> bool: ...
+    def record(self, relpath: str, st_dest: os.stat_result, digest: str) -> None: ...
+    def save(self) -> bool: ...
+
+class ExtractLock:
+    __slots__ = ("_fd", "_path_file", "_timeout")
+
+    _fd: int | None
+    _path_file: Path
+    _timeout: float
+
+    def __init__(
+        self,
+        path_dest_dir: Path | str,
+        package: str,
+        timeout: float = ...,
+    ) -> None: ...
+    @property
+    def path_file(self) -> Path: ...
+    @property
+    def is_locked(self) -> bool: ...
+    def _try_lock(self) -> bool: ...
+    def _is_stale(self) -> bool: ...
+    def acquire(self) -> bool: ...
+    def release(self) -> None: ...
+    def __enter__(self) -> Self: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
+
 class PackageResource:
     def __init__(
         self,
@@ -104,6 +259,17 @@ class PackageResource:
         cb_file_stem: Callable[[str], bool] | None = None,
         path_relative_package_dir: Path | str | None = None,
     ) -> Iterator[Traversable]: ...
+    def _get_file_index(
+        self,
+        path_relative_package_dir: Path | str | None,
+    ) -> PackageFileIndex: ...
+    def iter_data_files(
+        self,
+        *,
+        cb_suffix: Callable[[str], bool] | None = None,
+        cb_file_stem: Callable[[str], bool] | None = None,
+        path_relative_package_dir: Path | str | None = None,
+    ) -> Iterator[tuple[str, Traversable]]: ...
     def resource_extract(
         self,
         base_folder_generator: Iterator[Traversable],
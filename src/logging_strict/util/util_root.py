@@ -15,6 +15,7 @@ import os
 import platform
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import (
     Path,
     PurePath,
@@ -34,6 +35,8 @@ if TYPE_CHECKING:
 __all__ = (
     "IsRoot",
     "check_python_not_old",
+    "get_session_ids",
+    "OwnerFixups",
 )
 
 #: str: dotted path to this module
@@ -132,6 +135,23 @@ def get_logname():
     return ret
 
 
+@lru_cache(maxsize=None)
+def get_session_ids():
+    """Session user uid and gid. The session user doesn't change, so
+    resolved once per process. Clear with ``get_session_ids.cache_clear()``
+
+    Not available on Windows
+
+    :returns: session user uid and gid
+    :rtype: tuple[int, int]
+    """
+    session_user_name = get_logname()
+    pw_session = getpwnam(session_user_name)
+    ret = (pw_session[2], pw_session[3])
+
+    return ret
+
+
 def ungraceful_app_exit():  # pragma: no cover
     """Code separated, so it can be Mock'ed to do nothing"""
     if TYPE_CHECKING:
@@ -323,7 +343,6 @@ class IsRoot:
         :type is_as_user: typing.Any | None
         """
         if TYPE_CHECKING:
-            session_user_name: str
             session_uid: int
             session_gid: int
 
@@ -353,9 +372,7 @@ class IsRoot:
             g_is_root and is_as_user is True and platform.system().lower() != "windows"
         ):  # pragma: no branch
             # https://stackoverflow.com/questions/8086412/howto-determine-file-owner-on-windows-using-python-without-pywin32
-            session_user_name = get_logname()
-            session_uid = getpwnam(session_user_name)[2]
-            session_gid = getpwnam(session_user_name)[3]
+            session_uid, session_gid = get_session_ids()
             shutil.chown(
                 path_file,
                 user=session_uid,
@@ -363,6 +380,91 @@ class IsRoot:
             )
 
 
+class OwnerFixups:
+    """Batch of files and folders to be owned by the session user.
+    Collect while creating them, then :py:meth:`apply` once.
+
+    Only when run as root and as user, otherwise adding is a no-op.
+    Unlike :py:meth:`IsRoot.set_owner_as_user`, folders are included
+
+    :ivar is_as_user:
+
+       Default ``False``. ``True`` paths should be owned by the session user
+
+    :vartype is_as_user: typing.Any | None
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str]
+       :value: ("_is_active", "_paths")
+
+       Whether changing owner applies and pending paths
+
+    """
+
+    __slots__ = ("_is_active", "_paths")
+
+    def __init__(self, is_as_user=False):
+        """Class constructor"""
+        super().__init__()
+        self._is_active = (
+            g_is_root is True
+            and is_as_user is True
+            and platform.system().lower() != "windows"
+        )
+        # dict, not set. Insertion order, so parent folders first
+        self._paths = {}
+
+    @property
+    def is_active(self):
+        """Check owner will be changed
+
+        :returns: True if run as root and as user
+        :rtype: bool
+        """
+        return self._is_active
+
+    def add(self, path):
+        """Queue a file or folder. Adding again is a no-op
+
+        :param path: file or folder absolute path
+        :type path: pathlib.Path | str
+        """
+        if self._is_active:
+            self._paths[Path(path)] = None
+        else:  # pragma: no cover
+            pass
+
+    def apply(self):
+        """Change owner of queued paths not already owned by the session
+        user. Failures are skipped. Queue is emptied
+
+        :returns: count of paths whose owner changed
+        :rtype: int
+        """
+        if not self._is_active or not bool(self._paths):
+            return 0
+        else:  # pragma: no cover
+            pass
+
+        session_uid, session_gid = get_session_ids()
+        paths = self._paths
+        self._paths = {}
+        ret = 0
+        for path in paths:
+            try:
+                st_path = os.lstat(path)
+                if st_path.st_uid != session_uid or st_path.st_gid != session_gid:
+                    os.chown(path, session_uid, session_gid, follow_symlinks=False)
+                    ret += 1
+                else:  # pragma: no cover
+                    pass
+            except OSError:
+                # Removed meanwhile or not permitted
+                continue
+
+        return ret
+
+
 def check_python_not_old(
     callback=None,
     is_app_exit=False,
@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Any,
@@ -11,6 +12,8 @@ from typing_extensions import LiteralString
 __all__ = (
     "IsRoot",
     "check_python_not_old",
+    "get_session_ids",
+    "OwnerFixups",
 )
 
 dotted_path_module: Final[LiteralString]
@@ -20,6 +23,8 @@ is_python_old: Final[bool]
 
 def is_user_admin() -> bool: ...
 def get_logname() -> str: ...
+@lru_cache
+def get_session_ids() -> tuple[int, int]: ...
 def ungraceful_app_exit() -> None: ...
 
 class IsRoot:
@@ -50,6 +55,18 @@ class IsRoot:
         is_as_user: Any | None = False,
     ) -> None: ...
 
+class OwnerFixups:
+    __slots__ = ("_is_active", "_paths")
+
+    _is_active: bool
+    _paths: dict[Path, None]
+
+    def __init__(self, is_as_user: Any | None = False) -> None: ...
+    @property
+    def is_active(self) -> bool: ...
+    def add(self, path: Path | str) -> None: ...
+    def apply(self) -> int: ...
+
 def check_python_not_old(
     callback: Callable[[], str] | None = None,
     is_app_exit: bool | None = False,
@@ -0,0 +1,633 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Persist validated :py:mod:`logging.config` data in the XDG user cache folder.
+
+Short-lived worker processes validate the same logging config YAML
+files on every start. Once validated, store the resulting plain data
+as JSON. A warm start loads the JSON rather than running the strictyaml
+schema walk.
+
+Entries are keyed by sha256 of the YAML str, logging_strict version,
+strictyaml version, and Python version. An upgrade of any of these
+invalidates all prior entries.
+
+Writes are atomic, so concurrent processes never read a partial
+entry. Unreadable or malformed entries are ignored, i.e. treated as a
+cache miss. The cache is best effort. An OSError is swallowed, not raised.
+
+.. code-block:: text
+
+   from logging_strict.util.validation_cache import ValidationDiskCache
+
+   disk_cache = ValidationDiskCache()
+   d_config = disk_cache.get(str_yaml)
+   if d_config is None:
+       # validate str_yaml then
+       disk_cache.put(str_yaml, d_config)
+
+:py:class:`ValidationManifest` serves the validate entrypoint,
+``--incremental`` option. Per file, remembers content hash and result.
+Unchanged files are not validated again.
+
+:py:class:`RegistrySnapshot` serves
+:py:class:`~logging_strict.register_config.ExtractorLoggingConfig`. Per
+package, stores the validated ``logging_strict.yml`` registry. Keyed by
+installed distribution version and ``RECORD`` hash, so an upgrade or
+reinstall invalidates it.
+
+**Module private variables**
+
+.. py:data:: __all__
+   :type: tuple[str, str, str]
+   :value: ("RegistrySnapshot", "ValidationDiskCache", "ValidationManifest")
+
+   Module exports
+
+.. py:data:: _versions
+   :type: str | None
+   :value: None
+
+   Lazily determined. Versions which are part of each cache key
+
+**Module objects**
+
+"""
+
+import hashlib
+import json
+import os
+import platform
+import tempfile
+from pathlib import Path
+
+import importlib_metadata as metadata
+
+from .._version import __version__
+from ..constants import g_app_name
+from .check_type import is_ok
+from .xdg_folder import DestFolderUser
+
+__all__ = (
+    "RegistrySnapshot",
+    "ValidationDiskCache",
+    "ValidationManifest",
+)
+
+#: str: Subfolder within XDG user cache folder
+CACHE_SUBFOLDER = "validated"
+
+#: str: Cache entry file suffix
+CACHE_SUFFIX = ".json"
+
+#: str: Default manifest file name. Within XDG user cache folder
+MANIFEST_FILE_NAME = "validate_manifest.json"
+
+#: str: Registry snapshots subfolder within XDG user cache folder
+REGISTRY_SUBFOLDER = "registry"
+
+_versions = None
+
+
+def _get_versions():
+    """Get logging_strict, strictyaml, and Python versions. Avoids
+    importing strictyaml.
+
+    :returns: versions joined into one str
+    :rtype: str
+    """
+    global _versions
+
+    if _versions is None:
+        try:
+            strictyaml_version = metadata.version("strictyaml")
+        except metadata.PackageNotFoundError:  # pragma: no cover
+            strictyaml_version = ""
+        _versions = "\0".join(
+            (
+                __version__,
+                strictyaml_version,
+                platform.python_implementation(),
+                platform.python_version(),
+            )
+        )
+
+    return _versions
+
+
+def _write_atomic(path_file, str_contents):
+    """Write to a temporary file in the same folder, then rename. A
+    reader sees either the old or the new file, never a partial one
+
+    :param path_file: destination file absolute path
+    :type path_file: pathlib.Path
+    :param str_contents: file contents
+    :type str_contents: str
+    :returns: True if written otherwise False
+    :rtype: bool
+    """
+    path_dir = path_file.parent
+    path_tmp = None
+    try:
+        path_dir.mkdir(parents=True, exist_ok=True)
+        # Same folder as destination, so os.replace is atomic
+        fd, str_tmp = tempfile.mkstemp(
+            dir=path_dir,
+            prefix=f".{path_file.stem}.",
+            suffix=".tmp",
+        )
+        path_tmp = Path(str_tmp)
+        with os.fdopen(fd, mode="w", encoding="utf-8") as f:
+            f.write(str_contents)
+        os.replace(path_tmp, path_file)
+    except OSError:
+        if path_tmp is not None:
+            path_tmp.unlink(missing_ok=True)
+        ret = False
+    else:
+        ret = True
+
+    return ret
+
+
+class ValidationDiskCache:
+    """Persistent cache of validated logging.config data. One JSON file
+    per entry.
+
+    :ivar path_dir:
+
+       Default None. Cache folder. None uses XDG user cache folder,
+       determined on first use
+
+    :vartype path_dir: typing.Any | None
+
+    .. py:attribute:: __slots__
+       :type: tuple[str]
+       :value: ("_path_dir",)
+
+       Folder is determined lazily. Author lookup is not free
+
+    """
+
+    __slots__ = ("_path_dir",)
+
+    def __init__(self, path_dir=None):
+        """Class constructor"""
+        if path_dir is not None and is_ok(str(path_dir)):
+            self._path_dir = Path(path_dir)
+        else:
+            self._path_dir = None
+
+    @property
+    def path_dir(self):
+        """Get cache folder. Not created until first write
+
+        :returns: cache folder
+        :rtype: pathlib.Path
+        """
+        if self._path_dir is None:
+            str_cache_dir = DestFolderUser(g_app_name).cache_dir
+            self._path_dir = Path(str_cache_dir).joinpath(CACHE_SUBFOLDER)
+
+        return self._path_dir
+
+    @staticmethod
+    def get_key(yaml_snippet):
+        """Cache key. Also the cache entry file stem
+
+        :param yaml_snippet: :py:mod:`logging.config` YAML str
+        :type yaml_snippet: str
+        :returns: sha256 hex digest of YAML str and versions
+        :rtype: str
+        """
+        hash_ = hashlib.sha256(yaml_snippet.encode("utf-8"))
+        hash_.update(b"\0")
+        hash_.update(_get_versions().encode("utf-8"))
+        ret = hash_.hexdigest()
+
+        return ret
+
+    def get_path(self, key):
+        """Cache entry absolute path
+
+        :param key: From :py:meth:`ValidationDiskCache.get_key`
+        :type key: str
+        :returns: cache entry file absolute path
+        :rtype: pathlib.Path
+        """
+        ret = self.path_dir.joinpath(f"{key}{CACHE_SUFFIX}")
+
+        return ret
+
+    def get(self, yaml_snippet):
+        """Load validated data
+
+        :param yaml_snippet: :py:mod:`logging.config` YAML str
+        :type yaml_snippet: str
+        :returns: validated data. None if not cached or entry invalid
+        :rtype: typing.Any | None
+        """
+        key = self.get_key(yaml_snippet)
+        path_entry = self.get_path(key)
+        try:
+            str_json = path_entry.read_text(encoding="utf-8")
+            d_entry = json.loads(str_json)
+        except (OSError, ValueError):
+            # Not cached, unreadable, or not JSON
+            ret = None
+        else:
+            is_valid = (
+                isinstance(d_entry, dict)
+                and d_entry.get("key", None) == key
+                and "data" in d_entry.keys()
+            )
+            ret = d_entry["data"] if is_valid else None
+
+        return ret
+
+    def put(self, yaml_snippet, data):
+        """Store validated data. Atomic write. Failure is silent
+
+        :param yaml_snippet: :py:mod:`logging.config` YAML str
+        :type yaml_snippet: str
+        :param data: validated data. Must be JSON serializable
+        :type data: typing.Any
+        :returns: True if stored otherwise False
+        :rtype: bool
+        """
+        key = self.get_key(yaml_snippet)
+        try:
+            str_json = json.dumps({"key": key, "data": data})
+        except (TypeError, ValueError):
+            # Not JSON serializable. Don't cache
+            return False
+
+        path_entry = self.get_path(key)
+        ret = _write_atomic(path_entry, str_json)
+
+        return ret
+
+    def clear(self):
+        """Remove all cache entries. Also leftover temporary files
+
+        :returns: count of files removed
+        :rtype: int
+        """
+        count = 0
+        path_dir = self.path_dir
+        if path_dir.exists() and path_dir.is_dir():
+            for path_f in path_dir.iterdir():
+                is_entry = path_f.suffix in (CACHE_SUFFIX, ".tmp")
+                if is_entry and path_f.is_file():  # pragma: no branch
+                    try:
+                        path_f.unlink()
+                    except OSError:  # pragma: no cover
+                        pass
+                    else:
+                        count += 1
+        else:  # pragma: no cover
+            pass
+
+        return count
+
+
+class ValidationManifest:
+    """Per file content hash and validation result. So unchanged files
+    are not validated again.
+
+    The whole manifest is invalidated when the logging_strict,
+    strictyaml, or Python version, or the schema version, changes
+
+    Concurrent runs may share one manifest. On save, under a cross
+    process lock, the manifest file is read again and this run's
+    entries merged in. So another run's entries are not lost
+
+    :ivar path_file:
+
+       Default None. Manifest file. None uses XDG user cache folder,
+       determined on first use
+
+    :vartype path_file: typing.Any | None
+    :ivar schema_version:
+
+       Default empty str. Identifies the schema. A change invalidates
+       every entry
+
+    :vartype schema_version: str
+
+    .. py:attribute:: __slots__
+       :type: tuple[str, str, str, str]
+       :value: ("_d_files", "_d_recorded", "_path_file", "_schema_version")
+
+       File entries, entries recorded by this run, manifest file path,
+       and schema version
+
+    """
+
+    __slots__ = ("_d_files", "_d_recorded", "_path_file", "_schema_version")
+
+    def __init__(self, path_file=None, schema_version=""):
+        """Class constructor"""
+        if path_file is not None and is_ok(str(path_file)):
+            self._path_file = Path(path_file)
+        else:
+            self._path_file = None
+        self._schema_version = schema_version
+        self._d_files = {}
+        self._d_recorded = {}
+
+    @property
+    def path_file(self):
+        """Get manifest file path. Not created until saved
+
+        :returns: manifest file absolute path
+        :rtype: pathlib.Path
+        """
+        if self._path_file is None:
+            str_cache_dir = DestFolderUser(g_app_name).cache_dir
+            self._path_file = Path(str_cache_dir).joinpath(MANIFEST_FILE_NAME)
+
+        return self._path_file
+
+    @property
+    def version_key(self):
+        """Manifest entries are only valid for these versions
+
+        :returns: versions and schema version joined into one str
+        :rtype: str
+        """
+        ret = f"{_get_versions()}\0{self._schema_version}"
+
+        return ret
+
+    @staticmethod
+    def get_digest(path_f):
+        """File content hash
+
+        :param path_f: file absolute path
+        :type path_f: pathlib.Path
+        :returns: sha256 hex digest. None if file unreadable
+        :rtype: str | None
+        """
+        try:
+            ret = hashlib.sha256(Path(path_f).read_bytes()).hexdigest()
+        except OSError:
+            ret = None
+
+        return ret
+
+    def _read(self):
+        """Read manifest file entries. Missing, invalid, or other
+        version manifest results in no entries
+
+        :returns: file entries
+        :rtype: dict[str, typing.Any]
+        """
+        try:
+            str_json = self.path_file.read_text(encoding="utf-8")
+            d_manifest = json.loads(str_json)
+        except (OSError, ValueError):
+            d_manifest = None
+
+        is_valid = (
+            isinstance(d_manifest, dict)
+            and d_manifest.get("versions", None) == self.version_key
+            and isinstance(d_manifest.get("files", None), dict)
+        )
+        if is_valid:
+            ret = d_manifest["files"]
+        else:
+            ret = {}
+
+        return ret
+
+    def load(self):
+        """Load manifest file. Missing, invalid, or other version
+        manifest results in no entries
+
+        :returns: entry count
+        :rtype: int
+        """
+        self._d_files = self._read()
+
+        return len(self._d_files)
+
+    def lookup(self, path_f, digest):
+        """Get recorded result, if file unchanged
+
+        :param path_f: file absolute path
+        :type path_f: pathlib.Path
+        :param digest: current file content hash
+        :type digest: str | None
+        :returns: True if unchanged, and recorded result
+        :rtype: tuple[bool, typing.Any]
+        """
+        d_entry = self._d_files.get(str(path_f), None)
+        is_hit = (
+            digest is not None
+            and isinstance(d_entry, dict)
+            and d_entry.get("sha256", None) == digest
+            and "result" in d_entry.keys()
+        )
+        if is_hit:
+            ret = (True, d_entry["result"])
+        else:
+            ret = (False, None)
+
+        return ret
+
+    def record(self, path_f, digest, result):
+        """Record validation result
+
+        :param path_f: file absolute path
+        :type path_f: pathlib.Path
+        :param digest: file content hash. None does not record
+        :type digest: str | None
+        :param result: validation result. Must be JSON serializable
+        :type result: typing.Any
+        """
+        if digest is not None:
+            d_entry = {"sha256": digest, "result": result}
+            self._d_files[str(path_f)] = d_entry
+            self._d_recorded[str(path_f)] = d_entry
+        else:  # pragma: no cover
+            pass
+
+    def save(self):
+        """Under a cross process lock, read the manifest file again,
+        merge in entries recorded since load, then atomic write.
+        Entries of removed files are dropped
+
+        :returns: True if written otherwise False
+        :rtype: bool
+        """
+        # package_resource imports this module
+        from .package_resource import ExtractLock
+
+        path_file = self.path_file
+        try:
+            path_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return False
+
+        # Not acquired, e.g. no fcntl, is not an error. Still atomic
+        with ExtractLock(path_file.parent, path_file.name):
+            # Another run may have saved meanwhile. Keep its entries
+            d_files = self._read()
+            d_files.update(self._d_recorded)
+            d_files = {
+                str_path: d_entry
+                for str_path, d_entry in d_files.items()
+                if Path(str_path).exists()
+            }
+            self._d_files = d_files
+            d_manifest = {"versions": self.version_key, "files": d_files}
+            ret = _write_atomic(path_file, json.dumps(d_manifest))
+
+        return ret
+
+
+class RegistrySnapshot:
+    """Persistent, validated, registry of logging config YAML files. One
+    JSON file per package.
+
+    A warm start loads the JSON. No package walk, no file extraction,
+    and no strictyaml.
+
+    Entries are keyed by package name, installed distribution version,
+    and ``RECORD`` hash, plus logging_strict, strictyaml, and Python
+    versions. An editable install has no reliable key, its files change
+    without a reinstall. It's never cached.
+
+    :ivar path_dir:
+
+       Default None. Snapshot folder. None uses XDG user cache folder,
+       determined on first use
+
+    :vartype path_dir: typing.Any | None
+
+    .. py:attribute:: __slots__
+       :type: tuple[str]
+       :value: ("_path_dir",)
+
+       Folder is determined lazily. Author lookup is not free
+
+    """
+
+    __slots__ = ("_path_dir",)
+
+    def __init__(self, path_dir=None):
+        """Class constructor"""
+        if path_dir is not None and is_ok(str(path_dir)):
+            self._path_dir = Path(path_dir)
+        else:
+            self._path_dir = None
+
+    @property
+    def path_dir(self):
+        """Get snapshot folder. Not created until first write
+
+        :returns: snapshot folder
+        :rtype: pathlib.Path
+        """
+        if self._path_dir is None:
+            str_cache_dir = DestFolderUser(g_app_name).cache_dir
+            self._path_dir = Path(str_cache_dir).joinpath(REGISTRY_SUBFOLDER)
+
+        return self._path_dir
+
+    @staticmethod
+    def get_key(package_name):
+        """Identifies the installed distribution. Reads only the
+        distribution metadata
+
+        :param package_name: package name
+        :type package_name: str
+        :returns:
+
+           sha256 hex digest. None if not installed, editable install,
+           or no ``RECORD``
+
+        :rtype: str | None
+        """
+        try:
+            dist = metadata.distribution(package_name)
+        except (metadata.PackageNotFoundError, ValueError):
+            return None
+
+        str_record = dist.read_text("RECORD")
+        str_direct_url = dist.read_text("direct_url.json")
+        try:
+            d_direct_url = json.loads(str_direct_url) if str_direct_url else {}
+            is_editable = bool(d_direct_url["dir_info"]["editable"])
+        except (ValueError, TypeError, KeyError):
+            is_editable = False
+
+        if str_record is None or is_editable:
+            ret = None
+        else:
+            hash_ = hashlib.sha256(package_name.encode("utf-8"))
+            for str_part in (dist.version, str_record, _get_versions()):
+                hash_.update(b"\0")
+                hash_.update(str_part.encode("utf-8"))
+            ret = hash_.hexdigest()
+
+        return ret
+
+    def get_path(self, package_name):
+        """Snapshot absolute path
+
+        :param package_name: package name
+        :type package_name: str
+        :returns: snapshot file absolute path
+        :rtype: pathlib.Path
+        """
+        ret = self.path_dir.joinpath(f"{package_name}{CACHE_SUFFIX}")
+
+        return ret
+
+    def get(self, package_name, key):
+        """Load validated registry
+
+        :param package_name: package name
+        :type package_name: str
+        :param key: From :py:meth:`RegistrySnapshot.get_key`
+        :type key: str
+        :returns: validated registry. None if no snapshot or stale
+        :rtype: list[dict[str, dict[str, typing.Any]]] | None
+        """
+        try:
+            str_json = self.get_path(package_name).read_text(encoding="utf-8")
+            d_entry = json.loads(str_json)
+        except (OSError, ValueError):
+            ret = None
+        else:
+            is_valid = (
+                isinstance(d_entry, dict)
+                and d_entry.get("key", None) == key
+                and isinstance(d_entry.get("registry", None), list)
+            )
+            ret = d_entry["registry"] if is_valid else None
+
+        return ret
+
+    def put(self, package_name, key, registry):
+        """Store validated registry. Atomic write. Failure is silent
+
+        :param package_name: package name
+        :type package_name: str
+        :param key: From :py:meth:`RegistrySnapshot.get_key`
+        :type key: str
+        :param registry: validated registry. Must be JSON serializable
+        :type registry: collections.abc.Sequence[dict[str, dict[str, typing.Any]]]
+        :returns: True if stored otherwise False
+        :rtype: bool
+        """
+        try:
+            str_json = json.dumps({"key": key, "registry": list(registry)})
+        except (TypeError, ValueError):
+            return False
+
+        ret = _write_atomic(self.get_path(package_name), str_json)
+
+        return ret
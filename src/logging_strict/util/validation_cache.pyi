@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+from pathlib import Path
+from typing import (
+    Any,
+    Final,
+)
+
+__all__ = (
+    "RegistrySnapshot",
+    "ValidationDiskCache",
+    "ValidationManifest",
+)
+
+CACHE_SUBFOLDER: Final[str]
+CACHE_SUFFIX: Final[str]
+MANIFEST_FILE_NAME: Final[str]
+REGISTRY_SUBFOLDER: Final[str]
+_versions: str | None
+
+def _get_versions() -> str: ...
+def _write_atomic(path_file: Path, str_contents: str) -> bool: ...
+
+class ValidationDiskCache:
+    __slots__ = ("_path_dir",)
+
+    _path_dir: Path | None
+
+    def __init__(self, path_dir: Any | None = None) -> None: ...
+    @property
+    def path_dir(self) -> Path: ...
+    @staticmethod
+    def get_key(yaml_snippet: str) -> str: ...
+    def get_path(self, key: str) -> Path: ...
+    def get(self, yaml_snippet: str) -> Any | None: ...
+    def put(self, yaml_snippet: str, data: Any) -> bool: ...
+    def clear(self) -> int: ...
+
+class ValidationManifest:
+    __slots__ = ("_d_files", "_d_recorded", "_path_file", "_schema_version")
+
+    _d_files: dict[str, dict[str, Any]]
+    _d_recorded: dict[str, dict[str, Any]]
+    _path_file: Path | None
+    _schema_version: str
+
+    def __init__(
+        self,
+        path_file: Any | None = None,
+        schema_version: str = "",
+    ) -> None: ...
+    @property
+    def path_file(self) -> Path: ...
+    @property
+    def version_key(self) -> str: ...
+    @staticmethod
+    def get_digest(path_f: Path) -> str | None: ...
+    def _read(self) -> dict[str, Any]: ...
+    def load(self) -> int: ...
+    def lookup(self, path_f: Path, digest: str | None) -> tuple[bool, Any]: ...
+    def record(self, path_f: Path, digest: str | None, result: Any) -> None: ...
+    def save(self) -> bool: ...
+
+class RegistrySnapshot:
+    __slots__ = ("_path_dir",)
+
+    _path_dir: Path | None
+
+    def __init__(self, path_dir: Any | None = None) -> None: ...
+    @property
+    def path_dir(self) -> Path: ...
+    @staticmethod
+    def get_key(package_name: str) -> str | None: ...
+    def get_path(self, package_name: str) -> Path: ...
+    def get(
+        self,
+        package_name: str,
+        key: str,
+    ) -> list[dict[str, dict[str, Any]]] | None: ...
+    def put(
+        self,
+        package_name: str,
+        key: str,
+        registry: Sequence[dict[str, dict[str, Any]]],
+    ) -> bool: ...
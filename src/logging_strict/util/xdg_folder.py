@@ -46,6 +46,7 @@ Get XDG cache dir for package without author attribution
 
 import email
 import email.policy
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -64,7 +65,17 @@ from .check_type import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-__all__ = ("DestFolderSite", "DestFolderUser", "_get_path_config")
+__all__ = (
+    "DestFolderSite",
+    "DestFolderUser",
+    "_get_path_config",
+    "author_cache_clear",
+)
+
+#: dict[tuple[str, bool, bool, bool], tuple[tuple[str | None, int | None, str | None], str | None]]: process wide.
+#: Key is package and author name normalization flags. Value is
+#: distribution stamp and normalized author name
+_authors = {}
 
 
 def _author_normalize(
@@ -154,6 +165,51 @@ def _author_normalize(
     return name
 
 
+def _get_dist_stamp(dist):
+    """Identify an installed distribution, without parsing metadata.
+    A path distribution is stamped with its metadata folder
+
+    :param dist: installed distribution
+    :type dist: importlib_metadata.Distribution
+    :returns: metadata folder path and modification time. Or None and None
+    :rtype: tuple[str | None, int | None]
+    """
+    path_dist = getattr(dist, "_path", None)
+    try:
+        ret = (str(path_dist), os.stat(path_dist).st_mtime_ns)
+    except (OSError, TypeError):
+        ret = (None, None)
+
+    return ret
+
+
+def _is_dist_unchanged(stamp):
+    """Upgrade, downgrade, or reinstall replaces the metadata folder
+
+    :param stamp: From :py:func:`_get_dist_stamp` plus version
+    :type stamp: tuple[str | None, int | None, str | None]
+    :returns: True if unchanged or can't tell
+    :rtype: bool
+    """
+    str_path, mtime_ns = stamp[:2]
+    if str_path is None:
+        # Not a path distribution. Until cleared
+        ret = True
+    else:
+        try:
+            ret = os.stat(str_path).st_mtime_ns == mtime_ns
+        except OSError:
+            ret = False
+
+    return ret
+
+
+def author_cache_clear():
+    """Forget resolved author names. Authors are otherwise resolved once
+    per process, per package, unless the installed distribution changes"""
+    _authors.clear()
+
+
 def _get_author(
     package,
     no_period=True,
@@ -181,6 +237,10 @@ def _get_author(
     If not try "Author" then fallback is None. Which is useless, wrong,
     and crying out for the coder to make a judgement call!
 
+    Parsing metadata costs milliseconds. Result is cached per process,
+    until the distribution is replaced. Clear with
+    :py:func:`author_cache_clear`
+
     :param package:
 
        Default :paramref:`g_app_name`. Target package to retrieve author name.
@@ -235,7 +295,15 @@ def _get_author(
 
     ret_outer = None
     if is_ok(package):  # pragma: no branch
-        email_msg = metadata.metadata(package)
+        key = (package, no_period, no_space, no_underscore)
+        t_cached = _authors.get(key, None)
+        if t_cached is not None and _is_dist_unchanged(t_cached[0]):
+            return t_cached[1]
+        else:  # pragma: no cover
+            pass
+
+        dist = metadata.distribution(package)
+        email_msg = dist.metadata
         try_these = (
             ("Author-email", filter_author_email),
             ("Author", None),
@@ -250,6 +318,8 @@ def _get_author(
                     no_space=no_space,
                     no_underscore=no_underscore,
                 )
+        stamp = (*_get_dist_stamp(dist), email_msg.get("Version", None))
+        _authors[key] = (stamp, ret_outer)
 
     return ret_outer
 
@@ -1,7 +1,19 @@
 from pathlib import Path
 from typing import Any
 
-__all__ = ("DestFolderSite", "DestFolderUser", "_get_path_config")
+import importlib_metadata as metadata
+
+__all__ = (
+    "DestFolderSite",
+    "DestFolderUser",
+    "_get_path_config",
+    "author_cache_clear",
+)
+
+_authors: dict[
+    tuple[str, bool, bool, bool],
+    tuple[tuple[str | None, int | None, str | None], str | None],
+]
 
 def _author_normalize(
     author_name: str,
@@ -9,6 +21,9 @@ def _author_normalize(
     no_space: bool = True,
     no_underscore: bool = True,
 ) -> str: ...
+def _get_dist_stamp(dist: metadata.Distribution) -> tuple[str | None, int | None]: ...
+def _is_dist_unchanged(stamp: tuple[str | None, int | None, str | None]) -> bool: ...
+def author_cache_clear() -> None: ...
 def _get_author(
     package: str,
     no_period: bool = True,
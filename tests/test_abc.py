@@ -17,8 +17,6 @@ from typing import (
 )
 from unittest.mock import patch
 
-import strictyaml as s
-
 from logging_strict import (
     LoggingYamlType,
     setup_logging_yaml,
@@ -36,9 +34,13 @@ from logging_strict.logging_yaml_abc import (
 from logging_strict.logging_yaml_abc import (
     PACKAGE_NAME_SRC,
     VERSION_FALLBACK,
+    ValidatedLoggingConfig,
     after_as_str_update_package_name,
 )
-from logging_strict.logging_yaml_validate import validate_yaml_dirty
+from logging_strict.logging_yaml_validate import (
+    validate_yaml_data,
+    validate_yaml_dirty,
+)
 from logging_strict.tech_niques import (
     ClassAttribTypes,
     get_locals,
@@ -165,7 +167,7 @@ class LoggingWorker(unittest.TestCase):
                 t_ret = get_locals(func_path, setup_logging_yaml, *(arg0,), **kwargs)
                 self.assertIsInstance(t_ret, tuple)
                 _, d_locals = t_ret
-                self.assertIsInstance(d_locals["yaml_config"], s.YAML)
+                self.assertIsInstance(d_locals["config"], ValidatedLoggingConfig)
                 self.assertIsInstance(d_locals["path_yaml"], type(arg0))
                 #    Run w/o inspection
                 setup_logging_yaml(arg0)
@@ -551,6 +553,73 @@ class LoggingWorker(unittest.TestCase):
                 )
                 self.assertEqual(str_yaml_0, str_yaml_2)
 
+    def test_validated_logging_config(self) -> None:
+        """Validate once. Rename logger and dictConfig without reparsing"""
+        package_name = "dolphins-faster.swim"
+        package_name_clean = _to_package_case(package_name)
+
+        config = ValidatedLoggingConfig.from_str(self.yaml_worker)
+        self.assertEqual(config.text, self.yaml_worker)
+        self.assertIn(PACKAGE_NAME_SRC, config.data["loggers"])
+        self.assertIn("ValidatedLoggingConfig", repr(config))
+
+        # Nothing to rename --> same instance
+        t_invalids = (None, "", "   ", 1.2345)
+        for invalid in t_invalids:
+            config_same = config.with_logger_package_name(
+                invalid,  # type: ignore[arg-type]
+            )
+            self.assertIs(config_same, config)
+
+        # Rename does not modify the original
+        config_renamed = config.with_logger_package_name(package_name)
+        self.assertIsNot(config_renamed, config)
+        self.assertIn(PACKAGE_NAME_SRC, config.data["loggers"])
+        self.assertIn(package_name_clean, config_renamed.data["loggers"])
+        self.assertNotIn(PACKAGE_NAME_SRC, config_renamed.data["loggers"])
+        # YAML str generated from dict. Still valid
+        yaml_config = validate_yaml_dirty(config_renamed.text)
+        self.assertIsNotNone(yaml_config)
+
+        # setup_logging_yaml skips validation. dictConfig gets a copy
+        with (
+            patch(
+                f"{g_app_name}.logging_yaml_abc.validate_yaml_data",
+            ) as mock_validate,
+            patch(  # defang
+                "logging.config.dictConfig",
+                return_value=True,
+            ) as mock_dict_config,
+        ):
+            setup_logging_yaml(config_renamed)
+            mock_validate.assert_not_called()
+            mock_dict_config.assert_called_once()
+            d_config_passed = mock_dict_config.call_args.args[0]
+            self.assertIsNot(d_config_passed, config_renamed.data)
+            self.assertEqual(d_config_passed, config_renamed.data)
+
+        # Package data already extracted. Validates exactly once
+        with (
+            tempfile.TemporaryDirectory() as fp,
+            patch(  # temp folder rather than :code:`$HOME/.local/share/[app]`
+                f"{g_app_name}.logging_yaml_abc._get_path_config",
+                return_value=Path(fp).joinpath("bar"),
+            ),
+            patch(
+                f"{g_app_name}.logging_yaml_abc.validate_yaml_data",
+                wraps=validate_yaml_data,
+            ) as mock_validate,
+        ):
+            self.extract_yaml(fp, "bar")
+            my_logger = MyLogger(
+                "bar",
+                partial(cb_joinpath, Path(fp)),
+            )
+            config_1 = my_logger.as_validated()
+            config_2 = config_1.with_logger_package_name(package_name)
+            self.assertIsInstance(config_2.text, str)
+            mock_validate.assert_called_once()
+
 
 if __name__ == "__main__":  # pragma: no cover
     """Without coverage
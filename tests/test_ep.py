@@ -7,10 +7,14 @@ Test logging-strict main entrypoint.
 
 import argparse
 import io
+import json
 import tempfile
 import unittest
 from collections.abc import Sequence
-from contextlib import redirect_stderr
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout,
+)
 from pathlib import Path
 from unittest.mock import (
     Mock,
@@ -19,9 +23,18 @@ from unittest.mock import (
 
 from logging_strict import LoggingConfigCategory
 from logging_strict.constants import g_app_name
+from logging_strict.ep_validate_yaml import (
+    _get_schema_version,  # pyright: ignore[reportPrivateUsage]
+)
 from logging_strict.ep_validate_yaml import (
     _process_args,  # pyright: ignore[reportPrivateUsage]
 )
+from logging_strict.ep_validate_yaml import (
+    _validate_file,  # pyright: ignore[reportPrivateUsage]
+)
+from logging_strict.ep_validate_yaml import (
+    _watch,  # pyright: ignore[reportPrivateUsage]
+)
 from logging_strict.ep_validate_yaml import (
     main,
 )
@@ -183,12 +196,15 @@ class EntrypointStrictYAMLValidate(unittest.TestCase):
                     ),
                 ),
             ):
-                paths_file, is_fail_fast = _process_args()
+                paths_file, is_fail_fast, d_options = _process_args()
                 self.assertIsInstance(paths_file, Sequence)
                 file_count = len(paths_file)
                 self.assertEqual(file_count, 2)
                 self.assertIsInstance(is_fail_fast, bool)
                 self.assertEqual(is_fail_fast, True)
+                # jobs default cpu count
+                self.assertIsInstance(d_options["jobs"], int)
+                self.assertGreaterEqual(d_options["jobs"], 1)
 
         # No results
         dodgy_categories_1 = ((None, "bob"),)
@@ -243,7 +259,7 @@ class EntrypointStrictYAMLValidate(unittest.TestCase):
             ):
                 t_ret = _process_args()
                 self.assertIsInstance(t_ret, tuple)
-                files, is_fail_fast = t_ret
+                files, is_fail_fast, _ = t_ret
                 self.assertIsInstance(files, tuple)
                 files_count = len(files)
                 self.assertEqual(files_count, file_count_expected_2)
@@ -264,19 +280,112 @@ class EntrypointStrictYAMLValidate(unittest.TestCase):
                         "flavor": "asz",
                         "version": "1",
                         "fail_fast": False,
+                        "jobs": 2,
+                        "incremental": False,
+                        "cache_file": Path("/tmp/manifest.json"),
                     },
                 ),
             ),
         ):
             t_ret = _process_args()
             self.assertIsInstance(t_ret, tuple)
-            files, is_fail_fast = t_ret
+            files, is_fail_fast, d_options = t_ret
+            self.assertEqual(d_options["jobs"], 2)
+            # manifest file implies incremental
+            self.assertTrue(d_options["incremental"])
             self.assertIsInstance(files, tuple)
             files_count = len(files)
             self.assertEqual(files_count, 1)
             self.assertIsInstance(is_fail_fast, bool)
             self.assertFalse(is_fail_fast)
 
+    def test_explicit_files(self) -> None:
+        """Files given. No folder search"""
+        paths_shipped = sorted(
+            self.path_package_src.joinpath(self.package_data_folder_start).glob(
+                f"*{YAML_LOGGING_CONFIG_SUFFIX}"
+            )
+        )
+        self.assertEqual(len(paths_shipped), 2)
+        path_0, path_1 = paths_shipped
+        path_other = self.path_package_src.joinpath("constants.py")
+        path_missing = path_0.with_name(f"missing{YAML_LOGGING_CONFIG_SUFFIX}")
+        kwargs = {
+            "package": self.package,
+            "package_data_folder_start": self.package_data_folder_start,
+        }
+
+        with tempfile.TemporaryDirectory() as fp:
+            path_list = Path(fp).joinpath("files.txt")
+            path_list.write_text(f"{path_1!s}\n\n{path_other!s}\n")
+            path_list_other = Path(fp).joinpath("files_other.txt")
+            path_list_other.write_text(f"{path_other!s}\n")
+            path_list_missing = Path(fp).joinpath("files_missing.txt")
+            path_list_missing.write_text(f"{path_missing!s}\n")
+            try_these = (
+                # positional. Duplicates and other files skipped
+                ([path_0, path_0, path_other], None, "", (path_0,)),
+                # --files-from. Missing files skipped
+                ([path_0], str(path_list_missing), "", (path_0,)),
+                # stdin. Null delimited
+                ([], "-", f"{path_1!s}\0{path_0!s}\0", (path_1, path_0)),
+                # file. Newline delimited. Plus positional
+                ([path_0], str(path_list), "", (path_0, path_1)),
+            )
+            for paths_arg, files_from, str_stdin, expected in try_these:
+                with (
+                    patch(
+                        "argparse.ArgumentParser.parse_args",
+                        return_value=argparse.Namespace(
+                            dir=paths_arg,
+                            files_from=files_from,
+                            **kwargs,
+                        ),
+                    ),
+                    patch("sys.stdin", io.StringIO(str_stdin)),
+                    patch(
+                        f"{g_app_name}.ep_validate_yaml.LoggingConfigYaml.iter_yamls",
+                    ) as mock_iter_yamls,
+                ):
+                    paths_file, _, _ = _process_args()
+                    mock_iter_yamls.assert_not_called()
+                self.assertEqual(paths_file, expected)
+
+            # unreadable --files-from --> 3. No matching files --> 0
+            path_folder_missing = Path(fp).joinpath("nonexistent", "folder")
+            try_these_exit = (
+                ([], str(Path(fp).joinpath("nonexistent.txt")), 3),
+                ([path_other], None, 0),
+                ([path_other], str(path_list_other), 0),
+                # A folder without matching files --> 10
+                ([path_other, Path(fp)], None, 10),
+                # Missing positional path, e.g. mistyped folder --> 10
+                ([path_folder_missing], None, 10),
+                ([path_missing], str(path_list_other), 10),
+                ([path_0, path_missing], None, 10),
+                # Only files given. Not all exist --> 10
+                ([path_other], str(path_list_missing), 10),
+            )
+            for paths_arg, files_from, exit_code in try_these_exit:
+                with (
+                    redirect_stderr(io.StringIO()) as err,
+                    patch(
+                        "argparse.ArgumentParser.parse_args",
+                        return_value=argparse.Namespace(
+                            dir=paths_arg,
+                            files_from=files_from,
+                            **kwargs,
+                        ),
+                    ),
+                    self.assertRaises(SystemExit) as cm,
+                ):
+                    _process_args()
+                self.assertEqual(cm.exception.code, exit_code)
+                if path_folder_missing in paths_arg:
+                    self.assertIn(f"not found: {path_folder_missing!s}", err.getvalue())
+                else:  # pragma: no cover
+                    pass
+
     def test_thru_api(self) -> None:
         """Call main directly rather than thru a subprocess"""
         yaml_snippet0 = "version: 1\n"
@@ -298,7 +407,7 @@ class EntrypointStrictYAMLValidate(unittest.TestCase):
                 with (
                     patch(
                         f"{g_app_name}.ep_validate_yaml._process_args",
-                        return_value=((path_yaml,), is_fail_fast),
+                        return_value=((path_yaml,), is_fail_fast, {"jobs": 1}),
                     ),
                     redirect_stderr(io.StringIO()) as err,
                 ):
@@ -307,6 +416,350 @@ class EntrypointStrictYAMLValidate(unittest.TestCase):
                 self.assertIsInstance(actual, str)
                 self.assertIn(expected_ratio, actual)
 
+    def test_jobs(self) -> None:
+        """Parallel validation. Report order is file order"""
+        yaml_valid = "version: 1\n"
+        yaml_invalid = "b: 'tuna fish'\n"
+        snippets = (yaml_valid, yaml_invalid, yaml_valid, yaml_invalid, yaml_valid)
+        try_these = (
+            # fail fast --> as if one by one. Stops at index 1
+            (True, "Processed: 2 / 5", "Success / fail: 1 / 1", "last (1): "),
+            (False, "Processed: 5 / 5", "Success / fail: 3 / 2", "last (4): "),
+        )
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            paths_yaml = []
+            for idx, snippet in enumerate(snippets):
+                path_yaml = path_dir.joinpath(
+                    f"mp_{idx}.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}"
+                )
+                path_yaml.write_text(snippet)
+                paths_yaml.append(path_yaml)
+            t_paths = tuple(paths_yaml)
+
+            for is_fail_fast, processed, ratio, last in try_these:
+                for jobs in (1, 3):
+                    with (
+                        patch(
+                            f"{g_app_name}.ep_validate_yaml._process_args",
+                            return_value=(t_paths, is_fail_fast, {"jobs": jobs}),
+                        ),
+                        redirect_stderr(io.StringIO()) as err,
+                    ):
+                        main()
+                    actual = err.getvalue()
+                    self.assertIn(processed, actual)
+                    self.assertIn(ratio, actual)
+                    self.assertIn(last, actual)
+                    # errors in file order
+                    pos_1 = actual.find(str(t_paths[1]))
+                    self.assertNotEqual(pos_1, -1)
+                    if not is_fail_fast:
+                        pos_3 = actual.find(str(t_paths[3]))
+                        self.assertGreater(pos_3, pos_1)
+
+    def test_format_jsonl(self) -> None:
+        """One JSON record per file, then a summary record"""
+        snippets = ("version: 1\n", "b: 'tuna fish'\n", "version: 1\n")
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            paths_yaml = []
+            for idx, snippet in enumerate(snippets):
+                path_yaml = path_dir.joinpath(
+                    f"mp_{idx}.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}"
+                )
+                path_yaml.write_text(snippet)
+                paths_yaml.append(path_yaml)
+            t_paths = tuple(paths_yaml)
+
+            for jobs in (1, 2):
+                d_options = {"jobs": jobs, "format": "jsonl"}
+                with (
+                    patch(
+                        f"{g_app_name}.ep_validate_yaml._process_args",
+                        return_value=(t_paths, False, d_options),
+                    ),
+                    redirect_stdout(io.StringIO()) as out,
+                    redirect_stderr(io.StringIO()) as err,
+                ):
+                    main()
+                # Nothing human readable
+                self.assertEqual(err.getvalue(), "")
+                records = [json.loads(line) for line in out.getvalue().splitlines()]
+                self.assertEqual(len(records), 4)
+                d_summary = records[-1]
+                self.assertEqual(d_summary["type"], "summary")
+                self.assertEqual(d_summary["processed"], 3)
+                self.assertEqual(d_summary["succeed"], 2)
+                self.assertEqual(d_summary["fail"], 1)
+                self.assertEqual(d_summary["last"], str(t_paths[2]))
+
+                d_files = {d_rec["index"]: d_rec for d_rec in records[:-1]}
+                self.assertEqual(set(d_files.keys()), {0, 1, 2})
+                for idx, d_rec in d_files.items():
+                    self.assertEqual(d_rec["type"], "file")
+                    self.assertEqual(d_rec["path"], str(t_paths[idx]))
+                    self.assertEqual(d_rec["bytes"], len(snippets[idx]))
+                    self.assertGreaterEqual(d_rec["ms"], 0.0)
+                    # Which layer answered. Only a cache is cached
+                    is_cache = d_rec["engine"] in ("memory", "disk")
+                    self.assertIs(d_rec["cached"], is_cache)
+                self.assertEqual(d_files[0]["status"], "ok")
+                self.assertIsNone(d_files[0]["problem"])
+                self.assertEqual(d_files[1]["status"], "fail")
+                self.assertEqual(d_files[1]["engine"], "strictyaml")
+                self.assertIsInstance(d_files[1]["problem"], str)
+                self.assertIsInstance(d_files[1]["mark"], str)
+
+    def test_watch(self) -> None:
+        """Only new or changed files are validated"""
+        yaml_valid = "version: 1\n"
+        yaml_invalid = "b: 'tuna fish'\n"
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            path_0 = path_dir.joinpath(f"mp_0.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}")
+            path_1 = path_dir.joinpath(f"mp_1.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}")
+            path_2 = path_dir.joinpath(f"mp_2.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}")
+            path_0.write_text(yaml_valid)
+            path_1.write_text(yaml_invalid)
+            path_dir.joinpath("other.yaml").write_text(yaml_invalid)
+
+            # _process_args. Folder is searched on each poll, not now
+            kwargs = {
+                "dir": [],
+                "package": self.package,
+                "package_data_folder_start": self.package_data_folder_start,
+                "watch": path_dir,
+                "interval": 0.5,
+            }
+            with patch(
+                "argparse.ArgumentParser.parse_args",
+                return_value=argparse.Namespace(**kwargs),
+            ):
+                paths_file, _, d_options = _process_args()
+            self.assertEqual(paths_file, ())
+            self.assertEqual(d_options["watch"], path_dir.resolve())
+            self.assertEqual(d_options["interval"], 0.5)
+            kwargs["watch"] = path_dir.joinpath("nonexistent")
+            with (
+                patch(
+                    "argparse.ArgumentParser.parse_args",
+                    return_value=argparse.Namespace(**kwargs),
+                ),
+                self.assertRaises(SystemExit) as cm,
+            ):
+                _process_args()
+            self.assertEqual(cm.exception.code, 10)
+
+            # Between polls, edit files
+            edits = [
+                lambda: path_1.write_text(f"{yaml_valid}incremental: no\n"),
+                lambda: (path_0.unlink(), path_2.write_text(yaml_invalid)),
+                lambda: None,
+            ]
+
+            def sleep(seconds):
+                """Instead of waiting, edit"""
+                edits.pop(0)()
+
+            d_options = {
+                "pattern": f"*{YAML_LOGGING_CONFIG_SUFFIX}",
+                "jobs": 1,
+                "format": "jsonl",
+            }
+            with (
+                patch(f"{g_app_name}.ep_validate_yaml.time.sleep", side_effect=sleep),
+                patch(
+                    f"{g_app_name}.ep_validate_yaml._validate_file",
+                    wraps=_validate_file,
+                ) as mock_validate,
+                redirect_stdout(io.StringIO()) as out,
+            ):
+                _watch(path_dir, d_options, max_polls=4)
+            self.assertEqual(edits, [])
+            # 2 initially, then 1 changed, then 1 new. Last poll no changes
+            self.assertEqual(mock_validate.call_count, 4)
+            records = [json.loads(line) for line in out.getvalue().splitlines()]
+            actual = [(d["type"], Path(d["path"]).name) for d in records if "path" in d]
+            expected = [
+                ("file", path_0.name),
+                ("file", path_1.name),
+                ("file", path_1.name),
+                ("removed", path_0.name),
+                ("file", path_2.name),
+            ]
+            self.assertEqual(actual, expected)
+            summaries = [
+                (d["succeed"], d["fail"]) for d in records if d["type"] == "summary"
+            ]
+            self.assertEqual(summaries, [(1, 1), (2, 0), (1, 1)])
+
+            # text format
+            with (
+                patch(f"{g_app_name}.ep_validate_yaml.time.sleep"),
+                redirect_stderr(io.StringIO()) as err,
+            ):
+                _watch(path_dir, {"pattern": "*.yaml"}, max_polls=2)
+            actual_text = err.getvalue()
+            self.assertIn(f"ok: {path_1!s}", actual_text)
+            self.assertIn("Watching: 3\nSuccess / fail: 1 / 2", actual_text)
+
+    def test_incremental(self) -> None:
+        """Unchanged files are not validated again"""
+        yaml_valid = "version: 1\n"
+        yaml_invalid = "b: 'tuna fish'\n"
+        snippets = (yaml_valid, yaml_invalid, yaml_valid)
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            path_manifest = path_dir.joinpath("cache", "manifest.json")
+            paths_yaml = []
+            for idx, snippet in enumerate(snippets):
+                path_yaml = path_dir.joinpath(
+                    f"mp_{idx}.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}"
+                )
+                path_yaml.write_text(snippet)
+                paths_yaml.append(path_yaml)
+            t_paths = tuple(paths_yaml)
+            d_options = {
+                "jobs": 1,
+                "incremental": True,
+                "cache_file": path_manifest,
+            }
+
+            def run(is_fail_fast):
+                """main. Count files actually validated"""
+                with (
+                    patch(
+                        f"{g_app_name}.ep_validate_yaml._process_args",
+                        return_value=(t_paths, is_fail_fast, d_options),
+                    ),
+                    patch(
+                        f"{g_app_name}.ep_validate_yaml._validate_file",
+                        wraps=_validate_file,
+                    ) as mock_validate,
+                    redirect_stderr(io.StringIO()) as err,
+                ):
+                    main()
+                return mock_validate.call_count, err.getvalue()
+
+            # cold. All validated. Manifest written
+            count, actual = run(False)
+            self.assertEqual(count, 3)
+            self.assertIn("Success / fail: 2 / 1", actual)
+            self.assertTrue(path_manifest.exists())
+
+            # warm. Nothing validated. Same report, including the error
+            count, actual = run(False)
+            self.assertEqual(count, 0)
+            self.assertIn("Success / fail: 2 / 1", actual)
+            self.assertIn(str(t_paths[1]), actual)
+
+            # One file changed --> only it is validated
+            t_paths[1].write_text(yaml_valid)
+            count, actual = run(False)
+            self.assertEqual(count, 1)
+            self.assertIn("Success / fail: 3 / 0", actual)
+
+            # fail fast. Files after a known failure are skipped
+            t_paths[0].write_text(yaml_invalid)
+            t_paths[2].write_text("version: 1\ndisable_existing_loggers: no\n")
+            count, actual = run(True)
+            self.assertEqual(count, 1)
+            self.assertIn("Processed: 1 / 3", actual)
+            count, actual = run(True)
+            self.assertEqual(count, 0)
+            self.assertIn("Success / fail: 0 / 1", actual)
+
+            # Another schema version --> whole manifest invalid
+            with patch(
+                f"{g_app_name}.ep_validate_yaml._get_schema_version",
+                return_value="some other schema",
+            ):
+                count, _ = run(False)
+            self.assertEqual(count, 3)
+
+            # Schema version covers the whole schema module source. e.g. a
+            # default or value validator change, absent from the schema repr
+            schema_version = _get_schema_version()
+            self.assertEqual(_get_schema_version(), schema_version)
+            path_src = path_dir.joinpath("logging_yaml_validate.py")
+            path_src.write_text("schema = 1\n")
+            mock_spec = Mock(origin=str(path_src))
+            with patch(
+                f"{g_app_name}.ep_validate_yaml.importlib.util.find_spec",
+                return_value=mock_spec,
+            ):
+                schema_version_0 = _get_schema_version()
+                path_src.write_text("schema = 2\n")
+                schema_version_1 = _get_schema_version()
+            self.assertNotEqual(schema_version_0, schema_version)
+            self.assertNotEqual(schema_version_1, schema_version_0)
+
+    def test_excludes(self) -> None:
+        """--exclude and --exclude-from prune the folder search.
+        --no-default-excludes searches ignored folders too"""
+        yaml_valid = "version: 1\n"
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            relpaths = (
+                f"mp_0_asz.worker{YAML_LOGGING_CONFIG_SUFFIX}",
+                f"docs/mp_1_asz.worker{YAML_LOGGING_CONFIG_SUFFIX}",
+                f".venv/mp_2_asz.worker{YAML_LOGGING_CONFIG_SUFFIX}",
+                f"sub/mp_3_asz.worker{YAML_LOGGING_CONFIG_SUFFIX}",
+                f"build/mp_4_asz.worker{YAML_LOGGING_CONFIG_SUFFIX}",
+            )
+            for relpath in relpaths:
+                path_f = path_dir.joinpath(relpath)
+                path_f.parent.mkdir(parents=True, exist_ok=True)
+                path_f.write_text(yaml_valid)
+            path_excludes = path_dir.joinpath(".gitignore")
+            path_excludes.write_text("# local\n/sub/\n")
+            kwargs = {
+                "dir": [path_dir],
+                "package": self.package,
+                "package_data_folder_start": self.package_data_folder_start,
+                "category": "worker",
+                "flavor": "asz",
+            }
+
+            try_these = (
+                ({}, ("mp_0", "mp_4", "mp_1", "mp_3")),
+                ({"exclude": ["/docs/"]}, ("mp_0", "mp_4", "mp_3")),
+                ({"exclude_from": path_excludes}, ("mp_0", "mp_4", "mp_1")),
+                (
+                    {"exclude": ["mp_1*"], "exclude_from": path_excludes},
+                    ("mp_0", "mp_4"),
+                ),
+                (
+                    {"no_default_excludes": True},
+                    ("mp_0", "mp_2", "mp_4", "mp_1", "mp_3"),
+                ),
+            )
+            for kwargs_excludes, expected in try_these:
+                with (
+                    self.subTest(kwargs_excludes=kwargs_excludes),
+                    patch(
+                        "argparse.ArgumentParser.parse_args",
+                        return_value=argparse.Namespace(**kwargs, **kwargs_excludes),
+                    ),
+                ):
+                    paths_file, _, d_options = _process_args()
+                    actual = tuple(path_f.name[:4] for path_f in paths_file)
+                    self.assertEqual(actual, expected)
+                    self.assertIn("excludes", d_options)
+
+            # --exclude-from file unreadable
+            kwargs["exclude_from"] = path_dir.joinpath("nonexistent")
+            with (
+                patch(
+                    "argparse.ArgumentParser.parse_args",
+                    return_value=argparse.Namespace(**kwargs),
+                ),
+                self.assertRaises(SystemExit) as cm,
+            ):
+                _process_args()
+            self.assertEqual(cm.exception.code, 3)
+
 
 if __name__ == "__main__":  # pragma: no cover
     """Without coverage
@@ -318,9 +771,27 @@ if __name__ == "__main__":  # pragma: no cover
        python -m unittest tests.test_ep \
        -k EntrypointStrictYAMLValidate.test_process_args --locals --verbose
 
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_explicit_files --locals --verbose
+
        python -m unittest tests.test_ep \
        -k EntrypointStrictYAMLValidate.test_thru_api --locals --verbose
 
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_jobs --locals --verbose
+
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_format_jsonl --locals --verbose
+
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_watch --locals --verbose
+
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_incremental --locals --verbose
+
+       python -m unittest tests.test_ep \
+       -k EntrypointStrictYAMLValidate.test_excludes --locals --verbose
+
 
     With coverage
 
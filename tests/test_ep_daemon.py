@@ -0,0 +1,304 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Warm validation daemon and thin client. Daemon is served from a thread,
+on a socket within a temp folder.
+
+"""
+
+import io
+import json
+import socket
+import tempfile
+import threading
+import unittest
+from contextlib import (
+    redirect_stderr,
+    redirect_stdout,
+)
+from pathlib import Path
+from unittest.mock import patch
+
+from logging_strict.constants import g_app_name
+from logging_strict.ep_validate_client import (
+    SOCKET_NAME,
+    get_socket_path,
+)
+from logging_strict.ep_validate_client import main as main_client
+from logging_strict.ep_validate_client import request_daemon
+from logging_strict.ep_validate_daemon import (
+    _is_running,  # pyright: ignore[reportPrivateUsage]
+)
+from logging_strict.ep_validate_daemon import (
+    ValidateDaemon,
+    handle_request,
+)
+from logging_strict.logging_yaml_abc import YAML_LOGGING_CONFIG_SUFFIX
+
+
+class ValidateDaemonClient(unittest.TestCase):
+    """Client gets the same results from the daemon or in process"""
+
+    def setUp(self) -> None:
+        """Temp folder with one valid and one invalid file"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path_dir = Path(self.tmp.name)
+        self.path_socket = path_dir.joinpath(SOCKET_NAME)
+        self.path_valid = path_dir.joinpath(
+            f"mp_0.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}"
+        )
+        self.path_valid.write_text("version: 1\n")
+        self.path_invalid = path_dir.joinpath(
+            f"mp_1.asz.worker{YAML_LOGGING_CONFIG_SUFFIX}"
+        )
+        self.path_invalid.write_text("b: 'tuna fish'\n")
+        self.d_request = {
+            "paths": [str(self.path_valid), str(self.path_invalid)],
+            "contents": [{"path": "<stdin>", "yaml": "version: 1\n"}],
+            "fail_fast": False,
+        }
+
+    def tearDown(self) -> None:
+        """Remove temp folder"""
+        self.tmp.cleanup()
+
+    def test_handle_request(self) -> None:
+        """Files then contents. Then done record"""
+        replies = []
+        handle_request(self.d_request, replies.append)
+        self.assertEqual(len(replies), 4)
+        self.assertEqual([d["type"] for d in replies], ["file"] * 3 + ["done"])
+        self.assertEqual([d["status"] for d in replies[:-1]], ["ok", "fail", "ok"])
+        self.assertEqual(replies[2]["path"], "<stdin>")
+        d_summary = replies[-1]["summary"]
+        self.assertEqual((d_summary["succeed"], d_summary["fail"]), (2, 1))
+        self.assertIn("Success / fail: 2 / 1", replies[-1]["report"])
+
+        # fail fast. Missing file skipped
+        d_request = {
+            "paths": ["/nonexistent/a.yaml", str(self.path_invalid)],
+            "contents": [{"yaml": "version: 1\n"}],
+            "fail_fast": True,
+        }
+        replies = []
+        handle_request(d_request, replies.append)
+        self.assertEqual([d["type"] for d in replies], ["file", "done"])
+        self.assertEqual(replies[0]["index"], 0)
+        # Not validated, still counted. Same report as validate entrypoint
+        d_summary = replies[-1]["summary"]
+        self.assertEqual((d_summary["processed"], d_summary["total"]), (1, 2))
+        self.assertEqual(d_summary["last"], str(self.path_invalid))
+
+    def test_daemon(self) -> None:
+        """Serve from a thread. Client request, version mismatch, stop"""
+        # Not running --> client falls back
+        self.assertFalse(_is_running(self.path_socket))
+        self.assertFalse(request_daemon(self.d_request, print, self.path_socket))
+
+        server = ValidateDaemon(self.path_socket)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.assertTrue(_is_running(self.path_socket))
+            # Only the user
+            self.assertEqual(self.path_socket.stat().st_mode & 0o077, 0)
+
+            replies = []
+            is_done = request_daemon(self.d_request, replies.append, self.path_socket)
+            self.assertTrue(is_done)
+            replies_local = []
+            handle_request(self.d_request, replies_local.append)
+            self.assertEqual(
+                [d["status"] for d in replies[:-1]],
+                [d["status"] for d in replies_local[:-1]],
+            )
+
+            # Another logging_strict version --> client falls back
+            with patch(f"{g_app_name}.ep_validate_daemon.__version__", "0.0.1"):
+                replies = []
+                is_done = request_daemon(
+                    self.d_request,
+                    replies.append,
+                    self.path_socket,
+                )
+            self.assertFalse(is_done)
+            self.assertEqual(replies, [])
+
+            # Client entrypoint thru the daemon
+            argv = [
+                "prog",
+                str(self.path_valid),
+                "--socket",
+                str(self.path_socket),
+                "--format",
+                "jsonl",
+            ]
+            dones = []
+
+            def spy(*args, **kwargs):
+                """Record whether the daemon completed the request"""
+                is_done = request_daemon(*args, **kwargs)
+                dones.append(is_done)
+                return is_done
+
+            with (
+                patch("sys.argv", argv),
+                patch(
+                    f"{g_app_name}.ep_validate_client.request_daemon",
+                    side_effect=spy,
+                ),
+                redirect_stdout(io.StringIO()) as out,
+            ):
+                main_client()
+            self.assertEqual(dones, [True])
+            records = [json.loads(line) for line in out.getvalue().splitlines()]
+            self.assertEqual([d["type"] for d in records], ["file", "summary"])
+
+            # stop
+            self.assertTrue(request_daemon({"stop": True}, print, self.path_socket))
+            thread.join(timeout=5.0)
+            self.assertFalse(thread.is_alive())
+        finally:
+            server.server_close()
+        self.assertFalse(self.path_socket.exists())
+
+    def test_client_fallback(self) -> None:
+        """No daemon. Validates within this process"""
+        argv = ["prog", str(self.path_invalid), "--socket", str(self.path_socket)]
+        with (
+            patch("sys.argv", argv),
+            redirect_stderr(io.StringIO()) as err,
+        ):
+            main_client()
+        self.assertIn("Success / fail: 0 / 1", err.getvalue())
+
+        # fail fast by default. Same as validate entrypoint
+        paths = [str(self.path_invalid), str(self.path_valid)]
+        try_these = (
+            ([], "Processed: 1 / 2"),
+            (["--fail-fast"], "Processed: 1 / 2"),
+            (["--no-fail-fast"], "Processed: 2 / 2"),
+        )
+        for args_extra, expected in try_these:
+            argv = ["prog", *paths, "--socket", str(self.path_socket), *args_extra]
+            with (
+                self.subTest(args_extra=args_extra),
+                patch("sys.argv", argv),
+                redirect_stderr(io.StringIO()) as err,
+            ):
+                main_client()
+                self.assertIn(expected, err.getvalue())
+
+        # stdin
+        argv = ["prog", "--stdin", "--socket", str(self.path_socket)]
+        with (
+            patch("sys.argv", argv),
+            patch("sys.stdin", io.StringIO("version: 1\n")),
+            redirect_stderr(io.StringIO()) as err,
+        ):
+            main_client()
+        self.assertIn("Success / fail: 1 / 0", err.getvalue())
+
+        # Neither files nor stdin
+        with (
+            patch("sys.argv", ["prog", "/nonexistent/a.yaml"]),
+            self.assertRaises(SystemExit) as cm,
+        ):
+            main_client()
+        self.assertEqual(cm.exception.code, 10)
+
+    def test_daemon_fails_midway(self) -> None:
+        """Daemon goes away after a file record. Fallback output only.
+        No duplicate records"""
+        sock_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock_server.bind(str(self.path_socket))
+        sock_server.listen(1)
+
+        def serve_partial():
+            """Twice, reply with one file record, then hang up"""
+            for _ in range(2):
+                conn, _ = sock_server.accept()
+                with conn, conn.makefile(mode="rw", encoding="utf-8") as f:
+                    f.readline()
+                    d_reply = {"type": "file", "index": 0, "status": "ok"}
+                    f.write(f"{json.dumps(d_reply)}\n")
+                    f.flush()
+
+        thread = threading.Thread(target=serve_partial, daemon=True)
+        thread.start()
+        try:
+            replies = []
+            is_done = request_daemon(self.d_request, replies.append, self.path_socket)
+            self.assertFalse(is_done)
+            self.assertEqual(replies, [])
+
+            # Thru the client entrypoint. Records of the fallback run only
+            argv = [
+                "prog",
+                str(self.path_valid),
+                "--format",
+                "jsonl",
+                "--socket",
+                str(self.path_socket),
+            ]
+            with (
+                patch("sys.argv", argv),
+                redirect_stdout(io.StringIO()) as out,
+            ):
+                main_client()
+            thread.join(timeout=5.0)
+        finally:
+            sock_server.close()
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([d["type"] for d in records], ["file", "summary"])
+        self.assertEqual(records[0]["path"], str(self.path_valid))
+
+    def test_get_socket_path(self) -> None:
+        """XDG runtime folder, if there is one"""
+        with patch.dict("os.environ", {"XDG_RUNTIME_DIR": self.tmp.name}):
+            path_socket = get_socket_path()
+        expected = Path(self.tmp.name).joinpath(g_app_name, SOCKET_NAME)
+        self.assertEqual(path_socket, expected)
+
+        with patch.dict("os.environ", {"XDG_RUNTIME_DIR": ""}):
+            path_socket = get_socket_path()
+        self.assertEqual(path_socket.name, SOCKET_NAME)
+
+        self.assertEqual(get_socket_path(self.path_socket), self.path_socket)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    """Without coverage
+
+    .. code-block:: shell
+
+       python -m tests.test_ep_daemon --locals
+
+       python -m unittest tests.test_ep_daemon \
+       -k ValidateDaemonClient.test_handle_request --locals --verbose
+
+       python -m unittest tests.test_ep_daemon \
+       -k ValidateDaemonClient.test_daemon --locals --verbose
+
+       python -m unittest tests.test_ep_daemon \
+       -k ValidateDaemonClient.test_client_fallback --locals --verbose
+
+       python -m unittest tests.test_ep_daemon \
+       -k ValidateDaemonClient.test_daemon_fails_midway --locals --verbose
+
+       python -m unittest tests.test_ep_daemon \
+       -k ValidateDaemonClient.test_get_socket_path --locals --verbose
+
+    With coverage
+
+    .. code-block:: shell
+
+       coverage run --data-file=".coverage-combine-48" \
+       -m unittest discover -t. -s tests \
+       -p "test_ep_daemon*.py" --locals
+
+       coverage report --include="**/ep_validate_[cd]*" \
+       --no-skip-covered --data-file=".coverage-combine-48"
+
+    """
+    unittest.main(tb_locals=True)
@@ -0,0 +1,206 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Import cost. Importing the package, or LoggingState, must not import
+strictyaml nor build the logging.config schema. Each check runs in a
+fresh interpreter.
+
+Every module imported, package or not, is compared against the modules
+the package needs: those imported by :py:mod:`logging_strict.constants`
+and :py:mod:`logging_strict.exceptions`.
+
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+from logging_strict.constants import g_app_name
+
+# Package submodules imported by ``from logging_strict import LoggingState``
+ALLOWED_SUBMODULES = frozenset(
+    (
+        g_app_name,
+        f"{g_app_name}._version",
+        f"{g_app_name}.constants",
+        f"{g_app_name}.exceptions",
+        f"{g_app_name}.logging_state",
+        f"{g_app_name}.version_semantic",
+    )
+)
+
+# Needed by the package, constants, and exceptions. Whatever these
+# import is allowed
+IMPORTS_FLOOR = (
+    "import __future__, enum, importlib, logging, threading, types, typing\n"
+    "import packaging.version"
+)
+
+#: float: Seconds. API import cost beyond IMPORTS_FLOOR. Best of three
+IMPORT_TIME_BUDGET = 0.05
+
+# Must not be imported until validation occurs
+FORBIDDEN = (
+    "strictyaml",
+    "unittest.mock",
+    f"{g_app_name}.logging_yaml_prevalidate",
+)
+
+SCRIPT_MODULES = """
+import json
+import sys
+before = set(sys.modules)
+{imports}
+d_out = {{"modules": sorted(set(sys.modules) - before)}}
+print(json.dumps(d_out))
+"""
+
+SCRIPT_SCHEMA = f"""
+import json
+import sys
+from {g_app_name} import LoggingState, LoggingStrictError
+import {g_app_name}.logging_yaml_validate as v
+d_out = {{
+    "modules": sorted(sys.modules),
+    "is_schema_built": "schema_logging_config" in vars(v),
+}}
+print(json.dumps(d_out))
+"""
+
+SCRIPT_TIME = """
+import time
+start = time.perf_counter()
+{imports}
+print(time.perf_counter() - start)
+"""
+
+
+def _run(script):
+    """Run script in a fresh interpreter
+
+    :param script: python source
+    :type script: str
+    :returns: stdout
+    :rtype: str
+    """
+    cmd = [sys.executable, "-c", script]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    return proc.stdout
+
+
+def _modules(imports):
+    """Modules newly imported by imports, in a fresh interpreter
+
+    :param imports: python import statements
+    :type imports: str
+    :returns: module names
+    :rtype: set[str]
+    """
+    d_out = json.loads(_run(SCRIPT_MODULES.format(imports=imports)))
+
+    return set(d_out["modules"])
+
+
+def _import_time(imports):
+    """Import time, in a fresh interpreter. Best of three
+
+    :param imports: python import statements
+    :type imports: str
+    :returns: seconds
+    :rtype: float
+    """
+    script = SCRIPT_TIME.format(imports=imports)
+
+    return min(float(_run(script)) for _ in range(3))
+
+
+class LazyImport(unittest.TestCase):
+    """Package API is imported on first access"""
+
+    def test_imported_modules(self) -> None:
+        """Whole sys.modules delta. Only the package needs. Neither
+        strictyaml nor the schema"""
+        floor = _modules(IMPORTS_FLOOR)
+        for imports in (
+            f"import {g_app_name}",
+            f"from {g_app_name} import LoggingState, LoggingStrictError",
+        ):
+            with self.subTest(imports=imports):
+                # A new import, stdlib or third party, is deliberate.
+                # Add it to IMPORTS_FLOOR or ALLOWED_SUBMODULES
+                extra = _modules(imports) - floor - ALLOWED_SUBMODULES
+                self.assertEqual(sorted(extra), [])
+
+        # Package only. Not the API
+        modules = _modules(f"import {g_app_name}")
+        self.assertNotIn(f"{g_app_name}.logging_state", modules)
+
+        # Schema built on first access
+        d_out = json.loads(_run(SCRIPT_SCHEMA))
+        for mod_name in FORBIDDEN:
+            with self.subTest(mod_name=mod_name):
+                self.assertNotIn(mod_name, d_out["modules"])
+        self.assertFalse(d_out["is_schema_built"])
+
+    def test_import_time(self) -> None:
+        """API import costs at most a fixed budget beyond the modules
+        the package needs"""
+        floor = _import_time(IMPORTS_FLOOR)
+        api = _import_time(f"from {g_app_name} import LoggingState")
+        self.assertLess(api - floor, IMPORT_TIME_BUDGET)
+
+    def test_lazy_attributes(self) -> None:
+        """Lazy names resolve. Unknown names raise AttributeError"""
+        import logging_strict
+        import logging_strict.logging_api
+        from logging_strict.logging_state import LoggingState
+        from logging_strict.logging_yaml_abc import setup_logging_yaml
+
+        self.assertIs(logging_strict.LoggingState, LoggingState)
+        self.assertIs(logging_strict.logging_api.LoggingState, LoggingState)
+        self.assertIs(logging_strict.setup_logging_yaml, setup_logging_yaml)
+        for name in logging_strict.__all__:
+            with self.subTest(name=name):
+                self.assertIn(name, dir(logging_strict))
+                self.assertTrue(hasattr(logging_strict, name))
+        with self.assertRaises(AttributeError):
+            logging_strict.__getattr__("nonexistent")
+
+        import logging_strict.logging_yaml_validate as v
+
+        with self.assertRaises(AttributeError):
+            v.__getattr__("nonexistent")
+        self.assertIn("schema_logging_config", dir(v))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    """Without coverage
+
+    .. code-block:: shell
+
+       python -m tests.test_lazy_import --locals
+
+       python -m unittest tests.test_lazy_import \
+       -k LazyImport.test_imported_modules --locals --verbose
+
+       python -m unittest tests.test_lazy_import \
+       -k LazyImport.test_import_time --locals --verbose
+
+       python -m unittest tests.test_lazy_import \
+       -k LazyImport.test_lazy_attributes --locals --verbose
+
+    With coverage
+
+    .. code-block:: shell
+
+       coverage run --data-file=".coverage-combine-49" \
+       -m unittest discover -t. -s tests \
+       -p "test_lazy_import*.py" --locals
+
+       coverage report --include="**/__init__*" \
+       --no-skip-covered --data-file=".coverage-combine-49"
+
+    """
+    unittest.main(tb_locals=True)
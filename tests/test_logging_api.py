@@ -278,7 +278,7 @@ class LoggingApi(unittest.TestCase):
 
                 # simulate runtime validation fail
                 with patch(
-                    f"{g_app_name}.logging_yaml_abc.validate_yaml_dirty",
+                    f"{g_app_name}.logging_yaml_abc.validate_yaml_data",
                     side_effect=s.YAMLValidationError(None, None, None),
                 ):
                     with self.assertRaises(s.YAMLValidationError):
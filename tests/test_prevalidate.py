@@ -0,0 +1,266 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Conformance between the two validation engines. strictyaml is authoritative.
+
+- fast engine accepts --> strictyaml accepts and data is equal
+
+- strictyaml rejects --> fast engine rejects
+
+A fast engine reject of a valid config is allowed, but costs time. So
+also confirm the fast engine accepts typical configs.
+
+"""
+
+import time
+import unittest
+from pathlib import Path
+
+import strictyaml as s
+from strictyaml.ruamel.error import YAMLError
+
+from logging_strict import logging_yaml_validate
+from logging_strict.logging_yaml_prevalidate import (
+    PREVALIDATORS,
+    load_plain,
+    prevalidate_data,
+    prevalidate_yaml,
+)
+from logging_strict.logging_yaml_validate import validate_yaml_dirty
+
+path_package = Path(logging_yaml_validate.__file__).parent
+paths_shipped = sorted(path_package.rglob("*.logging.config.yaml"))
+
+# Configs. All valid
+valids = (
+    "version: 1\n",
+    "version: 01\nincremental:\ndisable_existing_loggers: 'yes'\n",
+    "version: 1\nformatters:\n  f:\n    format:\n    style: '{'\n    x: y\n",
+    "version: 1\nformatters:\n  f:\n    validate: off\n    y: 'no'\n",
+    "version: 1\nfilters:\n  allow_foo:\n    name: foo\n    '()': a.b\n",
+    "version: 1\nloggers: {}\nfoo: {}\nbar: []\nbaz:\n",
+    "version: 1\nroot:\n  level: INFO\n  handlers: []\n",
+    (
+        "version: 1\n"
+        "handlers:\n"
+        "  console:\n"
+        "    class: logging.StreamHandler\n"
+        "    formatter: brief\n"
+        "    level: INFO\n"
+        "    filters: [allow_foo]\n"
+        "    stream: ext://sys.stdout\n"
+        "  file:\n"
+        "    class: logging.handlers.RotatingFileHandler\n"
+        "    filename: logconfig.log\n"
+        "    maxBytes: 1_024\n"
+        "    backupCount: +3\n"
+        "    delay: Y\n"
+        "    encoding:\n"
+        "  smtp:\n"
+        "    class: logging.SMTPHandler\n"
+        "    mailhost: localhost\n"
+        "    toaddrs:\n"
+        "      - support_team@domain.tld\n"
+        "    credentials: [user, secret]\n"
+        "    secure:\n"
+        "    timeout: .inf\n"
+        "  syslog:\n"
+        "    class: logging.handlers.SysLogHandler\n"
+        "    address: [localhost, 514]\n"
+        "    extra: {a: [b, c]}\n"
+        "  qhand:\n"
+        "    class: logging.handlers.QueueHandler\n"
+        "    handlers:\n"
+        "    - hand_name_1\n"
+        "    respect_handler_level: True\n"
+        "    timeout: 1.5e3\n"
+    ),
+)
+
+# Configs. All invalid or use syntax strictyaml disallows
+invalids = (
+    "",
+    "- version\n",
+    "version\n",
+    "version: 2\n",
+    "b: 3\n",
+    "version: 1\nversion: 1\n",
+    "version: &v 1\n",
+    "version: !!int 1\n",
+    "version: 1\n---\nversion: 1\n",
+    "version: 1\nincremental: maybe\n",
+    "version: 1\nloggers:\n  a:\n    propagate: perhaps\n",
+    "version: 1\nloggers:\n  a:\n    level: info\n",
+    "version: 1\nloggers:\n  a:\n    unknown: 1\n",
+    "version: 1\nloggers:\n  a:\n    handlers: console\n",
+    "version: 1\nroot:\n  propagate: off\n",
+    "version: 1\nformatters:\n  f:\n    style: '#'\n",
+    "version: 1\nformatters:\n  f:\n    x: [a]\n",
+    "version: 1\nfilters:\n  f:\n    x: {a: b}\n",
+    "version: 1\nhandlers:\n  h:\n    port: http\n",
+    "version: 1\nhandlers:\n  h:\n    timeout: soon\n",
+    "version: 1\nhandlers:\n  h:\n    address: [localhost]\n",
+    "version: 1\nhandlers:\n  h:\n    credentials: [a, b, c]\n",
+    "version: 1\nhandlers:\n  h: []\n",
+)
+
+
+def _strictyaml_data(yaml_snippet, schema):
+    """strictyaml result. None if invalid"""
+    try:
+        yaml_config = validate_yaml_dirty(yaml_snippet, schema=schema)
+    except YAMLError:
+        # strictyaml or parser error
+        ret = None
+    else:
+        ret = yaml_config.data
+
+    return ret
+
+
+def _mutations(yaml_snippet):
+    """Replace each value, one at a time"""
+    replacements = ("", "maybe", "-1", "[a, b]")
+    lines = yaml_snippet.splitlines(keepends=True)
+    for idx, line in enumerate(lines):
+        key, sep, _ = line.partition(": ")
+        if not sep:
+            continue
+        for replacement in replacements:
+            line_new = f"{key}: {replacement}\n"
+            yield "".join(lines[:idx] + [line_new] + lines[idx + 1 :])
+
+
+class Conformance(unittest.TestCase):
+    """Fast engine agrees with strictyaml"""
+
+    def assert_conforms(self, yaml_snippet, schema_name="schema_logging_config"):
+        schema = getattr(logging_yaml_validate, schema_name)
+        expected = _strictyaml_data(yaml_snippet, schema)
+        actual = prevalidate_yaml(yaml_snippet, schema_name=schema_name)
+        if actual is not None:
+            self.assertIsNotNone(expected, msg=yaml_snippet)
+            self.assertEqual(actual, expected, msg=yaml_snippet)
+        if expected is None:
+            self.assertIsNone(actual, msg=yaml_snippet)
+
+        return actual
+
+    def test_shipped_configs(self) -> None:
+        """Package data logging config files and each value mutated"""
+        self.assertNotEqual(len(paths_shipped), 0)
+        for path_f in paths_shipped:
+            yaml_snippet = path_f.read_text()
+            actual = self.assert_conforms(yaml_snippet)
+            # fast engine handles shipped configs
+            self.assertIsNotNone(actual, msg=str(path_f))
+
+        path_f = paths_shipped[-1]
+        for yaml_mutated in _mutations(path_f.read_text()):
+            self.assert_conforms(yaml_mutated)
+
+    def test_valids_invalids(self) -> None:
+        """Edge cases"""
+        for yaml_snippet in valids:
+            actual = self.assert_conforms(yaml_snippet)
+            self.assertIsNotNone(actual, msg=yaml_snippet)
+
+        for yaml_snippet in invalids:
+            expected = _strictyaml_data(yaml_snippet, s.Any())
+            if expected is not None:
+                # Parsable by strictyaml. schema rejects
+                self.assert_conforms(yaml_snippet)
+            self.assertIsNone(prevalidate_yaml(yaml_snippet), msg=yaml_snippet)
+
+    def test_sections(self) -> None:
+        """Each schema section mirrored"""
+        sections = {
+            "formatter_map": (
+                "format: '%(message)s'\ndatefmt:\n",
+                "class: a.b\nvalidate: 'no'\n",
+                "style: $\n",
+                "style: '#'\n",
+            ),
+            "filters_map": ("name: foo\n", "level: 1\n", "x: [1]\n"),
+            "handlers_map": (
+                "class: a.b\nlevel: DEBUG\nport: 80\n",
+                "toaddrs:\nmaxBytes: 1.0\n",
+                "interval: 5\nutc: on\n",
+            ),
+            "loggers_map": (
+                "level: WARNING\npropagate: no\nfilters:\n  - bob_will_know\n",
+                "propagate: off\nlevel: WARNING\nfoo: bar\n",
+            ),
+            "root_map": ("level: ERROR\nhandlers: [console]\n", "qualname: a\n"),
+        }
+        names_expected = set(sections.keys()) | {"schema_logging_config"}
+        self.assertEqual(names_expected, set(PREVALIDATORS.keys()))
+        for schema_name, yaml_snippets in sections.items():
+            for yaml_snippet in yaml_snippets:
+                self.assert_conforms(yaml_snippet, schema_name=schema_name)
+
+        # unknown schema or no data --> None
+        self.assertIsNone(prevalidate_data({"version": "1"}, schema_name="bob"))
+        self.assertIsNone(prevalidate_data(None))
+        self.assertIsNone(load_plain(None))  # type: ignore[arg-type]
+        # non-scalar key. strictyaml crashes
+        self.assertIsNone(load_plain("version: 1\n[a]: b\n"))
+
+    def test_benchmark(self) -> None:
+        """Fast engine is faster than strictyaml. Typically 5x to 10x
+
+        .. code-block:: shell
+
+           python -m unittest tests.test_prevalidate \
+           -k Conformance.test_benchmark --locals
+
+        """
+        yaml_snippet = paths_shipped[-1].read_text()
+        number = 5
+
+        def best_of(func):
+            timings = []
+            for _ in range(number):
+                start = time.perf_counter()
+                func(yaml_snippet)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        seconds_strictyaml = best_of(lambda x: validate_yaml_dirty(x).data)
+        seconds_fast = best_of(prevalidate_yaml)
+        speedup = seconds_strictyaml / seconds_fast
+        self.assertGreater(speedup, 1.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    """Without coverage
+
+    .. code-block:: shell
+
+       python -m tests.test_prevalidate --locals
+
+       python -m unittest tests.test_prevalidate \
+       -k Conformance.test_shipped_configs --locals
+
+       python -m unittest tests.test_prevalidate \
+       -k Conformance.test_valids_invalids --locals
+
+       python -m unittest tests.test_prevalidate \
+       -k Conformance.test_sections --locals
+
+       python -m unittest tests.test_prevalidate \
+       -k Conformance.test_benchmark --locals
+
+    With coverage
+
+    .. code-block:: shell
+
+       coverage run --data-file=".coverage-combine-47" \
+       -m unittest discover -t. -s tests \
+       -p "test_prevalidate*.py" --locals
+
+       coverage report --include="**/logging_yaml_prevalidate*" \
+       --no-skip-covered --data-file=".coverage-combine-47"
+
+    """
+    unittest.main(tb_locals=True)
@@ -13,9 +13,11 @@ whilst testing or by ``pytest-logging-strict``
 
 """
 
+import copy
 import tempfile
 import unittest
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext as does_not_raise
 from contextlib import suppress
 from pathlib import (
@@ -27,12 +29,28 @@ from unittest.mock import (
     patch,
 )
 
+import importlib_metadata as metadata
 import strictyaml as s
 
 from logging_strict import LoggingConfigCategory
 from logging_strict.constants import g_app_name
-from logging_strict.register_config import ExtractorLoggingConfig
+from logging_strict.logging_api import (
+    get_in_memory,
+    set_in_memory,
+)
+from logging_strict.register_config import (
+    _build_index,  # pyright: ignore[reportPrivateUsage]
+)
+from logging_strict.register_config import (
+    ENTRY_POINT_GROUP,
+    ExtractorLoggingConfig,
+    RegistryCatalog,
+    get_registry_catalog,
+    iter_registry_packages,
+    registry_catalog_clear,
+)
 from logging_strict.tech_niques import captureLogs
+from logging_strict.util.validation_cache import RegistrySnapshot
 
 
 class TestExtractor(unittest.TestCase):
@@ -524,6 +542,371 @@ class TestExtractor(unittest.TestCase):
                             with suppress(OSError):
                                 abspath_f_1.unlink()
 
+    def test_iter_records(self) -> None:
+        """Indexed lookups match a linear scan. query_all is lazy"""
+        with tempfile.TemporaryDirectory() as fp:
+            reg = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp),
+                is_test_file=True,
+            )
+            # No registry
+            self.assertEqual(list(reg.iter_records()), [])
+            reg.get_db()
+            self.assertIsNotNone(reg._index)
+
+            testdata = (
+                ({}, 2),
+                ({"category": LoggingConfigCategory.WORKER}, 2),
+                ({"category": "worker", "flavor": "shared"}, 2),
+                ({"category": "app"}, 0),
+                ({"genre": "mp", "version_no": "1"}, 2),
+                ({"genre": "mp", "version_no": "2"}, 0),
+                ({"genre": "", "flavor": None}, 2),
+            )
+            for kwargs, count_expected in testdata:
+                with self.subTest(kwargs=kwargs):
+                    records = list(reg.iter_records(**kwargs))
+                    self.assertEqual(len(records), count_expected)
+                    scanned = [
+                        d_record["file"]
+                        for d_record in reg._registry
+                        if d_record["file"]["is_test_file"]
+                        and all(
+                            d_record["file"][k] == getattr(v, "value", v)
+                            for k, v in kwargs.items()
+                            if v
+                        )
+                    ]
+                    self.assertEqual(records, scanned)
+
+            # Empty str field is keyed as None. Record is listed once
+            registry = copy.deepcopy(reg._registry)
+            for d_record in registry:
+                d_record["file"]["flavor"] = ""
+            d_index = _build_index(registry)
+            for key, idxs in d_index.items():
+                self.assertEqual(idxs, sorted(set(idxs)))
+            reg._registry = registry
+            reg._index = d_index
+            scanned = [
+                d_record["file"]
+                for d_record in registry
+                if d_record["file"]["is_test_file"]
+            ]
+            self.assertEqual(len(scanned), 2)
+            self.assertEqual(list(reg.iter_records()), scanned)
+            self.assertEqual(list(reg.iter_records(flavor="")), scanned)
+
+            # Nothing extracted until a result is requested
+            reg = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp),
+                is_test_file=False,
+            )
+            reg.get_db()
+            with patch(
+                f"{g_app_name}.register_config.setup_worker_other",
+                return_value=("a.worker.logging.config.yaml", "version: 1\n"),
+            ) as mock_func:
+                gen = reg.query_all(LoggingConfigCategory.WORKER.value)
+                mock_func.assert_not_called()
+                t_ret = next(gen)
+                mock_func.assert_called_once()
+            self.assertEqual(t_ret[1], "version: 1\n")
+            self.assertEqual(list(gen), [])
+
+    def test_get_db_snapshot(self) -> None:
+        """Warm start loads the snapshot. Extracts only when needed"""
+        category = LoggingConfigCategory.WORKER.value
+        with (
+            tempfile.TemporaryDirectory() as fp_cache,
+            tempfile.TemporaryDirectory() as fp_0,
+            tempfile.TemporaryDirectory() as fp_1,
+            patch(
+                f"{g_app_name}.register_config._registry_snapshot",
+                RegistrySnapshot(fp_cache),
+            ),
+            patch.object(RegistrySnapshot, "get_key", return_value="abc"),
+        ):
+            # cold start. Extracts, validates, then stores snapshot
+            reg_0 = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp_0),
+            )
+            reg_0.get_db()
+            self.assertIsNotNone(reg_0._path_extracted_db)
+
+            # warm start. Neither extracted nor validated
+            reg_1 = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp_1),
+            )
+            with patch(
+                f"{g_app_name}.register_config.validate_yaml_dirty",
+            ) as mock_validate:
+                reg_1.get_db()
+                mock_validate.assert_not_called()
+            self.assertEqual(reg_1._registry, reg_0._registry)
+            self.assertIsNone(reg_1._path_extracted_db)
+            self.assertEqual(list(Path(fp_1).iterdir()), [])
+            reg_1.query_db(category, genre="mp", flavor="asz")
+            self.assertIsInstance(reg_1.logging_config_yaml_str, str)
+
+            # Registry db file extracted on first access
+            path_db = reg_1.path_extracted_db
+            self.assertIsNotNone(path_db)
+            self.assertTrue(Path(str(path_db)).is_file())
+
+            # Package upgraded --> stale snapshot --> extract again
+            with patch.object(RegistrySnapshot, "get_key", return_value="def"):
+                reg_2 = ExtractorLoggingConfig(
+                    self.package_name_raw,
+                    path_alternative_dest_folder=Path(fp_1),
+                )
+                reg_2.get_db()
+                self.assertIsNotNone(reg_2._path_extracted_db)
+
+    def test_query_db_concurrent(self) -> None:
+        """Extraction folder and skip setup are passed explicitly. Queries
+        from a thread pool do not clobber each others extraction folder"""
+        category = LoggingConfigCategory.UI.value
+
+        def query(path_dir):
+            """Extract registry and a logging config YAML file
+
+            :param path_dir: alternative extraction folder
+            :type path_dir: pathlib.Path
+            :returns: extracted logging config YAML file relative path
+            :rtype: str | None
+            """
+            reg = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=path_dir,
+                is_test_file=False,
+            )
+            reg.get_db()
+            reg.query_db(
+                category,
+                genre="textual",
+                flavor="asz",
+                version_no="1",
+                logger_package_name=g_app_name,
+                is_skip_setup=True,
+            )
+            self.assertIsInstance(reg.logging_config_yaml_str, str)
+
+            return reg.logging_config_yaml_relpath
+
+        with (
+            tempfile.TemporaryDirectory() as fp_0,
+            tempfile.TemporaryDirectory() as fp_1,
+            patch("logging.config.dictConfig") as mock_dict_config,
+        ):
+            paths_dir = [Path(fp_0), Path(fp_1)] * 2
+            with ThreadPoolExecutor(max_workers=len(paths_dir)) as executor:
+                relpaths = list(executor.map(query, paths_dir))
+            # Setup skipped
+            mock_dict_config.assert_not_called()
+            # Each extracted into its own folder
+            for path_dir, relpath in zip(paths_dir, relpaths):
+                self.assertIsNotNone(relpath)
+                self.assertTrue(path_dir.joinpath(str(relpath)).is_file())
+
+    def test_query_cache(self) -> None:
+        """Repeated query returns remembered result. Cleared on reload"""
+        category = LoggingConfigCategory.WORKER.value
+        with tempfile.TemporaryDirectory() as fp:
+            reg = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp),
+            )
+            reg.get_db()
+            kwargs = {"genre": "mp", "flavor": "asz", "logger_package_name": "a"}
+            with patch(
+                f"{g_app_name}.register_config.setup_worker_other",
+                return_value=("a.worker.logging.config.yaml", "version: 1\n"),
+            ) as mock_func:
+                reg.query_db(category, **kwargs)
+                reg.query_db(category, **kwargs)
+                mock_func.assert_called_once()
+                self.assertEqual(reg.logging_config_yaml_str, "version: 1\n")
+
+                # Another logger package name is another query
+                reg.query_db(category, genre="mp", flavor="asz")
+                self.assertEqual(mock_func.call_count, 2)
+
+                # Explicit
+                reg.query_cache_clear()
+                reg.query_db(category, **kwargs)
+                self.assertEqual(mock_func.call_count, 3)
+
+                # Registry reloaded
+                reg.get_db()
+                reg.query_db(category, **kwargs)
+                self.assertEqual(mock_func.call_count, 4)
+
+                # Bounded. Least recently used is dropped
+                with patch(f"{g_app_name}.register_config.QUERY_CACHE_MAXSIZE", 1):
+                    reg.query_db(category, genre="mp", flavor="asz")
+                    reg.query_db(category, **kwargs)
+                self.assertEqual(mock_func.call_count, 6)
+                self.assertEqual(len(reg._query_cache), 1)
+
+                # Concurrent queries share the cache. Bound holds
+                with (
+                    patch(f"{g_app_name}.register_config.QUERY_CACHE_MAXSIZE", 2),
+                    ThreadPoolExecutor(max_workers=8) as executor,
+                ):
+                    futures = [
+                        executor.submit(
+                            reg.query_db,
+                            category,
+                            genre="mp",
+                            flavor="asz",
+                            logger_package_name=f"pkg{idx % 5}",
+                        )
+                        for idx in range(200)
+                    ]
+                    for future in futures:
+                        future.result()
+                self.assertLessEqual(len(reg._query_cache), 2)
+
+            # UI setup is a side effect. Never remembered
+            with patch(
+                f"{g_app_name}.register_config.setup_ui_other",
+                return_value=("a.app.logging.config.yaml", "version: 1\n"),
+            ) as mock_func:
+                for _ in range(2):
+                    reg.query_db("app", genre="textual", is_skip_setup=False)
+                self.assertEqual(mock_func.call_count, 2)
+                for _ in range(2):
+                    reg.query_db("app", genre="textual", is_skip_setup=True)
+                self.assertEqual(mock_func.call_count, 3)
+
+    def test_registry_catalog(self) -> None:
+        """Registries of many packages merged into one catalog"""
+        package_nonexistent = "sdfsadfsdafsadfsadfsadfy"
+        eps = [
+            metadata.EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP)
+            for name, value in (
+                (g_app_name, g_app_name),
+                ("again", g_app_name),
+                ("nope", package_nonexistent),
+            )
+        ]
+        with patch(
+            f"{g_app_name}.register_config.metadata.entry_points",
+            return_value=eps,
+        ):
+            package_names = iter_registry_packages()
+        self.assertEqual(package_names, [g_app_name, package_nonexistent])
+
+        with tempfile.TemporaryDirectory() as fp:
+            catalog = RegistryCatalog(
+                path_alternative_dest_folder=Path(fp),
+                package_names=package_names,
+            )
+            # Not installed package is skipped
+            self.assertEqual(catalog.load(), 1)
+            self.assertEqual(catalog.package_names, [g_app_name])
+
+            records = list(catalog.iter_records(category="worker"))
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0][0], g_app_name)
+
+            t_ret = catalog.query_db(
+                LoggingConfigCategory.WORKER,
+                genre="mp",
+                flavor="asz",
+            )
+            self.assertIsNotNone(t_ret)
+            package_name, f_relpath, str_yaml = t_ret
+            self.assertEqual(package_name, g_app_name)
+            self.assertTrue(Path(fp).joinpath(f_relpath).is_file())
+            self.assertIsInstance(str_yaml, str)
+
+            self.assertIsNone(catalog.query_db("worker", genre="dogfood"))
+
+        # Loaded once per process
+        registry_catalog_clear()
+        with patch(
+            f"{g_app_name}.register_config.metadata.entry_points",
+            return_value=[],
+        ) as mock_eps:
+            catalog_0 = get_registry_catalog()
+            self.assertIs(get_registry_catalog(), catalog_0)
+            mock_eps.assert_called_once()
+            self.assertEqual(catalog_0.package_names, [])
+            registry_catalog_clear()
+            self.assertIsNot(get_registry_catalog(), catalog_0)
+        registry_catalog_clear()
+
+    def test_in_memory(self) -> None:
+        """Zero extraction. Registry db and logging config YAML files are
+        read from package data. Nothing written to destination folder"""
+        queries = (
+            (LoggingConfigCategory.WORKER.value, "mp"),
+            (LoggingConfigCategory.UI.value, "textual"),
+        )
+        with (
+            tempfile.TemporaryDirectory() as fp_extract,
+            tempfile.TemporaryDirectory() as fp_memory,
+            patch.object(RegistrySnapshot, "get_key", return_value=None),
+        ):
+            reg_extract = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp_extract),
+                is_in_memory=False,
+            )
+            self.assertFalse(reg_extract.is_in_memory)
+            reg_extract.get_db()
+            expected = []
+            for category, genre in queries:
+                reg_extract.query_db(category, genre=genre, flavor="asz")
+                expected.append(
+                    (
+                        reg_extract.logging_config_yaml_relpath,
+                        reg_extract.logging_config_yaml_str,
+                    )
+                )
+
+            reg = ExtractorLoggingConfig(
+                self.package_name_raw,
+                path_alternative_dest_folder=Path(fp_memory),
+                is_in_memory=True,
+            )
+            self.assertTrue(reg.is_in_memory)
+            with patch(
+                f"{g_app_name}.util.package_resource.PackageResource.resource_extract",
+            ) as mock_extract:
+                reg.get_db()
+                self.assertEqual(reg._registry, reg_extract._registry)
+                self.assertIsNone(reg.path_extracted_db)
+                for (category, genre), t_expected in zip(queries, expected):
+                    with self.subTest(category=category):
+                        reg.query_db(category, genre=genre, flavor="asz")
+                        self.assertIsInstance(reg.logging_config_yaml_str, str)
+                        t_actual = (
+                            reg.logging_config_yaml_relpath,
+                            reg.logging_config_yaml_str,
+                        )
+                        self.assertEqual(t_actual, t_expected)
+                mock_extract.assert_not_called()
+            self.assertEqual(list(Path(fp_memory).iterdir()), [])
+
+            # Process wide default. Per call overrides
+            self.assertFalse(get_in_memory())
+            try:
+                set_in_memory(True)
+                self.assertTrue(get_in_memory())
+                reg_0 = ExtractorLoggingConfig(self.package_name_raw)
+                self.assertTrue(reg_0.is_in_memory)
+                self.assertFalse(reg_extract.is_in_memory)
+            finally:
+                set_in_memory(False)
+            self.assertFalse(reg_0.is_in_memory)
+
 
 if __name__ == "__main__":  # pragma: no cover
     """Without coverage
@@ -547,6 +930,24 @@ if __name__ == "__main__":  # pragma: no cover
        python -m unittest tests.test_registry_config \
        -k TestExtractor.test_query_two_step --locals --verbose
 
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_query_db_concurrent --locals --verbose
+
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_iter_records --locals --verbose
+
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_get_db_snapshot --locals --verbose
+
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_registry_catalog --locals --verbose
+
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_query_cache --locals --verbose
+
+       python -m unittest tests.test_registry_config \
+       -k TestExtractor.test_in_memory --locals --verbose
+
     With coverage
 
     .. code-block:: shell
@@ -0,0 +1,211 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Recursive file search. Ignored folders are never descended into.
+``.gitignore`` style excludes prune folders and files.
+
+"""
+
+import os
+import platform
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from logging_strict.constants import g_app_name
+from logging_strict.util.file_walk import (
+    IGNORE_DIRS,
+    ExcludeRules,
+    compile_name_pattern,
+    iter_files,
+)
+
+
+class FileWalk(unittest.TestCase):
+    """Prune then match names"""
+
+    def setUp(self) -> None:
+        """Folder tree. Matching files within ignored folders"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path_dir = Path(self.tmp.name)
+        relpaths = (
+            "x.txt",
+            "x.md",
+            ".git/y.txt",
+            ".tox/pkg/z.txt",
+            "docs/d.txt",
+            "sub/keep.txt",
+            "sub/skip.txt",
+            "sub/.venv/w.txt",
+            "sub/deep/er/v.txt",
+        )
+        for relpath in relpaths:
+            path_f = self.path_dir.joinpath(relpath)
+            path_f.parent.mkdir(parents=True, exist_ok=True)
+            path_f.write_text("version: 1\n")
+        # Folder. Name matches. Not a file
+        self.path_dir.joinpath("sub", "folder.txt").mkdir()
+
+    def tearDown(self) -> None:
+        """Remove folder tree"""
+        self.tmp.cleanup()
+
+    def walk(self, *args, **kwargs):
+        """Relative paths of search results
+
+        :returns: relative paths. ``/`` separated. In search order
+        :rtype: list[str]
+        """
+        ret = [
+            path_f.relative_to(self.path_dir).as_posix()
+            for path_f in iter_files(self.path_dir, *args, **kwargs)
+        ]
+
+        return ret
+
+    def test_iter_files(self) -> None:
+        """Ignored folders pruned. Sorted. Files before sub-folders"""
+        expected = [
+            "x.txt",
+            "docs/d.txt",
+            "sub/keep.txt",
+            "sub/skip.txt",
+            "sub/deep/er/v.txt",
+        ]
+        self.assertEqual(self.walk("*.txt"), expected)
+        self.assertIn(".tox", IGNORE_DIRS)
+
+        # Ignored folders are never listed
+        with patch(
+            f"{g_app_name}.util.file_walk.os.scandir",
+            wraps=os.scandir,
+        ) as mock_scandir:
+            self.walk("*.txt")
+        names = {Path(mock_call.args[0]).name for mock_call in mock_scandir.mock_calls}
+        self.assertNotIn(".git", names)
+        self.assertNotIn(".tox", names)
+        self.assertNotIn(".venv", names)
+
+        # Nothing ignored
+        actual = self.walk("*.txt", ignore_dirs=())
+        self.assertEqual(len(actual), 8)
+        self.assertIn(".git/y.txt", actual)
+        self.assertNotIn("sub/folder.txt", actual)
+
+        # The search folder itself is never ignored
+        path_venv = self.path_dir.joinpath("sub", ".venv")
+        actual = [path_f.name for path_f in iter_files(path_venv, "*.txt")]
+        self.assertEqual(actual, ["w.txt"])
+
+        # Not a folder
+        actual = list(iter_files(self.path_dir.joinpath("x.txt"), "*.txt"))
+        self.assertEqual(actual, [])
+
+        # Build output may contain files intended to be searched
+        for relpath in ("build/b.txt", "dist/c.txt", "venv/e.txt"):
+            path_f = self.path_dir.joinpath(relpath)
+            path_f.parent.mkdir()
+            path_f.write_text("version: 1\n")
+        actual = self.walk("*.txt")
+        self.assertIn("build/b.txt", actual)
+        self.assertIn("dist/c.txt", actual)
+        self.assertIn("venv/e.txt", actual)
+
+    @unittest.skipUnless(platform.system() == "Linux", "requires Linux")
+    def test_symlinks(self) -> None:
+        """Symlinked folders are not followed. Symlinked files are found"""
+        path_sub = self.path_dir.joinpath("sub")
+        self.path_dir.joinpath("link_dir").symlink_to(path_sub)
+        self.path_dir.joinpath("link.txt").symlink_to(path_sub.joinpath("keep.txt"))
+        actual = self.walk("*.txt")
+        self.assertIn("link.txt", actual)
+        self.assertFalse(any(relpath.startswith("link_dir/") for relpath in actual))
+
+    def test_excludes(self) -> None:
+        """.gitignore style. Last matching rule wins"""
+        try_these = (
+            # name at any depth. Anchored folder
+            (["skip.txt", "/docs/"], ["x.txt", "sub/keep.txt", "sub/deep/er/v.txt"]),
+            # re-include
+            (["*.txt", "!keep.txt"], ["sub/keep.txt"]),
+            # anchored. Only the search folder
+            (
+                ["/x.txt"],
+                ["docs/d.txt", "sub/keep.txt", "sub/skip.txt", "sub/deep/er/v.txt"],
+            ),
+            # relative path containing a /
+            (["sub/*.txt"], ["x.txt", "docs/d.txt", "sub/deep/er/v.txt"]),
+            # ** across folders. Character class
+            (["**/er", "[a-s]*.txt"], ["x.txt"]),
+            # folders only. A file of that name is kept
+            (
+                ["x.txt/", "deep/"],
+                ["x.txt", "docs/d.txt", "sub/keep.txt", "sub/skip.txt"],
+            ),
+            # comments, blank lines, escaped leading chars
+            (
+                ["# comment", "", "\\#x.txt", "sub/deep/**"],
+                ["x.txt", "docs/d.txt", "sub/keep.txt", "sub/skip.txt"],
+            ),
+        )
+        for patterns, expected in try_these:
+            with self.subTest(patterns=patterns):
+                self.assertEqual(self.walk("*.txt", excludes=patterns), expected)
+
+        excludes = ExcludeRules(["/sub/", "", "# comment", "/"])
+        self.assertEqual(len(excludes), 1)
+        self.assertTrue(bool(excludes))
+        self.assertFalse(bool(ExcludeRules()))
+        self.assertTrue(excludes.is_excluded("sub", is_dir=True))
+        self.assertFalse(excludes.is_excluded("sub"))
+        self.assertEqual(self.walk("*.txt", excludes=excludes), ["x.txt", "docs/d.txt"])
+
+        # From a .gitignore file
+        path_gitignore = self.path_dir.joinpath(".gitignore")
+        path_gitignore.write_text("# local\n/sub/\ndocs\n")
+        excludes = ExcludeRules.from_file(path_gitignore)
+        self.assertEqual(self.walk("*.txt", excludes=excludes), ["x.txt"])
+
+    def test_compile_name_pattern(self) -> None:
+        """Compiled once. Whole name"""
+        pattern = "mp_1_*.worker.logging.config.yaml"
+        regex = compile_name_pattern(pattern)
+        self.assertIs(compile_name_pattern(pattern), regex)
+        self.assertIsNotNone(regex.match("mp_1_asz.worker.logging.config.yaml"))
+        self.assertIsNone(regex.match("mp_1_asz.worker.logging.config.yaml.bak"))
+        self.assertIsNone(regex.match("textual_1_asz.app.logging.config.yaml"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    """Without coverage
+
+    .. code-block:: shell
+
+       python -m tests.test_util_file_walk --locals
+
+       python -m unittest tests.test_util_file_walk \\
+       -k FileWalk.test_iter_files --locals --verbose
+
+       python -m unittest tests.test_util_file_walk \\
+       -k FileWalk.test_symlinks --locals --verbose
+
+       python -m unittest tests.test_util_file_walk \\
+       -k FileWalk.test_excludes --locals --verbose
+
+       python -m unittest tests.test_util_file_walk \\
+       -k FileWalk.test_compile_name_pattern --locals --verbose
+
+    With coverage
+
+    .. code-block:: shell
+
+       coverage run --data-file=".coverage-combine-50" \\
+       -m unittest discover -t. -s tests \\
+       -p "test_util_file_walk*.py" --locals
+
+       coverage report --include="**/util/file_walk*" \\
+       --no-skip-covered --data-file=".coverage-combine-50"
+
+    """
+    unittest.main(tb_locals=True)
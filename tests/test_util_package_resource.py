@@ -7,12 +7,18 @@ Extract package resources. Can extract many, not just one at a time.
 
 """
 
+import importlib
+import importlib.util
+import json
 import logging
 import os
 import platform
 import secrets
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from collections.abc import Generator
 from contextlib import nullcontext as does_not_raise
@@ -26,7 +32,12 @@ from typing import (
     TYPE_CHECKING,
     cast,
 )
-from unittest.mock import patch
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import importlib_resources
 
 from logging_strict.constants import g_app_name
 from logging_strict.exceptions import PackageNotFoundError
@@ -38,15 +49,30 @@ from logging_strict.util.package_resource import (
 from logging_strict.util.package_resource import (
     _get_package_data_folder,  # pyright: ignore[reportPrivateUsage]
 )
+from logging_strict.util.package_resource import (
+    _split_name,  # pyright: ignore[reportPrivateUsage]
+)
 from logging_strict.util.package_resource import (
     _to_package_case,  # pyright: ignore[reportPrivateUsage]
 )
+from logging_strict.util.package_resource import (
+    _write_bytes_atomic,  # pyright: ignore[reportPrivateUsage]
+)
 from logging_strict.util.package_resource import (  # noqa: F401 sphinx uses
+    EXTRACT_MANIFEST_SUFFIX,
+    ExtractLock,
+    ExtractManifest,
+    FileMatcher,
+    PackageFileIndex,
     PackageResource,
+    check_folder,
+    file_index_clear,
     filter_by_file_stem,
     filter_by_suffix,
+    get_file_index,
     get_package_data,
     is_package_exists,
+    lookup_cache_clear,
     msg_stem,
     walk_tree_folders,
 )
@@ -440,6 +466,107 @@ class PackageResourceMadness(unittest.TestCase):
         )
         self.assertFalse(cb_file_suffix(".html"))
 
+    def test_file_matcher(self) -> None:
+        """Compiled once. Same results as the callbacks"""
+        file_names = (
+            "mp_1_asz.worker.logging.config.yaml",
+            "pyproject.toml",
+            "README",
+            ".bashrc",
+            ".hidden.yml",
+            "..two.yml",
+            "a..b",
+            "trailing.",
+            "archive.tar.gz",
+        )
+        # Same split as msg_stem and Path.suffixes
+        for file_name in file_names:
+            with self.subTest(file_name=file_name):
+                stem, suffix = _split_name(file_name)
+                self.assertEqual(stem, msg_stem(file_name))
+                self.assertEqual(suffix, "".join(Path(file_name).suffixes))
+
+        suffix_specs = (
+            None,
+            "",
+            ".yaml",
+            ".worker.logging.config.yaml",
+            (".yml", ".toml"),
+            ("", ".gz"),
+            (),
+            ("",),
+        )
+        stem_specs = (None, "mp_1_asz", "archive.tar.gz", "README")
+        for suffix_spec in suffix_specs:
+            for stem_spec in stem_specs:
+                cb_suffix = partial(filter_by_suffix, suffix_spec)
+                cb_file_stem = partial(filter_by_file_stem, stem_spec)
+                matcher = FileMatcher.from_callbacks(cb_suffix, cb_file_stem)
+                matcher_direct = FileMatcher(suffix=suffix_spec, file_stem=stem_spec)
+                for file_name in file_names:
+                    with self.subTest(
+                        suffix_spec=suffix_spec,
+                        stem_spec=stem_spec,
+                        file_name=file_name,
+                    ):
+                        stem = msg_stem(file_name)
+                        suffix = "".join(Path(file_name).suffixes)
+                        expected = cb_suffix(suffix) and cb_file_stem(stem)
+                        self.assertIs(matcher.is_match(file_name), expected)
+                        # Constructor. None is no suffix filter
+                        expected_direct = (
+                            cb_file_stem(stem) if suffix_spec is None else expected
+                        )
+                        self.assertIs(
+                            matcher_direct.is_match(file_name), expected_direct
+                        )
+
+        # Compiled. Per file, neither callback is called nor Path created
+        matcher = FileMatcher.from_callbacks(
+            partial(filter_by_suffix, ".toml"),
+            partial(filter_by_file_stem, "pyproject"),
+        )
+        with (
+            patch(
+                f"{g_app_name}.util.package_resource.filter_by_suffix",
+                wraps=filter_by_suffix,
+            ) as mock_suffix,
+            patch(f"{g_app_name}.util.package_resource.Path") as mock_path,
+        ):
+            for file_name in file_names:
+                matcher.is_match(file_name)
+            mock_suffix.assert_not_called()
+            mock_path.assert_not_called()
+
+        # No filter
+        matcher = FileMatcher.from_callbacks()
+        self.assertTrue(all(matcher.is_match(file_name) for file_name in file_names))
+        matcher = FileMatcher()
+        self.assertTrue(all(matcher.is_match(file_name) for file_name in file_names))
+        self.assertTrue(matcher.is_match("a.yml"))
+
+        # File stem only. Any suffix
+        matcher = FileMatcher(file_stem="mp_1_asz")
+        self.assertTrue(matcher.is_match("mp_1_asz.worker.logging.config.yaml"))
+        self.assertTrue(matcher.is_match("mp_1_asz"))
+        self.assertFalse(matcher.is_match("mp_2_asz.worker.logging.config.yaml"))
+        actual = [file_name for file_name in file_names if matcher.is_match(file_name)]
+        self.assertEqual(actual, ["mp_1_asz.worker.logging.config.yaml"])
+
+        # Roll your own callbacks. Called per file
+        cb_suffix = Mock(return_value=True)
+        cb_file_stem = Mock(side_effect=lambda stem: stem == "README")
+        matcher = FileMatcher.from_callbacks(cb_suffix, cb_file_stem)
+        actual = [file_name for file_name in file_names if matcher.is_match(file_name)]
+        self.assertEqual(actual, ["README"])
+        self.assertEqual(cb_suffix.call_count, len(file_names))
+        cb_suffix.assert_any_call(".worker.logging.config.yaml")
+        cb_file_stem.assert_any_call("mp_1_asz")
+
+        # Empty file stem
+        with self.assertRaises(ValueError):
+            FileMatcher(file_stem="")
+
     def test_resource_extract(self) -> None:
         """Test PackageResource.resource_extract
 
@@ -619,6 +746,204 @@ class PackageResourceMadness(unittest.TestCase):
                 files_count = len(paths_4)
                 self.assertEqual(files_count, 2)
 
+    def test_extract_manifest(self) -> None:
+        """Up to date files are skipped. Stale files replaced atomically"""
+        pr = PackageResource(self.package_dest_c, self.fallback_package_base_folder)
+        cb_file_stem = partial(filter_by_file_stem, "mp_1_asz")
+        cb_file_suffix = partial(filter_by_suffix, ".worker.logging.config.yaml")
+        mod_path = f"{g_app_name}.util.package_resource"
+        file_name = "mp_1_asz.worker.logging.config.yaml"
+        trav_root = _get_package_data_folder(f"{self.package_dest_c}.configs")
+        self.assertIsNotNone(trav_root)
+        str_src = trav_root.joinpath(file_name).read_text()
+
+        def extract(path_dir, is_overwrite):
+            """Extract the one file
+
+            :param path_dir: destination folder
+            :type path_dir: pathlib.Path
+            :param is_overwrite: True replace existing file if content differs
+            :type is_overwrite: bool
+            :returns: extracted file path
+            :rtype: pathlib.Path
+            """
+            paths = list(
+                pr.resource_extract(
+                    pr.package_data_folders(
+                        cb_suffix=cb_file_suffix,
+                        cb_file_stem=cb_file_stem,
+                    ),
+                    path_dir,
+                    cb_suffix=cb_file_suffix,
+                    cb_file_stem=cb_file_stem,
+                    is_overwrite=is_overwrite,
+                )
+            )
+            self.assertEqual(len(paths), 1)
+
+            return paths[0]
+
+        with (
+            tempfile.TemporaryDirectory() as fp,
+            patch(f"{mod_path}._get_package_key", return_value="abc"),
+        ):
+            path_dir = Path(fp)
+            path_f = extract(path_dir, False)
+            self.assertEqual(path_f.read_text(), str_src)
+            manifest = ExtractManifest(path_dir, pr.package)
+            self.assertEqual(
+                manifest.path_file.name,
+                f".{pr.package}{EXTRACT_MANIFEST_SUFFIX}",
+            )
+            self.assertEqual(manifest.load(), 1)
+
+            # Up to date. Neither written nor package data file read
+            with (
+                patch(f"{mod_path}._write_bytes_atomic") as mock_write,
+                patch(f"{mod_path}.hashlib.sha256") as mock_sha256,
+            ):
+                extract(path_dir, True)
+                mock_write.assert_not_called()
+                mock_sha256.assert_not_called()
+
+            # Same size edit. Kept unless overwrite
+            str_edited = str_src.replace("version: 1", "version: 2", 1)
+            self.assertEqual(len(str_edited), len(str_src))
+            path_f.write_text(str_edited)
+            extract(path_dir, False)
+            self.assertEqual(path_f.read_text(), str_edited)
+            extract(path_dir, True)
+            self.assertEqual(path_f.read_text(), str_src)
+
+            # Package upgraded. Untouched copy with other content is replaced
+            d_manifest = json.loads(manifest.path_file.read_text())
+            d_manifest["files"][file_name]["sha256"] = "0" * 64
+            manifest.path_file.write_text(json.dumps(d_manifest))
+            with (
+                patch(f"{mod_path}._get_package_key", return_value="def"),
+                patch(
+                    f"{mod_path}._write_bytes_atomic",
+                    wraps=_write_bytes_atomic,
+                ) as mock_write,
+            ):
+                extract(path_dir, False)
+                # extracted file, then the manifest
+                written = [mock_call.args[0] for mock_call in mock_write.call_args_list]
+                self.assertEqual(written, [path_f, manifest.path_file])
+            self.assertEqual(path_f.read_text(), str_src)
+
+            # Missing file is extracted again. No temp files left behind
+            path_f.unlink()
+            extract(path_dir, False)
+            self.assertTrue(path_f.is_file())
+            names = sorted(path.name for path in path_dir.iterdir())
+            self.assertEqual(names, sorted((file_name, manifest.path_file.name)))
+
+    @unittest.skipUnless(platform.system() == "Linux", "requires Linux")
+    def test_extract_lock(self) -> None:
+        """One process extracts. Others wait or, if stale, break the lock"""
+        pr = PackageResource(self.package_dest_c, self.fallback_package_base_folder)
+        cb_file_stem = partial(filter_by_file_stem, "mp_1_asz")
+        cb_file_suffix = partial(filter_by_suffix, ".worker.logging.config.yaml")
+        mod_path = f"{g_app_name}.util.package_resource"
+        file_name = "mp_1_asz.worker.logging.config.yaml"
+
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            lock_a = ExtractLock(path_dir, pr.package)
+            self.assertFalse(lock_a.is_locked)
+            with lock_a:
+                self.assertTrue(lock_a.is_locked)
+                self.assertTrue(lock_a.path_file.exists())
+                # Held by another open file. Times out
+                lock_b = ExtractLock(path_dir, pr.package, timeout=0.05)
+                with self.assertLogs(mod_path, level=logging.WARNING) as cm:
+                    self.assertFalse(lock_b.acquire())
+                self.assertIn("Timeout", cm.output[0])
+                self.assertFalse(lock_b.is_locked)
+                lock_b.release()
+            # Removed on release
+            self.assertFalse(lock_a.is_locked)
+            self.assertFalse(lock_a.path_file.exists())
+
+            # Waits until released
+            lock_a.acquire()
+            timer = threading.Timer(0.2, lock_a.release)
+            timer.start()
+            lock_c = ExtractLock(path_dir, pr.package, timeout=10.0)
+            start = time.monotonic()
+            with lock_c:
+                self.assertTrue(lock_c.is_locked)
+                self.assertGreater(time.monotonic() - start, 0.1)
+            timer.join()
+
+            # Stale. Hung holder
+            lock_a.acquire()
+            old = time.time() - 3600.0
+            os.utime(lock_a.path_file, (old, old))
+            lock_b = ExtractLock(path_dir, pr.package, timeout=0.05)
+            with self.assertLogs(mod_path, level=logging.WARNING) as cm:
+                self.assertTrue(lock_b.acquire())
+            self.assertIn("stale", cm.output[0])
+            lock_b.release()
+            lock_a.release()
+
+            # Stale. Holder gone
+            lock_a.acquire()
+            proc = subprocess.Popen([sys.executable, "-c", "pass"])
+            proc.wait()
+            pid_gone = proc.pid
+            d_holder = {"pid": pid_gone, "host": platform.node()}
+            lock_a.path_file.write_text(json.dumps(d_holder))
+            lock_b = ExtractLock(path_dir, pr.package, timeout=0.05)
+            with self.assertLogs(mod_path, level=logging.WARNING):
+                self.assertTrue(lock_b.acquire())
+            lock_b.release()
+            lock_a.release()
+
+            # Holder on another host, not stale. Gives up
+            lock_a.acquire()
+            d_holder = {"pid": os.getpid(), "host": f"{platform.node()}-other"}
+            lock_a.path_file.write_text(json.dumps(d_holder))
+            lock_b = ExtractLock(path_dir, pr.package, timeout=0.05)
+            with self.assertLogs(mod_path, level=logging.WARNING):
+                self.assertFalse(lock_b.acquire())
+            lock_a.release()
+
+            # Concurrent extraction. Package data file written once
+            paths_written = []
+            write_orig = _write_bytes_atomic
+
+            def spy(path_file, data):
+                """Record written file paths"""
+                paths_written.append(path_file)
+                write_orig(path_file, data)
+
+            def extract():
+                """Extract the one file"""
+                gen = pr.resource_extract(
+                    pr.package_data_folders(
+                        cb_suffix=cb_file_suffix,
+                        cb_file_stem=cb_file_stem,
+                    ),
+                    path_dir,
+                    cb_suffix=cb_file_suffix,
+                    cb_file_stem=cb_file_stem,
+                    is_overwrite=False,
+                )
+                for _ in gen:
+                    pass
+
+            with patch(f"{mod_path}._write_bytes_atomic", side_effect=spy):
+                threads = [threading.Thread(target=extract) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            path_f = path_dir.joinpath(file_name)
+            self.assertEqual(paths_written.count(path_f), 1)
+            self.assertFalse(lock_a.path_file.exists())
+
     @unittest.skipUnless(platform.system() == "Linux", "requires Linux")
     def test_resource_extract_nonexistent_folder(self) -> None:
         """Allow resource_extract to mkdir"""
@@ -674,6 +999,8 @@ class PackageResourceMadness(unittest.TestCase):
         with suppress(Exception):
             if path_last_f is not None:
                 path_last_f.unlink()
+        with suppress(Exception):
+            ExtractManifest(path_dest, pr.package).path_file.unlink()
 
         # :py:func:`Path.rmdir`
         if path_dest.exists() and path_dest.is_dir():
@@ -895,6 +1222,122 @@ class PackageResourceMadness(unittest.TestCase):
             folder_count = len(folders)
             self.assertEqual(folder_count, expected_count_1)
 
+    def test_file_index(self) -> None:
+        """One walk per data folder. Shared by PackageResource instances"""
+        file_index_clear()
+        cb_file_stem = partial(filter_by_file_stem, "mp_1_asz")
+        cb_file_suffix = partial(filter_by_suffix, ".worker.logging.config.yaml")
+        trav_root = _get_package_data_folder(f"{self.package_dest_c}.configs")
+        self.assertIsNotNone(trav_root)
+
+        # Same folders as check_folder on each folder of the tree
+        file_index = PackageFileIndex(trav_root)
+        folders_expected = []
+        for trav_folder in (trav_root, *walk_tree_folders(trav_root)):
+            folders_expected.extend(
+                check_folder(
+                    trav_folder,
+                    cb_suffix=cb_file_suffix,
+                    cb_file_stem=cb_file_stem,
+                )
+            )
+        folders_actual = list(
+            file_index.iter_folders(
+                cb_suffix=cb_file_suffix,
+                cb_file_stem=cb_file_stem,
+            )
+        )
+        self.assertEqual(
+            [str(trav) for trav in folders_actual],
+            [str(trav) for trav in folders_expected],
+        )
+        self.assertIn(
+            (
+                (),
+                "mp_1_asz.worker.logging.config.yaml",
+                "mp_1_asz",
+                ".worker.logging.config.yaml",
+            ),
+            file_index.entries,
+        )
+        self.assertIs(file_index.folder(()), trav_root)
+        # No __pycache__
+        for reldir, _, _, _ in file_index.entries:
+            self.assertNotIn("__pycache__", reldir)
+
+        # Walked once. Both instances and queries share the index
+        pr_0 = PackageResource(self.package_dest_c, self.fallback_package_base_folder)
+        pr_1 = PackageResource(self.package_dest_c, self.fallback_package_base_folder)
+        with patch(
+            f"{g_app_name}.util.package_resource.PackageFileIndex",
+            wraps=PackageFileIndex,
+        ) as mock_index:
+            for pr in (pr_0, pr_1, pr_0):
+                folders = list(
+                    pr.package_data_folders(
+                        cb_suffix=cb_file_suffix,
+                        cb_file_stem=cb_file_stem,
+                    )
+                )
+                self.assertEqual(len(folders), 1)
+            self.assertEqual(mock_index.call_count, 1)
+        self.assertIs(
+            get_file_index(f"{self.package_dest_c}.configs", trav_root),
+            get_file_index(f"{self.package_dest_c}.configs", trav_root),
+        )
+
+        # Forget. Next query walks again
+        file_index_clear()
+        with patch(
+            f"{g_app_name}.util.package_resource.PackageFileIndex",
+            wraps=PackageFileIndex,
+        ) as mock_index:
+            list(pr_0.package_data_folders(cb_suffix=cb_file_suffix))
+            self.assertEqual(mock_index.call_count, 1)
+
+    def test_lookup_cache(self) -> None:
+        """Import system queried once per package or data folder. Even
+        if not found. Until invalidated"""
+        mod_path = f"{g_app_name}.util.package_resource"
+        package_name = f"{g_app_name}_nonexistent_{secrets.token_hex(4)}"
+        dotted_path = f"{self.package_dest_c}.nonexistent_folder"
+        lookup_cache_clear()
+        with (
+            patch(
+                f"{mod_path}.importlib.util.find_spec",
+                wraps=importlib.util.find_spec,
+            ) as mock_spec,
+            patch(
+                f"{mod_path}.importlib_resources.files",
+                wraps=importlib_resources.files,
+            ) as mock_files,
+        ):
+            for _ in range(3):
+                self.assertTrue(is_package_exists(self.package_dest_c))
+                self.assertFalse(is_package_exists(package_name))
+                self.assertIsNone(_get_package_data_folder(dotted_path))
+                self.assertIsNotNone(
+                    _get_package_data_folder(f"{self.package_dest_c}.configs")
+                )
+            self.assertEqual(mock_spec.call_count, 2)
+            self.assertEqual(mock_files.call_count, 2)
+
+            # Sanitized dotted path is the key
+            _get_package_data_folder(f"{self.package_dest_c}.Configs")
+            self.assertEqual(mock_files.call_count, 2)
+
+            # e.g. after installing a package
+            importlib.invalidate_caches()
+            self.assertFalse(is_package_exists(package_name))
+            self.assertIsNone(_get_package_data_folder(dotted_path))
+            self.assertEqual(mock_spec.call_count, 3)
+            self.assertEqual(mock_files.call_count, 3)
+
+            # Also on file_index_clear
+            file_index_clear()
+            self.assertFalse(is_package_exists(package_name))
+            self.assertEqual(mock_spec.call_count, 4)
+
     def test_walk_tree_folders(self) -> None:
         """What if no folders found?"""
         pr = PackageResource(self.package_dest_c, self.fallback_package_base_folder)
@@ -1086,6 +1529,21 @@ if __name__ == "__main__":  # pragma: no cover
        python -m unittest tests.test_util_package_resource \
        -k PackageResource.test_resource_extract --locals --verbose
 
+       python -m unittest tests.test_util_package_resource \
+       -k PackageResource.test_file_index --locals --verbose
+
+       python -m unittest tests.test_util_package_resource \
+       -k PackageResource.test_extract_manifest --locals --verbose
+
+       python -m unittest tests.test_util_package_resource \
+       -k PackageResource.test_extract_lock --locals --verbose
+
+       python -m unittest tests.test_util_package_resource \
+       -k PackageResource.test_lookup_cache --locals --verbose
+
+       python -m unittest tests.test_util_package_resource \
+       -k PackageResource.test_file_matcher --locals --verbose
+
     With coverage
 
     .. code-block:: shell
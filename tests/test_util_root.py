@@ -25,8 +25,10 @@ from logging_strict.constants import g_app_name
 from logging_strict.tech_niques import LoggerRedirector
 from logging_strict.util.util_root import (
     IsRoot,
+    OwnerFixups,
     check_python_not_old,
     get_logname,
+    get_session_ids,
 )
 
 if TYPE_CHECKING:
@@ -107,10 +109,12 @@ class UtilRoot(unittest.TestCase):
             ),
             patch("shutil.chown", return_value=None),
         ):
+            get_session_ids.cache_clear()
             IsRoot.set_owner_as_user(
                 fp.name,
                 is_as_user=True,
             )
+        get_session_ids.cache_clear()
 
         """
         file_path = f"/root/{g_app_name}.deleteme"
@@ -139,6 +143,68 @@ class UtilRoot(unittest.TestCase):
         """
         pass
 
+    def test_owner_fixups(self) -> None:
+        """Session user resolved once. Each queued path changed once"""
+        mod_path = f"{g_app_name}.util.util_root"
+        with (
+            patch(f"{mod_path}.g_is_root", True),
+            patch(f"{mod_path}.get_logname", return_value="faulkmore") as mock_name,
+            patch(
+                f"{mod_path}.getpwnam",
+                return_value=("faulkmore", None, 1000, 1000),
+            ),
+        ):
+            get_session_ids.cache_clear()
+            self.assertEqual(get_session_ids(), (1000, 1000))
+            self.assertEqual(get_session_ids(), (1000, 1000))
+            mock_name.assert_called_once()
+        get_session_ids.cache_clear()
+
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp).joinpath("a")
+            path_dir.mkdir()
+            path_f = path_dir.joinpath("b.txt")
+            path_f.touch()
+            st_f = path_f.stat()
+            ids_other = (st_f.st_uid + 1, st_f.st_gid + 1)
+
+            # Not root. Nothing queued
+            with patch(f"{mod_path}.g_is_root", False):
+                fixups = OwnerFixups(is_as_user=True)
+            self.assertFalse(fixups.is_active)
+            fixups.add(path_f)
+            self.assertEqual(fixups.apply(), 0)
+
+            with (
+                patch(f"{mod_path}.g_is_root", True),
+                patch(f"{mod_path}.get_session_ids", return_value=ids_other),
+                patch(f"{mod_path}.os.chown") as mock_chown,
+            ):
+                fixups = OwnerFixups(is_as_user=True)
+                self.assertTrue(fixups.is_active)
+                for path in (path_dir, path_f, path_dir, str(path_f)):
+                    fixups.add(path)
+                fixups.add(Path(fp).joinpath("nonexistent"))
+                self.assertEqual(fixups.apply(), 2)
+                self.assertEqual(
+                    [mock_call.args[0] for mock_call in mock_chown.call_args_list],
+                    [path_dir, path_f],
+                )
+                # Queue emptied
+                self.assertEqual(fixups.apply(), 0)
+
+            # Already owned by session user
+            ids_same = (st_f.st_uid, st_f.st_gid)
+            with (
+                patch(f"{mod_path}.g_is_root", True),
+                patch(f"{mod_path}.get_session_ids", return_value=ids_same),
+                patch(f"{mod_path}.os.chown") as mock_chown,
+            ):
+                fixups = OwnerFixups(is_as_user=True)
+                fixups.add(path_f)
+                self.assertEqual(fixups.apply(), 0)
+                mock_chown.assert_not_called()
+
 
 @patch(f"{g_app_name}.util.util_root.g_is_root", False)
 @patch(f"{g_app_name}.util.util_root.ungraceful_app_exit", lambda: None)
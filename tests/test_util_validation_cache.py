@@ -0,0 +1,259 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Persistent validation cache. A warm start loads JSON, skipping strictyaml.
+
+Never write into the actual XDG user cache folder. Use a temp folder.
+
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from logging_strict.constants import g_app_name
+from logging_strict.logging_yaml_validate import (
+    _validate_yaml_engine,  # pyright: ignore[reportPrivateUsage]
+)
+from logging_strict.logging_yaml_validate import (
+    ENGINE_DISK,
+    ENGINE_MEMORY,
+    ENGINE_PREVALIDATE,
+    ENGINE_STRICTYAML,
+    loggers_map,
+    validate_yaml_data,
+    validation_cache_clear,
+)
+from logging_strict.util.validation_cache import (
+    CACHE_SUBFOLDER,
+    REGISTRY_SUBFOLDER,
+    RegistrySnapshot,
+    ValidationDiskCache,
+    ValidationManifest,
+)
+
+
+class ValidationCacheDisk(unittest.TestCase):
+    """On-disk cache of validated logging.config data"""
+
+    def setUp(self) -> None:
+        """Valid logging.config YAML str"""
+        self.yaml_snippet = (
+            "version: 1\n"
+            "loggers:\n"
+            "  my_app:\n"
+            "    handlers: [console]\n"
+            "    level: INFO\n"
+            "    propagate: False\n"
+        )
+
+    def test_get_put(self) -> None:
+        """Round trip. Invalid entries ignored"""
+        d_data = {"version": 1, "loggers": {"my_app": {"level": "INFO"}}}
+        with tempfile.TemporaryDirectory() as fp:
+            disk_cache = ValidationDiskCache(fp)
+            self.assertEqual(disk_cache.path_dir, Path(fp))
+
+            # miss
+            self.assertIsNone(disk_cache.get(self.yaml_snippet))
+
+            # hit
+            self.assertTrue(disk_cache.put(self.yaml_snippet, d_data))
+            self.assertEqual(disk_cache.get(self.yaml_snippet), d_data)
+            # atomic write leaves no temporary file
+            paths = list(Path(fp).iterdir())
+            self.assertEqual(len(paths), 1)
+
+            # Not JSON serializable --> not stored
+            self.assertFalse(disk_cache.put("a: b\n", {"a": object()}))
+
+            # Corrupt entries --> miss
+            key = disk_cache.get_key(self.yaml_snippet)
+            path_entry = disk_cache.get_path(key)
+            invalids = (
+                "{not json",
+                "[1, 2]",
+                '{"key": "some other key", "data": {}}',
+                f'{{"key": "{key}"}}',
+            )
+            for invalid in invalids:
+                path_entry.write_text(invalid)
+                self.assertIsNone(disk_cache.get(self.yaml_snippet))
+
+            # Folder is a file --> write fails silently
+            path_file = Path(fp).joinpath("is_a_file")
+            path_file.touch()
+            disk_cache_bad = ValidationDiskCache(path_file)
+            self.assertFalse(disk_cache_bad.put(self.yaml_snippet, d_data))
+
+            # clear
+            self.assertEqual(disk_cache.clear(), 1)
+            self.assertIsNone(disk_cache.get(self.yaml_snippet))
+
+        # Default folder is within XDG user cache folder
+        disk_cache = ValidationDiskCache()
+        self.assertEqual(disk_cache.path_dir.name, CACHE_SUBFOLDER)
+
+        # Versions are part of the key
+        key_0 = disk_cache.get_key(self.yaml_snippet)
+        with patch(
+            f"{g_app_name}.util.validation_cache._versions",
+            "0.0.1\0" "1.0.0\0" "CPython\0" "3.10.0",
+        ):
+            key_1 = disk_cache.get_key(self.yaml_snippet)
+        self.assertNotEqual(key_0, key_1)
+
+    def test_validate_yaml_data_warm_start(self) -> None:
+        """Another process validated it already. Skip validation"""
+        with tempfile.TemporaryDirectory() as fp:
+            disk_cache = ValidationDiskCache(fp)
+            with patch(
+                f"{g_app_name}.logging_yaml_validate._disk_cache",
+                disk_cache,
+            ):
+                # cold start. Validates then persists
+                validation_cache_clear()
+                d_config_0 = validate_yaml_data(self.yaml_snippet)
+                self.assertEqual(disk_cache.get(self.yaml_snippet), d_config_0)
+
+                # warm start. New process, empty in-process cache
+                validation_cache_clear()
+                with patch(
+                    f"{g_app_name}.logging_yaml_validate.validate_yaml_dirty",
+                ) as mock_validate:
+                    d_config_1 = validate_yaml_data(self.yaml_snippet)
+                    mock_validate.assert_not_called()
+                self.assertEqual(d_config_1, d_config_0)
+
+                # Which layer answered
+                validation_cache_clear()
+                disk_cache.clear()
+                _, engine = _validate_yaml_engine(self.yaml_snippet)
+                self.assertIn(engine, (ENGINE_PREVALIDATE, ENGINE_STRICTYAML))
+                _, engine = _validate_yaml_engine(self.yaml_snippet)
+                self.assertEqual(engine, ENGINE_MEMORY)
+                validation_cache_clear()
+                _, engine = _validate_yaml_engine(self.yaml_snippet)
+                self.assertEqual(engine, ENGINE_DISK)
+                # Not the default schema. Neither fast engine nor disk
+                _, engine = _validate_yaml_engine(
+                    "level: INFO\n",
+                    schema=loggers_map,
+                )
+                self.assertEqual(engine, ENGINE_STRICTYAML)
+
+                # Non-default option is not persisted
+                validation_cache_clear()
+                disk_cache.clear()
+                validate_yaml_data("version: 1\n", allow_flow_style=False)
+                self.assertIsNone(disk_cache.get("version: 1\n"))
+                validation_cache_clear()
+
+    def test_registry_snapshot(self) -> None:
+        """Keyed by installed distribution. Stale or corrupt is a miss"""
+        # Editable install (this package), or not installed --> no key
+        self.assertIsNone(RegistrySnapshot.get_key(g_app_name))
+        self.assertIsNone(RegistrySnapshot.get_key("sdfsadfsdafsadfsadfsadfy"))
+        # Regular install
+        key = RegistrySnapshot.get_key("strictyaml")
+        self.assertIsInstance(key, str)
+        self.assertEqual(RegistrySnapshot.get_key("strictyaml"), key)
+
+        registry = [{"file": {"relative_path": "configs/a", "is_test_file": False}}]
+        with tempfile.TemporaryDirectory() as fp:
+            snapshot = RegistrySnapshot(fp)
+            self.assertIsNone(snapshot.get("strictyaml", key))
+            self.assertTrue(snapshot.put("strictyaml", key, registry))
+            self.assertEqual(snapshot.get("strictyaml", key), registry)
+            # Package upgraded or reinstalled
+            self.assertIsNone(snapshot.get("strictyaml", "other key"))
+            # Corrupt
+            snapshot.get_path("strictyaml").write_text("{not json")
+            self.assertIsNone(snapshot.get("strictyaml", key))
+            # Not JSON serializable
+            self.assertFalse(snapshot.put("strictyaml", key, [object()]))
+
+        self.assertEqual(RegistrySnapshot().path_dir.name, REGISTRY_SUBFOLDER)
+
+    def test_manifest_concurrent(self) -> None:
+        """Two runs share a manifest. Neither loses the other's entries"""
+        with tempfile.TemporaryDirectory() as fp:
+            path_dir = Path(fp)
+            path_manifest = path_dir.joinpath("cache", "manifest.json")
+            path_0 = path_dir.joinpath("a.yaml")
+            path_1 = path_dir.joinpath("b.yaml")
+            path_0.write_text("version: 1\n")
+            path_1.write_text("version: 1\n")
+            digest = ValidationManifest.get_digest(path_0)
+
+            # Both load before either saves
+            manifest_0 = ValidationManifest(path_manifest, schema_version="s")
+            manifest_1 = ValidationManifest(path_manifest, schema_version="s")
+            self.assertEqual(manifest_0.load(), 0)
+            self.assertEqual(manifest_1.load(), 0)
+            manifest_0.record(path_0, digest, {"status": "ok"})
+            manifest_1.record(path_1, digest, {"status": "fail"})
+            self.assertTrue(manifest_0.save())
+            self.assertTrue(manifest_1.save())
+
+            manifest = ValidationManifest(path_manifest, schema_version="s")
+            self.assertEqual(manifest.load(), 2)
+            self.assertEqual(manifest.lookup(path_0, digest), (True, {"status": "ok"}))
+            self.assertEqual(
+                manifest.lookup(path_1, digest),
+                (True, {"status": "fail"}),
+            )
+            # Lock file is removed once saved
+            self.assertEqual(
+                [path_f.name for path_f in path_manifest.parent.iterdir()],
+                ["manifest.json"],
+            )
+
+            # This run's entry wins. Removed files are dropped
+            manifest_0.record(path_1, digest, {"status": "ok"})
+            path_0.unlink()
+            self.assertTrue(manifest_0.save())
+            manifest = ValidationManifest(path_manifest, schema_version="s")
+            self.assertEqual(manifest.load(), 1)
+            self.assertEqual(manifest.lookup(path_1, digest), (True, {"status": "ok"}))
+
+            # Another schema version. Other entries are not merged
+            manifest_2 = ValidationManifest(path_manifest, schema_version="t")
+            self.assertEqual(manifest_2.load(), 0)
+            self.assertTrue(manifest_2.save())
+            self.assertEqual(manifest.load(), 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    """Without coverage
+
+    .. code-block:: shell
+
+       python -m tests.test_util_validation_cache --locals
+
+       python -m unittest tests.test_util_validation_cache \
+       -k ValidationCacheDisk.test_get_put --locals
+
+       python -m unittest tests.test_util_validation_cache \
+       -k ValidationCacheDisk.test_validate_yaml_data_warm_start --locals
+
+       python -m unittest tests.test_util_validation_cache \
+       -k ValidationCacheDisk.test_registry_snapshot --locals
+
+       python -m unittest tests.test_util_validation_cache \
+       -k ValidationCacheDisk.test_manifest_concurrent --locals
+
+    With coverage
+
+    .. code-block:: shell
+
+       coverage run --data-file=".coverage-combine-46" \
+       -m unittest discover -t. -s tests \
+       -p "test_util_validation_cache*.py" --locals
+
+       coverage report --include="**/util/validation_cache*" \
+       --no-skip-covered --data-file=".coverage-combine-46"
+
+    """
+    unittest.main(tb_locals=True)
@@ -27,7 +27,10 @@ from typing import (
 )
 
 import strictyaml as s
-from strictyaml.exceptions import YAMLValidationError
+from strictyaml.exceptions import (
+    DisallowedToken,
+    YAMLValidationError,
+)
 
 from logging_strict.logging_yaml_validate import (
     filters_map,
@@ -35,7 +38,10 @@ from logging_strict.logging_yaml_validate import (
     handlers_map,
     loggers_map,
     root_map,
+    validate_yaml_data,
     validate_yaml_dirty,
+    validation_cache_clear,
+    validation_cache_info,
 )
 
 if TYPE_CHECKING:
@@ -709,6 +715,64 @@ class YamlValidate(unittest.TestCase):
             self.assertIsInstance(bool_val, bool)
             self.assertTrue(bool_val)
 
+    def test_validation_cache(self) -> None:
+        """In-process cache. Deep copies, hit/miss stats, bounded"""
+        yaml_snippet = (
+            "version: 1\n"
+            "loggers:\n"
+            "  my_app:\n"
+            "    handlers: [console]\n"
+            "    level: INFO\n"
+            "    propagate: False\n"
+        )
+        validation_cache_clear()
+        info = validation_cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 0)
+        self.assertEqual(info.currsize, 0)
+
+        # miss then hit
+        d_config_0 = validate_yaml_data(yaml_snippet)
+        d_config_1 = validate_yaml_data(yaml_snippet)
+        info = validation_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.currsize, 1)
+
+        # Same data, independent copies
+        self.assertEqual(d_config_0, d_config_1)
+        self.assertIsNot(d_config_0, d_config_1)
+        d_config_0["loggers"]["my_app"]["handlers"].append("file")
+        d_config_2 = validate_yaml_data(yaml_snippet)
+        self.assertEqual(d_config_2["loggers"]["my_app"]["handlers"], ["console"])
+
+        # allow_flow_style is part of the key
+        with self.assertRaises(DisallowedToken):
+            validate_yaml_data(yaml_snippet, allow_flow_style=False)
+
+        # schema is part of the key
+        yaml_loggers = "level: INFO\npropagate: no\n"
+        d_loggers = validate_yaml_data(yaml_loggers, schema=loggers_map)
+        self.assertEqual(d_loggers["level"], "INFO")
+        with self.assertRaises(YAMLValidationError):
+            validate_yaml_data(yaml_loggers)
+
+        # Invalid is not cached
+        info = validation_cache_info()
+        self.assertEqual(info.currsize, 2)
+
+        # Bounded. Least recently used dropped
+        for idx in range(info.maxsize + 1):
+            validate_yaml_data(f"version: 1\nincremental: {idx % 2 == 0}\n# {idx}\n")
+        info = validation_cache_info()
+        self.assertEqual(info.currsize, info.maxsize)
+
+        validation_cache_clear()
+        info = validation_cache_info()
+        self.assertEqual(info.currsize, 0)
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 0)
+
 
 if __name__ == "__main__":  # pragma: no cover
     """Without coverage
@@ -735,6 +799,9 @@ if __name__ == "__main__":  # pragma: no cover
        python -m unittest tests.test_validate \
        -k YamlValidate.test_handler_args_kwargs --locals
 
+       python -m unittest tests.test_validate \
+       -k YamlValidate.test_validation_cache --locals
+
 
     With coverage
     .. code-block:: shell
@@ -13,10 +13,17 @@ Important to have an option to override to instead specify a temp folder.
 import platform
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+import importlib_metadata as metadata
+
+from logging_strict.constants import g_app_name
 from logging_strict.util.xdg_folder import (
     _author_normalize,  # pyright: ignore[reportPrivateUsage]
 )
+from logging_strict.util.xdg_folder import (
+    _authors,  # pyright: ignore[reportPrivateUsage]
+)
 from logging_strict.util.xdg_folder import (
     _get_author,  # pyright: ignore[reportPrivateUsage]
 )
@@ -25,6 +32,7 @@ from logging_strict.util.xdg_folder import (
     DestFolderUser,
     XDGBase,
     _get_path_config,
+    author_cache_clear,
 )
 
 
@@ -89,6 +97,46 @@ class XdgFolders(unittest.TestCase):
         with self.assertRaises(TypeError):
             _author_normalize(None)  # type: ignore[arg-type]
 
+    def test_get_author_cache(self) -> None:
+        """Metadata parsed once per package and flags. Until replaced"""
+        mod_path = f"{g_app_name}.util.xdg_folder"
+        version = metadata.version("appdirs")
+        author_cache_clear()
+        with patch(
+            f"{mod_path}.metadata.distribution",
+            wraps=metadata.distribution,
+        ) as mock_dist:
+            expected = _get_author("appdirs")
+            self.assertEqual(expected, "Trent-Mick")
+            for _ in range(3):
+                DestFolderUser("appdirs").cache_dir
+            self.assertEqual(mock_dist.call_count, 1)
+
+            # Other flags. Other entry
+            _get_author("appdirs", no_space=False)
+            self.assertEqual(mock_dist.call_count, 2)
+
+            # Distribution metadata folder replaced
+            key = ("appdirs", True, True, True)
+            stamp, author = _authors[key]
+            self.assertIsNotNone(stamp[0])
+            self.assertEqual(stamp[2], version)
+            _authors[key] = ((stamp[0], -1, version), author)
+            self.assertEqual(_get_author("appdirs"), expected)
+            self.assertEqual(mock_dist.call_count, 3)
+            _authors[key] = (("/nonexistent", -1, version), author)
+            self.assertEqual(_get_author("appdirs"), expected)
+            self.assertEqual(mock_dist.call_count, 4)
+
+            # Not a path distribution. Kept until cleared
+            _authors[key] = ((None, None, version), author)
+            _get_author("appdirs")
+            self.assertEqual(mock_dist.call_count, 4)
+            author_cache_clear()
+            self.assertEqual(len(_authors), 0)
+            _get_author("appdirs")
+            self.assertEqual(mock_dist.call_count, 5)
+
     @unittest.skipUnless(platform.system() == "Linux", "Results for Linux")
     def test_dest_folder_site_path(self) -> None:
         """Would require an installer that is run with root privledges"""
@@ -325,6 +373,9 @@ if __name__ == "__main__":  # pragma: no cover
 
        python -m tests.test_xdg_folders --locals
 
+       python -m unittest tests.test_xdg_folders \
+       -k XdgFolders.test_get_author_cache --locals --verbose
+
     .. code-block:: shell
 
        coverage run --data-file=".coverage-combine-2" \